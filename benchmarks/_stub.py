@@ -0,0 +1,33 @@
+"""Build helper for the stand-in core library used by the benchmarks"""
+import ctypes
+import os
+import subprocess
+import sys
+
+BENCH_DIR = os.path.dirname(os.path.realpath(__file__))
+BUILD_DIR = os.path.join(BENCH_DIR, '.build')
+SOURCE = os.path.join(BENCH_DIR, 'stub_core.c')
+
+# Make `tonclient` importable when running benchmarks from a checkout
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+
+def build_stub() -> str:
+    """Compile `stub_core.c` (if outdated) and return the library path"""
+    ext = {'darwin': 'dylib', 'win32': 'dll'}.get(sys.platform, 'so')
+    path = os.path.join(BUILD_DIR, f'stub_core.{ext}')
+    if (
+        not os.path.exists(path)
+        or os.path.getmtime(path) < os.path.getmtime(SOURCE)
+    ):
+        os.makedirs(BUILD_DIR, exist_ok=True)
+        compiler = os.environ.get('CC', 'cc')
+        subprocess.check_call(
+            [compiler, '-O2', '-shared', '-fPIC', '-pthread', '-o', path, SOURCE]
+        )
+    return path
+
+
+def load_stub() -> ctypes.CDLL:
+    """Build and load the stand-in core library"""
+    return ctypes.CDLL(build_stub())
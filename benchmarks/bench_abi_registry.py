@@ -0,0 +1,42 @@
+"""
+`ParamsOfEncodeMessage` encoding throughput with ABI passed as
+`Abi.Contract`, `Abi.Json` read from file and ABI interned by
+`AbiRegistry`.
+
+Usage: python benchmarks/bench_abi_registry.py [iterations] [codec]
+"""
+import os
+import sys
+
+from bench_params_encode import SAMPLES_DIR, abi_contract, params_samples, run
+
+from tonclient.bindings.codec import get_codec
+from tonclient.registry import AbiRegistry
+from tonclient.serializers import dump
+from tonclient.types import Abi
+
+
+def main(iterations: int, codec: str):
+    codec = get_codec(codec=codec)
+    print(f'codec: {codec.name}')
+    path = os.path.join(SAMPLES_DIR, 'Events.abi.json')
+    params = params_samples()['ParamsOfEncodeMessage']
+    abis = {
+        'Abi.Contract': Abi.Contract(value=abi_contract(path=path)),
+        'Abi.Json': Abi.from_path(path=path),
+        'AbiRegistry': AbiRegistry().from_path(path=path),
+    }
+    baseline = None
+    for name, abi in abis.items():
+        params.abi = abi
+        rate = run(lambda p: codec.dumps(dump(p)), params, iterations)
+        baseline = baseline or rate
+        size = len(codec.dumps(dump(params)))
+        print(f'{name:14s} {rate:9.0f}/s ({size} B)  {rate / baseline:.2f}x')
+
+
+if __name__ == '__main__':
+    main(
+        iterations=int(sys.argv[1]) if len(sys.argv) > 1 else 20000,
+        codec=sys.argv[2] if len(sys.argv) > 2 else None,
+    )
@@ -0,0 +1,94 @@
+"""
+Asyncio client throughput when the core completes requests from a
+background thread: loop wakeup per result (former behaviour) vs batched
+`LoopDelivery`.
+
+Requests are made in windows of `concurrency` (no semaphore, its wakeups
+would dominate the measurement). Each mode is warmed up and the best of
+`repeat` runs is reported.
+
+Usage: python benchmarks/bench_async_delivery.py [requests] [concurrency] [repeat]
+"""
+import asyncio
+import ctypes
+import sys
+import time
+
+from _stub import build_stub
+
+from tonclient.bindings.lib import preload
+from tonclient.client import TonClient
+from tonclient.module import LoopDelivery, ResponseRouter
+from tonclient.types import ClientConfig
+
+
+class PerResultDelivery(LoopDelivery):
+    """Former delivery: `call_soon_threadsafe` for each result"""
+
+    def push(self, future, result=None, exception=None):
+        self._loop().call_soon_threadsafe(self._resolve, future, result, exception)
+
+    @staticmethod
+    def _resolve(future, result, exception):
+        if future.done():
+            return
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(result)
+
+
+class CountingDelivery(LoopDelivery):
+    """Batched delivery which counts loop wakeups"""
+
+    wakeups = 0
+
+    def _drain(self):
+        CountingDelivery.wakeups += 1
+        super()._drain()
+
+
+async def run(requests: int, concurrency: int) -> float:
+    """Make requests and return requests per second"""
+    client = TonClient(config=ClientConfig(), is_async=True)
+
+    started = time.perf_counter()
+    for start in range(0, requests, concurrency):
+        await asyncio.gather(
+            *[
+                client.base.request(method='net.query', index=index)
+                for index in range(start, min(start + concurrency, requests))
+            ]
+        )
+    return requests / (time.perf_counter() - started)
+
+
+def main(requests: int, concurrency: int, repeat: int):
+    path = build_stub()
+    preload(path=path)
+    ctypes.CDLL(path).stub_set_threaded(1)
+
+    results = {}
+    for name, delivery_class in (
+        ('per result', PerResultDelivery),
+        ('batched', CountingDelivery),
+    ):
+        ResponseRouter.delivery_class = delivery_class
+        asyncio.run(run(requests=concurrency, concurrency=concurrency))  # Warmup
+        CountingDelivery.wakeups = 0
+        results[name] = max(
+            asyncio.run(run(requests=requests, concurrency=concurrency))
+            for _ in range(repeat)
+        )
+        print(f'{name:12s} {results[name]:10.0f} requests/sec (best of {repeat})')
+    wakeups = CountingDelivery.wakeups // repeat
+    print(f'loop wakeups per run  per result: {requests}  batched: {wakeups}')
+    print(f'speedup: {results["batched"] / results["per result"]:.2f}x')
+
+
+if __name__ == '__main__':
+    main(
+        requests=int(sys.argv[1]) if len(sys.argv) > 1 else 50000,
+        concurrency=int(sys.argv[2]) if len(sys.argv) > 2 else 5000,
+        repeat=int(sys.argv[3]) if len(sys.argv) > 3 else 5,
+    )
@@ -0,0 +1,130 @@
+"""
+JSON codecs throughput on `boc.parse_transaction` and `net.query_collection`
+sized payloads.
+`str` row is the former path: `json.dumps` -> `str.encode` for requests and
+`bytes.decode` -> `json.loads` for responses.
+
+Usage: python benchmarks/bench_codec.py [iterations]
+"""
+import json
+import sys
+import timeit
+
+import _stub  # noqa: F401 pylint: disable=unused-import
+
+from tonclient.bindings.codec import CODECS, JsonCodec
+
+
+def parsed_transaction(index: int) -> dict:
+    """Payload shaped like `boc.parse_transaction` result"""
+    return {
+        'json_version': 8,
+        'id': f'{index:064x}',
+        'boc': 'te6ccgECBwEAAYkAA7V' + 'A' * 600,
+        'status': 3,
+        'status_name': 'finalized',
+        'storage': {
+            'storage_fees_collected': '0x1f',
+            'status_change': 0,
+            'status_change_name': 'unchanged',
+        },
+        'compute': {
+            'success': True,
+            'msg_state_used': False,
+            'account_activated': False,
+            'gas_fees': '0x3d0900',
+            'gas_used': '0x0fa0',
+            'gas_limit': '0x0',
+            'gas_credit': 10000,
+            'mode': 0,
+            'exit_code': 0,
+            'vm_steps': 95,
+            'vm_init_state_hash': '0' * 64,
+            'vm_final_state_hash': '0' * 64,
+            'compute_type': 1,
+            'compute_type_name': 'vm',
+        },
+        'credit_first': True,
+        'aborted': False,
+        'destroyed': False,
+        'tr_type': 0,
+        'tr_type_name': 'ordinary',
+        'lt': f'0x{index:x}',
+        'prev_trans_hash': f'{index + 1:064x}',
+        'prev_trans_lt': f'0x{index + 1:x}',
+        'now': 1700000000 + index,
+        'outmsg_cnt': 2,
+        'orig_status': 1,
+        'orig_status_name': 'Active',
+        'end_status': 1,
+        'end_status_name': 'Active',
+        'in_msg': f'{index + 2:064x}',
+        'out_msgs': [f'{index + 3:064x}', f'{index + 4:064x}'],
+        'account_addr': f'0:{index:064x}',
+        'workchain_id': 0,
+        'total_fees': '0x3d0920',
+        'balance_delta': '-0x5f5e100',
+        'old_hash': '1' * 64,
+        'new_hash': '2' * 64,
+    }
+
+
+PAYLOADS = {
+    'parse_transaction': {
+        'params': {'boc': 'te6ccgECBwEAAYkAA7V' + 'A' * 600},
+        'result': {'parsed': parsed_transaction(index=1)},
+    },
+    'query_collection': {
+        'params': {
+            'collection': 'transactions',
+            'filter': {'account_addr': {'eq': '0:' + '1' * 64}},
+            'result': 'id lt now total_fees aborted in_msg out_msgs',
+            'order': [{'path': 'lt', 'direction': 'DESC'}],
+            'limit': 50,
+        },
+        'result': {'result': [parsed_transaction(index=i) for i in range(50)]},
+    },
+}
+
+
+def str_path():
+    """Former encode/decode functions"""
+
+    def dumps(obj):
+        return json.dumps(obj).encode()
+
+    def loads(data):
+        return json.loads(data.decode(errors='replace'))
+
+    return dumps, loads
+
+
+def main(iterations: int):
+    codecs = {'str': str_path()}
+    for name, codec_class in CODECS.items():
+        try:
+            codec: JsonCodec = codec_class()
+        except ImportError:
+            continue
+        codecs[name] = (codec.dumps, codec.loads)
+
+    for payload_name, payload in PAYLOADS.items():
+        response = json.dumps(payload['result']).encode()
+        print(f'{payload_name} (response {len(response)} bytes)')
+        for name, (dumps, loads) in codecs.items():
+            encode = min(
+                timeit.repeat(
+                    lambda: dumps(payload['params']), number=iterations, repeat=3
+                )
+            )
+            decode = min(
+                timeit.repeat(lambda: loads(response), number=iterations, repeat=3)
+            )
+            print(
+                f'  {name:8s} encode: {encode / iterations * 1e6:8.2f} us  '
+                f'decode: {decode / iterations * 1e6:8.2f} us'
+            )
+
+
+if __name__ == '__main__':
+    main(iterations=int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,100 @@
+"""
+Per-call FFI overhead: untyped calls with `restype` reassigned on each call
+(the former `bindings.lib` behaviour) vs the prebound dispatch table.
+
+Usage: python benchmarks/bench_ffi_dispatch.py [iterations]
+"""
+import ctypes
+import sys
+import timeit
+
+from _stub import build_stub
+
+from tonclient.bindings.lib import bind_library
+from tonclient.bindings.types import (
+    TCClientContext,
+    TCResponseHandler,
+    TCStringData,
+    TCStringHandle,
+)
+
+PARAMS = '{"boc":"te6ccgEBAQEAAgAAAA=="}'
+
+
+@TCResponseHandler
+def _handler(request_id, response_data, response_type, finished):
+    pass
+
+
+def legacy_calls(lib: ctypes.CDLL, ctx: TCClientContext):
+    """Former wrappers: no `argtypes`, `restype` set on each call"""
+
+    def request_sync():
+        method = TCStringData.from_string(string='boc.parse')
+        params_json = TCStringData.from_string(string=PARAMS)
+        lib.tc_request_sync.restype = ctypes.POINTER(ctypes.c_char_p)
+        ptr = lib.tc_request_sync(ctx, method, params_json)
+        lib.tc_read_string.restype = TCStringData
+        lib.tc_read_string(ptr)
+        lib.tc_destroy_string(ptr)
+
+    def request():
+        method = TCStringData.from_string(string='boc.parse')
+        params_json = TCStringData.from_string(string=PARAMS)
+        lib.tc_request(ctx, method, params_json, ctypes.c_int32(1), _handler)
+
+    return request_sync, request
+
+
+def table_calls(lib: ctypes.CDLL, ctx: TCClientContext):
+    """Dispatch table built by `bind_library`"""
+    table = bind_library(lib=lib)
+    tc_request_sync = table['tc_request_sync']
+    tc_read_string = table['tc_read_string']
+    tc_destroy_string = table['tc_destroy_string']
+    tc_request = table['tc_request']
+
+    def request_sync():
+        ptr: TCStringHandle = tc_request_sync(
+            ctx,
+            TCStringData.from_string(string='boc.parse'),
+            TCStringData.from_string(string=PARAMS),
+        )
+        tc_read_string(ptr)
+        tc_destroy_string(ptr)
+
+    def request():
+        tc_request(
+            ctx,
+            TCStringData.from_string(string='boc.parse'),
+            TCStringData.from_string(string=PARAMS),
+            1,
+            _handler,
+        )
+
+    return request_sync, request
+
+
+def main(iterations: int):
+    path = build_stub()
+    ctx = TCClientContext(1)
+    # Separate library objects, so typed functions do not leak into legacy
+    legacy = legacy_calls(lib=ctypes.CDLL(path), ctx=ctx)
+    table = table_calls(lib=ctypes.CDLL(path), ctx=ctx)
+
+    for title, legacy_fn, table_fn in zip(
+        ('tc_request_sync + read + destroy', 'tc_request (inline callback)'),
+        legacy,
+        table,
+    ):
+        before = min(timeit.repeat(legacy_fn, number=iterations, repeat=5))
+        after = min(timeit.repeat(table_fn, number=iterations, repeat=5))
+        print(
+            f'{title:34s} before: {before / iterations * 1e9:8.0f} ns/call  '
+            f'after: {after / iterations * 1e9:8.0f} ns/call  '
+            f'({before / after:.2f}x)'
+        )
+
+
+if __name__ == '__main__':
+    main(iterations=int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
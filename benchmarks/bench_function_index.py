@@ -0,0 +1,50 @@
+"""
+`FunctionIdIndex.route` throughput: bodies routed per second with many
+indexed ABIs, each body is routed with one lookup per distinct ABI headers
+set instead of a decode attempt per ABI.
+
+Usage: python benchmarks/bench_function_index.py [abis] [iterations]
+"""
+import base64
+import sys
+import time
+from types import SimpleNamespace
+
+from _stub import BENCH_DIR  # noqa: F401 (repo root is added to `sys.path`)
+
+from tonclient.registry import AbiRegistry, FunctionIdIndex
+
+
+def body(function_id: int) -> str:
+    """Internal message body BOC: function id and 256-bit value"""
+    data = function_id.to_bytes(4, 'big') + bytes(32)
+    cell = bytes([0, len(data) * 2]) + data
+    header = b'\xb5\xee\x9c\x72' + bytes([0x01, 0x01, 1, 1, 0, len(cell), 0])
+    return base64.b64encode(header + cell).decode()
+
+
+def main(abis: int, iterations: int):
+    client = SimpleNamespace(abi_registry=AbiRegistry(), is_async=False)
+    index = FunctionIdIndex(client=client)
+    for number in range(abis):
+        functions = [
+            {'name': f'f{number}_{i}', 'id': hex(number * 100 + i)} for i in range(20)
+        ]
+        header = [['time', 'expire'], ['pubkey', 'time', 'expire']][number % 2]
+        index.add(abi={'ABI version': 2, 'header': header, 'functions': functions})
+
+    bodies = [body(function_id=number * 100 + 7) for number in range(abis)]
+    for is_internal in (True, False):
+        started = time.perf_counter()
+        for _ in range(iterations // len(bodies)):
+            for item in bodies:
+                index.route(body=item, is_internal=is_internal)
+        rate = iterations / (time.perf_counter() - started)
+        print(f'{abis} ABIs, is_internal={is_internal!s:5s} {rate:9.0f} bodies/s')
+
+
+if __name__ == '__main__':
+    main(
+        abis=int(sys.argv[1]) if len(sys.argv) > 1 else 50,
+        iterations=int(sys.argv[2]) if len(sys.argv) > 2 else 100000,
+    )
@@ -0,0 +1,82 @@
+"""
+Cold import time of `tonclient` modules, measured in fresh interpreters
+with `python -X importtime`.
+Also checks lazy types loading did not regress: importing `tonclient.types`
+must not import types of SDK modules, and importing a single type must
+import only its SDK module types (and their dependencies).
+
+Usage: python benchmarks/bench_import.py [runs]
+"""
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, Tuple
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+# Statement -> `tonclient.types` modules allowed to be imported
+STATEMENTS = {
+    'import tonclient.types': {'tonclient.types', 'tonclient.types.base'},
+    'from tonclient.types import ParamsOfParse': {
+        'tonclient.types',
+        'tonclient.types.base',
+        'tonclient.types.boc',
+    },
+    'import tonclient.client': None,
+}
+
+
+def import_times(statement: str) -> Dict[str, Tuple[int, int]]:
+    """
+    Import times of modules for statement
+
+    :return: Dict of module name -> (nesting level, cumulative time in us)
+    """
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Line format: `import time: self [us] | cumulative | imported package`
+    times = {}
+    for line in process.stderr.splitlines():
+        parts = line.split('|')
+        if len(parts) == 3 and parts[1].strip().isdigit():
+            name = parts[2].rstrip()
+            level = (len(name) - len(name.lstrip())) // 2
+            times[name.strip()] = (level, int(parts[1]))
+    return times
+
+
+def main(runs: int):
+    failed = False
+    for statement, allowed in STATEMENTS.items():
+        totals = []
+        for _ in range(runs):
+            times = import_times(statement=statement)
+            totals.append(
+                sum(
+                    cumulative
+                    for module, (level, cumulative) in times.items()
+                    if level == 0 and module.startswith('tonclient')
+                )
+            )
+
+        print(
+            f'{statement:45s} median: {statistics.median(totals) / 1000:7.2f} ms  '
+            f'min: {min(totals) / 1000:7.2f} ms'
+        )
+
+        types_modules = {m for m in times if m.startswith('tonclient.types')}
+        if allowed is not None and types_modules - allowed:
+            failed = True
+            print(f'  REGRESSION: imported {sorted(types_modules - allowed)}')
+
+    sys.exit(int(failed))
+
+
+if __name__ == '__main__':
+    main(runs=int(sys.argv[1]) if len(sys.argv) > 1 else 10)
@@ -0,0 +1,38 @@
+"""
+Sync client calls per second with metrics disabled and enabled.
+
+Usage: python benchmarks/bench_metrics.py [calls]
+"""
+import sys
+import time
+
+from _stub import build_stub
+
+from tonclient.bindings.lib import preload
+from tonclient.client import TonClient
+from tonclient.types import ClientConfig
+
+
+def run(client: TonClient, calls: int) -> float:
+    """Make calls and return calls per second"""
+    started = time.perf_counter()
+    for _ in range(calls):
+        client.base.request(method='crypto.sha256', data='dGVzdA==')
+    return calls / (time.perf_counter() - started)
+
+
+def main(calls: int):
+    preload(path=build_stub())
+
+    for is_core_async in (False, True):
+        print('async core' if is_core_async else 'sync core')
+        for metrics in (False, True):
+            client = TonClient(
+                config=ClientConfig(), is_core_async=is_core_async, metrics=metrics
+            )
+            name = 'metrics on' if metrics else 'metrics off'
+            print(f'  {name:12s} {run(client=client, calls=calls):10.0f} calls/sec')
+
+
+if __name__ == '__main__':
+    main(calls=int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,132 @@
+"""
+Params encoding throughput: `codec.dumps(params.dict)` (former) vs
+compiled serializers `codec.dumps(dump(params))` for ABI and processing
+params. Each encoder is warmed up and the best of `repeat` runs is
+reported.
+
+Usage: python benchmarks/bench_params_encode.py [iterations] [codec] [repeat]
+"""
+import json
+import os
+import sys
+import time
+
+from _stub import BENCH_DIR
+
+from tonclient.bindings.codec import get_codec
+from tonclient.serializers import dump
+from tonclient.types import (
+    Abi,
+    AbiContract,
+    AbiEvent,
+    AbiFunction,
+    AbiParam,
+    AccountForExecutor,
+    CallSet,
+    DeploySet,
+    ExecutionOptions,
+    FunctionHeader,
+    KeyPair,
+    ParamsOfEncodeMessage,
+    ParamsOfProcessMessage,
+    ParamsOfRunExecutor,
+    Signer,
+)
+
+SAMPLES_DIR = os.path.join(os.path.dirname(BENCH_DIR), 'tonclient', 'test', 'samples')
+
+
+def abi_param(data: dict) -> AbiParam:
+    """Typed ABI param from dict"""
+    components = [abi_param(c) for c in data.get('components', [])]
+    return AbiParam(name=data['name'], type=data['type'], components=components)
+
+
+def abi_contract(path: str) -> AbiContract:
+    """Typed ABI from JSON file"""
+    with open(path, encoding='utf8') as fp:
+        data = json.load(fp)
+    return AbiContract(
+        abi_version=data.get('ABI version'),
+        version=data.get('version'),
+        header=data.get('header'),
+        functions=[
+            AbiFunction(
+                name=f['name'],
+                inputs=[abi_param(p) for p in f['inputs']],
+                outputs=[abi_param(p) for p in f['outputs']],
+                id=f.get('id'),
+            )
+            for f in data['functions']
+        ],
+        events=[
+            AbiEvent(name=e['name'], inputs=[abi_param(p) for p in e['inputs']])
+            for e in data.get('events', [])
+        ],
+    )
+
+
+def params_samples() -> dict:
+    """Params objects by name"""
+    abi = Abi.Contract(
+        value=abi_contract(path=os.path.join(SAMPLES_DIR, 'Events.abi.json'))
+    )
+    signer = Signer.Keys(keys=KeyPair(public='0' * 64, secret='1' * 64))
+    encode = ParamsOfEncodeMessage(
+        abi=abi,
+        signer=signer,
+        deploy_set=DeploySet(tvc='te6ccgEBAQEAAgAAAA=='),
+        call_set=CallSet(
+            function_name='constructor',
+            header=FunctionHeader(expire=1700000000, time=1700000000000),
+            input={'value': 1},
+        ),
+    )
+    return {
+        'ParamsOfEncodeMessage': encode,
+        'ParamsOfProcessMessage': ParamsOfProcessMessage(
+            message_encode_params=encode, send_events=False
+        ),
+        'ParamsOfRunExecutor': ParamsOfRunExecutor(
+            message='te6ccgEBAQEAAgAAAA==',
+            account=AccountForExecutor.Account(boc='te6ccgEBAQEAAgAAAA=='),
+            execution_options=ExecutionOptions(block_time=1700000000),
+            abi=abi,
+        ),
+    }
+
+
+def run(encode, params, iterations: int, repeat: int = 5) -> float:
+    """Encode params and return best of `repeat` runs in encodes per second"""
+    for _ in range(iterations // 10):  # Warmup
+        encode(params)
+
+    best = 0.0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            encode(params)
+        best = max(best, iterations / (time.perf_counter() - started))
+    return best
+
+
+def main(iterations: int, codec: str, repeat: int):
+    codec = get_codec(codec=codec)
+    print(f'codec: {codec.name}, best of {repeat}')
+    for name, params in params_samples().items():
+        former = codec.dumps(params.dict)
+        compiled = codec.dumps(dump(params))
+        before = run(lambda p: codec.dumps(p.dict), params, iterations, repeat)
+        after = run(lambda p: codec.dumps(dump(p)), params, iterations, repeat)
+        print(
+            f'{name:24s} before: {before:9.0f}/s ({len(former)} B)  '
+            f'after: {after:9.0f}/s ({len(compiled)} B)  {after / before:.2f}x'
+        )
+
+
+if __name__ == '__main__':
+    main(
+        iterations=int(sys.argv[1]) if len(sys.argv) > 1 else 20000,
+        codec=sys.argv[2] if len(sys.argv) > 2 else None,
+        repeat=int(sys.argv[3]) if len(sys.argv) > 3 else 5,
+    )
@@ -0,0 +1,44 @@
+"""
+Client calls per second with large results: types objects vs raw mode
+parsed dicts (`raw='dict'`) and undecoded JSON (`raw='bytes'`).
+Stand-in core echoes a `net.query_transaction_tree` result back.
+
+Usage: python benchmarks/bench_raw_results.py [messages] [calls]
+"""
+import sys
+import time
+
+from _stub import build_stub
+from bench_result_decode import transaction_tree
+
+from tonclient.bindings.lib import preload
+from tonclient.client import TonClient
+from tonclient.module import TonModule, request_options
+from tonclient.types import ClientConfig, ResultOfQueryTransactionTree
+
+
+def run(module: TonModule, params: dict, calls: int) -> float:
+    """Make calls and return calls per second"""
+    started = time.perf_counter()
+    for _ in range(calls):
+        response = module.request(method='stub.echo', params_or_str=params)
+        module.response(classname=ResultOfQueryTransactionTree, response=response)
+    return calls / (time.perf_counter() - started)
+
+
+def main(messages: int, calls: int):
+    preload(path=build_stub())
+    params = transaction_tree(messages=messages, unknown=False)
+    module = TonModule(client=TonClient(config=ClientConfig()))
+    print(f'{messages} messages')
+    for raw in (None, 'dict', 'bytes'):
+        with request_options(raw=raw):
+            rate = run(module=module, params=params, calls=calls)
+        print(f'  raw={raw!s:6s} {rate:9.1f} calls/sec')
+
+
+if __name__ == '__main__':
+    main(
+        messages=int(sys.argv[1]) if len(sys.argv) > 1 else 1000,
+        calls=int(sys.argv[2]) if len(sys.argv) > 2 else 200,
+    )
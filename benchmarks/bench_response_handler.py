@@ -0,0 +1,86 @@
+"""
+Response handler throughput with logging disabled: the former handler
+(eager `response_data.json` for the debug log, parse for result) vs
+`ResponseRouter` handler (single parse, no logging work).
+Stand-in core calls the handler inline from `tc_request`.
+
+Usage: python benchmarks/bench_response_handler.py [requests]
+"""
+import logging
+import sys
+import time
+from concurrent.futures import Future
+
+from _stub import build_stub
+
+from tonclient.bindings.codec import JsonCodec
+from tonclient.bindings.lib import preload, tc_request
+from tonclient.bindings.types import (
+    TCClientContext,
+    TCResponseHandler,
+    TCResponseType,
+    TCStringData,
+)
+from tonclient.module import ResponseRouter
+
+PARAMS = JsonCodec().dumps({'message': 'te6ccgEBAQEAAgAAAA==' * 20, 'id': 1})
+
+
+def former_router() -> ResponseRouter:
+    """Router with the former response handler logic"""
+    router = ResponseRouter(codec=JsonCodec())
+
+    def handler(request_id, response_data: TCStringData, response_type, finished):
+        logging.debug(
+            'Request: %s; Response: %r; Response type: %s; Finished: %s',
+            request_id,
+            response_data.json,
+            response_type,
+            finished,
+        )
+        request = router.requests.get(request_id)
+        if not request:
+            return
+        if finished:
+            del router.requests[request_id]
+        if response_type == TCResponseType.Success:
+            request['future'].set_result(response_data.json)
+
+    router.handler = TCResponseHandler(handler)
+    return router
+
+
+def run(router: ResponseRouter, requests: int) -> float:
+    """Make requests and return requests per second"""
+    ctx = TCClientContext(1)
+    started = time.perf_counter()
+    for _ in range(requests):
+        future = Future()
+        request_id = router.register(
+            request={'is_async': False, 'callback': None, 'future': future}
+        )
+        tc_request(
+            ctx=ctx,
+            method='stub.echo',
+            request_id=request_id,
+            response_handler=router.handler,
+            params_json=PARAMS,
+        )
+        future.result()
+    return requests / (time.perf_counter() - started)
+
+
+def main(requests: int):
+    preload(path=build_stub())
+    logging.basicConfig(level=logging.WARNING)
+
+    before = run(router=former_router(), requests=requests)
+    after = run(router=ResponseRouter(codec=JsonCodec()), requests=requests)
+    print(
+        f'responses/sec  before: {before:10.0f}  after: {after:10.0f}  '
+        f'({after / before:.2f}x)'
+    )
+
+
+if __name__ == '__main__':
+    main(requests=int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
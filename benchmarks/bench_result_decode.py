@@ -0,0 +1,114 @@
+"""
+Result decoding time of large transaction trees: `from_dict` (former) vs
+compiled decoders, parsed response dict to result object. Responses with
+keys unknown to the binding are decoded as well (`from_dict` raises on
+them, so they are removed before it is called).
+
+Usage: python benchmarks/bench_result_decode.py [messages] [iterations]
+"""
+import copy
+import gc
+import sys
+import time
+
+import _stub  # noqa: F401 (repo root in `sys.path`)
+
+from tonclient.decoders import load
+from tonclient.types import ResultOfQueryTransactionTree
+
+
+def transaction_tree(messages: int, unknown: bool) -> dict:
+    """Parsed `net.query_transaction_tree` response"""
+    result = {
+        'messages': [
+            {
+                'id': f'{i:064x}',
+                'src_transaction_id': f'{i:064x}',
+                'dst_transaction_id': f'{i + 1:064x}',
+                'src': '0:' + '1' * 64,
+                'dst': '0:' + '2' * 64,
+                'value': '1000000000',
+                'bounce': True,
+                'decoded_body': {
+                    'body_type': 'Input',
+                    'name': 'transfer',
+                    'value': {'dest': '0:' + '2' * 64, 'value': '1000'},
+                    'header': {'expire': 1700000000, 'time': 1700000000000},
+                },
+            }
+            for i in range(messages)
+        ],
+        'transactions': [
+            {
+                'id': f'{i + 1:064x}',
+                'in_msg': f'{i:064x}',
+                'out_msgs': [f'{i + 1:064x}'],
+                'account_addr': '0:' + '2' * 64,
+                'total_fees': '1000',
+                'aborted': False,
+                'exit_code': 0,
+            }
+            for i in range(messages)
+        ],
+    }
+    if unknown:
+        # Fields added by newer core versions
+        for i, message in enumerate(result['messages']):
+            message['dst_chain_order'] = f'{i:x}'
+        for transaction in result['transactions']:
+            transaction['chain_order'] = '1'
+    return result
+
+
+def former(data: dict) -> ResultOfQueryTransactionTree:
+    """Decode with `from_dict`, unknown keys are removed beforehand"""
+    for message in data['messages']:
+        message.pop('dst_chain_order', None)
+    for transaction in data['transactions']:
+        transaction.pop('chain_order', None)
+    return ResultOfQueryTransactionTree.from_dict(data=data)
+
+
+def compiled(data: dict) -> ResultOfQueryTransactionTree:
+    return load(cls=ResultOfQueryTransactionTree, data=data)
+
+
+def run(decoders: dict, data: dict, iterations: int, repeat: int = 5) -> dict:
+    """
+    Decode copies of response, decoders take turns to even out allocator
+    state. Return best seconds per decode by decoder name
+    """
+    timings = {name: [] for name in decoders}
+    for _ in range(repeat):
+        for name, decode in decoders.items():
+            copies = [copy.deepcopy(data) for _ in range(iterations)]
+            results = []
+            gc.collect()
+            gc.disable()
+            started = time.perf_counter()
+            for item in copies:
+                results.append(decode(item))
+            timings[name].append((time.perf_counter() - started) / iterations)
+            gc.enable()
+            del copies, results
+    return {name: min(values) for name, values in timings.items()}
+
+
+def main(messages: int, iterations: int):
+    decoders = {'from_dict': former, 'compiled': compiled}
+    for unknown in (False, True):
+        data = transaction_tree(messages=messages, unknown=unknown)
+        timings = run(decoders=decoders, data=data, iterations=iterations)
+        before, after = timings['from_dict'], timings['compiled']
+        print(
+            f'{messages} messages, unknown keys: {unknown!s:5s}  '
+            f'from_dict: {before * 1000:7.2f} ms  '
+            f'compiled: {after * 1000:7.2f} ms  {before / after:.2f}x'
+        )
+
+
+if __name__ == '__main__':
+    main(
+        messages=int(sys.argv[1]) if len(sys.argv) > 1 else 10000,
+        iterations=int(sys.argv[2]) if len(sys.argv) > 2 else 5,
+    )
@@ -0,0 +1,71 @@
+"""
+Sync client calls per second: `_sync_core_request` vs `_async_core_request`
+with the former `concurrent.futures.Future` and with `RequestWaiter`.
+Stand-in core completes async requests inline or from a background thread.
+
+Usage: python benchmarks/bench_sync_request.py [calls]
+"""
+import ctypes
+import sys
+import time
+from concurrent.futures import Future
+
+from _stub import build_stub
+
+from tonclient.bindings.lib import preload, tc_request
+from tonclient.client import TonClient
+from tonclient.module import TonModule
+from tonclient.types import ClientConfig
+
+
+class FutureModule(TonModule):
+    """Module with the former `_async_core_request`"""
+
+    def _async_core_request(self, method, request_params, callback, **options):
+        future = Future()
+        request_id = self._client.router.register(
+            request={'is_async': False, 'callback': callback, 'future': future}
+        )
+        tc_request(
+            ctx=self._client.ctx,
+            method=method,
+            request_id=request_id,
+            params_json=request_params,
+            response_handler=self._client.router.handler,
+        )
+        exception = future.exception()
+        if exception:
+            raise exception
+        return future.result()
+
+
+def run(module: TonModule, calls: int) -> float:
+    """Make calls and return calls per second"""
+    started = time.perf_counter()
+    for _ in range(calls):
+        module.request(method='crypto.sha256', data='dGVzdA==')
+    return calls / (time.perf_counter() - started)
+
+
+def main(calls: int):
+    path = build_stub()
+    preload(path=path)
+    stub = ctypes.CDLL(path)
+
+    sync_client = TonClient(config=ClientConfig(), is_core_async=False)
+    async_client = TonClient(config=ClientConfig())
+    modules = {
+        'sync core': TonModule(client=sync_client),
+        'async core, Future': FutureModule(client=async_client),
+        'async core, waiter': TonModule(client=async_client),
+    }
+
+    for threaded in (0, 1):
+        stub.stub_set_threaded(threaded)
+        print('core thread' if threaded else 'inline')
+        for name, module in modules.items():
+            print(f'  {name:20s} {run(module=module, calls=calls):10.0f} calls/sec')
+
+
+if __name__ == '__main__':
+    main(calls=int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,72 @@
+"""
+Memory of 1M result objects: types with `__slots__` vs the same classes
+with instance `__dict__` (former representation).
+
+Usage: python benchmarks/bench_types_memory.py [objects]
+"""
+import gc
+import sys
+import tracemalloc
+
+import _stub  # noqa: F401 (repo root in `sys.path`)
+
+from tonclient.types import (
+    DecodedMessageBody,
+    MessageBodyType,
+    MessageNode,
+    TransactionNode,
+)
+
+FACTORIES = {
+    'MessageNode': lambda cls, i: cls(
+        id=f'{i:064x}',
+        bounce=True,
+        src_transaction_id=f'{i:064x}',
+        src='0:' + '1' * 64,
+        dst='0:' + '2' * 64,
+        value='1000000000',
+    ),
+    'TransactionNode': lambda cls, i: cls(
+        id=f'{i:064x}',
+        in_msg=f'{i:064x}',
+        out_msgs=[],
+        account_addr='0:' + '2' * 64,
+        total_fees='1000',
+        aborted=False,
+    ),
+    'DecodedMessageBody': lambda cls, i: cls(
+        body_type=MessageBodyType.INPUT, name='transfer', value={}
+    ),
+}
+
+
+def former(cls: type) -> type:
+    """Same class with instance `__dict__`"""
+    return type(cls.__name__, (), {'__init__': cls.__init__})
+
+
+def measure(cls: type, factory, objects: int) -> int:
+    """Allocate objects and return traced memory in bytes"""
+    gc.collect()
+    tracemalloc.start()
+    items = [factory(cls, i) for i in range(objects)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del items
+    return size
+
+
+def main(objects: int):
+    for cls in (MessageNode, TransactionNode, DecodedMessageBody):
+        factory = FACTORIES[cls.__name__]
+        before = measure(cls=former(cls), factory=factory, objects=objects)
+        after = measure(cls=cls, factory=factory, objects=objects)
+        print(
+            f'{cls.__name__:20s} dict: {before / 2 ** 20:8.1f} MiB  '
+            f'slots: {after / 2 ** 20:8.1f} MiB  '
+            f'({(before - after) / objects:.0f} B per object less)'
+        )
+
+
+if __name__ == '__main__':
+    main(objects=int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
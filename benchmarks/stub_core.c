@@ -0,0 +1,196 @@
+/*
+ * Stand-in for the ton-rust-client core used by the benchmarks.
+ *
+ * Exports the same `tc_*` symbols as the real library and echoes request
+ * params back as the result, so the Python binding overhead can be measured
+ * without a network or the real core:
+ *
+ *   - `stub.error` responds with a client error;
+ *   - `stub.never` never responds;
+ *   - `stub.events` sends one custom (100) response before the result.
+ *
+ * `tc_request` completes inline by default. After `stub_set_threaded(1)` the
+ * responses are sent from a background worker thread, like the real core
+ * does.
+ */
+#include <pthread.h>
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+typedef struct {
+    const char *content;
+    uint32_t len;
+} tc_string_data_t;
+
+typedef struct {
+    char *content;
+    uint32_t len;
+} tc_string_handle_t;
+
+typedef void (*tc_response_handler_t)(
+    uint32_t request_id, tc_string_data_t params_json, uint32_t response_type,
+    bool finished);
+
+static const char ERROR_JSON[] =
+    "{\"code\":23,\"message\":\"Stub error\",\"data\":null}";
+
+static tc_string_handle_t *make_handle(
+    const char *prefix, const char *body, uint32_t body_len, const char *suffix)
+{
+    size_t prefix_len = strlen(prefix), suffix_len = strlen(suffix);
+    tc_string_handle_t *handle = malloc(sizeof(tc_string_handle_t));
+    handle->len = (uint32_t)(prefix_len + body_len + suffix_len);
+    handle->content = malloc(handle->len);
+    memcpy(handle->content, prefix, prefix_len);
+    memcpy(handle->content + prefix_len, body, body_len);
+    memcpy(handle->content + prefix_len + body_len, suffix, suffix_len);
+    return handle;
+}
+
+static bool is_method(tc_string_data_t method, const char *name)
+{
+    return method.len == strlen(name) && !memcmp(method.content, name, method.len);
+}
+
+/* Background worker */
+
+typedef struct job {
+    struct job *next;
+    uint32_t request_id;
+    int kind;
+    char *params;
+    uint32_t params_len;
+    tc_response_handler_t handler;
+} job_t;
+
+enum { JOB_RESULT, JOB_ERROR, JOB_EVENTS };
+
+static int threaded = 0;
+static pthread_mutex_t queue_lock = PTHREAD_MUTEX_INITIALIZER;
+static pthread_cond_t queue_cond = PTHREAD_COND_INITIALIZER;
+static job_t *queue_head = NULL, *queue_tail = NULL;
+static pthread_t worker;
+static int worker_started = 0;
+
+static void complete(job_t *job)
+{
+    tc_string_data_t data;
+    if (job->kind == JOB_ERROR) {
+        data.content = ERROR_JSON;
+        data.len = (uint32_t)strlen(ERROR_JSON);
+        job->handler(job->request_id, data, 1, true);
+        return;
+    }
+    data.content = job->params;
+    data.len = job->params_len;
+    if (job->kind == JOB_EVENTS)
+        job->handler(job->request_id, data, 100, false);
+    job->handler(job->request_id, data, 0, true);
+}
+
+static void *worker_main(void *arg)
+{
+    (void)arg;
+    for (;;) {
+        pthread_mutex_lock(&queue_lock);
+        while (!queue_head)
+            pthread_cond_wait(&queue_cond, &queue_lock);
+        job_t *job = queue_head;
+        queue_head = job->next;
+        if (!queue_head)
+            queue_tail = NULL;
+        pthread_mutex_unlock(&queue_lock);
+
+        complete(job);
+        free(job->params);
+        free(job);
+    }
+    return NULL;
+}
+
+void stub_set_threaded(int value)
+{
+    pthread_mutex_lock(&queue_lock);
+    threaded = value;
+    if (threaded && !worker_started) {
+        pthread_create(&worker, NULL, worker_main, NULL);
+        pthread_detach(worker);
+        worker_started = 1;
+    }
+    pthread_mutex_unlock(&queue_lock);
+}
+
+/* Core API */
+
+tc_string_handle_t *tc_create_context(tc_string_data_t config)
+{
+    (void)config;
+    return make_handle("{\"result\":1}", "", 0, "");
+}
+
+void tc_destroy_context(uint32_t context) { (void)context; }
+
+void tc_request(
+    uint32_t context, tc_string_data_t function_name,
+    tc_string_data_t function_params_json, uint32_t request_id,
+    tc_response_handler_t response_handler)
+{
+    (void)context;
+    if (is_method(function_name, "stub.never"))
+        return;
+
+    job_t job = {
+        NULL, request_id, JOB_RESULT, (char *)function_params_json.content,
+        function_params_json.len, response_handler};
+    if (is_method(function_name, "stub.error"))
+        job.kind = JOB_ERROR;
+    else if (is_method(function_name, "stub.events"))
+        job.kind = JOB_EVENTS;
+
+    if (!threaded) {
+        complete(&job);
+        return;
+    }
+
+    job_t *queued = malloc(sizeof(job_t));
+    *queued = job;
+    queued->params = malloc(job.params_len);
+    memcpy(queued->params, job.params, job.params_len);
+
+    pthread_mutex_lock(&queue_lock);
+    if (queue_tail)
+        queue_tail->next = queued;
+    else
+        queue_head = queued;
+    queue_tail = queued;
+    pthread_cond_signal(&queue_cond);
+    pthread_mutex_unlock(&queue_lock);
+}
+
+tc_string_handle_t *tc_request_sync(
+    uint32_t context, tc_string_data_t function_name,
+    tc_string_data_t function_params_json)
+{
+    (void)context;
+    if (is_method(function_name, "stub.error"))
+        return make_handle("{\"error\":", ERROR_JSON, strlen(ERROR_JSON), "}");
+    return make_handle(
+        "{\"result\":", function_params_json.content, function_params_json.len,
+        "}");
+}
+
+tc_string_data_t tc_read_string(const tc_string_handle_t *handle)
+{
+    tc_string_data_t data = {handle->content, handle->len};
+    return data;
+}
+
+void tc_destroy_string(const tc_string_handle_t *handle)
+{
+    if (!handle)
+        return;
+    free(handle->content);
+    free((void *)handle);
+}
@@ -1,41 +1,75 @@
 """ABI module methods"""
-from typing import Union, Awaitable
+from typing import Awaitable, Union
 
 from tonclient.module import TonModule
 from tonclient.types import (
-    ParamsOfCalcFunctionId,
-    ParamsOfEncodeMessageBody,
     DecodedMessageBody,
-    ResultOfCalcFunctionId,
-    ResultOfEncodeMessageBody,
-    ParamsOfAttachSignatureToMessageBody,
-    ResultOfAttachSignatureToMessageBody,
-    ParamsOfEncodeMessage,
-    ResultOfEncodeMessage,
+    ParamsOfAbiEncodeBoc,
     ParamsOfAttachSignature,
-    ResultOfAttachSignature,
+    ParamsOfAttachSignatureToMessageBody,
+    ParamsOfCalcFunctionId,
+    ParamsOfDecodeAccountData,
+    ParamsOfDecodeBoc,
+    ParamsOfDecodeInitialData,
     ParamsOfDecodeMessage,
     ParamsOfDecodeMessageBody,
     ParamsOfEncodeAccount,
-    ResultOfEncodeAccount,
+    ParamsOfEncodeInitialData,
     ParamsOfEncodeInternalMessage,
-    ResultOfEncodeInternalMessage,
-    ParamsOfDecodeAccountData,
-    ResultOfDecodeData,
+    ParamsOfEncodeMessage,
+    ParamsOfEncodeMessageBody,
+    ParamsOfGetSignatureData,
     ParamsOfUpdateInitialData,
-    ResultOfUpdateInitialData,
-    ParamsOfDecodeInitialData,
-    ResultOfDecodeInitialData,
-    ParamsOfDecodeBoc,
+    ResultOfAbiEncodeBoc,
+    ResultOfAttachSignature,
+    ResultOfAttachSignatureToMessageBody,
+    ResultOfCalcFunctionId,
     ResultOfDecodeBoc,
-    ParamsOfEncodeInitialData,
+    ResultOfDecodeData,
+    ResultOfDecodeInitialData,
+    ResultOfEncodeAccount,
     ResultOfEncodeInitialData,
-    ParamsOfAbiEncodeBoc,
-    ResultOfAbiEncodeBoc,
-    ParamsOfGetSignatureData,
+    ResultOfEncodeInternalMessage,
+    ResultOfEncodeMessage,
+    ResultOfEncodeMessageBody,
     ResultOfGetSignatureData,
+    ResultOfUpdateInitialData,
+)
+
+
+# region hand-written
+import asyncio
+import collections
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
 )
 
+from tonclient.errors import TonException, TonTimeoutError
+from tonclient.module import request_options
+from tonclient.types import AbiType
+
+# Default max concurrent core requests of batch methods
+BATCH_WORKERS = 16
+
+
+def _typed(method: Callable, params: Any) -> Any:
+    """
+    Call module method with types object result (or awaitable of it)
+    regardless of client raw mode, other request options apply
+    """
+    with request_options(raw=None):
+        return method(params=params)
+# endregion
+
 
 class TonAbi(TonModule):
     """Free TON abi SDK API implementation"""
@@ -49,7 +83,7 @@ class TonAbi(TonModule):
         :param params: See `types.ParamsOfDecodeMessage`
         :return: See `types.DecodedMessageBody`
         """
-        response = self.request(method="abi.decode_message", **params.dict)
+        response = self.request(method='abi.decode_message', params_or_str=params)
         return self.response(classname=DecodedMessageBody, response=response)
 
     def decode_message_body(
@@ -61,9 +95,205 @@ class TonAbi(TonModule):
         :param params: See `types.ParamsOfDecodeMessageBody`
         :return: See `types.DecodedMessageBody`
         """
-        response = self.request(method="abi.decode_message_body", **params.dict)
+        response = self.request(method='abi.decode_message_body', params_or_str=params)
         return self.response(classname=DecodedMessageBody, response=response)
 
+    # region hand-written
+    def decode_message_stream(
+        self,
+        abi: AbiType,
+        messages: Union[Iterable[str], AsyncIterable[str]],
+        in_flight: int = BATCH_WORKERS,
+        skip_invalid: bool = False,
+        allow_partial: bool = False,
+    ) -> Union[Iterator[DecodedMessageBody], AsyncIterator[DecodedMessageBody]]:
+        """
+        Decodes message bodies of messages stream with `decode_message`.
+        See `decode_message_body_stream` for details, results are types
+        objects regardless of client raw mode
+
+        :param abi: Contract ABI, interned in client ABI registry
+        :param messages: Iterable of messages BOCs, async iterable is
+                accepted by asyncio client
+        :param in_flight: Max decodes in flight
+        :param skip_invalid: Skip messages which can't be decoded instead of
+                raising `TonException`
+        :param allow_partial: See `types.ParamsOfDecodeMessage`
+        :return: Iterator of `types.DecodedMessageBody` in `messages` order,
+                async iterator for asyncio client
+        """
+        abi = self._client.abi_registry.register(abi=abi)
+
+        def _params(message: str) -> ParamsOfDecodeMessage:
+            return ParamsOfDecodeMessage(
+                abi=abi, message=message, allow_partial=allow_partial
+            )
+
+        return self._stream(
+            method=self.decode_message,
+            build=_params,
+            items=messages,
+            in_flight=in_flight,
+            skip_invalid=skip_invalid,
+        )
+
+    def decode_message_body_stream(
+        self,
+        abi: AbiType,
+        bodies: Union[Iterable[str], AsyncIterable[str]],
+        is_internal: bool,
+        in_flight: int = BATCH_WORKERS,
+        skip_invalid: bool = False,
+        allow_partial: bool = False,
+    ) -> Union[Iterator[DecodedMessageBody], AsyncIterator[DecodedMessageBody]]:
+        """
+        Decodes message bodies stream with `decode_message_body`.
+        Bodies are decoded with concurrent core requests, at most
+        `in_flight` of them are in flight and bodies iterable is consumed
+        as results are read, so it may be endless.
+        ABI is interned once and shared by all requests.
+        Results are types objects regardless of client raw mode
+
+        :param abi: Contract ABI, interned in client ABI registry
+        :param bodies: Iterable of bodies BOCs, async iterable is accepted
+                by asyncio client
+        :param is_internal: True if the bodies belong to internal messages
+        :param in_flight: Max decodes in flight
+        :param skip_invalid: Skip bodies which can't be decoded instead of
+                raising `TonException`
+        :param allow_partial: See `types.ParamsOfDecodeMessageBody`
+        :return: Iterator of `types.DecodedMessageBody` in `bodies` order,
+                async iterator for asyncio client
+        """
+        abi = self._client.abi_registry.register(abi=abi)
+
+        def _params(body: str) -> ParamsOfDecodeMessageBody:
+            return ParamsOfDecodeMessageBody(
+                abi=abi, body=body, is_internal=is_internal, allow_partial=allow_partial
+            )
+
+        return self._stream(
+            method=self.decode_message_body,
+            build=_params,
+            items=bodies,
+            in_flight=in_flight,
+            skip_invalid=skip_invalid,
+        )
+
+    def _stream(
+        self,
+        method: Callable,
+        build: Callable,
+        items: Union[Iterable, AsyncIterable],
+        in_flight: int,
+        skip_invalid: bool,
+    ) -> Union[Iterator, AsyncIterator]:
+        """Ordered results of `method` calls with bounded requests in flight"""
+        if in_flight < 1:
+            raise ValueError('`in_flight` must be positive')
+        if self._client.is_async:
+            return self._stream_async(
+                method=method,
+                build=build,
+                items=items,
+                in_flight=in_flight,
+                skip_invalid=skip_invalid,
+            )
+        if not isinstance(items, Iterable):
+            raise TypeError('Async iterable is accepted by asyncio client only')
+        return self._stream_sync(
+            method=method,
+            build=build,
+            items=items,
+            in_flight=in_flight,
+            skip_invalid=skip_invalid,
+        )
+
+    @staticmethod
+    def _stream_sync(
+        method: Callable,
+        build: Callable,
+        items: Iterable,
+        in_flight: int,
+        skip_invalid: bool,
+    ) -> Iterator:
+        iterator = iter(items)
+        exhausted = False
+        pending = collections.deque()
+        executor = ThreadPoolExecutor(max_workers=in_flight)
+        try:
+            while True:
+                while not exhausted and len(pending) < in_flight:
+                    try:
+                        params = build(next(iterator))
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    # Request options of the consumer context apply
+                    context = contextvars.copy_context()
+                    pending.append(
+                        executor.submit(context.run, _typed, method, params)
+                    )
+                if not pending:
+                    return
+
+                try:
+                    result = pending.popleft().result()
+                except TonTimeoutError:
+                    raise
+                except TonException:
+                    if not skip_invalid:
+                        raise
+                    continue
+                yield result
+        finally:
+            # Stream is closed or failed, requests already sent are completed
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    @staticmethod
+    async def _stream_async(
+        method: Callable,
+        build: Callable,
+        items: Union[Iterable, AsyncIterable],
+        in_flight: int,
+        skip_invalid: bool,
+    ) -> AsyncIterator:
+        is_async_iterable = isinstance(items, AsyncIterable)
+        iterator = items.__aiter__() if is_async_iterable else iter(items)
+        exhausted = False
+        pending = collections.deque()
+        try:
+            while True:
+                while not exhausted and len(pending) < in_flight:
+                    try:
+                        if is_async_iterable:
+                            item = await iterator.__anext__()
+                        else:
+                            item = next(iterator)
+                    except (StopIteration, StopAsyncIteration):
+                        exhausted = True
+                        break
+                    request = _typed(method=method, params=build(item))
+                    pending.append(asyncio.ensure_future(request))
+                if not pending:
+                    return
+
+                try:
+                    result = await pending.popleft()
+                except TonTimeoutError:
+                    raise
+                except TonException:
+                    if not skip_invalid:
+                        raise
+                    continue
+                yield result
+        finally:
+            for task in pending:
+                task.cancel()
+    # endregion
+
     def encode_account(
         self, params: ParamsOfEncodeAccount
     ) -> Union[ResultOfEncodeAccount, Awaitable[ResultOfEncodeAccount]]:
@@ -76,7 +306,7 @@ class TonAbi(TonModule):
         :param params: See `types.ParamsOfEncodeAccount`
         :return: See `types.ResultOfEncodeAccount`
         """
-        response = self.request(method="abi.encode_account", **params.dict)
+        response = self.request(method='abi.encode_account', params_or_str=params)
         return self.response(classname=ResultOfEncodeAccount, response=response)
 
     def encode_message(
@@ -104,14 +334,91 @@ class TonAbi(TonModule):
             - `Signer::SigningBox` Allows using a special interface to
               implement signing without private key disclosure to SDK.
               For instance, in case of using a cold wallet or HSM, when
-              application calls some API to sign data.
+              application calls some API to sign data
 
         :param params: See `types.ParamsOfEncodeMessage`
         :return: See `types.ResultOfEncodeMessage`
         """
-        response = self.request(method="abi.encode_message", **params.dict)
+        response = self.request(method='abi.encode_message', params_or_str=params)
         return self.response(classname=ResultOfEncodeMessage, response=response)
 
+    # region hand-written
+    def encode_message_batch(
+        self, params: List[ParamsOfEncodeMessage], workers: int = BATCH_WORKERS
+    ) -> Union[
+        List[Union[ResultOfEncodeMessage, TonException]],
+        Awaitable[List[Union[ResultOfEncodeMessage, TonException]]],
+    ]:
+        """
+        Encodes ABI-compatible messages with concurrent core requests.
+        Messages usually share ABI and signer, ABIs are interned in client
+        ABI registry, so each of them is serialized once.
+        Failed message doesn't fail the batch, its exception is returned
+        in place of the result. Results are types objects regardless of
+        client raw mode
+
+        :param params: List of `types.ParamsOfEncodeMessage`
+        :param workers: Max concurrent core requests (worker threads for
+                sync client)
+        :return: List of `types.ResultOfEncodeMessage` or `TonException`
+                in `params` order
+        """
+        if workers < 1:
+            raise ValueError('`workers` must be positive')
+
+        abis = {}
+        params = [self._with_registered_abi(params=p, abis=abis) for p in params]
+
+        if self._client.is_async:
+            return self._encode_message_batch_async(params=params, workers=workers)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Request options of the caller context apply to all requests
+            futures = [
+                executor.submit(
+                    contextvars.copy_context().run, self._encode_message_or_error, p
+                )
+                for p in params
+            ]
+            return [future.result() for future in futures]
+
+    async def _encode_message_batch_async(
+        self, params: List[ParamsOfEncodeMessage], workers: int
+    ) -> List[Union[ResultOfEncodeMessage, TonException]]:
+        semaphore = asyncio.Semaphore(workers)
+
+        async def _encode(item: ParamsOfEncodeMessage):
+            async with semaphore:
+                try:
+                    return await _typed(method=self.encode_message, params=item)
+                except TonException as exc:
+                    return exc
+
+        return await asyncio.gather(*[_encode(item=p) for p in params])
+
+    def _encode_message_or_error(
+        self, params: ParamsOfEncodeMessage
+    ) -> Union[ResultOfEncodeMessage, TonException]:
+        try:
+            return _typed(method=self.encode_message, params=params)
+        except TonException as exc:
+            return exc
+
+    def _with_registered_abi(self, params: Any, abis: Dict[int, Any]) -> Any:
+        """Params copy with ABI interned in client registry"""
+        abi = abis.get(id(params.abi))
+        if abi is None:
+            abi = abis[id(params.abi)] = self._client.abi_registry.register(
+                abi=params.abi
+            )
+        if abi is params.abi:
+            return params
+
+        kwargs = {name: getattr(params, name) for name in params.__slots__}
+        kwargs['abi'] = abi
+        return params.__class__(**kwargs)
+    # endregion
+
     def encode_message_body(
         self, params: ParamsOfEncodeMessageBody
     ) -> Union[ResultOfEncodeMessageBody, Awaitable[ResultOfEncodeMessageBody]]:
@@ -121,7 +428,7 @@ class TonAbi(TonModule):
         :param params: See `types.ParamsOfEncodeMessageBody`
         :return: See `types.ResultOfEncodeMessageBody`
         """
-        response = self.request(method="abi.encode_message_body", **params.dict)
+        response = self.request(method='abi.encode_message_body', params_or_str=params)
         return self.response(classname=ResultOfEncodeMessageBody, response=response)
 
     def attach_signature(
@@ -134,7 +441,7 @@ class TonAbi(TonModule):
         :param params: See `types.ParamsOfAttachSignature`
         :return: See `types.ResultOfAttachSignature`
         """
-        response = self.request(method="abi.attach_signature", **params.dict)
+        response = self.request(method='abi.attach_signature', params_or_str=params)
         return self.response(classname=ResultOfAttachSignature, response=response)
 
     def attach_signature_to_message_body(
@@ -148,7 +455,7 @@ class TonAbi(TonModule):
         :return: See `types.ResultOfAttachSignatureToMessageBody`
         """
         response = self.request(
-            method="abi.attach_signature_to_message_body", **params.dict
+            method='abi.attach_signature_to_message_body', params_or_str=params
         )
         return self.response(
             classname=ResultOfAttachSignatureToMessageBody, response=response
@@ -175,7 +482,9 @@ class TonAbi(TonModule):
         :param params: See `types.ParamsOfEncodeInternalMessage`
         :return: See `types.ResultOfEncodeInternalMessage`
         """
-        response = self.request(method="abi.encode_internal_message", **params.dict)
+        response = self.request(
+            method='abi.encode_internal_message', params_or_str=params
+        )
         return self.response(classname=ResultOfEncodeInternalMessage, response=response)
 
     def decode_account_data(
@@ -188,7 +497,7 @@ class TonAbi(TonModule):
         :param params: See `types.ParamsOfDecodeAccountData`
         :return: See `types.ResultOfDecodeData`
         """
-        response = self.request(method="abi.decode_account_data", **params.dict)
+        response = self.request(method='abi.decode_account_data', params_or_str=params)
         return self.response(classname=ResultOfDecodeData, response=response)
 
     def encode_initial_data(
@@ -201,10 +510,10 @@ class TonAbi(TonModule):
 
         This function is analogue of `tvm.buildDataInit` function in Solidity
 
-        :param params:
-        :return:
+        :param params: See `types.ParamsOfEncodeInitialData`
+        :return: See `types.ResultOfEncodeInitialData`
         """
-        response = self.request(method="abi.encode_initial_data", **params.dict)
+        response = self.request(method='abi.encode_initial_data', params_or_str=params)
         return self.response(classname=ResultOfEncodeInitialData, response=response)
 
     def update_initial_data(
@@ -221,7 +530,7 @@ class TonAbi(TonModule):
         :param params: See `types.ParamsOfUpdateInitialData`
         :return: See `types.ResultOfUpdateInitialData`
         """
-        response = self.request(method="abi.update_initial_data", **params.dict)
+        response = self.request(method='abi.update_initial_data', params_or_str=params)
         return self.response(classname=ResultOfUpdateInitialData, response=response)
 
     def decode_initial_data(
@@ -238,7 +547,7 @@ class TonAbi(TonModule):
         :param params: See `types.ParamsOfDecodeInitialData`
         :return: See `types.ResultOfDecodeInitialData`
         """
-        response = self.request(method="abi.decode_initial_data", **params.dict)
+        response = self.request(method='abi.decode_initial_data', params_or_str=params)
         return self.response(classname=ResultOfDecodeInitialData, response=response)
 
     def decode_boc(
@@ -267,19 +576,19 @@ class TonAbi(TonModule):
         :param params: See `types.ParamsOfDecodeBoc`
         :return: See `types.ResultOfDecodeBoc`
         """
-        response = self.request(method="abi.decode_boc", **params.dict)
+        response = self.request(method='abi.decode_boc', params_or_str=params)
         return self.response(classname=ResultOfDecodeBoc, response=response)
 
     def encode_boc(
         self, params: ParamsOfAbiEncodeBoc
     ) -> Union[ResultOfAbiEncodeBoc, Awaitable[ResultOfAbiEncodeBoc]]:
         """
-        Encodes given parameters in JSON into a BOC using param types from ABI.
+        Encodes given parameters in JSON into a BOC using param types from ABI
 
         :param params: See `types.ParamsOfAbiEncodeBoc`
         :return: See `types.ResultOfAbiEncodeBoc`
         """
-        response = self.request(method="abi.encode_boc", **params.dict)
+        response = self.request(method='abi.encode_boc', params_or_str=params)
         return self.response(classname=ResultOfAbiEncodeBoc, response=response)
 
     def calc_function_id(
@@ -291,7 +600,7 @@ class TonAbi(TonModule):
         :param params: See `types.ParamsOfCalcFunctionId`
         :return: See `types.ResultOfCalcFunctionId`
         """
-        response = self.request(method="abi.calc_function_id", **params.dict)
+        response = self.request(method='abi.calc_function_id', params_or_str=params)
         return self.response(classname=ResultOfCalcFunctionId, response=response)
 
     def get_signature_data(
@@ -304,5 +613,5 @@ class TonAbi(TonModule):
         :param params: See `types.ParamsOfGetSignatureData`
         :return: See `types.ResultOfGetSignatureData`
         """
-        response = self.request(method="abi.get_signature_data", **params.dict)
+        response = self.request(method='abi.get_signature_data', params_or_str=params)
         return self.response(classname=ResultOfGetSignatureData, response=response)
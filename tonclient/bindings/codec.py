@@ -0,0 +1,134 @@
+"""
+JSON codecs for core requests/responses marshalling.
+All codecs work on bytes, so request params go to the core and responses
+come back without intermediate `str` encoding/decoding.
+Standard library codec is the default one, fast codecs are opt-in (by
+name or `auto`) and are used only if corresponding package is installed
+"""
+import abc
+import json
+from typing import Any, Dict, Type, Union
+
+
+class JsonCodec:
+    """Standard library `json` codec"""
+
+    name = 'json'
+    # Codec `loads` accepts any buffer (e.g. memoryview), not only bytes
+    buffer_input = True
+
+    def dumps(self, obj: Any) -> bytes:
+        """Serialize object to JSON bytes"""
+        return json.dumps(obj).encode()
+
+    def loads(self, data: Union[bytes, bytearray, memoryview]) -> Any:
+        """Deserialize JSON bytes"""
+        return json.loads(str(data, 'utf-8'))
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__} {self.name}>'
+
+
+class _FastJsonCodec(JsonCodec, abc.ABC):
+    """
+    Base for third-party codecs.
+    Values such codecs can't encode (e.g. integers out of 64-bit range,
+    which are valid ABI input values) are encoded by standard library
+    """
+
+    _errors = (TypeError, ValueError, OverflowError)
+
+    def dumps(self, obj: Any) -> bytes:
+        try:
+            return self._dumps(obj)
+        except self._errors:
+            return super().dumps(obj)
+
+    @abc.abstractmethod
+    def _dumps(self, obj: Any) -> bytes:
+        """Serialize object to JSON bytes with third-party package"""
+
+
+class OrjsonCodec(_FastJsonCodec):
+    """
+    `orjson` codec.
+    Note, that `orjson` decodes integers out of 64-bit range as floats, so
+    it is used only if it is chosen explicitly
+    """
+
+    name = 'orjson'
+
+    def __init__(self):
+        import orjson  # pylint: disable=import-outside-toplevel
+
+        self._encode = orjson.dumps
+        self.loads = orjson.loads
+
+    def _dumps(self, obj: Any) -> bytes:
+        return self._encode(obj)
+
+
+class MsgspecCodec(_FastJsonCodec):
+    """`msgspec` codec"""
+
+    name = 'msgspec'
+
+    def __init__(self):
+        import msgspec  # pylint: disable=import-outside-toplevel
+
+        self._encode = msgspec.json.Encoder().encode
+        self.loads = msgspec.json.Decoder().decode
+        self._errors = _FastJsonCodec._errors + (msgspec.EncodeError,)
+
+    def _dumps(self, obj: Any) -> bytes:
+        return self._encode(obj)
+
+
+class UjsonCodec(_FastJsonCodec):
+    """`ujson` codec"""
+
+    name = 'ujson'
+    buffer_input = False
+
+    def __init__(self):
+        import ujson  # pylint: disable=import-outside-toplevel
+
+        self._encode = ujson.dumps
+        self.loads = ujson.loads
+
+    def _dumps(self, obj: Any) -> bytes:
+        return self._encode(obj, ensure_ascii=False).encode()
+
+
+# Codecs in order of preference for `auto` mode
+CODECS: Dict[str, Type[JsonCodec]] = {
+    OrjsonCodec.name: OrjsonCodec,
+    MsgspecCodec.name: MsgspecCodec,
+    UjsonCodec.name: UjsonCodec,
+    JsonCodec.name: JsonCodec,
+}
+
+
+def get_codec(codec: Union[str, JsonCodec, None] = None) -> JsonCodec:
+    """
+    Resolve JSON codec
+
+    :param codec: Codec instance, codec name (see `CODECS`), `auto` for
+            the fastest installed codec or `None` for standard library one
+    :return: Codec instance
+    """
+    if isinstance(codec, JsonCodec):
+        return codec
+    if codec is None:
+        return JsonCodec()
+
+    if codec == 'auto':
+        for codec_class in CODECS.values():
+            try:
+                return codec_class()
+            except ImportError:
+                continue
+
+    if codec not in CODECS:
+        raise ValueError(f'Unknown JSON codec `{codec}`')
+    return CODECS[codec]()
@@ -3,10 +3,18 @@ import ctypes
 import json
 import os
 import platform
+import threading
 
-from typing import Dict, Union
+from typing import Callable, Dict, Union
 
-from .types import TCStringData, TCResponseHandler
+from .codec import JsonCodec
+from .types import (
+    TCClientContext,
+    TCResponse,
+    TCResponseHandler,
+    TCStringData,
+    TCStringHandle,
+)
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
 LIB_DIR = os.path.join(BASE_DIR, 'bin')
@@ -35,57 +43,134 @@ def get_lib_path():
     return fallback
 
 
-_LIB = ctypes.cdll.LoadLibrary(get_lib_path())
+# Library exports signatures: name -> (argtypes, restype)
+TC_SIGNATURES = {
+    'tc_create_context': ([TCStringData], TCStringHandle),
+    'tc_destroy_context': ([TCClientContext], None),
+    'tc_request': (
+        [
+            TCClientContext,
+            TCStringData,
+            TCStringData,
+            ctypes.c_int32,
+            TCResponseHandler,
+        ],
+        None,
+    ),
+    'tc_request_sync': (
+        [TCClientContext, TCStringData, TCStringData],
+        TCStringHandle,
+    ),
+    'tc_read_string': ([TCStringHandle], TCStringData),
+    'tc_destroy_string': ([TCStringHandle], None),
+}
+
+
+def bind_library(lib: ctypes.CDLL) -> Dict[str, Callable]:
+    """
+    Build dispatch table for library `tc_*` exports.
+    Functions `argtypes` and `restype` are set once here, so ctypes does not
+    re-derive arguments conversions on each call
+
+    :param lib: Loaded core library
+    :return: Dict of export name -> typed function
+    """
+    table = {}
+    for name, (argtypes, restype) in TC_SIGNATURES.items():
+        function = getattr(lib, name)
+        function.argtypes = argtypes
+        function.restype = restype
+        table[name] = function
+    return table
+
+
+# Dispatch table is filled on library load, see `preload`
+_TC: Dict[str, Callable] = {}
+_TC_PATH = None
+_TC_LOCK = threading.Lock()
+
+
+def preload(path: str = None) -> str:
+    """
+    Load core library.
+    Library is loaded on the first client context creation, call this
+    to pay the loading cost up front or to load library from custom path
+
+    :param path: Library path, default is `get_lib_path()`
+    :return: Loaded library path
+    """
+    global _TC_PATH  # pylint: disable=global-statement
+
+    if _TC_PATH is None:
+        with _TC_LOCK:
+            if _TC_PATH is None:
+                path = path or get_lib_path()
+                _TC.update(bind_library(lib=ctypes.cdll.LoadLibrary(path)))
+                _TC_PATH = path
+    return _TC_PATH
 
 
 def tc_create_context(
     config: Dict[str, Dict[str, Union[str, int, float]]]
-) -> ctypes.POINTER(ctypes.c_char_p):
+) -> TCStringHandle:
     """Create client context"""
+    preload()
     _config = TCStringData.from_string(string=json.dumps(config))
+    return _TC['tc_create_context'](_config)
 
-    _LIB.tc_create_context.restype = ctypes.POINTER(ctypes.c_char_p)
-    return _LIB.tc_create_context(_config)
 
-
-def tc_destroy_context(ctx: ctypes.c_int32):
+def tc_destroy_context(ctx: TCClientContext):
     """Destroy client context"""
-    _LIB.tc_destroy_context(ctx)
+    _TC['tc_destroy_context'](ctx)
 
 
 def tc_request(
-    ctx: ctypes.c_int32,
+    ctx: TCClientContext,
     method: str,
     request_id: int,
     response_handler: TCResponseHandler,
-    params_json: str = None,
+    params_json: Union[str, bytes] = None,
 ):
     """Make async request"""
-    # Cast args to ctypes
-    method = TCStringData.from_string(string=method)
-    request_id = ctypes.c_int32(request_id)
-    params_json = TCStringData.from_string(string=params_json)
-
-    _LIB.tc_request(ctx, method, params_json, request_id, response_handler)
+    _TC['tc_request'](
+        ctx,
+        TCStringData.from_string(string=method),
+        TCStringData.from_string(string=params_json),
+        request_id,
+        response_handler,
+    )
 
 
 def tc_request_sync(
-    ctx: ctypes.c_int32, method: str, params_json: str = None
-) -> ctypes.POINTER(ctypes.c_char_p):
+    ctx: TCClientContext, method: str, params_json: Union[str, bytes] = None
+) -> TCStringHandle:
     """Make sync request (might be deprecated)"""
-    method = TCStringData.from_string(string=method)
-    params_json = TCStringData.from_string(string=params_json)
-
-    _LIB.tc_request_sync.restype = ctypes.POINTER(ctypes.c_char_p)
-    return _LIB.tc_request_sync(ctx, method, params_json)
+    return _TC['tc_request_sync'](
+        ctx,
+        TCStringData.from_string(string=method),
+        TCStringData.from_string(string=params_json),
+    )
 
 
-def tc_destroy_string(string: ctypes.POINTER(ctypes.c_char_p)):
+def tc_destroy_string(string: TCStringHandle):
     """Destroy string"""
-    _LIB.tc_destroy_string(string)
-
-
-def tc_read_string(string: ctypes.POINTER(ctypes.c_char_p)) -> TCStringData:
-    """Read string"""
-    _LIB.tc_read_string.restype = TCStringData
-    return _LIB.tc_read_string(string)
+    _TC['tc_destroy_string'](string)
+
+
+def tc_read_string(string: TCStringHandle) -> TCStringData:
+    """
+    Read string.
+    Result points to the string memory, so it must be read before
+    `tc_destroy_string` is called (see `TCStringData`)
+    """
+    return _TC['tc_read_string'](string)
+
+
+def tc_read_response(
+    string: TCStringHandle, codec: JsonCodec = None
+) -> TCResponse:
+    """Read and parse response string, then destroy it"""
+    try:
+        return TCResponse(tc_read_string(string=string), codec=codec)
+    finally:
+        tc_destroy_string(string=string)
@@ -1,31 +1,69 @@
 """Library binding types"""
 import ctypes
 import json
+from typing import Any, Union
+
+from .codec import JsonCodec
 
 
 class TCStringData(ctypes.Structure):
-    """TCStringData"""
+    """
+    TCStringData.
+    Strings received from core point to the core's memory, which is valid
+    only until `tc_destroy_string` is called for the sync response or until
+    the response handler returns for async responses.
+    `view` gives no-copy access to this memory and must not be used after
+    that, `to_bytes`, `string` and `json` are copies and have no limitations.
+    `json` and `loads` decode UTF-8 strictly and raise `ValueError` on
+    malformed content, `string` (used for logs) replaces it
+    """
 
     _fields_ = [('content', ctypes.c_char_p), ('len', ctypes.c_int32)]
 
+    @property
+    def address(self) -> int:
+        """Address of content (reading `content` field would copy it)"""
+        return ctypes.c_void_p.from_buffer(self, TCStringData.content.offset).value
+
+    @property
+    def view(self) -> memoryview:
+        """No-copy view of content, see class docstring for lifetime"""
+        buffer = (ctypes.c_char * self.len).from_address(self.address)
+        return memoryview(buffer).cast('B')
+
+    @property
+    def to_bytes(self) -> bytes:
+        """Content copied to bytes"""
+        return ctypes.string_at(self.address, self.len)
+
     @property
     def string(self):
-        """Response as string"""
+        """Response as string, malformed UTF-8 is replaced"""
         if self.len:
-            return self.content[: self.len].decode(errors='replace')
+            return self.to_bytes.decode(errors='replace')
         return None
 
     @property
     def json(self):
         """Response as JSON"""
-        if self.string:
-            return json.loads(self.string)
+        if self.len:
+            return json.loads(self.to_bytes.decode())
+        return None
+
+    def loads(self, codec: JsonCodec) -> Any:
+        """
+        Response decoded with JSON codec.
+        Codec reads core's memory directly if it supports buffers input
+        """
+        if self.len:
+            return codec.loads(self.view if codec.buffer_input else self.to_bytes)
         return None
 
     @staticmethod
-    def from_string(string: str):
-        """StringData from string"""
-        string = string.encode()
+    def from_string(string: Union[str, bytes]):
+        """StringData from string or already encoded bytes"""
+        if isinstance(string, str):
+            string = string.encode()
         return TCStringData(ctypes.c_char_p(string), len(string))
 
     def __str__(self):
@@ -34,25 +72,66 @@ class TCStringData(ctypes.Structure):
     __repr__ = __str__
 
 
+class TCResponse:
+    """
+    Core response envelope.
+    Native string is copied and parsed once on creation, so `result` and
+    `error` are read from that single parse
+    """
+
+    __slots__ = ('data', 'size')
+
+    def __init__(self, string_data: TCStringData, codec: JsonCodec = None):
+        self.size = string_data.len
+        if codec is None:
+            self.data = string_data.json or {}
+        else:
+            self.data = string_data.loads(codec=codec) or {}
+
+    @property
+    def is_success(self):
+        """Request status"""
+        return not self.error
+
+    @property
+    def result(self):
+        """Parsed response result"""
+        return self.data.get('result')
+
+    @property
+    def error(self):
+        """Parsed request error"""
+        return self.data.get('error')
+
+
 class TCSyncResponseData(ctypes.Structure):
     """TCSyncResponseData"""
 
     _fields_ = [('string_data', TCStringData)]
+    # Instances are created by ctypes without `__init__`
+    _response = None
+
+    @property
+    def response(self) -> TCResponse:
+        """Response envelope, parsed on first access"""
+        if self._response is None:
+            self._response = TCResponse(self.string_data)
+        return self._response
 
     @property
     def is_success(self):
         """Request status"""
-        return not self.error
+        return self.response.is_success
 
     @property
     def result(self):
         """Parsed response result"""
-        return self.string_data.json.get('result')
+        return self.response.result
 
     @property
     def error(self):
         """Parsed request error"""
-        return self.string_data.json.get('error')
+        return self.response.error
 
     def __str__(self):
         return self.string_data.__str__()
@@ -72,6 +151,7 @@ class TCResponseType:
 
 
 TCClientContext = ctypes.c_int32
+TCStringHandle = ctypes.POINTER(ctypes.c_char_p)
 TCResponseHandler = ctypes.CFUNCTYPE(
     ctypes.c_void_p, ctypes.c_int32, TCStringData, ctypes.c_int32, ctypes.c_bool
 )
@@ -1,40 +1,40 @@
 """BOC module methods"""
-from typing import Union, Awaitable
+from typing import Awaitable, Union
 
 from tonclient.module import TonModule
 from tonclient.types import (
-    ParamsOfParse,
-    ResultOfParse,
-    ParamsOfParseShardstate,
-    ParamsOfGetBocHash,
-    ResultOfGetBocHash,
-    ParamsOfGetBlockchainConfig,
-    ResultOfGetBlockchainConfig,
-    ParamsOfGetCodeFromTvc,
-    ResultOfGetCodeFromTvc,
     ParamsOfBocCacheGet,
-    ResultOfBocCacheGet,
     ParamsOfBocCacheSet,
-    ResultOfBocCacheSet,
     ParamsOfBocCacheUnpin,
+    ParamsOfDecodeStateInit,
+    ParamsOfDecodeTvc,
     ParamsOfEncodeBoc,
-    ResultOfEncodeBoc,
+    ParamsOfEncodeExternalInMessage,
+    ParamsOfEncodeStateInit,
+    ParamsOfGetBlockchainConfig,
+    ParamsOfGetBocDepth,
+    ParamsOfGetBocHash,
+    ParamsOfGetCodeFromTvc,
     ParamsOfGetCodeSalt,
-    ResultOfGetCodeSalt,
+    ParamsOfGetCompilerVersion,
+    ParamsOfParse,
+    ParamsOfParseShardstate,
     ParamsOfSetCodeSalt,
-    ResultOfSetCodeSalt,
-    ParamsOfDecodeTvc,
+    ResultOfBocCacheGet,
+    ResultOfBocCacheSet,
+    ResultOfDecodeStateInit,
     ResultOfDecodeTvc,
-    ParamsOfEncodeStateInit,
+    ResultOfEncodeBoc,
+    ResultOfEncodeExternalInMessage,
     ResultOfEncodeStateInit,
-    ParamsOfGetCompilerVersion,
-    ResultOfGetCompilerVersion,
-    ParamsOfGetBocDepth,
+    ResultOfGetBlockchainConfig,
     ResultOfGetBocDepth,
-    ParamsOfEncodeExternalInMessage,
-    ResultOfEncodeExternalInMessage,
-    ParamsOfDecodeStateInit,
-    ResultOfDecodeStateInit,
+    ResultOfGetBocHash,
+    ResultOfGetCodeFromTvc,
+    ResultOfGetCodeSalt,
+    ResultOfGetCompilerVersion,
+    ResultOfParse,
+    ResultOfSetCodeSalt,
 )
 
 
@@ -51,7 +51,7 @@ class TonBoc(TonModule):
         :param params: See `types.ParamsOfParse`
         :return: See `types.ResultOfParse`
         """
-        response = self.request(method='boc.parse_message', **params.dict)
+        response = self.request(method='boc.parse_message', params_or_str=params)
         return self.response(classname=ResultOfParse, response=response)
 
     def parse_transaction(
@@ -64,7 +64,7 @@ class TonBoc(TonModule):
         :param params: See `types.ParamsOfParse`
         :return: See `types.ResultOfParse`
         """
-        response = self.request(method='boc.parse_transaction', **params.dict)
+        response = self.request(method='boc.parse_transaction', params_or_str=params)
         return self.response(classname=ResultOfParse, response=response)
 
     def parse_account(
@@ -77,7 +77,7 @@ class TonBoc(TonModule):
         :param params: See `types.ParamsOfParse`
         :return: See `types.ResultOfParse`
         """
-        response = self.request(method='boc.parse_account', **params.dict)
+        response = self.request(method='boc.parse_account', params_or_str=params)
         return self.response(classname=ResultOfParse, response=response)
 
     def parse_block(
@@ -90,7 +90,7 @@ class TonBoc(TonModule):
         :param params: See `types.ParamsOfParse`
         :return: See `types.ResultOfParse`
         """
-        response = self.request(method='boc.parse_block', **params.dict)
+        response = self.request(method='boc.parse_block', params_or_str=params)
         return self.response(classname=ResultOfParse, response=response)
 
     def parse_shardstate(
@@ -100,10 +100,10 @@ class TonBoc(TonModule):
         Parses shardstate boc into a JSON.
         JSON structure is compatible with GraphQL API shardstate object
 
-        :param params: See `ParamsOfParseShardstate`
-        :return: See `ResultOfParse`
+        :param params: See `types.ParamsOfParseShardstate`
+        :return: See `types.ResultOfParse`
         """
-        response = self.request(method='boc.parse_shardstate', **params.dict)
+        response = self.request(method='boc.parse_shardstate', params_or_str=params)
         return self.response(classname=ResultOfParse, response=response)
 
     def get_boc_hash(
@@ -112,10 +112,10 @@ class TonBoc(TonModule):
         """
         Calculates BOC root hash
 
-        :param params: See `ParamsOfGetBocHash`
-        :return: See `ResultOfGetBocHash`
+        :param params: See `types.ParamsOfGetBocHash`
+        :return: See `types.ResultOfGetBocHash`
         """
-        response = self.request(method='boc.get_boc_hash', **params.dict)
+        response = self.request(method='boc.get_boc_hash', params_or_str=params)
         return self.response(classname=ResultOfGetBocHash, response=response)
 
     def get_blockchain_config(
@@ -125,10 +125,12 @@ class TonBoc(TonModule):
         Extract blockchain configuration from key block and also from
         zero state
 
-        :param params: See `ParamsOfGetBlockchainConfig`
-        :return: See `ResultOfGetBlockchainConfig`
+        :param params: See `types.ParamsOfGetBlockchainConfig`
+        :return: See `types.ResultOfGetBlockchainConfig`
         """
-        response = self.request(method='boc.get_blockchain_config', **params.dict)
+        response = self.request(
+            method='boc.get_blockchain_config', params_or_str=params
+        )
         return self.response(classname=ResultOfGetBlockchainConfig, response=response)
 
     def get_code_from_tvc(
@@ -140,7 +142,7 @@ class TonBoc(TonModule):
         :param params: See `types.ParamsOfGetCodeFromTvc`
         :return: See `types.ResultOfGetCodeFromTvc`
         """
-        response = self.request(method='boc.get_code_from_tvc', **params.dict)
+        response = self.request(method='boc.get_code_from_tvc', params_or_str=params)
         return self.response(classname=ResultOfGetCodeFromTvc, response=response)
 
     def cache_get(
@@ -152,7 +154,7 @@ class TonBoc(TonModule):
         :param params: See `types.ParamsOfBocCacheGet`
         :return: See `types.ResultOfBocCacheGet`
         """
-        response = self.request(method='boc.cache_get', **params.dict)
+        response = self.request(method='boc.cache_get', params_or_str=params)
         return self.response(classname=ResultOfBocCacheGet, response=response)
 
     def cache_set(
@@ -164,7 +166,7 @@ class TonBoc(TonModule):
         :param params: See `types.ParamsOfBocCacheSet`
         :return: See `types.ResultOfBocCacheSet`
         """
-        response = self.request(method='boc.cache_set', **params.dict)
+        response = self.request(method='boc.cache_set', params_or_str=params)
         return self.response(classname=ResultOfBocCacheSet, response=response)
 
     def cache_unpin(
@@ -175,9 +177,8 @@ class TonBoc(TonModule):
         BOCs which don't have another pins will be removed from cache
 
         :param params: See `types.ParamsOfBocCacheUnpin`
-        :return:
         """
-        return self.request(method='boc.cache_unpin', **params.dict)
+        return self.request(method='boc.cache_unpin', params_or_str=params)
 
     def encode_boc(
         self, params: ParamsOfEncodeBoc
@@ -191,7 +192,7 @@ class TonBoc(TonModule):
         :param params: See `types.ParamsOfEncodeBoc`
         :return: See `types.ResultOfEncodeBoc`
         """
-        response = self.request(method='boc.encode_boc', **params.dict)
+        response = self.request(method='boc.encode_boc', params_or_str=params)
         return self.response(classname=ResultOfEncodeBoc, response=response)
 
     def get_code_salt(
@@ -203,7 +204,7 @@ class TonBoc(TonModule):
         :param params: See `types.ParamsOfGetCodeSalt`
         :return: See `types.ResultOfGetCodeSalt`
         """
-        response = self.request(method='boc.get_code_salt', **params.dict)
+        response = self.request(method='boc.get_code_salt', params_or_str=params)
         return self.response(classname=ResultOfGetCodeSalt, response=response)
 
     def set_code_salt(
@@ -216,7 +217,7 @@ class TonBoc(TonModule):
         :param params: See `types.ParamsOfSetCodeSalt`
         :return: See `types.ResultOfSetCodeSalt`
         """
-        response = self.request(method='boc.set_code_salt', **params.dict)
+        response = self.request(method='boc.set_code_salt', params_or_str=params)
         return self.response(classname=ResultOfSetCodeSalt, response=response)
 
     def decode_tvc(
@@ -228,19 +229,19 @@ class TonBoc(TonModule):
         :param params: See `types.ParamsOfDecodeTvc`
         :return: See `types.ResultOfDecodeTvc`
         """
-        response = self.request(method='boc.decode_tvc', **params.dict)
+        response = self.request(method='boc.decode_tvc', params_or_str=params)
         return self.response(classname=ResultOfDecodeTvc, response=response)
 
     def decode_state_init(
         self, params: ParamsOfDecodeStateInit
     ) -> Union[ResultOfDecodeStateInit, Awaitable[ResultOfDecodeStateInit]]:
         """
-        Decodes contract's initial state into code, data, libraries and special options.
+        Decodes contract's initial state into code, data, libraries and special options
 
         :param params: See `types.ParamsOfDecodeStateInit`
         :return: See `types.ResultOfDecodeStateInit`
         """
-        response = self.request(method='boc.decode_state_init', **params.dict)
+        response = self.request(method='boc.decode_state_init', params_or_str=params)
         return self.response(classname=ResultOfDecodeStateInit, response=response)
 
     def encode_state_init(
@@ -253,7 +254,7 @@ class TonBoc(TonModule):
         :param params: See `types.ParamsOfEncodeStateInit`
         :return: See `types.ResultOfEncodeStateInit`
         """
-        response = self.request(method='boc.encode_state_init', **params.dict)
+        response = self.request(method='boc.encode_state_init', params_or_str=params)
         return self.response(classname=ResultOfEncodeStateInit, response=response)
 
     def get_compiler_version(
@@ -265,7 +266,7 @@ class TonBoc(TonModule):
         :param params: See `types.ParamsOfGetCompilerVersion`
         :return: See `types.ResultOfGetCompilerVersion`
         """
-        response = self.request(method='boc.get_compiler_version', **params.dict)
+        response = self.request(method='boc.get_compiler_version', params_or_str=params)
         return self.response(classname=ResultOfGetCompilerVersion, response=response)
 
     def get_boc_depth(
@@ -277,7 +278,7 @@ class TonBoc(TonModule):
         :param params: See `types.ParamsOfGetBocDepth`
         :return: See `types.ResultOfGetBocDepth`
         """
-        response = self.request(method='boc.get_boc_depth', **params.dict)
+        response = self.request(method='boc.get_boc_depth', params_or_str=params)
         return self.response(classname=ResultOfGetBocDepth, response=response)
 
     def encode_external_in_message(
@@ -287,12 +288,14 @@ class TonBoc(TonModule):
     ]:
         """
         Encodes a message.
-        Allows to encode any external inbound message.
+        Allows to encode any external inbound message
 
-        :params params: See `types.ParamsOfEncodeExternalInMessage`
+        :param params: See `types.ParamsOfEncodeExternalInMessage`
         :return: See `types.ResultOfEncodeExternalInMessage`
         """
-        response = self.request(method='boc.encode_external_in_message', **params.dict)
+        response = self.request(
+            method='boc.encode_external_in_message', params_or_str=params
+        )
         return self.response(
             classname=ResultOfEncodeExternalInMessage, response=response
         )
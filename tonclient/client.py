@@ -1,37 +1,45 @@
 """Everscale client module"""
 from typing import Awaitable, Union
 
+from tonclient.module import TonModule
+from tonclient.types import (
+    ClientConfig,
+    ParamsOfResolveAppRequest,
+    ResultOfBuildInfo,
+    ResultOfGetApiReference,
+    ResultOfVersion,
+)
+
+
+# region hand-written
+from typing import Dict
+
+from tonclient.abi import TonAbi
+from tonclient.bindings.codec import JsonCodec, get_codec
 from tonclient.bindings.lib import (
     LIB_VERSION,
-    get_lib_path,
+    preload,
     tc_create_context,
     tc_destroy_context,
-    tc_read_string,
-    tc_destroy_string,
+    tc_read_response,
 )
-from tonclient.bindings.types import TCClientContext, TCSyncResponseData
+from tonclient.bindings.types import TCClientContext
 from tonclient.boc import TonBoc
+from tonclient.crypto import TonCrypto
 from tonclient.debot import TonDebot
 from tonclient.errors import TonException
-from tonclient.module import TonModule
-from tonclient.crypto import TonCrypto
+from tonclient.limiter import ConcurrencyLimiter
+from tonclient.metrics import ClientMetrics
+from tonclient.module import ResponseRouter, check_raw
 from tonclient.net import TonNet
-from tonclient.abi import TonAbi
 from tonclient.processing import TonProcessing
 from tonclient.proofs import TonProofs
+from tonclient.registry import AbiRegistry
+from tonclient.tracing import Tracer
 from tonclient.tvm import TonTvm
-from tonclient.types import (
-    ClientError,
-    ClientConfig,
-    BindingConfig,
-    ResultOfVersion,
-    ResultOfGetApiReference,
-    ResultOfBuildInfo,
-    ParamsOfResolveAppRequest,
-)
+from tonclient.types import BindingConfig, ClientError
 from tonclient.utils import TonUtils
 
-
 DEVNET_BASE_URLS = [
     'eri01.net.everos.dev',
     'rbx01.net.everos.dev',
@@ -44,56 +52,114 @@ MAINNET_BASE_URLS = [
     'lim01.main.everos.dev',
     'rbx01.main.everos.dev',
 ]
+# endregion
 
 
 class TonClientBase(TonModule):
-    """Client module methods"""
+    """Free TON client SDK API implementation"""
 
     def version(self) -> Union[ResultOfVersion, Awaitable[ResultOfVersion]]:
-        """Returns Core Library version"""
+        """
+        Returns Core Library version
+
+        :return: See `types.ResultOfVersion`
+        """
         response = self.request(method='client.version')
         return self.response(classname=ResultOfVersion, response=response)
 
     def get_api_reference(
         self,
     ) -> Union[ResultOfGetApiReference, Awaitable[ResultOfGetApiReference]]:
-        """Returns Core Library API reference"""
+        """
+        Returns Core Library API reference
+
+        :return: See `types.ResultOfGetApiReference`
+        """
         response = self.request(method='client.get_api_reference')
         return self.response(classname=ResultOfGetApiReference, response=response)
 
     def build_info(self) -> Union[ResultOfBuildInfo, Awaitable[ResultOfBuildInfo]]:
-        """Get build info"""
+        """
+        Get build info
+
+        :return: See `types.ResultOfBuildInfo`
+        """
         response = self.request(method='client.build_info')
         return self.response(classname=ResultOfBuildInfo, response=response)
 
     def resolve_app_request(
         self, params: ParamsOfResolveAppRequest
     ) -> Union[None, Awaitable[None]]:
-        """Resolves application request processing result"""
-        return self.request(method='client.resolve_app_request', **params.dict)
+        """
+        Resolves application request processing result
+
+        :param params: See `types.ParamsOfResolveAppRequest`
+        """
+        return self.request(method='client.resolve_app_request', params_or_str=params)
 
     def config(self) -> Union[ClientConfig, Awaitable[ClientConfig]]:
-        """Get client config"""
+        """
+        Get client config
+
+        :return: See `types.ClientConfig`
+        """
         response = self.request(method='client.config')
         return self.response(classname=ClientConfig, response=response)
 
 
+# region hand-written
 class TonClient:
     """Main client class to create object of"""
 
     def __init__(
-        self, config: ClientConfig, is_core_async: bool = True, is_async: bool = False
+        self,
+        config: ClientConfig,
+        is_core_async: bool = True,
+        is_async: bool = False,
+        codec: Union[str, JsonCodec] = None,
+        metrics: Union[bool, ClientMetrics] = False,
+        tracer: Tracer = None,
+        timeout: float = None,
+        limits: Dict[str, int] = None,
+        raw: str = None,
     ):
         """
         :param config: ClientConfig object
         :param is_core_async: Use sync or async core requests
         :param is_async: Client mode
+        :param codec: JSON codec for requests/responses, codec name
+                (`orjson`, `msgspec`, `ujson`, `json`), `auto` for the fastest
+                installed one or instance. Default is standard library `json`
+        :param metrics: Collect requests metrics, `ClientMetrics` instance
+                may be passed to share metrics between clients
+        :param tracer: Requests tracer, e.g. `OpenTelemetryTracer`
+        :param timeout: Default async core requests timeout in seconds,
+                may be overridden with `tonclient.module.request_options`
+        :param limits: Max concurrent requests per method prefix, e.g.
+                `{'net.': 100, 'processing.': 10}`, excess requests wait
+                in FIFO queue
+        :param raw: Return results as parsed dicts (`'dict'`) or as
+                undecoded JSON (`'bytes'`) instead of types objects, may be
+                overridden with `tonclient.module.request_options`
         """
         super().__init__()
 
         self._ctx = self.create_context(config=config)
         self._is_core_async = is_core_async
         self._is_async = is_async
+        self._timeout = timeout
+        check_raw(raw=raw)
+        self._raw = raw
+        self._limiter = ConcurrencyLimiter(limits=limits) if limits else None
+        self._abi_registry = AbiRegistry()
+        self._codec = get_codec(codec=codec)
+        if metrics is True:
+            metrics = ClientMetrics()
+        self._metrics = metrics or None
+        self._tracer = tracer
+        self._router = ResponseRouter(
+            codec=self._codec, metrics=self._metrics, tracer=self._tracer
+        )
 
         self.base = TonClientBase(client=self)
         self.crypto = TonCrypto(client=self)
@@ -126,6 +192,46 @@ class TonClient:
         """Client mode"""
         return self._is_async
 
+    @property
+    def timeout(self) -> Union[float, None]:
+        """Default requests timeout"""
+        return self._timeout
+
+    @property
+    def raw(self) -> Union[str, None]:
+        """Default raw result mode, `None` if results are types objects"""
+        return self._raw
+
+    @property
+    def limiter(self) -> Union[ConcurrencyLimiter, None]:
+        """Requests concurrency limiter, `None` if requests are not limited"""
+        return self._limiter
+
+    @property
+    def abi_registry(self) -> AbiRegistry:
+        """Client ABI registry, interned ABIs are serialized once"""
+        return self._abi_registry
+
+    @property
+    def codec(self) -> JsonCodec:
+        """Client JSON codec"""
+        return self._codec
+
+    @property
+    def metrics(self) -> Union[ClientMetrics, None]:
+        """Client requests metrics, `None` if disabled"""
+        return self._metrics
+
+    @property
+    def tracer(self) -> Union[Tracer, None]:
+        """Client requests tracer, `None` if not installed"""
+        return self._tracer
+
+    @property
+    def router(self) -> ResponseRouter:
+        """Client core responses router"""
+        return self._router
+
     @property
     def version(self):
         """Client base shortcut"""
@@ -149,22 +255,16 @@ class TonClient:
     @staticmethod
     def create_context(config: ClientConfig) -> TCClientContext:
         """Create context"""
-        config.binding = BindingConfig(library=get_lib_path(), version=LIB_VERSION)
+        config.binding = BindingConfig(library=preload(), version=LIB_VERSION)
 
         response_ptr = tc_create_context(config=config.dict)
-        response = TCSyncResponseData(tc_read_string(string=response_ptr))
-        is_success, result, error = (
-            response.is_success,
-            response.result,
-            response.error,
-        )
-        tc_destroy_string(response_ptr)
-
-        if not is_success:
-            raise TonException(error=ClientError(**error))
+        response = tc_read_response(string=response_ptr)
+        if not response.is_success:
+            raise TonException(error=ClientError(**response.error))
 
-        return TCClientContext(result)
+        return TCClientContext(response.result)
 
     def destroy_context(self):
         """Destroy context"""
         tc_destroy_context(ctx=self._ctx)
+# endregion
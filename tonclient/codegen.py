@@ -0,0 +1,1030 @@
+"""
+Types and module methods generator.
+Regenerates `tonclient/types/<module>.py` and methods of
+`tonclient/<module>.py` from the core API reference: `client.get_api_reference()`
+result or its saved JSON copy, `api.json` is checked in, so it runs offline.
+Generated types have `__slots__`, `dict` property for types which are
+sent to the core and `from_dict` for nested results, compiled serializers
+and decoders are built from them.
+Hand-written code (e.g. `Abi.from_path`, app objects, `TonClient` itself)
+is kept in `# region hand-written` ... `# endregion` blocks, which are
+carried over to regenerated sources: block follows the same generated item
+as before and replaces generated items of names it defines.
+
+    python -m tonclient.codegen --save
+    python -m tonclient.codegen
+"""
+import argparse
+import io
+import json
+import os
+import re
+import shutil
+import textwrap
+import tokenize
+from typing import Any, Dict, Iterable, List, Set, Tuple, Union
+
+LINE_LENGTH = 88
+INDENT = ' ' * 4
+
+# Core types which are passed as is
+VALUE_TYPES = ('Value', 'API')
+
+PRIMITIVES = {'String': 'str', 'Boolean': 'bool', 'BigInt': 'int', 'None': 'None'}
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(PACKAGE_DIR)
+API_REFERENCE = os.path.join(ROOT_DIR, 'api.json')
+
+# Markers of hand-written blocks
+REGION = '# region hand-written'
+END_REGION = '# endregion'
+
+# Name defined by a line: class, function or assignment target
+DEFINITION = re.compile(r'(?:class|def) (\w+)|(\w+)(?:: [^=]+)? = ')
+
+
+class ApiReference:
+    """Core API reference with types index"""
+
+    def __init__(self, api: Dict[str, Any]):
+        """
+        :param api: API reference, `ResultOfGetApiReference.api`
+        """
+        self.version = api.get('version')
+        self.modules = api['modules']
+        self.types = {
+            f'{module["name"]}.{typedef["name"]}': typedef
+            for module in self.modules
+            for typedef in module['types']
+        }
+
+    @staticmethod
+    def load(path: str) -> 'ApiReference':
+        """Load saved API reference"""
+        with open(path, encoding='utf8') as fp:
+            api = json.load(fp)
+        return ApiReference(api=api.get('api', api))
+
+    def resolve(self, ref_name: str) -> Union[Dict[str, Any], None]:
+        """Get type definition by ref name, `None` for core value types"""
+        return self.types.get(ref_name)
+
+    def referenced(self, roots: Iterable[Dict[str, Any]]) -> Set[str]:
+        """Ref names of types used by type definitions recursively"""
+        found = set()
+        stack = list(roots)
+        while stack:
+            node = stack.pop()
+            if isinstance(node, list):
+                stack.extend(node)
+                continue
+            if not isinstance(node, dict):
+                continue
+            ref_name = node.get('ref_name')
+            if node.get('type') == 'Ref' and ref_name not in found:
+                typedef = self.resolve(ref_name=ref_name)
+                if typedef is not None:
+                    found.add(ref_name)
+                    stack.append(typedef)
+            stack.extend(v for v in node.values() if isinstance(v, (dict, list)))
+        return found
+
+
+def generate(
+    reference: ApiReference, out: str = ROOT_DIR, sources: str = ROOT_DIR
+) -> List[str]:
+    """
+    Generate sources
+
+    :param reference: API reference
+    :param out: Output directory, sources are written to `tonclient` and
+            `tonclient/types` subdirectories, in place by default
+    :param sources: Directory of current sources, which hand-written
+            blocks are carried over from
+    :return: Paths of generated files
+    """
+    params, results = [], []
+    for module in reference.modules:
+        for function in module['functions']:
+            for param in function['params'][1:]:
+                if param.get('generic_name') == 'AppObject':
+                    # App object receives requests and sends results
+                    results.append(param['generic_args'][0])
+                    params.extend(param['generic_args'][1:])
+                else:
+                    params.append(param)
+            results.append(function['result'])
+    # Client config is sent on context creation
+    params.append({'type': 'Ref', 'ref_name': 'client.ClientConfig'})
+
+    sent = reference.referenced(roots=params)
+    received = reference.referenced(roots=results)
+    package_dir = os.path.join(out, 'tonclient')
+    sources_dir = os.path.join(sources, 'tonclient')
+    os.makedirs(os.path.join(package_dir, 'types'), exist_ok=True)
+
+    paths = []
+    exports = {}
+    for module in reference.modules:
+        generator = ModuleGenerator(
+            reference=reference, module=module, sent=sent, received=received
+        )
+        for path, source in (
+            (os.path.join('types', f'{module["name"]}.py'), generator.types_source()),
+            (f'{module["name"]}.py', generator.methods_source()),
+        ):
+            existing = _read(path=os.path.join(sources_dir, path))
+            paths.append(
+                _write(
+                    path=os.path.join(package_dir, path),
+                    source=merge(source=source, existing=existing),
+                )
+            )
+        exports[module['name']] = generator.exports
+
+    # Base types are hand-written, types index is updated in place
+    types_dir = os.path.join(package_dir, 'types')
+    if os.path.abspath(out) != os.path.abspath(sources):
+        shutil.copy(os.path.join(sources_dir, 'types', 'base.py'), types_dir)
+    paths.append(os.path.join(types_dir, 'base.py'))
+    index = _read(path=os.path.join(sources_dir, 'types', '__init__.py'))
+    source = re.sub(
+        r'^_MODULES = \{\n.*?^\}\n',
+        lambda _: _modules_index(exports=exports),
+        index,
+        count=1,
+        flags=re.MULTILINE | re.DOTALL,
+    )
+    paths.append(_write(path=os.path.join(types_dir, '__init__.py'), source=source))
+    return paths
+
+
+def _read(path: str) -> Union[str, None]:
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding='utf8') as fp:
+        return fp.read()
+
+
+def _write(path: str, source: str) -> str:
+    with open(path, 'w', encoding='utf8') as fp:
+        fp.write(source)
+    return path
+
+
+def _modules_index(exports: Dict[str, List[str]]) -> str:
+    """`_MODULES` of types package"""
+    lines = ['_MODULES = {', "    'base': (", "        'BaseTypedType',"]
+    lines += ["        'ResponseHandler',", '    ),']
+    for module, names in exports.items():
+        lines.append(f'    {module!r}: (')
+        lines.extend(f'        {name!r},' for name in names)
+        lines.append('    ),')
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+
+class ModuleGenerator:
+    """Sources of SDK module types and methods"""
+
+    def __init__(
+        self,
+        reference: ApiReference,
+        module: Dict[str, Any],
+        sent: Set[str],
+        received: Set[str],
+    ):
+        """
+        :param reference: API reference
+        :param module: Module definition
+        :param sent: Ref names of types which are sent to the core
+        :param received: Ref names of types which are received from the core
+        """
+        self.reference = reference
+        self.module = module
+        self.name = module['name']
+        self.sent = sent
+        self.received = received
+        self.exports: List[str] = []
+        self._imports: Set[str] = set()
+        self._typing: Set[str] = set()
+        self._loaders: Dict[str, bool] = {}
+
+    def types_source(self) -> str:
+        """Source of `tonclient/types/<module>.py`"""
+        aliases, blocks, aggregated = [], [], []
+        for typedef in self.module['types']:
+            kind = typedef['type']
+            name = typedef['name']
+            if kind == 'Struct':
+                blocks.append(self._struct(typedef=typedef))
+            elif kind == 'EnumOfConsts':
+                blocks.append(self._consts(typedef=typedef))
+            elif kind == 'EnumOfTypes':
+                blocks.append(self._variants(typedef=typedef))
+                aggregated.append(self._aggregated(typedef=typedef))
+            else:
+                aliases.append(f'{name} = {self._annotation(t=typedef)}')
+            self.exports.append(name)
+        self.exports.extend(line.split(' = ')[0] for line in aggregated)
+
+        header = [f'"""{self.name.capitalize()} module types"""']
+        if any(t['type'] == 'EnumOfConsts' for t in self.module['types']):
+            header.append('from enum import Enum')
+        if self._typing:
+            header.append(f'from typing import {", ".join(sorted(self._typing))}')
+        local = []
+        if any(t['type'] == 'EnumOfTypes' for t in self.module['types']):
+            local.append('from .base import BaseTypedType')
+        if self._imports:
+            local.append(f'from . import {", ".join(sorted(self._imports))}')
+        if local:
+            header.extend(['', *local])
+
+        parts = ['\n'.join(header)]
+        if aliases:
+            parts.append('\n'.join(aliases))
+        parts.extend(blocks)
+        if aggregated:
+            parts.append('\n'.join(['# Aggregated types', *aggregated]))
+        return '\n\n\n'.join(parts) + '\n'
+
+    def methods_source(self) -> str:
+        """Source of `tonclient/<module>.py` methods class"""
+        names = set()
+        methods = []
+        self._typing = {'Awaitable', 'Union'}
+        for function in self.module['functions']:
+            methods.append(self._method(function=function, names=names))
+
+        class_name = f'Ton{self.name.capitalize()}'
+        if self.name == 'client':
+            class_name = 'TonClientBase'
+        header = [f'"""{self.name.capitalize()} module methods"""']
+        header.append(f'from typing import {", ".join(sorted(self._typing))}')
+        header.append('')
+        header.append('from tonclient.module import TonModule')
+        imports = f'from tonclient.types import {", ".join(sorted(names))}'
+        if len(imports) > LINE_LENGTH:
+            imports = '\n'.join(
+                _wrap(
+                    'from tonclient.types import (', sorted(names), ')', '', True
+                )
+            )
+        header.append(imports)
+        body = [
+            f'class {class_name}(TonModule):',
+            f'    """Free TON {self.name} SDK API implementation"""',
+        ]
+        for method in methods:
+            body.append('')
+            body.extend(method)
+        return '\n'.join(header) + '\n\n\n' + '\n'.join(body) + '\n'
+
+    def _struct(self, typedef: Dict[str, Any]) -> str:
+        """Class of struct type"""
+        name = typedef['name']
+        fields = typedef['struct']
+        lines = [f'class {name}:']
+        lines.extend(_docstring(typedef=typedef, default=name, indent=INDENT))
+        lines.append('')
+        lines.extend(self._init(name=name, fields=fields, indent=INDENT))
+
+        ref_name = f'{self.name}.{name}'
+        if ref_name in self.sent:
+            lines.append('')
+            lines.extend(self._dict(fields=fields, indent=INDENT))
+        is_received = ref_name in self.received or ref_name not in self.sent
+        if is_received and self._needs_loader(ref_name=ref_name):
+            lines.append('')
+            lines.extend(self._from_dict(name=name, fields=fields))
+        return '\n'.join(lines)
+
+    def _consts(self, typedef: Dict[str, Any]) -> str:
+        """Enum of consts"""
+        name = typedef['name']
+        consts = typedef['enum_consts']
+        is_number = all(c['value']['type'] == 'Number' for c in consts)
+        lines = [f'class {name}({"int" if is_number else "str"}, Enum):']
+        lines.extend(_docstring(typedef=typedef, default=name, indent=INDENT))
+        lines.append('')
+        for const in consts:
+            if const.get('summary') or const.get('description'):
+                text = _text(const.get('summary'), const.get('description'))
+                text = ' '.join(' '.join(text).split())
+                width = LINE_LENGTH - len(INDENT) - 2
+                lines.extend(f'{INDENT}# {line}' for line in textwrap.wrap(text, width))
+            value = const['value']['value']
+            value = int(value) if is_number else repr(value)
+            lines.append(f'{INDENT}{_const_name(const["name"])} = {value}')
+        return '\n'.join(lines)
+
+    def _variants(self, typedef: Dict[str, Any]) -> str:
+        """Namespace class with `BaseTypedType` variants"""
+        name = typedef['name']
+        lines = [f'class {name}:']
+        lines.extend(_docstring(typedef=typedef, default=name, indent=INDENT))
+        indent = INDENT * 2
+        for variant in typedef['enum_types']:
+            qualname = f'{name}.{variant["name"]}'
+            fields = variant.get('struct') or []
+            if variant['type'] == 'Ref':
+                # Fields of referenced type are flattened into variant
+                fields = [
+                    {**variant, 'name': 'params', 'summary': None, 'description': None}
+                ]
+            lines.append('')
+            lines.append(f'{INDENT}class {variant["name"]}(BaseTypedType):')
+            lines.extend(_docstring(typedef=variant, default=qualname, indent=indent))
+            lines.append('')
+            lines.extend(
+                self._init(name=qualname, fields=fields, indent=indent, variant=True)
+            )
+            if fields:
+                lines.append('')
+                lines.extend(
+                    self._dict(
+                        fields=fields,
+                        indent=indent,
+                        variant=qualname,
+                        flatten=variant['type'] == 'Ref',
+                    )
+                )
+
+        ref_name = f'{self.name}.{name}'
+        if ref_name in self.sent and ref_name not in self.received:
+            return '\n'.join(lines)
+        self._typing.update(('Any', 'Dict'))
+        lines.append('')
+        lines.append(f'{INDENT}@staticmethod')
+        lines.extend(
+            _wrap(
+                f'{INDENT}def from_dict(',
+                ['data: Dict[str, Any]'],
+                f") -> '{name}Type':",
+                INDENT,
+            )
+        )
+        lines.append(f'{indent}"""Object from dict"""')
+        # Nested objects of variants, keys are absent in other variants
+        decoded = set()
+        for variant in typedef['enum_types']:
+            for field in variant.get('struct') or []:
+                key = f'data[{field["name"]!r}]'
+                value = self._load(t=_inner(t=field), expression=key)
+                if value is None or field['name'] in decoded:
+                    continue
+                decoded.add(field['name'])
+                lines.append(f'{indent}if data.get({field["name"]!r}):')
+                lines.extend(_assign(key, value, indent + INDENT))
+        kwargs = "{k: v for k, v in data.items() if k != 'type'}"
+        lines.append(f'{indent}kwargs = {kwargs}')
+        lines.append(f"{indent}return getattr({name}, data['type'])(**kwargs)")
+        return '\n'.join(lines)
+
+    def _aggregated(self, typedef: Dict[str, Any]) -> str:
+        """Union of variants"""
+        name = typedef['name']
+        variants = [f'{name}.{v["name"]}' for v in typedef['enum_types']]
+        if len(variants) == 1:
+            return f'{name}Type = {variants[0]}'
+        self._typing.add('Union')
+        return '\n'.join(_wrap(f'{name}Type = Union[', variants, ']', ''))
+
+    def _init(
+        self,
+        name: str,
+        fields: List[Dict[str, Any]],
+        indent: str,
+        variant: bool = False,
+    ) -> List[str]:
+        """`__init__` with slots"""
+        slots = [repr(f['name']) for f in fields]
+        if len(slots) == 1:
+            lines = [f'{indent}__slots__ = ({slots[0]},)']
+        else:
+            lines = _wrap(f'{indent}__slots__ = (', slots, ')', indent, collection=True)
+        lines.append('')
+
+        params = ['self']
+        for field in _ordered(fields=fields):
+            annotation = self._annotation(t=field)
+            default = ' = None' if field['type'] == 'Optional' else ''
+            params.append(f'{field["name"]}: {annotation}{default}')
+        lines.extend(_wrap(f'{indent}def __init__(', params, '):', indent))
+
+        body = indent + INDENT
+        if fields:
+            lines.append(f'{body}"""')
+            for field in fields:
+                text = _text(field.get('summary'), field.get('description'))
+                first = f'{body}:param {field["name"]}:'
+                if text:
+                    lines.extend(_paragraphs(text, f'{first} ', body + INDENT * 2))
+                else:
+                    lines.append(first)
+            lines.append(f'{body}"""')
+        if variant:
+            type_name = name.split('.')[-1]
+            lines.extend(
+                _wrap(
+                    f'{body}super({name}, self).__init__(',
+                    [f'type={type_name!r}'],
+                    ')',
+                    body,
+                )
+            )
+        for field in fields:
+            lines.extend(_assign(f'self.{field["name"]}', field['name'], body))
+        return lines
+
+    def _dict(
+        self,
+        fields: List[Dict[str, Any]],
+        indent: str,
+        variant: str = None,
+        flatten: bool = False,
+    ) -> List[str]:
+        """`dict` property"""
+        body = indent + INDENT
+        items = [f'**super({variant}, self).dict'] if variant else []
+        if flatten:
+            items.append(f'**self.{fields[0]["name"]}.dict')
+            fields = []
+        lines = [f'{indent}@property', f'{indent}def dict(self):']
+        if not variant:
+            lines.append(f'{body}"""Dict from object"""')
+        for field in fields:
+            attribute = f'self.{field["name"]}'
+            value = self._dump(t=field, expression=attribute)
+            item = f'{field["name"]!r}: {value or attribute}'
+            if value and len(body + INDENT + item) >= LINE_LENGTH:
+                # Long expression is assigned to a local first
+                lines.extend(_assign(field['name'], value, body))
+                item = f'{field["name"]!r}: {field["name"]}'
+            items.append(item)
+        lines.extend(_wrap(f'{body}return {{', items, '}', body, collection=True))
+        return lines
+
+    def _from_dict(self, name: str, fields: List[Dict[str, Any]]) -> List[str]:
+        """`from_dict` which decodes nested objects"""
+        self._typing.update(('Any', 'Dict'))
+        body = INDENT * 2
+        lines = [f'{INDENT}@staticmethod']
+        lines.extend(
+            _wrap(
+                f'{INDENT}def from_dict(',
+                ['data: Dict[str, Any]'],
+                f") -> '{name}':",
+                INDENT,
+            )
+        )
+        lines.append(f'{body}"""Object from dict"""')
+        for field in fields:
+            key = f'data[{field["name"]!r}]'
+            t = field['optional_inner'] if field['type'] == 'Optional' else field
+            value = self._load(t=t, expression=key)
+            if value is None:
+                continue
+            if field['type'] == 'Optional':
+                lines.append(f'{body}if data.get({field["name"]!r}):')
+                lines.extend(_assign(key, value, body + INDENT))
+            else:
+                lines.extend(_assign(key, value, body))
+        lines.append('')
+        lines.append(f'{body}return {name}(**data)')
+        return lines
+
+    def _method(self, function: Dict[str, Any], names: Set[str]) -> List[str]:
+        """Module method"""
+        name = function['name']
+        method = f'{self.name}.{name}'
+        params = ['self']
+        request = [f'method={method!r}']
+        docs = []
+
+        extra = function['params'][1:]
+        if extra and extra[0]['name'] == 'params':
+            params_type = self._type_name(ref_name=extra[0]['ref_name'])
+            names.add(params_type)
+            params.append(f'params: {params_type}')
+            request.append('params_or_str=params')
+            docs.append(f':param params: See `types.{params_type}`')
+            extra = extra[1:]
+        if extra:
+            names.add('ResponseHandler')
+            request.append('callback=callback')
+            if extra[0].get('generic_name') == 'AppObject':
+                params.append('callback: ResponseHandler')
+                docs.append(':param callback: Callback to send events to')
+            else:
+                # Subscription or processing events
+                params.append('callback: ResponseHandler = None')
+                docs.append(':param callback: Additional responses handler')
+
+        result = function['result']['generic_args'][0]
+        result_type = None
+        if result['type'] == 'Ref' and self.reference.resolve(result['ref_name']):
+            result_type = self._type_name(ref_name=result['ref_name'])
+            names.add(result_type)
+            docs.append(f':return: See `types.{result_type}`')
+        returns = result_type or ('None' if result['type'] == 'None' else 'Any')
+        if returns == 'Any':
+            self._typing.add('Any')
+
+        lines = _wrap(
+            f'{INDENT}def {name}(',
+            params,
+            f') -> Union[{returns}, Awaitable[{returns}]]:',
+            INDENT,
+        )
+        if len(lines[-1]) > LINE_LENGTH:
+            lines[-1:] = _wrap(
+                f'{INDENT}) -> Union[', [returns, f'Awaitable[{returns}]'], ']:', INDENT
+            )
+
+        body = INDENT * 2
+        text = [function.get('summary'), function.get('description')]
+        text = '\n'.join(t.strip().rstrip('.') for t in text if t).splitlines()
+        if docs:
+            text += ['', *docs] if text else docs
+        if len(text) == 1 and len(body) + len(text[0]) + 6 <= LINE_LENGTH:
+            lines.append(f'{body}"""{text[0]}"""')
+        else:
+            lines.extend([f'{body}"""', *_paragraphs(text, body, body), f'{body}"""'])
+
+        if result_type is None:
+            lines.extend(_wrap(f'{body}return self.request(', request, ')', body))
+        else:
+            lines.extend(_wrap(f'{body}response = self.request(', request, ')', body))
+            lines.extend(
+                _wrap(
+                    f'{body}return self.response(',
+                    [f'classname={result_type}', 'response=response'],
+                    ')',
+                    body,
+                )
+            )
+        return lines
+
+    def _annotation(self, t: Dict[str, Any]) -> str:
+        """Type annotation"""
+        kind = t['type']
+        if kind == 'Optional':
+            return self._annotation(t=t['optional_inner'])
+        if kind == 'Array':
+            self._typing.add('List')
+            item = t['array_item']
+            if item['type'] == 'Optional':
+                self._typing.add('Union')
+                return f'List[Union[{self._annotation(t=item)}, None]]'
+            return f'List[{self._annotation(t=item)}]'
+        if kind == 'Number':
+            return 'float' if t.get('number_type') == 'Float' else 'int'
+        if kind == 'Ref':
+            typedef = self.reference.resolve(ref_name=t['ref_name'])
+            if typedef is None:
+                self._typing.add('Any')
+                return 'Any'
+            return repr(self._qualified(ref_name=t['ref_name'], annotation=True))
+        if kind in PRIMITIVES:
+            return PRIMITIVES[kind]
+        self._typing.add('Any')
+        return 'Any'
+
+    def _qualified(self, ref_name: str, annotation: bool = False) -> str:
+        """Name of referenced type in this module"""
+        module, name = ref_name.split('.')
+        if annotation and self.reference.resolve(ref_name)['type'] == 'EnumOfTypes':
+            name = f'{name}Type'
+        if module == self.name:
+            return name
+        self._imports.add(module)
+        return f'{module}.{name}'
+
+    def _type_name(self, ref_name: str) -> str:
+        """Name of type exported by `tonclient.types`"""
+        return ref_name.split('.')[-1]
+
+    def _is_object(self, t: Dict[str, Any]) -> bool:
+        """Whether type is a types class (not enum of consts or alias)"""
+        if t['type'] != 'Ref':
+            return False
+        typedef = self.reference.resolve(ref_name=t['ref_name'])
+        return typedef is not None and typedef['type'] in ('Struct', 'EnumOfTypes')
+
+    def _dump(self, t: Dict[str, Any], expression: str) -> Union[str, None]:
+        """Expression converting value to dict, `None` if value is sent as is"""
+        kind = t['type']
+        if kind == 'Optional':
+            value = self._dump(t=t['optional_inner'], expression=expression)
+            return f'{value} if {expression} else {expression}' if value else None
+        if kind == 'Array':
+            value = self._dump(t=t['array_item'], expression='i')
+            return f'[{value} for i in {expression}]' if value else None
+        if self._is_object(t=t):
+            return f'{expression}.dict'
+        return None
+
+    def _load(self, t: Dict[str, Any], expression: str) -> Union[str, None]:
+        """Expression building object from dict, `None` if value is kept"""
+        kind = t['type']
+        if kind == 'Array':
+            item = t['array_item']
+            if item['type'] == 'Optional':
+                value = self._load(t=item['optional_inner'], expression='i')
+                value = f'{value} if i else None' if value else None
+            else:
+                value = self._load(t=item, expression='i')
+            return f'[{value} for i in {expression}]' if value else None
+        if not self._is_object(t=t):
+            return None
+
+        name = self._qualified(ref_name=t['ref_name'])
+        if self._needs_loader(ref_name=t['ref_name']):
+            return f'{name}.from_dict(data={expression})'
+        return f'{name}(**{expression})'
+
+    def _needs_loader(self, ref_name: str) -> bool:
+        """Whether type needs `from_dict` to decode nested objects"""
+        loader = self._loaders.get(ref_name)
+        if loader is not None:
+            return loader
+
+        typedef = self.reference.resolve(ref_name=ref_name)
+        if typedef['type'] == 'EnumOfTypes':
+            return True
+        # Recursive types are decoded by `from_dict`
+        self._loaders[ref_name] = True
+        loader = any(
+            self._load(t=_inner(t=field), expression='') is not None
+            for field in typedef.get('struct') or []
+        )
+        self._loaders[ref_name] = loader
+        return loader
+
+
+def _inner(t: Dict[str, Any]) -> Dict[str, Any]:
+    return t['optional_inner'] if t['type'] == 'Optional' else t
+
+
+def _ordered(fields: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Required fields first, as params with defaults follow them"""
+    required = [f for f in fields if f['type'] != 'Optional']
+    return required + [f for f in fields if f['type'] == 'Optional']
+
+
+def _text(summary: Union[str, None], description: Union[str, None]) -> List[str]:
+    """Doc lines of summary and description"""
+    parts = [p.strip().rstrip('.') for p in (summary, description) if p]
+    return [line.rstrip() for line in '. '.join(parts).splitlines()]
+
+
+def _paragraphs(lines: List[str], first: str, indent: str) -> List[str]:
+    """
+    Wrap doc lines, indent of lines is kept
+
+    :param lines: Doc lines
+    :param first: Start of the first line
+    :param indent: Indent of the rest lines
+    """
+    wrapped = []
+    for index, line in enumerate(lines):
+        if not line.strip():
+            wrapped.append('')
+            continue
+        offset = ' ' * (len(line) - len(line.lstrip()))
+        wrapped.extend(
+            textwrap.wrap(
+                line.strip(),
+                width=LINE_LENGTH,
+                initial_indent=first if index == 0 else indent + offset,
+                subsequent_indent=indent + offset,
+            )
+        )
+    return wrapped
+
+
+def _docstring(typedef: Dict[str, Any], default: str, indent: str) -> List[str]:
+    """Class docstring of summary and description"""
+    text = [
+        line.rstrip()
+        for part in (typedef.get('summary'), typedef.get('description'))
+        if part
+        for line in part.strip().splitlines()
+    ]
+    if not text:
+        text = [default]
+    if len(text) == 1 and len(indent) + len(text[0]) + 6 <= LINE_LENGTH:
+        return [f'{indent}"""{text[0]}"""']
+    return [f'{indent}"""', *_paragraphs(text, indent, indent), f'{indent}"""']
+
+
+def _const_name(name: str) -> str:
+    """Enum member name, e.g. `InternalOutput` -> `INTERNAL_OUTPUT`"""
+    name = re.sub(r'(.)([A-Z][a-z]+)', r'\1_\2', name)
+    return re.sub(r'([a-z0-9])([A-Z])', r'\1_\2', name).upper()
+
+
+def _assign(target: str, value: str, indent: str) -> List[str]:
+    """Assignment, too long value is split like black does"""
+    line = f'{indent}{target} = {value}'
+    if len(line) <= LINE_LENGTH:
+        return [line]
+    inner = indent + INDENT
+    if value.startswith('[') and value.endswith(']') and ' for i in ' in value:
+        # List comprehension
+        lines = [f'{indent}{target} = [', f'{inner}{value[1:-1]}', f'{indent}]']
+        if len(lines[1]) > LINE_LENGTH:
+            item, iterable = value[1:-1].split(' for i in ')
+            lines[1:2] = [f'{inner}{item}', f'{inner}for i in {iterable}']
+        return lines
+    if ' if ' in value or value[-1] not in ')]':
+        # Conditional or plain expression is put in brackets
+        lines = [f'{indent}{target} = (', f'{inner}{value}', f'{indent})']
+        if len(lines[1]) > LINE_LENGTH and ' if ' in value:
+            true, rest = value.rsplit(' if ', 1)
+            test, false = rest.split(' else ', 1)
+            lines[1:2] = [f'{inner}{true}', f'{inner}if {test}', f'{inner}else {false}']
+        return lines
+
+    depth = 0
+    for index in range(len(value) - 1, -1, -1):
+        depth += {')': 1, ']': 1, '(': -1, '[': -1}.get(value[index], 0)
+        if depth == 0:
+            break
+    split = index + 1
+    head = f'{indent}{target} = {value[:split]}'
+    return _wrap(head, [value[split:-1]], value[-1], indent)
+
+
+def _wrap(
+    head: str, items: List[str], tail: str, indent: str, collection: bool = False
+) -> List[str]:
+    """
+    Split bracketed items like black does: one line, items on the
+    indented line or one item per line
+
+    :param head: Line start including opening bracket
+    :param items: Items inside brackets
+    :param tail: Closing bracket and the rest of the line
+    :param indent: Indent of the first line
+    :param collection: Collection literal, which is never joined on the
+            indented line
+    """
+    joined = ', '.join(items)
+    if len(head) + len(joined) + len(tail) <= LINE_LENGTH:
+        return [f'{head}{joined}{tail}']
+
+    inner = indent + INDENT
+    if not collection and len(inner) + len(joined) <= LINE_LENGTH:
+        if len(items) == 1 and head.lstrip().startswith('def '):
+            # Single parameter of split definition gets trailing comma
+            joined += ','
+        return [head, f'{inner}{joined}', f'{indent}{tail}']
+    return [head, *[f'{inner}{item},' for item in items], f'{indent}{tail}']
+
+
+class Block:
+    """Hand-written block of sources"""
+
+    __slots__ = ('lines', 'path', 'anchor', 'names')
+
+    def __init__(
+        self, lines: List[str], path: List[str], anchor: Union[str, None]
+    ):
+        """
+        :param lines: Block lines including markers
+        :param path: Names of classes the block is nested in
+        :param anchor: Name of generated item the block follows, `None` if
+                the block starts module or class body
+        """
+        self.lines = lines
+        self.path = path
+        self.anchor = anchor
+        self.names = _definitions(lines=lines[1:-1], indent=_indent(lines[0]))
+
+
+def merge(source: str, existing: Union[str, None]) -> str:
+    """
+    Carry hand-written blocks and module docstring over to generated source
+
+    :param source: Generated source
+    :param existing: Current source, `None` if there is no one
+    :return: Source
+    """
+    if existing is None:
+        return source
+
+    lines = source.splitlines()
+    for token in tokenize.generate_tokens(io.StringIO(existing).readline):
+        if token.type == tokenize.STRING:
+            lines[:1] = existing.splitlines()[: token.end[0]]
+        if token.type not in (tokenize.COMMENT, tokenize.NL):
+            break
+    for block in blocks(source=existing):
+        lines = _insert(lines=lines, block=block)
+    return '\n'.join(lines) + '\n'
+
+
+def blocks(source: str) -> List[Block]:
+    """Hand-written blocks of source"""
+    lines = source.splitlines()
+    spans, start = [], None
+    for index, line in enumerate(lines):
+        if line.strip() == REGION:
+            start = index
+        elif line.strip() == END_REGION and start is not None:
+            spans.append((start, index + 1))
+            start = None
+    skipped = {index for start, end in spans for index in range(start, end)}
+
+    found = []
+    for start, end in spans:
+        level = _indent(lines[start])
+        anchor, path = None, []
+        # Previous generated definition of the same level is the anchor,
+        # classes of lower levels enclose the block
+        for index in range(start - 1, -1, -1):
+            line = lines[index]
+            if index in skipped or not line.strip():
+                continue
+            indent = _indent(line)
+            match = DEFINITION.match(line.strip())
+            if indent == level and anchor is None and not path and match:
+                anchor = match.group(1) or match.group(2)
+            elif indent < level:
+                match = re.match(r'class (\w+)', line.strip())
+                if match is None:
+                    raise ValueError(
+                        f'Hand-written block at line {start + 1} is not in '
+                        'module or class body'
+                    )
+                path.insert(0, match.group(1))
+                level = indent
+        found.append(Block(lines=lines[start:end], path=path, anchor=anchor))
+    return found
+
+
+def _insert(lines: List[str], block: Block) -> List[str]:
+    """Insert block to generated lines"""
+    start, end, level = 0, len(lines), 0
+    for name in block.path:
+        start, end, level = _body(
+            lines=lines, start=start, end=end, level=level, name=name
+        )
+    separator = [''] * (1 if level else 2)
+
+    # Generated items of names defined by the block are replaced with it
+    items = _items(lines=lines, start=start, end=end, level=level)
+    for index in range(len(items) - 1, -1, -1):
+        item_start, item_end, names, is_block = items[index]
+        if is_block or not names or not names <= block.names:
+            continue
+        if index:
+            item_start = items[index - 1][1]
+        elif index + 1 < len(items):
+            item_end = items[index + 1][0]
+        del lines[item_start:item_end]
+        end -= item_end - item_start
+    items = _items(lines=lines, start=start, end=end, level=level)
+
+    position = -1
+    for index, (_, _, names, is_block) in enumerate(items):
+        if block.anchor is None and (names or is_block):
+            break
+        if block.anchor is None or block.anchor in names:
+            position = index
+    if block.anchor is not None and position < 0:
+        # Anchor is not generated anymore
+        position = len(items) - 1
+    while position + 1 < len(items) and items[position + 1][3]:
+        position += 1
+
+    if position < 0:
+        return lines[:start] + block.lines + separator + lines[start:]
+    at = items[position][1]
+    return lines[:at] + separator + block.lines + lines[at:]
+
+
+def _body(
+    lines: List[str], start: int, end: int, level: int, name: str
+) -> Tuple[int, int, int]:
+    """Range and indent level of class body"""
+    for index in range(start, end):
+        line = lines[index]
+        if _indent(line) == level and re.match(rf'class {name}\b', line.strip()):
+            break
+    else:
+        raise ValueError(f'Class `{name}` of hand-written block is not generated')
+
+    body = index + 1
+    last = body
+    for index in range(body, end):
+        line = lines[index]
+        if line.strip():
+            if _indent(line) <= level:
+                break
+            last = index + 1
+    return body, last, level + len(INDENT)
+
+
+def _items(
+    lines: List[str], start: int, end: int, level: int
+) -> List[Tuple[int, int, Set[str], bool]]:
+    """
+    Items of module or class body: statements separated with blank lines
+
+    :return: List of (start, end, defined names, whether item is a
+            hand-written block)
+    """
+    items = []
+    index = start
+    while index < end:
+        if not lines[index].strip():
+            index += 1
+            continue
+        first = index
+        if lines[index].strip() == REGION:
+            while lines[index].strip() != END_REGION:
+                index += 1
+            index += 1
+            names = _definitions(lines=lines[first:index][1:-1], indent=level)
+            items.append((first, index, names, True))
+            continue
+
+        last = index + 1
+        for index in range(index + 1, end + 1):
+            if index == end:
+                break
+            line = lines[index]
+            if not line.strip():
+                continue
+            if _indent(line) <= level and not lines[index - 1].strip():
+                break
+            last = index + 1
+        names = _definitions(lines=lines[first:last], indent=level)
+        items.append((first, last, names, False))
+        index = last
+    return items
+
+
+def _definitions(lines: List[str], indent: int) -> Set[str]:
+    """Names defined by lines of the indent level"""
+    names = set()
+    for line in lines:
+        match = DEFINITION.match(line.strip())
+        if match and line.strip() and _indent(line) == indent:
+            names.add(match.group(1) or match.group(2))
+    return names
+
+
+def _indent(line: str) -> int:
+    return len(line) - len(line.lstrip())
+
+
+def save(path: str):
+    """Save API reference of the core library"""
+    # pylint: disable=import-outside-toplevel
+    from tonclient.client import TonClient
+    from tonclient.module import request_options
+    from tonclient.types import ClientConfig
+
+    client = TonClient(config=ClientConfig(), is_core_async=False)
+    with request_options(raw='dict'):
+        api = client.get_api_reference()['api']
+    client.destroy_context()
+    _write(path=path, source=json.dumps(api, indent=2) + '\n')
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(
+        prog='python -m tonclient.codegen', description=__doc__.split('\n\n')[0]
+    )
+    parser.add_argument(
+        'reference',
+        nargs='?',
+        default=API_REFERENCE,
+        help='Saved API reference JSON, checked in `api.json` by default',
+    )
+    parser.add_argument(
+        '--out', default=ROOT_DIR, help='Output directory, sources by default'
+    )
+    parser.add_argument(
+        '--save',
+        action='store_true',
+        help='Save API reference of the core library to `reference` path',
+    )
+    args = parser.parse_args(argv)
+
+    if args.save:
+        save(path=args.reference)
+        print(f'Saved {args.reference}')
+        return
+    for path in generate(reference=ApiReference.load(args.reference), out=args.out):
+        print(path)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,82 +1,82 @@
 """Crypto module methods"""
-from typing import Union, Awaitable
+from typing import Awaitable, Union
 
 from tonclient.module import TonModule
 from tonclient.types import (
     KeyPair,
+    ParamsOfChaCha20,
+    ParamsOfConvertPublicKeyToTonSafeFormat,
     ParamsOfCreateCryptoBox,
+    ParamsOfCreateEncryptionBox,
+    ParamsOfEncryptionBoxDecrypt,
+    ParamsOfEncryptionBoxEncrypt,
+    ParamsOfEncryptionBoxGetInfo,
     ParamsOfFactorize,
+    ParamsOfGenerateRandomBytes,
     ParamsOfGetEncryptionBoxFromCryptoBox,
     ParamsOfGetSigningBoxFromCryptoBox,
-    RegisteredCryptoBox,
-    ResultOfFactorize,
-    ParamsOfModularPower,
-    ResultOfGetCryptoBoxInfo,
-    ResultOfGetCryptoBoxSeedPhrase,
-    ResultOfModularPower,
-    ParamsOfTonCrc16,
-    ResultOfTonCrc16,
-    ParamsOfGenerateRandomBytes,
-    ParamsOfConvertPublicKeyToTonSafeFormat,
-    ResultOfGenerateRandomBytes,
-    ResultOfConvertPublicKeyToTonSafeFormat,
-    ParamsOfSign,
-    ResultOfSign,
-    ParamsOfVerifySignature,
-    ResultOfVerifySignature,
+    ParamsOfHDKeyDeriveFromXPrv,
+    ParamsOfHDKeyDeriveFromXPrvPath,
+    ParamsOfHDKeyPublicFromXPrv,
+    ParamsOfHDKeySecretFromXPrv,
+    ParamsOfHDKeyXPrvFromMnemonic,
     ParamsOfHash,
-    ResultOfHash,
-    ParamsOfScrypt,
-    ResultOfScrypt,
-    ParamsOfNaclSignKeyPairFromSecret,
-    ParamsOfNaclSign,
-    ResultOfNaclSign,
-    ParamsOfNaclSignOpen,
-    ResultOfNaclSignOpen,
-    ResultOfNaclSignDetached,
-    ParamsOfNaclBoxKeyPairFromSecret,
+    ParamsOfMnemonicDeriveSignKeys,
+    ParamsOfMnemonicFromEntropy,
+    ParamsOfMnemonicFromRandom,
+    ParamsOfMnemonicVerify,
+    ParamsOfMnemonicWords,
+    ParamsOfModularPower,
     ParamsOfNaclBox,
-    ResultOfNaclBox,
+    ParamsOfNaclBoxKeyPairFromSecret,
     ParamsOfNaclBoxOpen,
-    ResultOfNaclBoxOpen,
     ParamsOfNaclSecretBox,
     ParamsOfNaclSecretBoxOpen,
-    ParamsOfMnemonicWords,
-    ResultOfMnemonicWords,
-    ParamsOfMnemonicFromRandom,
-    ResultOfMnemonicFromRandom,
-    ParamsOfMnemonicFromEntropy,
-    ResultOfMnemonicFromEntropy,
-    ParamsOfMnemonicVerify,
-    ResultOfMnemonicVerify,
-    ParamsOfMnemonicDeriveSignKeys,
-    ParamsOfHDKeyXPrvFromMnemonic,
-    ResultOfHDKeyXPrvFromMnemonic,
-    ParamsOfHDKeyDeriveFromXPrv,
+    ParamsOfNaclSign,
+    ParamsOfNaclSignDetachedVerify,
+    ParamsOfNaclSignKeyPairFromSecret,
+    ParamsOfNaclSignOpen,
+    ParamsOfScrypt,
+    ParamsOfSign,
+    ParamsOfSigningBoxSign,
+    ParamsOfTonCrc16,
+    ParamsOfVerifySignature,
+    RegisteredCryptoBox,
+    RegisteredEncryptionBox,
+    RegisteredSigningBox,
+    ResponseHandler,
+    ResultOfChaCha20,
+    ResultOfConvertPublicKeyToTonSafeFormat,
+    ResultOfEncryptionBoxDecrypt,
+    ResultOfEncryptionBoxEncrypt,
+    ResultOfEncryptionBoxGetInfo,
+    ResultOfFactorize,
+    ResultOfGenerateRandomBytes,
+    ResultOfGetCryptoBoxInfo,
+    ResultOfGetCryptoBoxSeedPhrase,
     ResultOfHDKeyDeriveFromXPrv,
-    ParamsOfHDKeyDeriveFromXPrvPath,
     ResultOfHDKeyDeriveFromXPrvPath,
-    ParamsOfHDKeySecretFromXPrv,
-    ResultOfHDKeySecretFromXPrv,
-    ParamsOfHDKeyPublicFromXPrv,
     ResultOfHDKeyPublicFromXPrv,
-    ParamsOfChaCha20,
-    ResultOfChaCha20,
-    RegisteredSigningBox,
+    ResultOfHDKeySecretFromXPrv,
+    ResultOfHDKeyXPrvFromMnemonic,
+    ResultOfHash,
+    ResultOfMnemonicFromEntropy,
+    ResultOfMnemonicFromRandom,
+    ResultOfMnemonicVerify,
+    ResultOfMnemonicWords,
+    ResultOfModularPower,
+    ResultOfNaclBox,
+    ResultOfNaclBoxOpen,
+    ResultOfNaclSign,
+    ResultOfNaclSignDetached,
+    ResultOfNaclSignDetachedVerify,
+    ResultOfNaclSignOpen,
+    ResultOfScrypt,
+    ResultOfSign,
     ResultOfSigningBoxGetPublicKey,
-    ParamsOfSigningBoxSign,
     ResultOfSigningBoxSign,
-    ParamsOfNaclSignDetachedVerify,
-    ResultOfNaclSignDetachedVerify,
-    ResponseHandler,
-    RegisteredEncryptionBox,
-    ParamsOfEncryptionBoxGetInfo,
-    ResultOfEncryptionBoxGetInfo,
-    ParamsOfEncryptionBoxEncrypt,
-    ResultOfEncryptionBoxEncrypt,
-    ParamsOfEncryptionBoxDecrypt,
-    ResultOfEncryptionBoxDecrypt,
-    ParamsOfCreateEncryptionBox,
+    ResultOfTonCrc16,
+    ResultOfVerifySignature,
 )
 
 
@@ -92,7 +92,7 @@ class TonCrypto(TonModule):
         :param params: See `types.ParamsOfHash`
         :return: See `types.ResultOfHash`
         """
-        response = self.request(method='crypto.sha256', **params.dict)
+        response = self.request(method='crypto.sha256', params_or_str=params)
         return self.response(classname=ResultOfHash, response=response)
 
     def sha512(
@@ -104,7 +104,7 @@ class TonCrypto(TonModule):
         :param params: See `types.ParamsOfHash`
         :return: See `types.ResultOfHash`
         """
-        response = self.request(method='crypto.sha512', **params.dict)
+        response = self.request(method='crypto.sha512', params_or_str=params)
         return self.response(classname=ResultOfHash, response=response)
 
     def hdkey_xprv_from_mnemonic(
@@ -117,7 +117,9 @@ class TonCrypto(TonModule):
         :param params: See `types.ParamsOfHDKeyXPrvFromMnemonic`
         :return: See `types.ResultOfHDKeyXPrvFromMnemonic`
         """
-        response = self.request(method='crypto.hdkey_xprv_from_mnemonic', **params.dict)
+        response = self.request(
+            method='crypto.hdkey_xprv_from_mnemonic', params_or_str=params
+        )
         return self.response(classname=ResultOfHDKeyXPrvFromMnemonic, response=response)
 
     def hdkey_secret_from_xprv(
@@ -129,7 +131,9 @@ class TonCrypto(TonModule):
         :param params: See `types.ParamsOfHDKeySecretFromXPrv`
         :return: See `types.ResultOfHDKeySecretFromXPrv`
         """
-        response = self.request(method='crypto.hdkey_secret_from_xprv', **params.dict)
+        response = self.request(
+            method='crypto.hdkey_secret_from_xprv', params_or_str=params
+        )
         return self.response(classname=ResultOfHDKeySecretFromXPrv, response=response)
 
     def hdkey_public_from_xprv(
@@ -141,7 +145,9 @@ class TonCrypto(TonModule):
         :param params: See `types.ParamsOfHDKeyPublicFromXPrv`
         :return: See `types.ResultOfHDKeyPublicFromXPrv`
         """
-        response = self.request(method='crypto.hdkey_public_from_xprv', **params.dict)
+        response = self.request(
+            method='crypto.hdkey_public_from_xprv', params_or_str=params
+        )
         return self.response(classname=ResultOfHDKeyPublicFromXPrv, response=response)
 
     def hdkey_derive_from_xprv(
@@ -154,7 +160,9 @@ class TonCrypto(TonModule):
         :param params: See `types.ParamsOfHDKeyDeriveFromXPrv`
         :return: See `types.ResultOfHDKeyDeriveFromXPrv`
         """
-        response = self.request(method='crypto.hdkey_derive_from_xprv', **params.dict)
+        response = self.request(
+            method='crypto.hdkey_derive_from_xprv', params_or_str=params
+        )
         return self.response(classname=ResultOfHDKeyDeriveFromXPrv, response=response)
 
     def hdkey_derive_from_xprv_path(
@@ -169,7 +177,7 @@ class TonCrypto(TonModule):
         :return: See `types.ResultOfHDKeyDeriveFromXPrvPath`
         """
         response = self.request(
-            method='crypto.hdkey_derive_from_xprv_path', **params.dict
+            method='crypto.hdkey_derive_from_xprv_path', params_or_str=params
         )
         return self.response(
             classname=ResultOfHDKeyDeriveFromXPrvPath, response=response
@@ -188,7 +196,7 @@ class TonCrypto(TonModule):
         :return: See `types.ResultOfConvertPublicKeyToTonSafeFormat`
         """
         response = self.request(
-            method='crypto.convert_public_key_to_ton_safe_format', **params.dict
+            method='crypto.convert_public_key_to_ton_safe_format', params_or_str=params
         )
         return self.response(
             classname=ResultOfConvertPublicKeyToTonSafeFormat, response=response
@@ -212,7 +220,7 @@ class TonCrypto(TonModule):
         :param params: See `types.ParamsOfSign`
         :return: See `types.ResultOfSign`
         """
-        response = self.request(method='crypto.sign', **params.dict)
+        response = self.request(method='crypto.sign', params_or_str=params)
         return self.response(classname=ResultOfSign, response=response)
 
     def verify_signature(
@@ -225,7 +233,7 @@ class TonCrypto(TonModule):
         :param params: See `types.ParamsOfVerifySignature`
         :return: See `types.ResultOfVerifySignature`
         """
-        response = self.request(method='crypto.verify_signature', **params.dict)
+        response = self.request(method='crypto.verify_signature', params_or_str=params)
         return self.response(classname=ResultOfVerifySignature, response=response)
 
     def modular_power(
@@ -239,7 +247,7 @@ class TonCrypto(TonModule):
         :param params: See `types.ParamsOfModularPower`
         :return: See `types.ResultOfModularPower`
         """
-        response = self.request(method='crypto.modular_power', **params.dict)
+        response = self.request(method='crypto.modular_power', params_or_str=params)
         return self.response(classname=ResultOfModularPower, response=response)
 
     def factorize(
@@ -253,7 +261,7 @@ class TonCrypto(TonModule):
         :param params: See `types.ParamsOfFactorize`
         :return: See `types.ResultOfFactorize`
         """
-        response = self.request(method='crypto.factorize', **params.dict)
+        response = self.request(method='crypto.factorize', params_or_str=params)
         return self.response(classname=ResultOfFactorize, response=response)
 
     def ton_crc16(
@@ -265,7 +273,7 @@ class TonCrypto(TonModule):
         :param params: See `types.ParamsOfTonCrc16`
         :return: See `types.ResultOfTonCrc16`
         """
-        response = self.request(method='crypto.ton_crc16', **params.dict)
+        response = self.request(method='crypto.ton_crc16', params_or_str=params)
         return self.response(classname=ResultOfTonCrc16, response=response)
 
     def generate_random_bytes(
@@ -278,7 +286,9 @@ class TonCrypto(TonModule):
         :param params: See `types.ParamsOfGenerateRandomBytes`
         :return: See `types.ResultOfGenerateRandomBytes`
         """
-        response = self.request(method='crypto.generate_random_bytes', **params.dict)
+        response = self.request(
+            method='crypto.generate_random_bytes', params_or_str=params
+        )
         return self.response(classname=ResultOfGenerateRandomBytes, response=response)
 
     def mnemonic_words(
@@ -290,7 +300,7 @@ class TonCrypto(TonModule):
         :param params: See `types.ParamsOfMnemonicWords`
         :return: See `types.ResultOfMnemonicWords`
         """
-        response = self.request(method='crypto.mnemonic_words', **params.dict)
+        response = self.request(method='crypto.mnemonic_words', params_or_str=params)
         return self.response(classname=ResultOfMnemonicWords, response=response)
 
     def mnemonic_from_random(
@@ -303,7 +313,9 @@ class TonCrypto(TonModule):
         :param params: See `types.ParamsOfMnemonicFromRandom`
         :return: See `types.ResultOfMnemonicFromRandom`
         """
-        response = self.request(method='crypto.mnemonic_from_random', **params.dict)
+        response = self.request(
+            method='crypto.mnemonic_from_random', params_or_str=params
+        )
         return self.response(classname=ResultOfMnemonicFromRandom, response=response)
 
     def mnemonic_from_entropy(
@@ -315,7 +327,9 @@ class TonCrypto(TonModule):
         :param params: See `types.ParamsOfMnemonicFromEntropy`
         :return: See `types.ResultOfMnemonicFromEntropy`
         """
-        response = self.request(method='crypto.mnemonic_from_entropy', **params.dict)
+        response = self.request(
+            method='crypto.mnemonic_from_entropy', params_or_str=params
+        )
         return self.response(classname=ResultOfMnemonicFromEntropy, response=response)
 
     def mnemonic_verify(
@@ -328,7 +342,7 @@ class TonCrypto(TonModule):
         :param params: See `types.ParamsOfMnemonicVerify`
         :return: See `types.ResultOfMnemonicVerify`
         """
-        response = self.request(method='crypto.mnemonic_verify', **params.dict)
+        response = self.request(method='crypto.mnemonic_verify', params_or_str=params)
         return self.response(classname=ResultOfMnemonicVerify, response=response)
 
     def mnemonic_derive_sign_keys(
@@ -342,7 +356,7 @@ class TonCrypto(TonModule):
         :return: See `types.KeyPair`
         """
         response = self.request(
-            method='crypto.mnemonic_derive_sign_keys', **params.dict
+            method='crypto.mnemonic_derive_sign_keys', params_or_str=params
         )
         return self.response(classname=KeyPair, response=response)
 
@@ -359,7 +373,7 @@ class TonCrypto(TonModule):
         :return: See `types.KeyPair`
         """
         response = self.request(
-            method='crypto.nacl_sign_keypair_from_secret_key', **params.dict
+            method='crypto.nacl_sign_keypair_from_secret_key', params_or_str=params
         )
         return self.response(classname=KeyPair, response=response)
 
@@ -372,7 +386,7 @@ class TonCrypto(TonModule):
         :param params: See `types.ParamsOfNaclSign`
         :return: See `types.ResultOfNaclSign`
         """
-        response = self.request(method='crypto.nacl_sign', **params.dict)
+        response = self.request(method='crypto.nacl_sign', params_or_str=params)
         return self.response(classname=ResultOfNaclSign, response=response)
 
     def nacl_sign_detached(
@@ -386,7 +400,9 @@ class TonCrypto(TonModule):
         :param params: See `types.ParamsOfNaclSign`
         :return: See `types.ResultOfNaclSignDetached`
         """
-        response = self.request(method='crypto.nacl_sign_detached', **params.dict)
+        response = self.request(
+            method='crypto.nacl_sign_detached', params_or_str=params
+        )
         return self.response(classname=ResultOfNaclSignDetached, response=response)
 
     def nacl_sign_detached_verify(
@@ -401,7 +417,7 @@ class TonCrypto(TonModule):
         :return: See `types.ResultOfNaclSignDetachedVerify`
         """
         response = self.request(
-            method='crypto.nacl_sign_detached_verify', **params.dict
+            method='crypto.nacl_sign_detached_verify', params_or_str=params
         )
         return self.response(
             classname=ResultOfNaclSignDetachedVerify, response=response
@@ -419,11 +435,15 @@ class TonCrypto(TonModule):
         :param params: See `types.ParamsOfNaclSignOpen`
         :return: See `types.ResultOfNaclSignOpen`
         """
-        response = self.request(method='crypto.nacl_sign_open', **params.dict)
+        response = self.request(method='crypto.nacl_sign_open', params_or_str=params)
         return self.response(classname=ResultOfNaclSignOpen, response=response)
 
     def nacl_box_keypair(self) -> Union[KeyPair, Awaitable[KeyPair]]:
-        """Generates a random NaCl key pair"""
+        """
+        Generates a random NaCl key pair
+
+        :return: See `types.KeyPair`
+        """
         response = self.request(method='crypto.nacl_box_keypair')
         return self.response(classname=KeyPair, response=response)
 
@@ -437,7 +457,7 @@ class TonCrypto(TonModule):
         :return: See `types.KeyPair`
         """
         response = self.request(
-            method='crypto.nacl_box_keypair_from_secret_key', **params.dict
+            method='crypto.nacl_box_keypair_from_secret_key', params_or_str=params
         )
         return self.response(classname=KeyPair, response=response)
 
@@ -452,7 +472,7 @@ class TonCrypto(TonModule):
         :param params: See `types.ParamsOfNaclBox`
         :return: See `types.ResultOfNaclBox`
         """
-        response = self.request(method='crypto.nacl_box', **params.dict)
+        response = self.request(method='crypto.nacl_box', params_or_str=params)
         return self.response(classname=ResultOfNaclBox, response=response)
 
     def nacl_box_open(
@@ -465,7 +485,7 @@ class TonCrypto(TonModule):
         :param params: See `types.ParamsOfNaclBoxOpen`
         :return: See `types.ResultOfNaclBoxOpen`
         """
-        response = self.request(method='crypto.nacl_box_open', **params.dict)
+        response = self.request(method='crypto.nacl_box_open', params_or_str=params)
         return self.response(classname=ResultOfNaclBoxOpen, response=response)
 
     def nacl_secret_box(
@@ -477,7 +497,7 @@ class TonCrypto(TonModule):
         :param params: See `types.ParamsOfNaclSecretBox`
         :return: See `types.ResultOfNaclBox`
         """
-        response = self.request(method='crypto.nacl_secret_box', **params.dict)
+        response = self.request(method='crypto.nacl_secret_box', params_or_str=params)
         return self.response(classname=ResultOfNaclBox, response=response)
 
     def nacl_secret_box_open(
@@ -489,7 +509,9 @@ class TonCrypto(TonModule):
         :param params: See `types.ParamsOfNaclSecretBoxOpen`
         :return: See `types.ResultOfNaclBoxOpen`
         """
-        response = self.request(method='crypto.nacl_secret_box_open', **params.dict)
+        response = self.request(
+            method='crypto.nacl_secret_box_open', params_or_str=params
+        )
         return self.response(classname=ResultOfNaclBoxOpen, response=response)
 
     def scrypt(
@@ -497,12 +519,12 @@ class TonCrypto(TonModule):
     ) -> Union[ResultOfScrypt, Awaitable[ResultOfScrypt]]:
         """
         Derives key from `password` and `key` using `scrypt` algorithm.
-        See [https://en.wikipedia.org/wiki/Scrypt].
+        See [https://en.wikipedia.org/wiki/Scrypt]
 
         :param params: See `types.ParamsOfScrypt`
         :return: See `types.ResultOfScrypt`
         """
-        response = self.request(method='crypto.scrypt', **params.dict)
+        response = self.request(method='crypto.scrypt', params_or_str=params)
         return self.response(classname=ResultOfScrypt, response=response)
 
     def chacha20(
@@ -514,7 +536,7 @@ class TonCrypto(TonModule):
         :param params: See `types.ParamsOfChaCha20`
         :return: See `types.ResultOfChaCha20`
         """
-        response = self.request(method='crypto.chacha20', **params.dict)
+        response = self.request(method='crypto.chacha20', params_or_str=params)
         return self.response(classname=ResultOfChaCha20, response=response)
 
     def register_signing_box(
@@ -538,7 +560,7 @@ class TonCrypto(TonModule):
         :param params: See `types.KeyPair`
         :return: See `types.RegisteredSigningBox`
         """
-        response = self.request(method='crypto.get_signing_box', **params.dict)
+        response = self.request(method='crypto.get_signing_box', params_or_str=params)
         return self.response(classname=RegisteredSigningBox, response=response)
 
     def signing_box_get_public_key(
@@ -553,7 +575,7 @@ class TonCrypto(TonModule):
         :return: See `types.ResultOfSigningBoxGetPublicKey`
         """
         response = self.request(
-            method='crypto.signing_box_get_public_key', **params.dict
+            method='crypto.signing_box_get_public_key', params_or_str=params
         )
         return self.response(
             classname=ResultOfSigningBoxGetPublicKey, response=response
@@ -568,7 +590,7 @@ class TonCrypto(TonModule):
         :param params: See `types.ParamsOfSigningBoxSign`
         :return: See `types.ResultOfSigningBoxSign`
         """
-        response = self.request(method='crypto.signing_box_sign', **params.dict)
+        response = self.request(method='crypto.signing_box_sign', params_or_str=params)
         return self.response(classname=ResultOfSigningBoxSign, response=response)
 
     def remove_signing_box(
@@ -578,9 +600,8 @@ class TonCrypto(TonModule):
         Removes signing box from SDK
 
         :param params: See `types.RegisteredSigningBox`
-        :return:
         """
-        return self.request(method='crypto.remove_signing_box', **params.dict)
+        return self.request(method='crypto.remove_signing_box', params_or_str=params)
 
     def register_encryption_box(
         self, callback: ResponseHandler
@@ -599,8 +620,12 @@ class TonCrypto(TonModule):
     def remove_encryption_box(
         self, params: RegisteredEncryptionBox
     ) -> Union[None, Awaitable[None]]:
-        """Removes encryption box from SDK"""
-        return self.request(method='crypto.remove_encryption_box', **params.dict)
+        """
+        Removes encryption box from SDK
+
+        :param params: See `types.RegisteredEncryptionBox`
+        """
+        return self.request(method='crypto.remove_encryption_box', params_or_str=params)
 
     def encryption_box_get_info(
         self, params: ParamsOfEncryptionBoxGetInfo
@@ -611,7 +636,9 @@ class TonCrypto(TonModule):
         :param params: See `types.ParamsOfEncryptionBoxGetInfo`
         :return: See `types.ResultOfEncryptionBoxGetInfo`
         """
-        response = self.request(method='crypto.encryption_box_get_info', **params.dict)
+        response = self.request(
+            method='crypto.encryption_box_get_info', params_or_str=params
+        )
         return self.response(classname=ResultOfEncryptionBoxGetInfo, response=response)
 
     def encryption_box_encrypt(
@@ -627,7 +654,9 @@ class TonCrypto(TonModule):
         :param params: See `types.ParamsOfEncryptionBoxEncrypt`
         :return: See `types.ResultOfEncryptionBoxEncrypt`
         """
-        response = self.request(method='crypto.encryption_box_encrypt', **params.dict)
+        response = self.request(
+            method='crypto.encryption_box_encrypt', params_or_str=params
+        )
         return self.response(classname=ResultOfEncryptionBoxEncrypt, response=response)
 
     def encryption_box_decrypt(
@@ -643,7 +672,9 @@ class TonCrypto(TonModule):
         :param params: See `types.ParamsOfEncryptionBoxDecrypt`
         :return: See `types.ResultOfEncryptionBoxDecrypt`
         """
-        response = self.request(method='crypto.encryption_box_decrypt', **params.dict)
+        response = self.request(
+            method='crypto.encryption_box_decrypt', params_or_str=params
+        )
         return self.response(classname=ResultOfEncryptionBoxDecrypt, response=response)
 
     def create_encryption_box(
@@ -655,7 +686,9 @@ class TonCrypto(TonModule):
         :param params: See `types.ParamsOfCreateEncryptionBox`
         :return: See `types.RegisteredEncryptionBox`
         """
-        response = self.request(method='crypto.create_encryption_box', **params.dict)
+        response = self.request(
+            method='crypto.create_encryption_box', params_or_str=params
+        )
         return self.response(classname=RegisteredEncryptionBox, response=response)
 
     def create_crypto_box(
@@ -682,7 +715,7 @@ class TonCrypto(TonModule):
         :return: See `types.RegisteredCryptoBox`
         """
         response = self.request(
-            method='crypto.create_crypto_box', **params.dict, callback=callback
+            method='crypto.create_crypto_box', params_or_str=params, callback=callback
         )
         return self.response(classname=RegisteredCryptoBox, response=response)
 
@@ -690,11 +723,11 @@ class TonCrypto(TonModule):
         self, params: RegisteredCryptoBox
     ) -> Union[None, Awaitable[None]]:
         """
-        Removes Crypto Box. Clears all secret data.
+        Removes Crypto Box. Clears all secret data
 
         :param params: See `types.RegisteredCryptoBox`
         """
-        return self.request(method='crypto.remove_crypto_box', **params.dict)
+        return self.request(method='crypto.remove_crypto_box', params_or_str=params)
 
     def get_crypto_box_info(
         self, params: RegisteredCryptoBox
@@ -707,7 +740,9 @@ class TonCrypto(TonModule):
         :param params: See `types.RegisteredCryptoBox`
         :return: See `types.ResultOfGetCryptoBoxInfo`
         """
-        response = self.request(method='crypto.get_crypto_box_info', **params.dict)
+        response = self.request(
+            method='crypto.get_crypto_box_info', params_or_str=params
+        )
         return self.response(classname=ResultOfGetCryptoBoxInfo, response=response)
 
     def get_crypto_box_seed_phrase(
@@ -725,7 +760,7 @@ class TonCrypto(TonModule):
         :return: See `types.ResultOfGetCryptoBoxSeedPhrase`
         """
         response = self.request(
-            method='crypto.get_crypto_box_seed_phrase', **params.dict
+            method='crypto.get_crypto_box_seed_phrase', params_or_str=params
         )
         return self.response(
             classname=ResultOfGetCryptoBoxSeedPhrase, response=response
@@ -741,7 +776,7 @@ class TonCrypto(TonModule):
         :return: See `types.RegisteredSigningBox`
         """
         response = self.request(
-            method='crypto.get_signing_box_from_crypto_box', **params.dict
+            method='crypto.get_signing_box_from_crypto_box', params_or_str=params
         )
         return self.response(classname=RegisteredSigningBox, response=response)
 
@@ -754,13 +789,13 @@ class TonCrypto(TonModule):
         stores it in cache for secret_lifetime or until explicitly cleared
         by `clear_crypto_box_secret_cache` method.
         If `secret_lifetime` is not specified - overwrites encryption secret
-        with zeroes immediately after encryption operation.
+        with zeroes immediately after encryption operation
 
         :param params: See `types.ParamsOfGetEncryptionBoxFromCryptoBox`
         :return: See `types.RegisteredEncryptionBox`
         """
         response = self.request(
-            method='crypto.get_encryption_box_from_crypto_box', **params.dict
+            method='crypto.get_encryption_box_from_crypto_box', params_or_str=params
         )
         return self.response(classname=RegisteredEncryptionBox, response=response)
 
@@ -774,5 +809,5 @@ class TonCrypto(TonModule):
         :param params: See `types.RegisteredCryptoBox`
         """
         return self.request(
-            method='crypto.clear_crypto_box_secret_cache', **params.dict
+            method='crypto.clear_crypto_box_secret_cache', params_or_str=params
         )
@@ -1,21 +1,25 @@
 """DeBot module methods"""
-from typing import Union, Awaitable
-from warnings import warn
+from typing import Awaitable, Union
 
 from tonclient.module import TonModule
 from tonclient.types import (
-    ParamsOfStart,
-    RegisteredDebot,
-    ParamsOfFetch,
     ParamsOfExecute,
+    ParamsOfFetch,
+    ParamsOfInit,
+    ParamsOfRemove,
     ParamsOfSend,
+    ParamsOfStart,
+    RegisteredDebot,
     ResponseHandler,
-    ParamsOfInit,
     ResultOfFetch,
-    ParamsOfRemove,
 )
 
+
+# region hand-written
+from warnings import warn
+
 warn(f'`Module {__name__}` is deprecated', DeprecationWarning, stacklevel=2)
+# endregion
 
 
 class TonDebot(TonModule):
@@ -30,10 +34,12 @@ class TonDebot(TonModule):
         creates an instance of Debot Engine for it
 
         :param params: See `types.ParamsOfInit`
-        :param callback: Callback for debot events
+        :param callback: Callback to send events to
         :return: See `types.RegisteredDebot`
         """
-        response = self.request(method='debot.init', callback=callback, **params.dict)
+        response = self.request(
+            method='debot.init', params_or_str=params, callback=callback
+        )
         return self.response(classname=RegisteredDebot, response=response)
 
     def start(self, params: ParamsOfStart) -> Union[None, Awaitable[None]]:
@@ -51,9 +57,8 @@ class TonDebot(TonModule):
         never be used again
 
         :param params: See `types.ParamsOfStart`
-        :return:
         """
-        return self.request(method='debot.start', **params.dict)
+        return self.request(method='debot.start', params_or_str=params)
 
     def fetch(
         self, params: ParamsOfFetch
@@ -65,7 +70,7 @@ class TonDebot(TonModule):
         :param params: See `types.ParamsOfFetch`
         :return: See `types.ResultOfFetch`
         """
-        response = self.request(method='debot.fetch', **params.dict)
+        response = self.request(method='debot.fetch', params_or_str=params)
         return self.response(classname=ResultOfFetch, response=response)
 
     def execute(self, params: ParamsOfExecute) -> Union[None, Awaitable[None]]:
@@ -78,9 +83,8 @@ class TonDebot(TonModule):
         subactions
 
         :param params: See `types.ParamsOfExecute`
-        :return:
         """
-        return self.request(method='debot.execute', **params.dict)
+        return self.request(method='debot.execute', params_or_str=params)
 
     def send(self, params: ParamsOfSend) -> Union[None, Awaitable[None]]:
         """
@@ -89,9 +93,8 @@ class TonDebot(TonModule):
         other Debots
 
         :param params: See `types.ParamsOfSend`
-        :return:
         """
-        return self.request(method='debot.send', **params.dict)
+        return self.request(method='debot.send', params_or_str=params)
 
     def remove(self, params: ParamsOfRemove) -> Union[None, Awaitable[None]]:
         """
@@ -100,6 +103,5 @@ class TonDebot(TonModule):
         by that handle
 
         :param params: See `types.ParamsOfRemove`
-        :return:
         """
-        return self.request(method='debot.remove', **params.dict)
+        return self.request(method='debot.remove', params_or_str=params)
@@ -0,0 +1,279 @@
+"""
+Compiled result decoders.
+Decoder of types class is compiled once from its `__init__` signature:
+unknown keys added by newer core versions are dropped, nested objects are
+decoded in place (response dict is owned by decoder as with `from_dict`).
+Fields which are decoded to nested objects are the ones converted by the
+class `from_dict` (or by `from_dict` of union the class is variant of), so
+decoded objects are the same as `from_dict` ones
+"""
+import ast
+import enum
+import inspect
+import logging
+import sys
+import textwrap
+import threading
+import typing
+from typing import Any, Callable, Dict, List, Set, Union
+
+logger = logging.getLogger(__name__)
+
+Decoder = Callable[[Dict[str, Any]], Any]
+
+# Decoders of nested types are resolved while decoder is being compiled
+_LOCK = threading.RLock()
+
+
+class _Decoders(dict):
+    """Decoders by class, compiled on first lookup"""
+
+    def __missing__(self, cls: type) -> Decoder:
+        with _LOCK:
+            decoder = self.get(cls)
+            if decoder is None:
+                decoder = self[cls] = _LazyDecoder(cls=cls)
+                decoder = self[cls] = _compile(cls=cls)
+        return decoder
+
+
+_DECODERS: Dict[type, Decoder] = _Decoders()
+
+
+def load(cls: type, data: Dict[str, Any]) -> Any:
+    """
+    Build types object from response dict
+
+    :param cls: Types class, e.g. `ResultOfQueryTransactionTree`
+    :param data: Parsed response
+    :return: `cls` instance
+    """
+    return _DECODERS[cls](data)
+
+
+def get_decoder(cls: type) -> Decoder:
+    """
+    Get compiled decoder of types class
+
+    :param cls: Types class
+    :return: Decoder function
+    """
+    return _DECODERS[cls]
+
+
+class _LazyDecoder:
+    """Decoder of class which is being compiled (recursive types)"""
+
+    __slots__ = ('cls',)
+
+    def __init__(self, cls: type):
+        self.cls = cls
+
+    def __call__(self, data: Dict[str, Any]) -> Any:
+        return _DECODERS[self.cls](data)
+
+
+def _compile(cls: type) -> Decoder:
+    """Compile decoder, fall back to `from_dict` if it can't be"""
+    from_dict = inspect.getattr_static(cls, 'from_dict', None)
+    union = _union_of(cls=cls)
+
+    try:
+        if '__init__' not in vars(cls) and from_dict is not None:
+            return _compile_union(cls=cls)
+
+        decoded = set()
+        for owner in (cls, union):
+            method = inspect.getattr_static(owner, 'from_dict', None)
+            if owner is not None and method is not None:
+                decoded |= _decoded_keys(function=method.__func__)
+        return _compile_class(cls=cls, decoded=decoded)
+    except (OSError, TypeError, ValueError, SyntaxError, NameError) as exc:
+        logger.warning('Decoder of %s is not compiled: %s', cls.__qualname__, exc)
+
+    if from_dict is not None:
+        return cls.from_dict
+    return lambda data: cls(**data)
+
+
+def _union_of(cls: type) -> Union[type, None]:
+    """Union namespace class is variant of, e.g. `ProcessingEvent`"""
+    if '.' not in cls.__qualname__:
+        return None
+    owner = sys.modules[cls.__module__]
+    for name in cls.__qualname__.split('.')[:-1]:
+        owner = getattr(owner, name)
+    return owner
+
+
+def _decoded_keys(function: Callable) -> Set[str]:
+    """Keys `from_dict` converts to nested objects"""
+    source = textwrap.dedent(inspect.getsource(function))
+    keys = set()
+    for node in ast.walk(ast.parse(source)):
+        # `data['key'] = Type(**data['key'])`
+        if isinstance(node, ast.Assign):
+            for target in node.targets:
+                if isinstance(target, ast.Subscript):
+                    keys.add(_subscript_key(node=target))
+        # `Class(key=Type(**data['key']))`
+        if isinstance(node, ast.keyword) and isinstance(node.value, ast.Call):
+            keys.add(node.arg)
+    keys.discard(None)
+    return keys
+
+
+def _subscript_key(node: ast.Subscript) -> Union[str, None]:
+    key = node.slice
+    if sys.version_info < (3, 9):
+        key = getattr(key, 'value', None)
+    # Python 3.7 parses string literals as `ast.Str`
+    if sys.version_info < (3, 8):
+        return key.s if isinstance(key, ast.Str) else None
+    if isinstance(key, ast.Constant) and isinstance(key.value, str):
+        return key.value
+    return None
+
+
+def _compile_union(cls: type) -> Decoder:
+    """Decoder of union namespace, variant is chosen by `type` key"""
+    source = textwrap.dedent(inspect.getsource(cls.from_dict))
+    if "k != 'type'" not in source:
+        raise ValueError('Union `from_dict` is not standard')
+
+    variants = {
+        name: _DECODERS[variant]
+        for name, variant in vars(cls).items()
+        if inspect.isclass(variant) and '__init__' in vars(variant)
+    }
+
+    def decode(data: Dict[str, Any]) -> Any:
+        return variants[data['type']](data)
+
+    return decode
+
+
+def _compile_class(cls: type, decoded: Set[str]) -> Decoder:
+    """Decoder of plain types class"""
+    # Forward references, e.g. `List['AbiParam']`, are resolved in the
+    # module of the class
+    module = vars(sys.modules[cls.__module__])
+    hints = typing.get_type_hints(cls.__init__, globalns=module)
+    parameters = list(inspect.signature(cls.__init__).parameters.values())[1:]
+    for parameter in parameters:
+        if parameter.kind not in (
+            parameter.POSITIONAL_OR_KEYWORD,
+            parameter.KEYWORD_ONLY,
+        ):
+            raise ValueError(f'Unsupported parameter `{parameter.name}`')
+
+    # Unknown keys met in responses are remembered and removed beforehand
+    # (list is only appended, so it may be iterated by other threads)
+    extra = []
+    namespace = {
+        '_cls': cls,
+        '_known': frozenset(p.name for p in parameters),
+        '_extra': extra,
+        '_retry': _retry,
+    }
+    lines = ['def decode(data):']
+    for index, parameter in enumerate(parameters):
+        name = parameter.name
+        if name not in decoded:
+            continue
+        converter = _converter(hint=hints.get(name))
+        if converter is None:
+            continue
+
+        # Nested object or list of objects, decoded if value is not empty
+        decoder, is_list = converter
+        namespace[f'_decode{index}'] = decoder
+        lines.append(f'    _v = data.get({name!r})')
+        lines.append('    if _v:')
+        slow = f'[_decode{index}(i) if i else i for i in _v]'
+        inline = getattr(decoder, 'inline', None)
+        if not is_list:
+            lines.append(f'        data[{name!r}] = _decode{index}(_v)')
+        elif inline is None:
+            lines.append(f'        data[{name!r}] = {slow}')
+        else:
+            # Items without nested objects are built inline
+            namespace[f'_cls{index}'], namespace[f'_extra{index}'] = inline
+            fast = f'[_cls{index}(**i) if i else i for i in _v]'
+            lines.append(f'        if _extra{index}:')
+            lines.append(f'            data[{name!r}] = {slow}')
+            lines.append('        else:')
+            lines.append('            try:')
+            lines.append(f'                data[{name!r}] = {fast}')
+            lines.append('            except TypeError:')
+            lines.append(f'                data[{name!r}] = {slow}')
+    nested = len(lines) > 1
+
+    lines.append('    if _extra:')
+    lines.append('        for _k in _extra:')
+    lines.append('            data.pop(_k, None)')
+    lines.append('    try:')
+    lines.append('        return _cls(**data)')
+    lines.append('    except TypeError as _exc:')
+    lines.append('        return _retry(_cls, _known, _extra, data, _exc)')
+
+    code = compile('\n'.join(lines), f'<decoder {cls.__qualname__}>', 'exec')
+    exec(code, namespace)
+    decode = namespace['decode']
+    if not nested:
+        decode.inline = cls, extra
+    return decode
+
+
+def _retry(
+    cls: type,
+    known: Set[str],
+    extra: List[str],
+    data: Dict[str, Any],
+    exc: TypeError,
+) -> Any:
+    """
+    Build object again without unknown keys and remember them
+
+    :param exc: Error of the first attempt, raised if there are no
+            unknown keys
+    """
+    unknown = data.keys() - known
+    if not unknown:
+        raise exc
+    with _LOCK:
+        for key in unknown.difference(extra):
+            logger.debug('Unknown key of %s: %s', cls.__qualname__, key)
+            extra.append(key)
+    for key in unknown:
+        del data[key]
+    return cls(**data)
+
+
+def _converter(hint: Any) -> Union[tuple, None]:
+    """
+    Get decoder of annotated field
+
+    :param hint: Field annotation
+    :return: Tuple of (decoder, is list) or `None` if field is kept as is
+    """
+    origin = getattr(hint, '__origin__', None)
+    if origin in (list, List):
+        converter = _converter(hint=hint.__args__[0])
+        return (converter[0], True) if converter and not converter[1] else None
+    if origin is Union:
+        args = [a for a in hint.__args__ if a is not type(None)]
+        if len(args) == 1:
+            return _converter(hint=args[0])
+        # Union of variants, e.g. `ProcessingEventType`
+        unions = {_union_of(cls=a) if inspect.isclass(a) else None for a in args}
+        if len(unions) == 1 and None not in unions:
+            return _DECODERS[unions.pop()], False
+        return None
+    if (
+        inspect.isclass(hint)
+        and hint.__module__.startswith('tonclient.types')
+        and not issubclass(hint, enum.Enum)
+    ):
+        return _DECODERS[hint], False
+    return None
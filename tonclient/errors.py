@@ -2,18 +2,8 @@
 from enum import EnumMeta
 from typing import Any, Tuple, Union
 
-from tonclient.types import (
-    ClientError,
-    AbiErrorCode,
-    ClientErrorCode,
-    BocErrorCode,
-    CryptoErrorCode,
-    NetErrorCode,
-    ProcessingErrorCode,
-    TvmErrorCode,
-    DebotErrorCode,
-    ProofsErrorCode,
-)
+from tonclient import types
+from tonclient.types import ClientError
 
 
 class TonException(Exception):
@@ -52,19 +42,24 @@ class TonException(Exception):
         :param code: Error code
         :return: Module class name, error verbose name
         """
+        # Error codes are resolved here, so types modules are imported lazily
         modules = [
-            ClientErrorCode,
-            AbiErrorCode,
-            BocErrorCode,
-            CryptoErrorCode,
-            NetErrorCode,
-            ProcessingErrorCode,
-            TvmErrorCode,
-            DebotErrorCode,
-            ProofsErrorCode,
+            types.ClientErrorCode,
+            types.AbiErrorCode,
+            types.BocErrorCode,
+            types.CryptoErrorCode,
+            types.NetErrorCode,
+            types.ProcessingErrorCode,
+            types.TvmErrorCode,
+            types.DebotErrorCode,
+            types.ProofsErrorCode,
         ]
         for module in modules:
             if code not in list(module):
                 continue
             return module, module(code).name
         return None, 'UNKNOWN'
+
+
+class TonTimeoutError(TonException, TimeoutError):
+    """Core request was not completed in time"""
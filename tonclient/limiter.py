@@ -0,0 +1,186 @@
+"""Client requests concurrency limiter"""
+import asyncio
+import collections
+import threading
+from typing import Any, Dict, Union
+
+
+class _Family:
+    """Limit state of requests with the same method prefix"""
+
+    __slots__ = ('prefix', 'limit', 'active', 'queue', 'queued_total', 'max_queued')
+
+    def __init__(self, prefix: str, limit: int):
+        self.prefix = prefix
+        self.limit = limit
+        self.active = 0
+        # FIFO of sync waiters (locked `threading.Lock`) and asyncio waiters
+        # (`(loop, future)`), so sync and asyncio requests are served fairly
+        self.queue = collections.deque()
+        self.queued_total = 0
+        self.max_queued = 0
+
+
+class ConcurrencyLimiter:
+    """
+    Caps concurrent core requests per method prefix, e.g. `net.` or
+    `processing.`. Excess requests wait in FIFO order; the slot of completed
+    request is handed over to the first waiter.
+    Method is limited by the longest matching prefix, methods without
+    matching prefix are not limited
+    """
+
+    def __init__(self, limits: Dict[str, int]):
+        """
+        :param limits: Dict of method prefix -> max concurrent requests
+        """
+        for prefix, limit in limits.items():
+            if limit < 1:
+                raise ValueError(f'Limit of `{prefix}` must be positive')
+
+        self._families = {
+            prefix: _Family(prefix=prefix, limit=limit)
+            for prefix, limit in limits.items()
+        }
+        self._methods: Dict[str, Union[_Family, None]] = {}
+        self._lock = threading.Lock()
+
+    def family(self, method: str) -> Union[_Family, None]:
+        """Get limit of method, `None` if method is not limited"""
+        try:
+            return self._methods[method]
+        except KeyError:
+            pass
+
+        prefixes = [p for p in self._families if method.startswith(p)]
+        family = self._families[max(prefixes, key=len)] if prefixes else None
+        self._methods[method] = family
+        return family
+
+    def _try_acquire(self, family: _Family, waiter: Any) -> bool:
+        """Take slot or enqueue waiter, called under lock"""
+        if family.active < family.limit and not family.queue:
+            family.active += 1
+            return True
+
+        family.queue.append(waiter)
+        family.queued_total += 1
+        family.max_queued = max(family.max_queued, len(family.queue))
+        return False
+
+    def acquire(self, family: _Family, timeout: float = None) -> bool:
+        """
+        Wait for slot in sync mode
+
+        :param family: Limit returned by `family()`
+        :param timeout: Timeout in seconds, wait forever if `None`
+        :return: `False` on timeout
+        """
+        waiter = threading.Lock()
+        waiter.acquire()
+        with self._lock:
+            if self._try_acquire(family=family, waiter=waiter):
+                return True
+
+        if waiter.acquire(timeout=-1 if timeout is None else timeout):
+            return True
+        with self._lock:
+            try:
+                family.queue.remove(waiter)
+                return False
+            except ValueError:
+                # Slot was handed over after timeout
+                return True
+
+    async def acquire_async(self, family: _Family):
+        """
+        Wait for slot in asyncio mode
+
+        :param family: Limit returned by `family()`
+        """
+        loop = asyncio.get_event_loop()
+        future = loop.create_future()
+        with self._lock:
+            if self._try_acquire(family=family, waiter=(loop, future)):
+                return
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                try:
+                    family.queue.remove((loop, future))
+                    raise
+                except ValueError:
+                    pass
+            # Slot was handed over, cancelled future hands it over again
+            if not future.cancelled():
+                self.release(family=family)
+            raise
+
+    def release(self, family: _Family):
+        """
+        Release slot, hand it over to the first waiter
+
+        :param family: Limit returned by `family()`
+        """
+        with self._lock:
+            if not family.queue:
+                family.active -= 1
+                return
+            waiter = family.queue.popleft()
+
+        if isinstance(waiter, tuple):
+            loop, future = waiter
+            loop.call_soon_threadsafe(self._grant, family, future)
+        else:
+            waiter.release()
+
+    def _grant(self, family: _Family, future: asyncio.Future):
+        """Hand over slot to asyncio waiter, called in its loop"""
+        if future.cancelled():
+            self.release(family=family)
+        else:
+            future.set_result(None)
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        """
+        Get limits state
+
+        :return: Dict of prefix -> `limit`, `in_flight`, `queued` (current
+                queue depth), `max_queued` and `queued_total`
+        """
+        with self._lock:
+            return {
+                family.prefix: {
+                    'limit': family.limit,
+                    'in_flight': family.active,
+                    'queued': len(family.queue),
+                    'max_queued': family.max_queued,
+                    'queued_total': family.queued_total,
+                }
+                for family in self._families.values()
+            }
+
+    def prometheus(self, prefix: str = 'tonclient') -> str:
+        """
+        Export limits state in Prometheus text format
+
+        :param prefix: Metrics names prefix
+        :return: Exposition text
+        """
+        snapshot = self.snapshot()
+        gauges = (
+            ('limit_in_flight', 'gauge', 'in_flight', 'Requests holding slot'),
+            ('limit_queued', 'gauge', 'queued', 'Requests waiting for slot'),
+            ('limit_queued_total', 'counter', 'queued_total', 'Queued requests'),
+        )
+
+        lines = []
+        for name, kind, key, description in gauges:
+            lines.append(f'# HELP {prefix}_{name} {description}')
+            lines.append(f'# TYPE {prefix}_{name} {kind}')
+            for family, state in snapshot.items():
+                lines.append(f'{prefix}_{name}{{prefix="{family}"}} {state[key]}')
+
+        return '\n'.join(lines) + '\n'
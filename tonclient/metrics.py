@@ -0,0 +1,164 @@
+"""Client requests metrics"""
+import bisect
+import threading
+import time
+from typing import Any, Dict, Tuple
+
+# Latency histogram buckets upper bounds (seconds)
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+
+class MethodMetrics:
+    """Metrics of single core method"""
+
+    __slots__ = (
+        'requests',
+        'errors',
+        'in_flight',
+        'request_bytes',
+        'response_bytes',
+        'latency_sum',
+        'latency_counts',
+    )
+
+    def __init__(self, buckets: int):
+        self.requests = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.latency_sum = 0.0
+        # Last item counts latencies over the greatest bucket
+        self.latency_counts = [0] * (buckets + 1)
+
+
+class ClientMetrics:
+    """
+    Per method counters, in-flight gauges, payload sizes and latency
+    histograms of core requests.
+    Client records metrics only if they are enabled, otherwise requests
+    cost a single `None` check
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        """
+        :param buckets: Latency histogram buckets upper bounds (seconds)
+        """
+        self.buckets = tuple(sorted(buckets))
+        self._methods: Dict[str, MethodMetrics] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, method: str) -> MethodMetrics:
+        metrics = self._methods.get(method)
+        if metrics is None:
+            metrics = self._methods.setdefault(
+                method, MethodMetrics(buckets=len(self.buckets))
+            )
+        return metrics
+
+    def started(self, method: str, size: int) -> float:
+        """
+        Record request start
+
+        :param method: Core method name
+        :param size: Request params size in bytes
+        :return: Start time to pass to `finished`
+        """
+        with self._lock:
+            metrics = self._get(method=method)
+            metrics.requests += 1
+            metrics.in_flight += 1
+            metrics.request_bytes += size
+        return time.perf_counter()
+
+    def response(self, method: str, size: int):
+        """
+        Record core response (result, error or intermediate event)
+
+        :param method: Core method name
+        :param size: Response size in bytes
+        """
+        with self._lock:
+            self._get(method=method).response_bytes += size
+
+    def finished(self, method: str, started: float, is_error: bool = False):
+        """
+        Record request completion
+
+        :param method: Core method name
+        :param started: Value returned by `started`
+        :param is_error: Request completed with error
+        """
+        latency = time.perf_counter() - started
+        index = bisect.bisect_left(self.buckets, latency)
+        with self._lock:
+            metrics = self._get(method=method)
+            metrics.in_flight -= 1
+            metrics.errors += is_error
+            metrics.latency_sum += latency
+            metrics.latency_counts[index] += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get metrics snapshot
+
+        :return: Dict of method -> metrics, latency buckets are cumulative
+                and keyed by upper bound (`float('inf')` for the last one)
+        """
+        bounds = self.buckets + (float('inf'),)
+        snapshot = {}
+        with self._lock:
+            for method, metrics in self._methods.items():
+                cumulative, buckets = 0, {}
+                for bound, count in zip(bounds, metrics.latency_counts):
+                    cumulative += count
+                    buckets[bound] = cumulative
+                snapshot[method] = {
+                    'requests': metrics.requests,
+                    'errors': metrics.errors,
+                    'in_flight': metrics.in_flight,
+                    'request_bytes': metrics.request_bytes,
+                    'response_bytes': metrics.response_bytes,
+                    'latency': {
+                        'count': cumulative,
+                        'sum': metrics.latency_sum,
+                        'buckets': buckets,
+                    },
+                }
+        return snapshot
+
+    def prometheus(self, prefix: str = 'tonclient') -> str:
+        """
+        Export metrics in Prometheus text format
+
+        :param prefix: Metrics names prefix
+        :return: Exposition text
+        """
+        snapshot = self.snapshot()
+        counters = (
+            ('requests_total', 'counter', 'requests', 'Core requests'),
+            ('request_errors_total', 'counter', 'errors', 'Failed core requests'),
+            ('requests_in_flight', 'gauge', 'in_flight', 'Core requests in flight'),
+            ('request_bytes_total', 'counter', 'request_bytes', 'Params size'),
+            ('response_bytes_total', 'counter', 'response_bytes', 'Responses size'),
+        )
+
+        lines = []
+        for name, kind, key, description in counters:
+            lines.append(f'# HELP {prefix}_{name} {description}')
+            lines.append(f'# TYPE {prefix}_{name} {kind}')
+            for method, metrics in snapshot.items():
+                lines.append(f'{prefix}_{name}{{method="{method}"}} {metrics[key]}')
+
+        name = f'{prefix}_request_duration_seconds'
+        lines.append(f'# HELP {name} Core requests latency')
+        lines.append(f'# TYPE {name} histogram')
+        for method, metrics in snapshot.items():
+            latency = metrics['latency']
+            for bound, count in latency['buckets'].items():
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                lines.append(f'{name}_bucket{{method="{method}",le="{le}"}} {count}')
+            lines.append(f'{name}_sum{{method="{method}"}} {latency["sum"]}')
+            lines.append(f'{name}_count{{method="{method}"}} {latency["count"]}')
+
+        return '\n'.join(lines) + '\n'
@@ -1,28 +1,417 @@
 """Base bindings module"""
 import asyncio
+import collections
+import contextlib
+import contextvars
 import inspect
+import itertools
 import logging
-import os
+import threading
+import time
+import weakref
 
-import json
-from concurrent.futures import Future
-from typing import Any, Dict, Union
+from typing import Any, Container, Dict, Iterator, List, Union
 
+from tonclient.bindings.codec import JsonCodec
 from tonclient.bindings.lib import (
     tc_request,
     tc_request_sync,
-    tc_read_string,
-    tc_destroy_string,
+    tc_read_response,
 )
 from tonclient.bindings.types import (
     TCStringData,
     TCResponseHandler,
     TCResponseType,
-    TCSyncResponseData,
 )
-from tonclient.errors import TonException
+from tonclient.decoders import load
+from tonclient.errors import TonException, TonTimeoutError
+from tonclient.metrics import ClientMetrics
+from tonclient.serializers import dump
+from tonclient.tracing import Tracer
 from tonclient.types import ClientError, ResponseHandler
 
+logger = logging.getLogger(__name__)
+
+# Options of requests made in the current context, see `request_options`
+_REQUEST_OPTIONS = contextvars.ContextVar('request_options', default={})
+REQUEST_OPTIONS = ('timeout', 'raw')
+RAW_MODES = ('dict', 'bytes')
+
+
+def check_raw(raw: Union[str, None]):
+    """Check raw result mode"""
+    if raw is not None and raw not in RAW_MODES:
+        raise ValueError(f'Raw result mode must be one of {RAW_MODES} or `None`')
+
+
+@contextlib.contextmanager
+def request_options(**options) -> Iterator[None]:
+    """
+    Set options of requests made in the context (thread or asyncio task),
+    they override client defaults.
+    Core method params are passed as request kwargs, so options can't be.
+
+        with request_options(timeout=10):
+            client.net.query_collection(params=params)
+
+    :param options: `timeout` - timeout in seconds (`None` to wait forever),
+            applies to waiting in the concurrency limiter queue and to the
+            core request separately; sync core requests can't time out
+            once they are sent.
+            `raw` - return results as parsed dicts (`'dict'`) or as
+            undecoded JSON (`'bytes'`) instead of types objects, `None`
+            for objects
+    """
+    unknown = set(options) - set(REQUEST_OPTIONS)
+    if unknown:
+        raise TypeError(f'Unknown request options {sorted(unknown)}')
+    if 'raw' in options:
+        check_raw(raw=options['raw'])
+
+    token = _REQUEST_OPTIONS.set({**_REQUEST_OPTIONS.get(), **options})
+    try:
+        yield
+    finally:
+        _REQUEST_OPTIONS.reset(token)
+
+
+class RequestIdAllocator:
+    """
+    Monotonic request ids allocator.
+    `next()` on `itertools.count` is atomic, so ids are allocated without
+    locks and syscalls. Ids wrap around and skip ones which are still in use
+    """
+
+    # Response handler receives request id as `c_int32`
+    MAX_ID = 0x7FFFFFFF
+
+    def __init__(self):
+        self._counter = itertools.count(1)
+
+    def allocate(self, in_use: Container[int]) -> int:
+        """
+        Allocate request id
+
+        :param in_use: Ids of requests in flight
+        :return: Request id
+        """
+        while True:
+            request_id = next(self._counter) & self.MAX_ID
+            if request_id and request_id not in in_use:
+                return request_id
+
+
+class RequestWaiter:
+    """
+    Result waiter of the sync client core request.
+    Lighter replacement of `concurrent.futures.Future`: one lock, which is
+    held until result or exception is set, without condition variable and
+    callbacks machinery
+    """
+
+    __slots__ = ('_lock', '_result', '_exception')
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._lock.acquire()
+        self._result = None
+        self._exception = None
+
+    def set_result(self, result: Any):
+        """Set result and wake up waiting thread"""
+        self._result = result
+        self._lock.release()
+
+    def set_exception(self, exception: Exception):
+        """Set exception and wake up waiting thread"""
+        self._exception = exception
+        self._lock.release()
+
+    def wait(self, timeout: float = None) -> bool:
+        """
+        Wait for the result or exception
+
+        :param timeout: Timeout in seconds, wait forever if `None`
+        :return: `False` on timeout
+        """
+        if not self._lock.acquire(timeout=-1 if timeout is None else timeout):
+            return False
+        self._lock.release()
+        return True
+
+    def result(self) -> Any:
+        """Wait for the result, raise exception if it is set"""
+        self.wait()
+        if self._exception is not None:
+            raise self._exception
+        return self._result
+
+
+class LoopDelivery:
+    """
+    Batched delivery of results to event loop futures.
+    Core threads push results to the buffer and the loop is woken up once
+    per batch, instead of `call_soon_threadsafe` for each result
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        # Loop is referenced weakly, router deliveries are keyed by loop
+        self._loop = weakref.ref(loop)
+        self._buffer = collections.deque()
+        self._scheduled = False
+
+    def push(
+        self, future: asyncio.Future, result: Any = None, exception: Exception = None
+    ):
+        """Push result or exception for future, may be called from any thread"""
+        self._buffer.append((future, result, exception))
+        if self._scheduled:
+            return
+        loop = self._loop()
+        if loop is None or loop.is_closed():
+            return
+        # Flag is checked without lock: racing pushers at most schedule
+        # an extra drain, which finds an empty buffer
+        self._scheduled = True
+        loop.call_soon_threadsafe(self._drain)
+
+    def _drain(self):
+        """Resolve buffered futures, called in the loop"""
+        # Results pushed after the flag is reset schedule the next drain
+        self._scheduled = False
+
+        buffer = self._buffer
+        while buffer:
+            future, result, exception = buffer.popleft()
+            if future.done():
+                continue
+            if exception is not None:
+                future.set_exception(exception)
+            else:
+                future.set_result(result)
+
+
+# Response handlers of all routers. Core may call handler of a client
+# after the client is collected (e.g. with late response of timed out
+# request), so callback objects are never freed
+_HANDLERS: List[TCResponseHandler] = []
+
+
+def _response_handler(router: 'ResponseRouter') -> TCResponseHandler:
+    """Create router response handler, which references router weakly"""
+    ref = weakref.ref(router)
+
+    def _handle(
+        request_id: int, response_data: TCStringData, response_type: int, finished: bool
+    ):
+        target = ref()
+        if target is not None:
+            target._handle(request_id, response_data, response_type, finished)
+
+    handler = TCResponseHandler(_handle)
+    _HANDLERS.append(handler)
+    return handler
+
+
+class ResponseRouter:
+    """
+    Client core responses router.
+    Each client has its own requests table, ids and response handler, so
+    clients don't share (and contend on) a single table.
+    Handler is never freed and references router weakly, see
+    `_response_handler`
+    """
+
+    delivery_class = LoopDelivery
+
+    def __init__(
+        self, codec: JsonCodec, metrics: ClientMetrics = None, tracer: Tracer = None
+    ):
+        self.codec = codec
+        self.metrics = metrics
+        self.tracer = tracer
+        self.requests: Dict[int, Dict[str, Any]] = {}
+        self.request_ids = RequestIdAllocator()
+        self.handler = _response_handler(router=self)
+        self._deliveries = weakref.WeakKeyDictionary()
+
+    def delivery(self, loop: asyncio.AbstractEventLoop) -> LoopDelivery:
+        """Get results delivery for event loop"""
+        delivery = self._deliveries.get(loop)
+        if delivery is None:
+            delivery = self._deliveries[loop] = self.delivery_class(loop=loop)
+        return delivery
+
+    def register(self, request: Dict[str, Any]) -> int:
+        """
+        Add request to the table
+
+        :param request: Request data (future, callback, etc.)
+        :return: Request id
+        """
+        request_id = self.request_ids.allocate(in_use=self.requests)
+        request['created'] = time.monotonic()
+        self.requests[request_id] = request
+        return request_id
+
+    def cancel(self, request_id: int, exception: Exception) -> bool:
+        """
+        Remove request from the table, e.g. on timeout or cancellation.
+        Core has no generic request abort, so it may still complete the
+        request, late responses are ignored
+
+        :param request_id: Request id
+        :param exception: Reason of cancellation
+        :return: Whether request was in flight
+        """
+        request = self.requests.pop(request_id, None)
+        if request is None:
+            return False
+        self._finished(request=request, exception=exception)
+        return True
+
+    def stale_requests(self, max_age: float) -> List[Dict[str, Any]]:
+        """
+        Find requests which are in flight longer than `max_age`.
+        Subscriptions stay in the table until they are unsubscribed, so
+        they are reported too
+
+        :param max_age: Age in seconds
+        :return: List of dicts with `request_id`, `method` and `age`
+        """
+        now = time.monotonic()
+        return [
+            {
+                'request_id': request_id,
+                'method': request.get('method'),
+                'age': now - request['created'],
+            }
+            for request_id, request in list(self.requests.items())
+            if now - request['created'] > max_age
+        ]
+
+    def _finished(self, request: Dict[str, Any], exception: Exception = None):
+        """Record request completion"""
+        self._observe(request=request, finished=True, exception=exception)
+
+    def _observe(
+        self,
+        request: Dict[str, Any],
+        finished: bool,
+        exception: Exception = None,
+        response_type: int = None,
+        data: Any = None,
+        size: int = None,
+    ):
+        """
+        Report request to metrics and tracer, called after request future
+        is resolved. Errors are logged, since core calls response handler
+        and exceptions raised in it are lost
+
+        :param size: Response size, `None` if there is no core response
+        """
+        try:
+            metrics = self.metrics
+            if metrics is not None and size is not None:
+                metrics.response(method=request['method'], size=size)
+            if metrics is not None and finished:
+                metrics.finished(
+                    method=request['method'],
+                    started=request['started'],
+                    is_error=exception is not None,
+                )
+
+            tracer = self.tracer
+            if tracer is None:
+                return
+            if finished:
+                tracer.end(
+                    span=request['span'],
+                    duration=time.perf_counter() - request['span_started'],
+                    error=exception,
+                )
+            else:
+                tracer.event(
+                    span=request['span'], response_type=response_type, data=data
+                )
+        except Exception:  # pylint: disable=broad-except
+            logger.exception('Observer of request `%s` failed', request['method'])
+
+    def _handle(
+        self,
+        request_id: int,
+        response_data: TCStringData,
+        response_type: int,
+        finished: bool,
+    ):
+        """Core response handler"""
+        request = self.requests.get(request_id)
+        is_debug = logging.root.isEnabledFor(logging.DEBUG)
+        if not request and not is_debug:
+            return
+
+        # Response is parsed once, log arguments are built only if needed.
+        # Results of raw bytes requests are not parsed at all
+        exception = None
+        if (
+            response_type == TCResponseType.Success
+            and request
+            and request.get('raw') == 'bytes'
+        ):
+            data = response_data.to_bytes
+        else:
+            try:
+                data = response_data.loads(codec=self.codec)
+            except ValueError as exc:
+                # Malformed response fails the request, not the callback
+                data, exception = response_data.string, exc
+        if is_debug:
+            logging.debug(
+                'Request: %s; Response: %r; Response type: %s; Finished: %s',
+                request_id,
+                data,
+                response_type,
+                finished,
+            )
+
+        # Request may be removed on timeout or cancellation
+        if not request:
+            return
+        if finished and self.requests.pop(request_id, None) is None:
+            return
+
+        if exception is None and response_type == TCResponseType.Error:
+            exception = TonException(error=ClientError(**data))
+
+        if exception is None and response_type == TCResponseType.Success:
+            # Check if client is asyncio or common
+            if request['is_async']:
+                request['delivery'].push(future=request['future'], result=data)
+            else:
+                request['future'].set_result(data)
+        elif exception is not None:
+            # Check if client is asyncio or common
+            if request['is_async']:
+                request['delivery'].push(
+                    future=request['future'], exception=exception
+                )
+            else:
+                request['future'].set_exception(exception)
+        elif request['callback'] and data:
+            args = [data, response_type, request.get('loop')]
+            request['callback'](*args)
+
+        # Observers are called when the request is already resolved
+        if self.metrics is not None or self.tracer is not None:
+            self._observe(
+                request=request,
+                finished=finished,
+                exception=exception,
+                response_type=response_type,
+                data=data,
+                size=response_data.len,
+            )
+
 
 class TonModule:
     """
@@ -31,8 +420,6 @@ class TonModule:
     from this class.
     """
 
-    _async_response_map = {}
-
     def __init__(self, client):
         self._client = client
 
@@ -40,59 +427,113 @@ class TonModule:
         self,
         method: str,
         callback: ResponseHandler = None,
-        params_or_str: Union[str, Dict[str, Any]] = None,
+        params_or_str: Union[str, Dict[str, Any], Any] = None,
         **kwargs,
     ) -> Any:
         """Perform core request"""
         # Prepare request params
         request_params = self._prepare_params(params_or_str, **kwargs)
-        kwargs = {'method': method, 'request_params': request_params}
+        options = _REQUEST_OPTIONS.get()
+        timeout = options.get('timeout', self._client.timeout)
+        kwargs = {
+            'method': method,
+            'request_params': request_params,
+            'raw': options.get('raw', self._client.raw),
+        }
+
+        limiter = self._client.limiter
+        family = None if limiter is None else limiter.family(method=method)
 
         # Make sync or async core/client request
         if self._client.is_core_async:
-            kwargs.update({'callback': callback})
+            kwargs.update({'callback': callback, 'timeout': timeout})
             if self._client.is_async:
+                if family is not None:
+                    return self._limited_request_future(family=family, **kwargs)
                 return self._async_core_request_future(**kwargs)
-            return self._async_core_request(**kwargs)
-        return self._sync_core_request(**kwargs)
-
-    def _sync_core_request(self, method: str, request_params: str) -> Any:
+            core_request = self._async_core_request
+        else:
+            core_request = self._sync_core_request
+
+        if family is None:
+            return core_request(**kwargs)
+
+        # Wait for free slot of the method family
+        if not limiter.acquire(family=family, timeout=timeout):
+            raise TonTimeoutError(
+                f'Request `{method}` timed out in queue after {timeout} seconds'
+            )
+        try:
+            return core_request(**kwargs)
+        finally:
+            limiter.release(family=family)
+
+    def _sync_core_request(
+        self, method: str, request_params: bytes, raw: str = None
+    ) -> Any:
         """Perform core synchronous request"""
+        metrics = self._client.metrics
+        if metrics is not None:
+            started = metrics.started(method=method, size=len(request_params))
+        tracer = self._client.tracer
+        if tracer is not None:
+            span = tracer.start(method=method)
+            span_started = time.perf_counter()
+
         # Make sync request, get response pointer and parse it
         response_ptr = tc_request_sync(
             ctx=self._client.ctx, method=method, params_json=request_params
         )
-        response = TCSyncResponseData(tc_read_string(string=response_ptr))
-
-        # Copy response data and destroy response pointer
-        is_success, result, error = (
-            response.is_success,
-            response.result,
-            response.error,
-        )
-        tc_destroy_string(string=response_ptr)
-
-        if not is_success:
-            raise TonException(error=ClientError(**error))
+        response = tc_read_response(string=response_ptr, codec=self._client.codec)
+
+        if metrics is not None:
+            metrics.response(method=method, size=response.size)
+            metrics.finished(
+                method=method, started=started, is_error=not response.is_success
+            )
+
+        exception = None
+        if not response.is_success:
+            exception = TonException(error=ClientError(**response.error))
+
+        if tracer is not None:
+            try:
+                tracer.end(
+                    span=span,
+                    duration=time.perf_counter() - span_started,
+                    error=exception,
+                )
+            except Exception:  # pylint: disable=broad-except
+                logger.exception('Tracer of request `%s` failed', method)
 
-        return result
+        if exception is not None:
+            raise exception
+        if raw == 'bytes':
+            # Result is a part of sync response, so it's encoded again
+            return self._client.codec.dumps(response.result)
+        return response.result
 
     def _async_core_request(
-        self, method: str, request_params: str, callback: ResponseHandler
+        self,
+        method: str,
+        request_params: bytes,
+        callback: ResponseHandler,
+        timeout: float = None,
+        raw: str = None,
     ) -> Any:
         """Perform core asynchronous request"""
-        # Generate request id
-        request_id = self._generate_request_id()
-
-        # Create concurrent future
-        future = Future()
-
-        # Set response map data
-        self._async_response_map[request_id] = {
-            'is_async': False,
-            'callback': callback,
-            'future': future,
-        }
+        # Create waiter and register request
+        waiter = RequestWaiter()
+        request_id = self._register(
+            method=method,
+            request_params=request_params,
+            request={
+                'is_async': False,
+                'callback': callback,
+                'future': waiter,
+                'raw': raw,
+            },
+        )
 
         # Execute core request
         tc_request(
@@ -100,33 +541,44 @@ class TonModule:
             method=method,
             request_id=request_id,
             params_json=request_params,
-            response_handler=self._async_response_handler,
+            response_handler=self._client.router.handler,
         )
 
-        # Resolve future
-        exception = future.exception()
-        if exception:
-            raise exception
-        return future.result()
+        if not waiter.wait(timeout=timeout):
+            exception = TonTimeoutError(
+                f'Request `{method}` timed out after {timeout} seconds'
+            )
+            # Request is not in the table if the response raced the timeout,
+            # handler is resolving the waiter
+            if self._client.router.cancel(request_id=request_id, exception=exception):
+                raise exception
+        return waiter.result()
 
     async def _async_core_request_future(
-        self, method: str, request_params: str, callback: ResponseHandler
+        self,
+        method: str,
+        request_params: bytes,
+        callback: ResponseHandler,
+        timeout: float = None,
+        raw: str = None,
     ):
         """Perform core asynchronous request"""
-        # Generate request id
-        request_id = self._generate_request_id()
-
-        # Get event loop and create future
+        # Get event loop, create future and register request
         loop = asyncio.get_event_loop()
         future = loop.create_future()
-
-        # Set response map data
-        self._async_response_map[request_id] = {
-            'is_async': True,
-            'callback': callback,
-            'loop': loop,
-            'future': future,
-        }
+        router = self._client.router
+        request_id = self._register(
+            method=method,
+            request_params=request_params,
+            request={
+                'is_async': True,
+                'callback': callback,
+                'loop': loop,
+                'delivery': router.delivery(loop=loop),
+                'future': future,
+                'raw': raw,
+            },
+        )
 
         # Execute core request
         tc_request(
@@ -134,36 +586,72 @@ class TonModule:
             method=method,
             request_id=request_id,
             params_json=request_params,
-            response_handler=self._async_response_handler,
+            response_handler=router.handler,
         )
 
-        return await future
-
-    def _generate_request_id(self, size: int = 3) -> int:
-        """
-        Generate random int of size in bytes
-
-        :param size: Length in bytes
-        :return:
-        """
-        while True:
-            request_id = int.from_bytes(os.urandom(size), 'big')
-            if request_id in self._async_response_map:
-                continue
-            return request_id
-
-    @staticmethod
-    def response(classname: type, response: Any):
+        try:
+            if timeout is not None:
+                # Future is not cancelled on timeout, unlike `wait_for`, so
+                # response which raced the timeout is still delivered to it
+                await asyncio.wait((future,), timeout=timeout)
+                if not future.done():
+                    exception = TonTimeoutError(
+                        f'Request `{method}` timed out after {timeout} seconds'
+                    )
+                    if router.cancel(request_id=request_id, exception=exception):
+                        raise exception
+            return await future
+        except asyncio.CancelledError as exc:
+            router.cancel(request_id=request_id, exception=exc)
+            raise
+
+    async def _limited_request_future(self, family: Any, **kwargs):
+        """Perform asyncio request when slot of the method family is free"""
+        limiter = self._client.limiter
+        timeout = kwargs['timeout']
+        try:
+            await asyncio.wait_for(
+                limiter.acquire_async(family=family), timeout=timeout
+            )
+        except asyncio.TimeoutError:
+            raise TonTimeoutError(
+                f'Request `{kwargs["method"]}` timed out in queue after '
+                f'{timeout} seconds'
+            ) from None
+
+        try:
+            return await self._async_core_request_future(**kwargs)
+        finally:
+            limiter.release(family=family)
+
+    def _register(
+        self, method: str, request_params: bytes, request: Dict[str, Any]
+    ) -> int:
+        """Register async core request in client router"""
+        request['method'] = method
+        metrics = self._client.metrics
+        if metrics is not None:
+            request['started'] = metrics.started(
+                method=method, size=len(request_params)
+            )
+        tracer = self._client.tracer
+        if tracer is not None:
+            request['span'] = tracer.start(method=method)
+            request['span_started'] = time.perf_counter()
+        return self._client.router.register(request=request)
+
+    def response(self, classname: type, response: Any):
         """
-        Parse response
+        Parse response, result of raw mode request is returned as is
 
         :return: Awaitable if `response` is awaitable or `classname` instance
         """
+        # Mode is resolved in the same context the request was made in
+        if _REQUEST_OPTIONS.get().get('raw', self._client.raw) is not None:
+            return response
 
         def _parse(result):
-            if hasattr(classname, 'from_dict'):
-                return classname.from_dict(data=result)
-            return classname(**result)
+            return load(cls=classname, data=result)
 
         def _sync_response():
             """Decorate synchronous request response"""
@@ -179,57 +667,18 @@ class TonModule:
             return _async_response()
         return _sync_response()
 
-    @staticmethod
-    def _prepare_params(params_or_str, **kwargs) -> str:
+    def _prepare_params(self, params_or_str, **kwargs) -> bytes:
         """Prepare params to pass to request"""
         if isinstance(params_or_str, dict):
-            params_or_str = {**params_or_str, **kwargs}
+            if kwargs:
+                params_or_str = {**params_or_str, **kwargs}
         elif params_or_str is None:
             params_or_str = kwargs or {}
-
-        return json.dumps(params_or_str)
-
-    @staticmethod
-    @TCResponseHandler
-    def _async_response_handler(
-        request_id: int, response_data: TCStringData, response_type: int, finished: bool
-    ):
-        """Core response handler"""
-        logging.debug(
-            'Request: %s; Response: %r; Response type: %s; Finished: %s',
-            request_id,
-            response_data.json,
-            response_type,
-            finished,
-        )
-
-        request = TonModule._async_response_map.get(request_id)
-        if not request:
-            return
-        if finished:
-            del TonModule._async_response_map[request_id]
-
-        if response_type == TCResponseType.Success:
-            # Check if client is asyncio or common
-            if request['is_async']:
-                request['loop'].call_soon_threadsafe(
-                    request['future'].set_result, response_data.json
-                )
-            else:
-                request['future'].set_result(response_data.json)
-            return
-
-        if response_type == TCResponseType.Error:
-            exception = TonException(error=ClientError(**response_data.json))
-            # Check if client is asyncio or common
-            if request['is_async']:
-                request['loop'].call_soon_threadsafe(
-                    request['future'].set_exception, exception
-                )
-            else:
-                request['future'].set_exception(exception)
-            return
-
-        if request['callback'] and response_data.json:
-            args = [response_data.json, response_type, request.get('loop')]
-            request['callback'](*args)
+        elif not isinstance(params_or_str, str):
+            # Params object, e.g. `ParamsOfEncodeMessage`. Dumped dict is
+            # a new object, so kwargs are merged into it without a copy
+            params_or_str = dump(params_or_str)
+            if kwargs:
+                params_or_str.update(kwargs)
+
+        return self._client.codec.dumps(params_or_str)
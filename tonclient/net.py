@@ -1,37 +1,37 @@
 """Net module methods"""
-from typing import Union, Awaitable
+from typing import Awaitable, Union
 
 from tonclient.module import TonModule
 from tonclient.types import (
-    ParamsOfQuery,
-    ResultOfQuery,
-    ParamsOfQueryCollection,
-    ResultOfQueryCollection,
-    ParamsOfWaitForCollection,
-    ResultOfWaitForCollection,
-    ResultOfSubscribeCollection,
-    ParamsOfSubscribeCollection,
-    ParamsOfFindLastShardBlock,
-    ResultOfFindLastShardBlock,
     EndpointsSet,
     ParamsOfAggregateCollection,
-    ResultOfAggregateCollection,
     ParamsOfBatchQuery,
-    ResultOfBatchQuery,
-    ResponseHandler,
+    ParamsOfCreateBlockIterator,
+    ParamsOfCreateTransactionIterator,
+    ParamsOfFindLastShardBlock,
+    ParamsOfIteratorNext,
+    ParamsOfQuery,
+    ParamsOfQueryCollection,
     ParamsOfQueryCounterparties,
-    ResultOfGetEndpoints,
     ParamsOfQueryTransactionTree,
-    ResultOfQueryTransactionTree,
-    ParamsOfCreateBlockIterator,
-    RegisteredIterator,
     ParamsOfResumeBlockIterator,
-    ParamsOfCreateTransactionIterator,
     ParamsOfResumeTransactionIterator,
-    ParamsOfIteratorNext,
-    ResultOfIteratorNext,
     ParamsOfSubscribe,
+    ParamsOfSubscribeCollection,
+    ParamsOfWaitForCollection,
+    RegisteredIterator,
+    ResponseHandler,
+    ResultOfAggregateCollection,
+    ResultOfBatchQuery,
+    ResultOfFindLastShardBlock,
+    ResultOfGetEndpoints,
     ResultOfGetSignatureId,
+    ResultOfIteratorNext,
+    ResultOfQuery,
+    ResultOfQueryCollection,
+    ResultOfQueryTransactionTree,
+    ResultOfSubscribeCollection,
+    ResultOfWaitForCollection,
 )
 
 
@@ -50,7 +50,7 @@ class TonNet(TonModule):
         :param params: See `types.ParamsOfQueryCollection`
         :return: See `types.ResultOfQueryCollection`
         """
-        response = self.request(method='net.query_collection', **params.dict)
+        response = self.request(method='net.query_collection', params_or_str=params)
         return self.response(classname=ResultOfQueryCollection, response=response)
 
     def wait_for_collection(
@@ -67,7 +67,7 @@ class TonNet(TonModule):
         :param params: See `types.ParamsOfWaitForCollection`
         :return: See `types.ResultOfWaitForCollection`
         """
-        response = self.request(method='net.wait_for_collection', **params.dict)
+        response = self.request(method='net.wait_for_collection', params_or_str=params)
         return self.response(classname=ResultOfWaitForCollection, response=response)
 
     def subscribe(
@@ -104,14 +104,14 @@ class TonNet(TonModule):
               object and handle actual data as a regular data from the subscription.
             - If application monitors sequence of some objects (for example
               transactions of the specific account): application must refresh all
-              cached (or visible to user) lists where this sequences presents.
+              cached (or visible to user) lists where this sequences presents
 
         :param params: See `types.ParamsOfSubscribe`
         :param callback: Additional responses handler
         :return: See `types.ResultOfSubscribeCollection`
         """
         response = self.request(
-            method='net.subscribe', callback=callback, **params.dict
+            method='net.subscribe', params_or_str=params, callback=callback
         )
         return self.response(classname=ResultOfSubscribeCollection, response=response)
 
@@ -125,10 +125,10 @@ class TonNet(TonModule):
 
         :param params: See `types.ParamsOfSubscribeCollection`
         :param callback: Additional responses handler
-        :return:
+        :return: See `types.ResultOfSubscribeCollection`
         """
         response = self.request(
-            method='net.subscribe_collection', callback=callback, **params.dict
+            method='net.subscribe_collection', params_or_str=params, callback=callback
         )
         return self.response(classname=ResultOfSubscribeCollection, response=response)
 
@@ -141,7 +141,7 @@ class TonNet(TonModule):
 
         :param params: See `types.ResultOfSubscribeCollection`
         """
-        return self.request(method='net.unsubscribe', **params.dict)
+        return self.request(method='net.unsubscribe', params_or_str=params)
 
     def query(
         self, params: ParamsOfQuery
@@ -149,10 +149,10 @@ class TonNet(TonModule):
         """
         Performs DAppServer GraphQL query
 
-        :param params: See `types.ResultOfQuery`
+        :param params: See `types.ParamsOfQuery`
         :return: See `types.ResultOfQuery`
         """
-        response = self.request(method='net.query', **params.dict)
+        response = self.request(method='net.query', params_or_str=params)
         return self.response(classname=ResultOfQuery, response=response)
 
     def suspend(self) -> Union[None, Awaitable[None]]:
@@ -170,7 +170,9 @@ class TonNet(TonModule):
         :param params: See `types.ParamsOfFindLastShardBlock`
         :return: See `types.ResultOfFindLastShardBlock`
         """
-        response = self.request(method='net.find_last_shard_block', **params.dict)
+        response = self.request(
+            method='net.find_last_shard_block', params_or_str=params
+        )
         return self.response(classname=ResultOfFindLastShardBlock, response=response)
 
     def fetch_endpoints(self) -> Union[EndpointsSet, Awaitable[EndpointsSet]]:
@@ -187,9 +189,8 @@ class TonNet(TonModule):
         Sets the list of endpoints to use on re-init
 
         :param params: See `types.EndpointsSet`
-        :return:
         """
-        return self.request(method='net.set_endpoints', **params.dict)
+        return self.request(method='net.set_endpoints', params_or_str=params)
 
     def get_endpoints(
         self,
@@ -213,7 +214,7 @@ class TonNet(TonModule):
         :param params: See `types.ParamsOfAggregateCollection`
         :return: See `types.ResultOfAggregateCollection`
         """
-        response = self.request(method='net.aggregate_collection', **params.dict)
+        response = self.request(method='net.aggregate_collection', params_or_str=params)
         return self.response(classname=ResultOfAggregateCollection, response=response)
 
     def batch_query(
@@ -225,7 +226,7 @@ class TonNet(TonModule):
         :param params: See `types.ParamsOfBatchQuery`
         :return: See `types.ResultOfBatchQuery`
         """
-        response = self.request(method='net.batch_query', **params.dict)
+        response = self.request(method='net.batch_query', params_or_str=params)
         return self.response(classname=ResultOfBatchQuery, response=response)
 
     def query_counterparties(
@@ -245,7 +246,7 @@ class TonNet(TonModule):
         :param params: See `types.ParamsOfQueryCounterparties`
         :return: See `types.ResultOfQueryCollection`
         """
-        response = self.request(method='net.query_counterparties', **params.dict)
+        response = self.request(method='net.query_counterparties', params_or_str=params)
         return self.response(classname=ResultOfQueryCollection, response=response)
 
     def query_transaction_tree(
@@ -264,12 +265,14 @@ class TonNet(TonModule):
         corresponding transaction in the `result.transactions`.
         But there are no guaranties that all messages from transactions
         `out_msgs` are presented in `result.messages`. So the application have
-        to continue retrieval for missing messages if it requires.
+        to continue retrieval for missing messages if it requires
 
         :param params: See `types.ParamsOfQueryTransactionTree`
         :return: See `types.ResultOfQueryTransactionTree`
         """
-        response = self.request(method='net.query_transaction_tree', **params.dict)
+        response = self.request(
+            method='net.query_transaction_tree', params_or_str=params
+        )
         return self.response(classname=ResultOfQueryTransactionTree, response=response)
 
     def create_block_iterator(
@@ -303,7 +306,9 @@ class TonNet(TonModule):
         :param params: See `types.ParamsOfCreateBlockIterator`
         :return: See `types.RegisteredIterator`
         """
-        response = self.request(method='net.create_block_iterator', **params.dict)
+        response = self.request(
+            method='net.create_block_iterator', params_or_str=params
+        )
         return self.response(classname=RegisteredIterator, response=response)
 
     def resume_block_iterator(
@@ -319,7 +324,9 @@ class TonNet(TonModule):
         :param params: See `types.ParamsOfResumeBlockIterator`
         :return: See `types.RegisteredIterator`
         """
-        response = self.request(method='net.resume_block_iterator', **params.dict)
+        response = self.request(
+            method='net.resume_block_iterator', params_or_str=params
+        )
         return self.response(classname=RegisteredIterator, response=response)
 
     def create_transaction_iterator(
@@ -359,7 +366,9 @@ class TonNet(TonModule):
         :param params: See `types.ParamsOfCreateTransactionIterator`
         :return: See `types.RegisteredIterator`
         """
-        response = self.request(method='net.create_transaction_iterator', **params.dict)
+        response = self.request(
+            method='net.create_transaction_iterator', params_or_str=params
+        )
         return self.response(classname=RegisteredIterator, response=response)
 
     def resume_transaction_iterator(
@@ -381,7 +390,9 @@ class TonNet(TonModule):
         :param params: See `types.ParamsOfResumeTransactionIterator`
         :return: See `types.RegisteredIterator`
         """
-        response = self.request(method='net.resume_transaction_iterator', **params.dict)
+        response = self.request(
+            method='net.resume_transaction_iterator', params_or_str=params
+        )
         return self.response(classname=RegisteredIterator, response=response)
 
     def iterator_next(
@@ -393,7 +404,7 @@ class TonNet(TonModule):
         :param params: See `types.ParamsOfIteratorNext`
         :return: See `types.ResultOfIteratorNext`
         """
-        response = self.request(method='net.iterator_next', **params.dict)
+        response = self.request(method='net.iterator_next', params_or_str=params)
         return self.response(classname=ResultOfIteratorNext, response=response)
 
     def remove_iterator(
@@ -407,7 +418,7 @@ class TonNet(TonModule):
 
         :param params: See `types.RegisteredIterator`
         """
-        return self.request(method='net.remove_iterator', **params.dict)
+        return self.request(method='net.remove_iterator', params_or_str=params)
 
     def get_signature_id(
         self,
@@ -1,21 +1,21 @@
 """Processing module methods"""
-from typing import Union, Awaitable
+from typing import Awaitable, Union
 
 from tonclient.module import TonModule
 from tonclient.types import (
+    MonitoringQueueInfo,
+    ParamsOfCancelMonitor,
+    ParamsOfFetchNextMonitorResults,
+    ParamsOfGetMonitorInfo,
+    ParamsOfMonitorMessages,
+    ParamsOfProcessMessage,
     ParamsOfSendMessage,
-    ResultOfSendMessage,
+    ParamsOfSendMessages,
     ParamsOfWaitForTransaction,
-    ResultOfProcessMessage,
     ResponseHandler,
-    ParamsOfProcessMessage,
-    ParamsOfMonitorMessages,
-    ParamsOfGetMonitorInfo,
-    MonitoringQueueInfo,
-    ParamsOfFetchNextMonitorResults,
     ResultOfFetchNextMonitorResults,
-    ParamsOfCancelMonitor,
-    ParamsOfSendMessages,
+    ResultOfProcessMessage,
+    ResultOfSendMessage,
     ResultOfSendMessages,
 )
 
@@ -49,7 +49,7 @@ class TonProcessing(TonModule):
         :return: See `types.ResultOfProcessMessage`
         """
         response = self.request(
-            method='processing.process_message', callback=callback, **params.dict
+            method='processing.process_message', params_or_str=params, callback=callback
         )
         return self.response(classname=ResultOfProcessMessage, response=response)
 
@@ -67,7 +67,7 @@ class TonProcessing(TonModule):
         :return: See `types.ResultOfSendMessage`
         """
         response = self.request(
-            method='processing.send_message', callback=callback, **params.dict
+            method='processing.send_message', params_or_str=params, callback=callback
         )
         return self.response(classname=ResultOfSendMessage, response=response)
 
@@ -98,14 +98,16 @@ class TonProcessing(TonModule):
             - The maximum block gen time is set to
               `now() + transaction_wait_timeout`.
             - If maximum block gen time is reached and no result transaction
-              is found, the processing will exit with an error.
+              is found, the processing will exit with an error
 
         :param params: See `types.ParamsOfWaitForTransaction`
         :param callback: Additional responses handler
         :return: See `types.ResultOfProcessMessage`
         """
         response = self.request(
-            method='processing.wait_for_transaction', callback=callback, **params.dict
+            method='processing.wait_for_transaction',
+            params_or_str=params,
+            callback=callback,
         )
         return self.response(classname=ResultOfProcessMessage, response=response)
 
@@ -141,11 +143,11 @@ class TonProcessing(TonModule):
         added to the unresolved list.
 
         If monitoring queue with specified name does not exist then monitoring queue
-        will be created with specified unresolved messages.
+        will be created with specified unresolved messages
 
         :param params: See `types.ParamsOfMonitorMessages`
         """
-        return self.request(method='processing.monitor_messages', **params.dict)
+        return self.request(method='processing.monitor_messages', params_or_str=params)
 
     def get_monitor_info(
         self, params: ParamsOfGetMonitorInfo
@@ -157,7 +159,9 @@ class TonProcessing(TonModule):
         :param params: See `types.ParamsOfGetMonitorInfo`
         :return: See `types.MonitoringQueueInfo`
         """
-        response = self.request(method='processing.get_monitor_info', **params.dict)
+        response = self.request(
+            method='processing.get_monitor_info', params_or_str=params
+        )
         return self.response(classname=MonitoringQueueInfo, response=response)
 
     def fetch_next_monitor_results(
@@ -174,7 +178,7 @@ class TonProcessing(TonModule):
         :return: See `types.ResultOfFetchNextMonitorResults`
         """
         response = self.request(
-            method='processing.fetch_next_monitor_results', **params.dict
+            method='processing.fetch_next_monitor_results', params_or_str=params
         )
         return self.response(
             classname=ResultOfFetchNextMonitorResults, response=response
@@ -189,7 +193,7 @@ class TonProcessing(TonModule):
 
         :param params: See `types.ParamsOfCancelMonitor`
         """
-        return self.request(method='processing.cancel_monitor', **params.dict)
+        return self.request(method='processing.cancel_monitor', params_or_str=params)
 
     def send_messages(
         self, params: ParamsOfSendMessages
@@ -200,5 +204,5 @@ class TonProcessing(TonModule):
         :param params: See `types.ParamsOfSendMessages`
         :return: See `types.ResultOfSendMessages`
         """
-        response = self.request(method='processing.send_messages', **params.dict)
+        response = self.request(method='processing.send_messages', params_or_str=params)
         return self.response(classname=ResultOfSendMessages, response=response)
@@ -1,16 +1,16 @@
 """Proofs module methods"""
-from typing import Union, Awaitable
+from typing import Awaitable, Union
 
 from tonclient.module import TonModule
 from tonclient.types import (
     ParamsOfProofBlockData,
-    ParamsOfProofTransactionData,
     ParamsOfProofMessageData,
+    ParamsOfProofTransactionData,
 )
 
 
 class TonProofs(TonModule):
-    """Module for proving data, retrieved from TONOS API"""
+    """Free TON proofs SDK API implementation"""
 
     def proof_block_data(
         self, params: ParamsOfProofBlockData
@@ -87,9 +87,8 @@ class TonProofs(TonModule):
         can ensure that this shard-block has also been proven
 
         :param params: See `types.ParamsOfProofBlockData`
-        :return:
         """
-        return self.request(method='proofs.proof_block_data', **params.dict)
+        return self.request(method='proofs.proof_block_data', params_or_str=params)
 
     def proof_transaction_data(
         self, params: ParamsOfProofTransactionData
@@ -123,12 +122,13 @@ class TonProofs(TonModule):
         of the client.
 
         For more information about proofs checking, see description of
-        `proof_block_data` function.
+        `proof_block_data` function
 
         :param params: See `types.ParamsOfProofTransactionData`
-        :return:
         """
-        return self.request(method='proofs.proof_transaction_data', **params.dict)
+        return self.request(
+            method='proofs.proof_transaction_data', params_or_str=params
+        )
 
     def proof_message_data(
         self, params: ParamsOfProofMessageData
@@ -159,6 +159,5 @@ class TonProofs(TonModule):
         `proof_block_data function`
 
         :param params: See `types.ParamsOfProofMessageData`
-        :return:
         """
-        return self.request(method='proofs.proof_message_data', **params.dict)
+        return self.request(method='proofs.proof_message_data', params_or_str=params)
@@ -0,0 +1,485 @@
+"""
+Client-side ABI registry.
+ABI is interned by content hash: JSON text (or `AbiContract`) is parsed,
+normalized and serialized once, the same `RegisteredAbi` object is returned
+for equal ABIs and its request dict is reused by all calls which pass it.
+This saves client-side ABI serialization only, core still parses ABI JSON
+of every request.
+Function id index routes message bodies to ABI and function by the id
+read from the body BOC locally
+"""
+import asyncio
+import base64
+import collections
+import hashlib
+import json
+import threading
+from typing import Any, Awaitable, Dict, List, Tuple, Union
+
+from tonclient.module import request_options
+from tonclient.serializers import dump
+from tonclient.types import (
+    Abi,
+    AbiContract,
+    AbiType,
+    DecodedMessageBody,
+    MessageBodyType,
+    ParamsOfCalcFunctionId,
+    ParamsOfDecodeMessageBody,
+)
+
+
+class RegisteredAbi(Abi.Json):
+    """ABI interned by `AbiRegistry`"""
+
+    __slots__ = ('hash', '_dict')
+
+    def __init__(self, value: str, hash: str):
+        """
+        :param value: Normalized ABI JSON
+        :param hash: ABI content hash (`sha256` hex of normalized JSON)
+        """
+        super(RegisteredAbi, self).__init__(value=value)
+        self.hash = hash
+        self._dict = {'type': self.type, 'value': value}
+
+    @property
+    def dict(self):
+        """Request dict, built once"""
+        return self._dict
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__} {self.hash[:12]}>'
+
+
+class AbiRegistry:
+    """
+    Registry of ABIs interned by content hash.
+    Core has no method to register ABI and get `Abi.Handle` for it, so
+    handles (if they are obtained elsewhere) are passed as is and other
+    ABIs are sent as normalized JSON built once.
+    Module methods don't intern ABIs of params, registered ABI should be
+    passed to them
+    """
+
+    # Max ABI JSON texts remembered to skip parsing
+    TEXT_CACHE_SIZE = 256
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._by_hash: Dict[str, RegisteredAbi] = {}
+        # Recently met ABI JSON texts (LRU), to skip parsing on repeated
+        # registering. Texts may differ in formatting only, so they are
+        # bounded unlike ABIs
+        self._by_text = collections.OrderedDict()
+
+    def register(
+        self, abi: Union[AbiType, AbiContract, Dict[str, Any], str]
+    ) -> Union[RegisteredAbi, Abi.Handle]:
+        """
+        Intern ABI
+
+        :param abi: `Abi` object, `AbiContract`, ABI dict or JSON text
+        :return: Registered ABI, the same object for ABIs with equal content,
+                `Abi.Handle` is returned as is
+        """
+        if isinstance(abi, (RegisteredAbi, Abi.Handle)):
+            return abi
+
+        if isinstance(abi, Abi.Json):
+            abi = abi.value
+        if isinstance(abi, str):
+            with self._lock:
+                registered = self._by_text.get(abi)
+                if registered is not None:
+                    self._by_text.move_to_end(abi)
+                    return registered
+
+            registered = self._intern(data=json.loads(abi))
+            with self._lock:
+                self._by_text[abi] = registered
+                if len(self._by_text) > self.TEXT_CACHE_SIZE:
+                    self._by_text.popitem(last=False)
+            return registered
+
+        if isinstance(abi, (Abi.Contract, Abi.Serialized)):
+            abi = abi.value
+        if isinstance(abi, AbiContract):
+            abi = dump(abi)
+        if not isinstance(abi, dict):
+            raise TypeError(f'Unsupported ABI type `{type(abi).__name__}`')
+        return self._intern(data=abi)
+
+    def from_path(self, path: str) -> RegisteredAbi:
+        """Intern ABI from file"""
+        with open(path, encoding='utf8') as fp:
+            return self.register(abi=fp.read())
+
+    def get(self, hash: str) -> Union[RegisteredAbi, None]:
+        """Get registered ABI by content hash"""
+        return self._by_hash.get(hash)
+
+    def clear(self):
+        """Forget registered ABIs"""
+        with self._lock:
+            self._by_hash.clear()
+            self._by_text.clear()
+
+    def __len__(self) -> int:
+        return len(self._by_hash)
+
+    def __contains__(self, hash: str) -> bool:
+        return hash in self._by_hash
+
+    def _intern(self, data: Dict[str, Any]) -> RegisteredAbi:
+        value = json.dumps(data, sort_keys=True, separators=(',', ':'))
+        hash = hashlib.sha256(value.encode()).hexdigest()
+        registered = self._by_hash.get(hash)
+        if registered is None:
+            with self._lock:
+                registered = self._by_hash.setdefault(
+                    hash, RegisteredAbi(value=value, hash=hash)
+                )
+        return registered
+
+
+class IndexEntry:
+    """Function or event of indexed ABI"""
+
+    __slots__ = ('abi', 'name', 'body_type', 'function_id')
+
+    def __init__(
+        self,
+        abi: RegisteredAbi,
+        name: str,
+        body_type: MessageBodyType,
+        function_id: int,
+    ):
+        """
+        :param abi: Registered ABI
+        :param name: Function or event name
+        :param body_type: `MessageBodyType.INPUT` or `MessageBodyType.OUTPUT`
+                for function, `MessageBodyType.EVENT` for event
+        :param function_id: Function input/output or event id
+        """
+        self.abi = abi
+        self.name = name
+        self.body_type = body_type
+        self.function_id = function_id
+
+    def __repr__(self):
+        return (
+            f'<{self.__class__.__name__} {self.name} {self.body_type.value} '
+            f'0x{self.function_id:08x}>'
+        )
+
+
+class FunctionIdIndex:
+    """
+    Index of function and event ids of many ABIs.
+    Ids of ABI are calculated once with `abi.calc_function_id` (explicit
+    ids of ABI are used as is; events ids are hashes of event signatures,
+    since core calculates ids of functions only), then body is routed to
+    ABI and function with a lookup by id read from body BOC, so body is
+    decoded once with the right ABI instead of trying ABIs in turn.
+    Bodies of external inbound messages have id after signature and
+    headers, so they are looked up once per distinct ABI headers set
+    """
+
+    def __init__(self, client: Any):
+        """
+        :param client: `TonClient` instance
+        """
+        self._client = client
+        self._lock = threading.Lock()
+        self._abis: Dict[str, RegisteredAbi] = {}
+        # Ids at body start: internal messages and external outbound ones
+        self._by_id: Dict[int, List[IndexEntry]] = {}
+        # Ids of external inbound messages by (ABI version, headers). Dict
+        # is replaced, not changed, so `route` iterates it without the lock
+        self._by_headers: Dict[Tuple, Dict[int, List[IndexEntry]]] = {}
+
+    def add(
+        self, abi: Union[AbiType, str]
+    ) -> Union[RegisteredAbi, Awaitable[RegisteredAbi]]:
+        """
+        Add ABI functions and events to index, ABI is interned in client
+        ABI registry and is indexed once
+
+        :param abi: ABI object or JSON text
+        :return: Registered ABI, awaitable for asyncio client
+        """
+        abi = self._client.abi_registry.register(abi=abi)
+        if not isinstance(abi, RegisteredAbi):
+            raise TypeError('ABI handle can\'t be indexed')
+
+        contract = json.loads(abi.value)
+        params = []
+        if abi.hash not in self._abis:
+            params = [
+                ParamsOfCalcFunctionId(abi=abi, function_name=f['name'], output=output)
+                for f in contract.get('functions', [])
+                if f.get('id') is None
+                for output in (False, True)
+            ]
+
+        # Ids are read from results, not from raw responses
+        with request_options(raw=None):
+            calls = [self._client.abi.calc_function_id(params=p) for p in params]
+        if self._client.is_async:
+            return self._add_async(abi=abi, contract=contract, calls=calls)
+
+        ids = [result.function_id for result in calls]
+        self._insert(abi=abi, contract=contract, ids=ids)
+        return abi
+
+    async def _add_async(
+        self, abi: RegisteredAbi, contract: Dict[str, Any], calls: List[Awaitable]
+    ) -> RegisteredAbi:
+        results = await asyncio.gather(*calls)
+        ids = [result.function_id for result in results]
+        self._insert(abi=abi, contract=contract, ids=ids)
+        return abi
+
+    def route(self, body: str, is_internal: bool) -> Union[IndexEntry, None]:
+        """
+        Find function or event of message body
+
+        :param body: Message body BOC encoded as base64
+        :param is_internal: True if the body belongs to the internal message
+        :return: Index entry or `None` if body id is unknown or body
+                can't be read
+        """
+        try:
+            cell = _Cell.from_boc(boc=body)
+        except ValueError:
+            return None
+
+        if is_internal:
+            types = (MessageBodyType.INPUT, MessageBodyType.OUTPUT)
+        else:
+            for headers, ids in self._by_headers.items():
+                offset = _input_id_offset(cell=cell, headers=headers)
+                if offset is None:
+                    continue
+                entry = _first(ids=ids, cell=cell, offset=offset, types=None)
+                if entry is not None:
+                    return entry
+            types = (MessageBodyType.OUTPUT, MessageBodyType.EVENT)
+        return _first(ids=self._by_id, cell=cell, offset=0, types=types)
+
+    def decode(
+        self, body: str, is_internal: bool, allow_partial: bool = False
+    ) -> Union[DecodedMessageBody, Awaitable[DecodedMessageBody], None]:
+        """
+        Decode message body with ABI it's routed to
+
+        :param body: Message body BOC encoded as base64
+        :param is_internal: True if the body belongs to the internal message
+        :param allow_partial: See `types.ParamsOfDecodeMessageBody`
+        :return: See `types.DecodedMessageBody` regardless of client raw
+                mode, awaitable for asyncio client or `None` if body is not
+                routed
+        """
+        entry = self.route(body=body, is_internal=is_internal)
+        if entry is None:
+            return None
+
+        params = ParamsOfDecodeMessageBody(
+            abi=entry.abi,
+            body=body,
+            is_internal=is_internal,
+            allow_partial=allow_partial,
+        )
+        with request_options(raw=None):
+            return self._client.abi.decode_message_body(params=params)
+
+    def __len__(self) -> int:
+        return len(self._abis)
+
+    def __contains__(self, abi: RegisteredAbi) -> bool:
+        return abi.hash in self._abis
+
+    def _insert(self, abi: RegisteredAbi, contract: Dict[str, Any], ids: List[int]):
+        """Add entries of ABI calculated ids"""
+        ids = iter(ids)
+        entries = []
+        for function in contract.get('functions', []):
+            if function.get('id') is None:
+                input_id, output_id = next(ids), next(ids)
+            else:
+                input_id = int(function['id'], 0)
+                output_id = input_id | 0x80000000
+            for body_type, function_id in (
+                (MessageBodyType.INPUT, input_id),
+                (MessageBodyType.OUTPUT, output_id),
+            ):
+                entries.append(
+                    IndexEntry(
+                        abi=abi,
+                        name=function['name'],
+                        body_type=body_type,
+                        function_id=function_id,
+                    )
+                )
+        major = _major_version(contract=contract)
+        for event in contract.get('events', []):
+            event_id = event.get('id')
+            if event_id is None:
+                event_id = _event_id(event=event, major=major)
+            else:
+                event_id = int(event_id, 0)
+            entries.append(
+                IndexEntry(
+                    abi=abi,
+                    name=event['name'],
+                    body_type=MessageBodyType.EVENT,
+                    function_id=event_id,
+                )
+            )
+
+        headers = (major, *_header_names(contract=contract))
+        with self._lock:
+            if abi.hash in self._abis:
+                return
+            external = self._by_headers.get(headers)
+            if external is None:
+                external = {}
+                self._by_headers = {**self._by_headers, headers: external}
+            for entry in entries:
+                self._by_id.setdefault(entry.function_id, []).append(entry)
+                if entry.body_type == MessageBodyType.INPUT:
+                    external.setdefault(entry.function_id, []).append(entry)
+            self._abis[abi.hash] = abi
+
+
+class _Cell:
+    """Data bits of BOC root cell"""
+
+    __slots__ = ('value', 'bits', 'size')
+
+    # `serialized_boc#b5ee9c72` tag
+    MAGIC = b'\xb5\xee\x9c\x72'
+
+    def __init__(self, data: bytes, bits: int):
+        self.value = int.from_bytes(data, 'big')
+        self.size = len(data) * 8
+        self.bits = bits
+
+    def read(self, offset: int, count: int) -> int:
+        """Read unsigned integer of `count` bits at `offset`"""
+        if offset + count > self.bits:
+            raise ValueError('Cell data is too short')
+        return (self.value >> (self.size - offset - count)) & ((1 << count) - 1)
+
+    @staticmethod
+    def from_boc(boc: str) -> '_Cell':
+        """Root cell of BOC encoded as base64"""
+        try:
+            data = base64.b64decode(boc)
+        except (TypeError, ValueError) as exc:
+            raise ValueError('BOC is not base64') from exc
+        if data[:4] != _Cell.MAGIC or len(data) < 6:
+            raise ValueError('Unsupported BOC format')
+
+        has_index, size, offset_size = data[4] & 0x80, data[4] & 0x07, data[5]
+        position = 6
+
+        def _read(length: int) -> int:
+            nonlocal position
+            start, position = position, position + length
+            return int.from_bytes(data[start:position], 'big')
+
+        cells, roots = _read(size), _read(size)
+        position += size + offset_size  # Absent cells and total cells size
+        root = _read(size)
+        position += size * (roots - 1)
+        if has_index:
+            position += cells * offset_size
+
+        for index in range(min(root, cells - 1) + 1):
+            if position + 2 > len(data):
+                break
+            d1, d2 = data[position], data[position + 1]
+            position += 2
+            if d1 & 0x10:
+                # Hashes and depths of cell levels
+                position += (bin(d1 >> 5).count('1') + 1) * 34
+            length = (d2 + 1) // 2
+            if index == root:
+                end = position + length
+                cell = data[position:end]
+                if len(cell) != length:
+                    break
+                bits = length * 8
+                if d2 & 1:
+                    # Incomplete byte ends with completion tag `1` and zeros
+                    last = cell[-1]
+                    bits -= (last & -last).bit_length()
+                return _Cell(data=cell, bits=bits)
+            position += length + (d1 & 0x07) * size
+        raise ValueError('BOC is truncated')
+
+
+def _first(
+    ids: Dict[int, List[IndexEntry]], cell: _Cell, offset: int, types: Tuple = None
+) -> Union[IndexEntry, None]:
+    """First entry of id read from cell at offset"""
+    try:
+        function_id = cell.read(offset=offset, count=32)
+    except ValueError:
+        return None
+    for entry in ids.get(function_id, ()):
+        if types is None or entry.body_type in types:
+            return entry
+    return None
+
+
+def _input_id_offset(cell: _Cell, headers: Tuple) -> Union[int, None]:
+    """
+    Offset of function id in external inbound message body:
+    `maybe(bits512)` signature, then ABI headers
+    """
+    major, *names = headers
+    if major < 2:
+        return None
+    try:
+        offset = 1 + (512 if cell.read(offset=0, count=1) else 0)
+        for name in names:
+            if name == 'pubkey':
+                offset += 1 + (256 if cell.read(offset=offset, count=1) else 0)
+            elif name == 'time':
+                offset += 64
+            elif name == 'expire':
+                offset += 32
+            else:
+                return None
+    except ValueError:
+        return None
+    return offset
+
+
+def _major_version(contract: Dict[str, Any]) -> int:
+    version = contract.get('version') or str(contract.get('ABI version', 2))
+    return int(str(version).split('.')[0])
+
+
+def _header_names(contract: Dict[str, Any]) -> List[str]:
+    """Header names, header may be a name or a param dict"""
+    return [h if isinstance(h, str) else h['name'] for h in contract.get('header', [])]
+
+
+def _type_signature(param: Dict[str, Any]) -> str:
+    """ABI type signature, tuple is replaced with its components types"""
+    kind = param['type']
+    if 'tuple' in kind:
+        components = ','.join(_type_signature(c) for c in param['components'])
+        kind = kind.replace('tuple', f'({components})')
+    return kind
+
+
+def _event_id(event: Dict[str, Any], major: int) -> int:
+    """Event id: first 4 bytes of signature `sha256`, high bit is cleared"""
+    inputs = ','.join(_type_signature(p) for p in event.get('inputs', []))
+    digest = hashlib.sha256(f'{event["name"]}({inputs})v{major}'.encode()).digest()
+    return int.from_bytes(digest[:4], 'big') & 0x7FFFFFFF
@@ -0,0 +1,199 @@
+"""
+Compiled params serializers.
+Serializer of types class is compiled once from its `dict` property: nested
+`.dict` calls are replaced with serializers of nested objects and keys with
+`None` values are omitted, so params are converted to the request dict in
+a single pass without intermediate dicts
+"""
+import ast
+import inspect
+import logging
+import sys
+import textwrap
+import threading
+from typing import Any, Callable, Dict, Set, Union
+
+logger = logging.getLogger(__name__)
+
+# Python 3.7 parses string literals as `ast.Str`
+_STRING_NODES = (ast.Constant,) if sys.version_info >= (3, 8) else (ast.Str,)
+
+Serializer = Callable[[Any], Dict[str, Any]]
+
+# Parent class serializer is compiled while child one is being compiled
+_LOCK = threading.RLock()
+
+
+class _Serializers(dict):
+    """Serializers by class, compiled on first lookup"""
+
+    def __missing__(self, cls: type) -> Serializer:
+        with _LOCK:
+            serializer = self.get(cls)
+            if serializer is None:
+                serializer = self[cls] = _compile(cls=cls)
+        return serializer
+
+
+_SERIALIZERS: Dict[type, Serializer] = _Serializers()
+
+
+def dump(obj: Any) -> Dict[str, Any]:
+    """
+    Convert types object to request params dict, same as `obj.dict`
+    without `None` values of optional params
+
+    :param obj: Types object, e.g. `ParamsOfEncodeMessage`
+    :return: Params dict
+    """
+    return _SERIALIZERS[type(obj)](obj)
+
+
+def get_serializer(cls: type) -> Serializer:
+    """
+    Get compiled serializer of types class
+
+    :param cls: Types class
+    :return: Serializer function
+    """
+    return _SERIALIZERS[cls]
+
+
+def _fallback(obj: Any) -> Dict[str, Any]:
+    return obj.dict
+
+
+class _DictCallsTransformer(ast.NodeTransformer):
+    """
+    Replace `x.dict` with `_serializers[type(x)](x)` and `super(...).dict`
+    with parent serializer
+    """
+
+    def visit_Attribute(self, node: ast.Attribute) -> ast.AST:
+        self.generic_visit(node)
+        if node.attr != 'dict':
+            return node
+
+        value = node.value
+        if (
+            isinstance(value, ast.Call)
+            and isinstance(value.func, ast.Name)
+            and value.func.id == 'super'
+        ):
+            return ast.Call(
+                func=ast.Name(id='_parent', ctx=ast.Load()),
+                args=[ast.Name(id='self', ctx=ast.Load())],
+                keywords=[],
+            )
+        if isinstance(value, (ast.Name, ast.Attribute)):
+            return _parse_expression('_serializers[type(_)](_)', _=value)
+        return _parse_expression('_dump(_)', _=value)
+
+
+def _compile(cls: type) -> Serializer:
+    """Compile serializer, fall back to `dict` property if it can't be"""
+    prop = inspect.getattr_static(cls, 'dict', None)
+    if not isinstance(prop, property):
+        return _fallback
+
+    try:
+        source = textwrap.dedent(inspect.getsource(prop.fget))
+        function = ast.parse(source).body[0]
+        code = _build(function=function, optional=_optional_params(cls=cls))
+    except (OSError, TypeError, ValueError, SyntaxError) as exc:
+        logger.debug('Serializer of %s is not compiled: %s', cls.__qualname__, exc)
+        # Property of this class, not `obj.dict`, since it may be parent one
+        return prop.fget
+
+    namespace = {
+        **vars(inspect.getmodule(prop.fget)),
+        '_dump': dump,
+        '_serializers': _SERIALIZERS,
+        '_parent': _SERIALIZERS[cls.__mro__[1]],
+    }
+    exec(compile(code, f'<serializer {cls.__qualname__}>', 'exec'), namespace)
+    return namespace['serialize']
+
+
+def _optional_params(cls: type) -> Set[str]:
+    """Names of `__init__` params with `None` default"""
+    try:
+        parameters = inspect.signature(cls.__init__).parameters.values()
+    except (TypeError, ValueError):
+        return set()
+    return {p.name for p in parameters if p.default is None}
+
+
+def _build(function: ast.FunctionDef, optional: Set[str]) -> ast.Module:
+    """
+    Build serializer function from `dict` property function.
+    Dict display is kept for required keys, optional ones are set only if
+    they are not `None`
+    """
+    *statements, last = function.body
+    if not isinstance(last, ast.Return) or not isinstance(last.value, ast.Dict):
+        raise ValueError('`dict` must return dict display')
+
+    transformer = _DictCallsTransformer()
+    body = [
+        transformer.visit(statement)
+        for statement in statements
+        if isinstance(statement, ast.Assign)
+    ]
+    if len(body) != sum(not _is_docstring(s) for s in statements):
+        raise ValueError('`dict` has unsupported statements')
+
+    display = ast.Dict(keys=[], values=[])
+    conditional = []
+    for key, value in zip(last.value.keys, last.value.values):
+        value = transformer.visit(value)
+        if _string(node=key) not in optional:
+            display.keys.append(key)
+            display.values.append(value)
+        else:
+            conditional.append((key, value))
+    body.append(_parse_statement('_d = _', _=display))
+
+    for key, value in conditional:
+        body.append(_parse_statement('_v = _', _=value))
+        body.append(
+            _parse_statement('if _v is not None:\n    _d[_k] = _v', _k=key)
+        )
+    body.append(_parse_statement('return _d'))
+
+    serializer = _parse_statement('def serialize(self):\n    pass')
+    serializer.body = body
+    module = ast.Module(body=[serializer], type_ignores=[])
+    return ast.fix_missing_locations(module)
+
+
+def _is_docstring(statement: ast.stmt) -> bool:
+    return isinstance(statement, ast.Expr) and _string(node=statement.value) is not None
+
+
+def _string(node: ast.AST) -> Union[str, None]:
+    """Value of string literal node, `None` if node is not a string literal"""
+    if not isinstance(node, _STRING_NODES):
+        return None
+    value = node.value if sys.version_info >= (3, 8) else node.s
+    return value if isinstance(value, str) else None
+
+
+class _Substitute(ast.NodeTransformer):
+    """Substitute names with expressions"""
+
+    def __init__(self, substitutions: Dict[str, ast.expr]):
+        self.substitutions = substitutions
+
+    def visit_Name(self, node: ast.Name) -> ast.AST:
+        return self.substitutions.get(node.id, node)
+
+
+def _parse_statement(source: str, **substitutions: ast.expr) -> ast.stmt:
+    """Parse statement and substitute names with expressions"""
+    return _Substitute(substitutions).visit(ast.parse(source).body[0])
+
+
+def _parse_expression(source: str, **substitutions: ast.expr) -> ast.expr:
+    """Parse expression and substitute names with expressions"""
+    return _Substitute(substitutions).visit(ast.parse(source, mode='eval').body)
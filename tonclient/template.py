@@ -0,0 +1,204 @@
+"""
+Message body templates.
+Template precomputes request params of repeated function call: ABI is
+interned in client ABI registry, signer, call set and static inputs are
+serialized once, so each message only rebinds changed inputs and
+`expire`/`time` header and is signed again
+"""
+import inspect
+import threading
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Dict, Union
+
+from tonclient.module import request_options
+from tonclient.serializers import dump
+from tonclient.types import (
+    AbiType,
+    CallSet,
+    FunctionHeader,
+    ParamsOfAttachSignatureToMessageBody,
+    ParamsOfEncodeMessageBody,
+    ResultOfEncodeMessageBody,
+    Signer,
+    SignerType,
+)
+
+
+class MessageTemplate:
+    """
+    Template of function call message bodies built with
+    `abi.encode_message_body`.
+    Bodies are signed by core in the same request, except for
+    `Signer.External`: body is signed with `sign` callback and signature
+    is attached with `abi.attach_signature_to_message_body`.
+    Encoded messages and their params preparation time are reported by
+    `stats`
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        abi: AbiType,
+        function_name: str,
+        signer: SignerType,
+        input: Dict[str, Any] = None,
+        header: FunctionHeader = None,
+        is_internal: bool = False,
+        address: str = None,
+        sign: Callable[[str], Union[str, Awaitable[str]]] = None,
+    ):
+        """
+        :param client: `TonClient` instance
+        :param abi: Contract ABI
+        :param function_name: Function name
+        :param signer: Signing parameters
+        :param input: Static function inputs, changed ones are passed to
+                `encode`
+        :param header: Static function header, `expire` and `time` are
+                usually passed to `encode`
+        :param is_internal: True if internal message body must be encoded
+        :param address: Destination address of the message
+        :param sign: Callback which signs `data_to_sign` (`base64`) and
+                returns signature (`hex`), may be a coroutine function for
+                asyncio client. Required for `Signer.External`
+        """
+        if isinstance(signer, Signer.External) and sign is None:
+            raise ValueError('`sign` callback is required for external signer')
+
+        self._client = client
+        self._sign = sign
+        self._input = input or {}
+        self._header = dump(header) if header else {}
+        registered = client.abi_registry.register(abi=abi)
+        self._params = dump(
+            ParamsOfEncodeMessageBody(
+                abi=registered,
+                call_set=CallSet(function_name=function_name),
+                is_internal=is_internal,
+                signer=signer,
+                address=address,
+            )
+        )
+        self._attach = None
+        if isinstance(signer, Signer.External):
+            self._attach = dump(
+                ParamsOfAttachSignatureToMessageBody(
+                    abi=registered,
+                    public_key=signer.public_key,
+                    message='',
+                    signature='',
+                )
+            )
+
+        self._lock = threading.Lock()
+        self._messages = 0
+        self._prepare = 0.0
+
+    def encode(
+        self, input: Dict[str, Any] = None, expire: int = None, time: int = None
+    ) -> Union[ResultOfEncodeMessageBody, Awaitable[ResultOfEncodeMessageBody]]:
+        """
+        Encode signed message body
+
+        :param input: Changed function inputs, merged into static ones
+        :param expire: Message expiration time in seconds, filled by core
+                if not set
+        :param time: Message creation time in milliseconds, filled by core
+                if not set
+        :return: See `types.ResultOfEncodeMessageBody`, body is signed
+        """
+        started = perf_counter()
+        params = self.params(input=input, expire=expire, time=time)
+        prepare = perf_counter() - started
+
+        # Intermediate results are types objects in any raw mode
+        with request_options(raw=None):
+            result = self._client.abi.encode_message_body(params=params)
+        if self._client.is_async:
+            return self._encode_async(result=result, prepare=prepare)
+        if self._attach is not None:
+            signature = self._sign(result.data_to_sign)
+            result = self._attach_signature(result=result, signature=signature)
+        self._encoded(prepare=prepare)
+        return result
+
+    def params(
+        self, input: Dict[str, Any] = None, expire: int = None, time: int = None
+    ) -> Dict[str, Any]:
+        """
+        Request params of message
+
+        :param input: Changed function inputs
+        :param expire: Message expiration time in seconds
+        :param time: Message creation time in milliseconds
+        :return: `abi.encode_message_body` params dict
+        """
+        call_set = {**self._params['call_set']}
+        header = self._header
+        if expire is not None or time is not None:
+            header = {**header}
+            if expire is not None:
+                header['expire'] = expire
+            if time is not None:
+                header['time'] = time
+        if header:
+            call_set['header'] = header
+        inputs = {**self._input, **input} if input else self._input
+        if inputs:
+            call_set['input'] = inputs
+        return {**self._params, 'call_set': call_set}
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """
+        Count of successfully encoded `messages`, total time of their
+        params preparation (`prepare`) and `prepare` time per message in
+        seconds
+        """
+        with self._lock:
+            messages, prepare = self._messages, self._prepare
+        return {
+            'messages': messages,
+            'prepare': prepare,
+            'per_message': prepare / messages if messages else 0.0,
+        }
+
+    def _encoded(self, prepare: float):
+        """Count successfully encoded message"""
+        with self._lock:
+            self._messages += 1
+            self._prepare += prepare
+
+    async def _encode_async(
+        self, result: Awaitable[ResultOfEncodeMessageBody], prepare: float
+    ) -> ResultOfEncodeMessageBody:
+        result = await result
+        if self._attach is not None:
+            signature = self._sign(result.data_to_sign)
+            if inspect.isawaitable(signature):
+                signature = await signature
+            result = await self._attach_signature(result=result, signature=signature)
+        self._encoded(prepare=prepare)
+        return result
+
+    def _attach_signature(
+        self, result: ResultOfEncodeMessageBody, signature: str
+    ) -> Union[ResultOfEncodeMessageBody, Awaitable[ResultOfEncodeMessageBody]]:
+        """Attach signature to unsigned body"""
+        params = {**self._attach, 'message': result.body, 'signature': signature}
+        with request_options(raw=None):
+            attached = self._client.abi.attach_signature_to_message_body(
+                params=params
+            )
+
+        def _result(response) -> ResultOfEncodeMessageBody:
+            return ResultOfEncodeMessageBody(
+                body=response.body, data_to_sign=result.data_to_sign
+            )
+
+        async def _result_async() -> ResultOfEncodeMessageBody:
+            return _result(response=await attached)
+
+        if inspect.isawaitable(attached):
+            return _result_async()
+        return _result(response=attached)
@@ -3,6 +3,9 @@ import os
 import unittest
 
 from tonclient.errors import TonException
+from tonclient.module import request_options
+from tonclient.registry import FunctionIdIndex
+from tonclient.template import MessageTemplate
 from tonclient.test.helpers import SAMPLES_DIR, async_core_client, sync_core_client
 from tonclient.types import (
     Abi,
@@ -96,6 +99,57 @@ class TestTonAbiAsyncCore(unittest.TestCase):
         self.assertEqual(self.events_time, decoded.header.time)
         self.assertEqual(self.keypair.public, decoded.header.pubkey)
 
+    def test_decode_message_body_stream(self):
+        message = 'te6ccgEBAwEAvAABRYgAC31qq9KF9Oifst6LU9U6FQSQQRlCSEMo+A3LN5MvphIMAQHhrd/b+MJ5Za+AygBc5qS/dVIPnqxCsM9PvqfVxutK+lnQEKzQoRTLYO6+jfM8TF4841bdNjLQwIDWL4UVFdxIhdMfECP8d3ruNZAXul5xxahT91swIEkEHph08JVlwmUmQAAAXRnJcuDX1XMZBW+LBKACAEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA=='
+        boc = async_core_client.boc.parse_message(params=ParamsOfParse(boc=message))
+        bodies = [boc.parsed['body'], 'Wrong==', boc.parsed['body']]
+
+        stream = async_core_client.abi.decode_message_body_stream(
+            abi=self.events_abi, bodies=bodies, is_internal=False, skip_invalid=True
+        )
+        decoded = list(stream)
+        self.assertEqual(2, len(decoded))
+        for item in decoded:
+            self.assertEqual(MessageBodyType.INPUT, item.body_type)
+            self.assertEqual(self.events_time, item.header.time)
+
+        with self.assertRaises(TonException):
+            stream = async_core_client.abi.decode_message_body_stream(
+                abi=self.events_abi, bodies=bodies, is_internal=False, in_flight=1
+            )
+            list(stream)
+
+        stream = async_core_client.abi.decode_message_stream(
+            abi=self.events_abi, messages=[message]
+        )
+        self.assertEqual([MessageBodyType.INPUT], [item.body_type for item in stream])
+
+        # Results are objects in raw mode too
+        with request_options(raw='dict'):
+            stream = async_core_client.abi.decode_message_body_stream(
+                abi=self.events_abi, bodies=bodies[:1], is_internal=False
+            )
+            self.assertEqual(MessageBodyType.INPUT, next(stream).body_type)
+
+    def test_function_id_index(self):
+        index = FunctionIdIndex(client=async_core_client)
+        index.add(abi=Abi.from_path(path=os.path.join(SAMPLES_DIR, 'Giver.abi.json')))
+        abi = index.add(abi=self.events_abi)
+
+        message = 'te6ccgEBAwEAvAABRYgAC31qq9KF9Oifst6LU9U6FQSQQRlCSEMo+A3LN5MvphIMAQHhrd/b+MJ5Za+AygBc5qS/dVIPnqxCsM9PvqfVxutK+lnQEKzQoRTLYO6+jfM8TF4841bdNjLQwIDWL4UVFdxIhdMfECP8d3ruNZAXul5xxahT91swIEkEHph08JVlwmUmQAAAXRnJcuDX1XMZBW+LBKACAEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA=='
+        boc = async_core_client.boc.parse_message(params=ParamsOfParse(boc=message))
+        entry = index.route(body=boc.parsed['body'], is_internal=False)
+        self.assertIs(abi, entry.abi)
+        self.assertEqual(MessageBodyType.INPUT, entry.body_type)
+
+        decoded = index.decode(body=boc.parsed['body'], is_internal=False)
+        self.assertEqual(entry.name, decoded.name)
+        self.assertEqual(self.events_time, decoded.header.time)
+
+        with request_options(raw='dict'):
+            decoded = index.decode(body=boc.parsed['body'], is_internal=False)
+        self.assertEqual(entry.name, decoded.name)
+
     def test_encode_message(self):
         deploy_set = DeploySet(tvc=self.events_tvc)
         call_set = CallSet(
@@ -232,6 +286,38 @@ class TestTonAbiAsyncCore(unittest.TestCase):
             signed.message,
         )
 
+    def test_encode_message_batch(self):
+        signer = Signer.Keys(keys=self.keypair)
+        params = [
+            ParamsOfEncodeMessage(
+                abi=self.events_abi,
+                signer=signer,
+                deploy_set=DeploySet(tvc=self.events_tvc),
+                call_set=CallSet(
+                    function_name=function_name,
+                    header=FunctionHeader(
+                        pubkey=self.keypair.public,
+                        time=self.events_time + index,
+                        expire=self.events_expire,
+                    ),
+                ),
+            )
+            for index, function_name in enumerate(['constructor', 'unknown', None])
+        ]
+        results = async_core_client.abi.encode_message_batch(params=params)
+        self.assertEqual(3, len(results))
+        self.assertIsInstance(results[1], TonException)
+        for index in (0, 2):
+            encoded = async_core_client.abi.encode_message(params=params[index])
+            self.assertEqual(encoded.message, results[index].message)
+
+        with request_options(raw='dict'):
+            results = async_core_client.abi.encode_message_batch(params=params)
+        self.assertEqual(encoded.message, results[2].message)
+
+        with self.assertRaises(ValueError):
+            async_core_client.abi.encode_message_batch(params=params, workers=0)
+
     def test_encode_message_body(self):
         header = FunctionHeader(
             expire=self.events_expire, time=self.events_time, pubkey=self.keypair.public
@@ -744,6 +830,45 @@ class TestTonAbiSyncCore(unittest.TestCase):
 
         self.assertIsNone(encoded.data_to_sign)
 
+    def test_message_template(self):
+        header = FunctionHeader(pubkey=self.keypair.public)
+        kwargs = {
+            'client': sync_core_client,
+            'abi': self.events_abi,
+            'function_name': 'returnValue',
+            'header': header,
+            'input': {'id': '0'},
+        }
+        template = MessageTemplate(signer=Signer.Keys(keys=self.keypair), **kwargs)
+        encoded = template.encode(expire=self.events_expire, time=self.events_time)
+
+        header = FunctionHeader(
+            expire=self.events_expire, time=self.events_time, pubkey=self.keypair.public
+        )
+        call_set = CallSet(
+            function_name='returnValue', header=header, input={'id': '0'}
+        )
+        params = ParamsOfEncodeMessageBody(
+            abi=self.events_abi,
+            call_set=call_set,
+            is_internal=False,
+            signer=Signer.Keys(keys=self.keypair),
+        )
+        expected = sync_core_client.abi.encode_message_body(params=params)
+        self.assertEqual(expected.body, encoded.body)
+
+        # External signer with signing callback
+        def sign(data_to_sign: str) -> str:
+            sign_params = ParamsOfSign(unsigned=data_to_sign, keys=self.keypair)
+            return sync_core_client.crypto.sign(params=sign_params).signature
+
+        template = MessageTemplate(
+            signer=Signer.External(public_key=self.keypair.public), sign=sign, **kwargs
+        )
+        encoded = template.encode(expire=self.events_expire, time=self.events_time)
+        self.assertEqual(expected.body, encoded.body)
+        self.assertEqual(1, template.stats['messages'])
+
     def test_encode_account(self):
         # Encode account from encoded deploy message
         encoded_deploy_message = 'te6ccgECFwEAA2gAAqeIAAt9aqvShfTon7Lei1PVOhUEkEEZQkhDKPgNyzeTL6YSEZTHxAj/Hd67jWQF7peccWoU/dbMCBJBB6YdPCVZcJlJkAAAF0ZyXLg19VzGRotV8/gGAQEBwAICA88gBQMBAd4EAAPQIABB2mPiBH+O713GsgL3S844tQp+62YECSCD0w6eEqy4TKTMAib/APSkICLAAZL0oOGK7VNYMPShCQcBCvSkIPShCAAAAgEgDAoByP9/Ie1E0CDXScIBjhDT/9M/0wDRf/hh+Gb4Y/hijhj0BXABgED0DvK91wv/+GJw+GNw+GZ/+GHi0wABjh2BAgDXGCD5AQHTAAGU0/8DAZMC+ELiIPhl+RDyqJXTAAHyeuLTPwELAGqOHvhDIbkgnzAg+COBA+iogggbd0Cgud6S+GPggDTyNNjTHwH4I7zyudMfAfAB+EdukvI83gIBIBINAgEgDw4AvbqLVfP/hBbo417UTQINdJwgGOENP/0z/TANF/+GH4Zvhj+GKOGPQFcAGAQPQO8r3XC//4YnD4Y3D4Zn/4YeLe+Ebyc3H4ZtH4APhCyMv/+EPPCz/4Rs8LAMntVH/4Z4AgEgERAA5biABrW/CC3Rwn2omhp/+mf6YBov/ww/DN8Mfwxb30gyupo6H0gb+j8IpA3SRg4b3whXXlwMnwAZGT9ghBkZ8KEZ0aCBAfQAAAAAAAAAAAAAAAAACBni2TAgEB9gBh8IWRl//wh54Wf/CNnhYBk9qo//DPAAxbmTwqLfCC3Rwn2omhp/+mf6YBov/ww/DN8Mfwxb2uG/8rqaOhp/+/o/ABkRe4AAAAAAAAAAAAAAAAIZ4tnwOfI48sYvRDnhf/kuP2AGHwhZGX//CHnhZ/8I2eFgGT2qj/8M8AIBSBYTAQm4t8WCUBQB/PhBbo4T7UTQ0//TP9MA0X/4Yfhm+GP4Yt7XDf+V1NHQ0//f0fgAyIvcAAAAAAAAAAAAAAAAEM8Wz4HPkceWMXohzwv/yXH7AMiL3AAAAAAAAAAAAAAAABDPFs+Bz5JW+LBKIc8L/8lx+wAw+ELIy//4Q88LP/hGzwsAye1UfxUABPhnAHLccCLQ1gIx0gAw3CHHAJLyO+Ah1w0fkvI84VMRkvI74cEEIoIQ/////byxkvI84AHwAfhHbpLyPN4='
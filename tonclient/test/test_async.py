@@ -1,4 +1,5 @@
 import base64
+import os
 import unittest
 import logging
 import asyncio
@@ -9,7 +10,12 @@ from tonclient.client import TonClient
 from tonclient.errors import TonException
 from tonclient.objects import AppSigningBox, AppEncryptionBox
 from tonclient.types import (
+    Abi,
+    CallSet,
     ClientConfig,
+    ParamsOfEncodeMessage,
+    ResultOfEncodeMessage,
+    Signer,
     ParamsOfMnemonicFromRandom,
     ParamsOfAppRequest,
     ParamsOfAppSigningBox,
@@ -35,7 +41,7 @@ from tonclient.types import (
 )
 
 from tonclient.test.test_client import LIB_VERSION
-from tonclient.test.helpers import async_core_client, tonos_punch
+from tonclient.test.helpers import SAMPLES_DIR, async_core_client, tonos_punch
 
 
 class TestTonClientAsync(unittest.TestCase):
@@ -241,6 +247,31 @@ class TestTonClientAsync(unittest.TestCase):
 
         asyncio.run(__main())
 
+    def test_encode_message_batch(self):  # Abi
+        async def __main():
+            abi = Abi.from_path(path=os.path.join(SAMPLES_DIR, 'Events.abi.json'))
+            params = [
+                ParamsOfEncodeMessage(
+                    abi=abi,
+                    signer=Signer.NoSigner(),
+                    address=f'0:{"1" * 64}',
+                    call_set=CallSet(function_name=name, input={'id': hex(index)}),
+                )
+                for index, name in enumerate(['emitValue', 'unknown', 'returnValue'])
+            ]
+            results = await self.client.abi.encode_message_batch(
+                params=params, workers=2
+            )
+            self.assertIsInstance(results[0], ResultOfEncodeMessage)
+            self.assertIsInstance(results[1], TonException)
+            self.assertIsInstance(results[2], ResultOfEncodeMessage)
+
+            # Raised before the batch is started instead of waiting forever
+            with self.assertRaises(ValueError):
+                self.client.abi.encode_message_batch(params=params, workers=0)
+
+        asyncio.run(__main())
+
     def test_subscribe_collection(self):  # Net
         async def __main():
             results = []
@@ -0,0 +1,45 @@
+import unittest
+
+from tonclient.bindings.codec import CODECS, JsonCodec, _FastJsonCodec, get_codec
+from tonclient.bindings.types import TCStringData
+
+
+class TestCodecs(unittest.TestCase):
+    def test_default(self):
+        # Fast codecs are opt-in, big integers are decoded exactly by default
+        codec = get_codec()
+        self.assertIs(JsonCodec, type(codec))
+        number = 123456789012345678901234567890
+        self.assertEqual(number, codec.loads(codec.dumps(number)))
+
+    def test_auto(self):
+        self.assertIsInstance(get_codec(codec='auto'), JsonCodec)
+
+    def test_named(self):
+        for name, codec_class in CODECS.items():
+            with self.subTest(codec=name):
+                try:
+                    codec = get_codec(codec=name)
+                except ImportError:
+                    continue
+                self.assertIsInstance(codec, codec_class)
+                data = {'a': [1, 'b', None], 'big': 2**70}
+                self.assertEqual(data['a'], codec.loads(codec.dumps(data))['a'])
+
+        with self.assertRaises(ValueError):
+            get_codec(codec='yaml')
+
+    def test_abstract(self):
+        with self.assertRaises(TypeError):
+            _FastJsonCodec()
+
+
+class TestStringData(unittest.TestCase):
+    def test_malformed(self):
+        data = TCStringData.from_string(string=b'{"a": "\xff"}')
+        # Strings for logs are readable, data is decoded strictly
+        self.assertEqual('{"a": "�"}', data.string)
+        with self.assertRaises(ValueError):
+            data.json
+        with self.assertRaises(ValueError):
+            data.loads(codec=JsonCodec())
@@ -0,0 +1,218 @@
+import importlib.util
+import os
+import sys
+import tempfile
+import unittest
+
+from tonclient.codegen import (
+    API_REFERENCE,
+    LINE_LENGTH,
+    ROOT_DIR,
+    ApiReference,
+    generate,
+    merge,
+)
+from tonclient.serializers import dump
+
+GENERATED = '''"""Sample module"""
+from typing import Any
+
+
+class Params:
+    """Params"""
+
+    def __init__(self, value: int):
+        self.value = value
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'value': self.value}
+
+
+class Result:
+    """Result"""
+
+    def __init__(self, value: int):
+        self.value = value
+'''
+
+EXISTING = '''"""
+Sample module.
+Docstring is kept
+"""
+from typing import Any
+
+# region hand-written
+import json
+# endregion
+
+
+class Params:
+    """Params"""
+
+    def __init__(self, value: int):
+        self.value = value
+
+    # region hand-written
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'value': json.dumps(self.value)}
+
+    def dump(self) -> str:
+        return json.dumps(self.dict)
+    # endregion
+
+
+class Result:
+    """Result"""
+
+    def __init__(self, value: int):
+        self.value = value
+
+
+# region hand-written
+class Removed:
+    """Type which is not in the reference"""
+# endregion
+'''
+
+
+class TestCodegen(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        reference = ApiReference.load(path=API_REFERENCE)
+        cls.paths = generate(reference=reference, out=cls.tmp.name)
+
+        # Import generated types as a separate package
+        types_dir = os.path.join(cls.tmp.name, 'tonclient', 'types')
+        spec = importlib.util.spec_from_file_location(
+            'generated_types',
+            os.path.join(types_dir, '__init__.py'),
+            submodule_search_locations=[types_dir],
+        )
+        cls.types = importlib.util.module_from_spec(spec)
+        sys.modules[spec.name] = cls.types
+        spec.loader.exec_module(cls.types)
+
+    @classmethod
+    def tearDownClass(cls):
+        for name in list(sys.modules):
+            if name.split('.')[0] == 'generated_types':
+                del sys.modules[name]
+        cls.tmp.cleanup()
+
+    def test_round_trip(self):
+        """Regeneration from `api.json` gives committed sources"""
+        for path in self.paths:
+            relpath = os.path.relpath(path, self.tmp.name)
+            with self.subTest(path=relpath):
+                with open(path, encoding='utf8') as fp:
+                    generated = fp.read()
+                with open(os.path.join(ROOT_DIR, relpath), encoding='utf8') as fp:
+                    self.assertEqual(fp.read(), generated)
+
+    def test_sources(self):
+        for path in self.paths:
+            with open(path, encoding='utf8') as fp:
+                source = fp.read()
+            compile(source, path, 'exec')
+            for line in source.splitlines():
+                # Key and value of a dict item can't be split
+                if len(line.split()) > 2:
+                    self.assertLessEqual(len(line), LINE_LENGTH, msg=line)
+
+    def test_merge(self):
+        source = merge(source=GENERATED, existing=EXISTING)
+        self.assertEqual(
+            [
+                '"""',
+                'Sample module.',
+                'Docstring is kept',
+                '"""',
+                'from typing import Any',
+                '',
+                '',
+                '# region hand-written',
+                'import json',
+                '# endregion',
+                '',
+                '',
+                'class Params:',
+                '    """Params"""',
+                '',
+                '    def __init__(self, value: int):',
+                '        self.value = value',
+                '',
+                '    # region hand-written',
+                '    @property',
+                '    def dict(self):',
+                '        """Dict from object"""',
+                "        return {'value': json.dumps(self.value)}",
+                '',
+                '    def dump(self) -> str:',
+                '        return json.dumps(self.dict)',
+                '    # endregion',
+                '',
+                '',
+                'class Result:',
+                '    """Result"""',
+                '',
+                '    def __init__(self, value: int):',
+                '        self.value = value',
+                '',
+                '',
+                '# region hand-written',
+                'class Removed:',
+                '    """Type which is not in the reference"""',
+                '# endregion',
+            ],
+            source.splitlines(),
+        )
+        self.assertEqual(source, merge(source=GENERATED, existing=source))
+        self.assertEqual(GENERATED, merge(source=GENERATED, existing=None))
+
+    def test_merge_error(self):
+        existing = EXISTING.replace('class Params:', 'class Other:')
+        with self.assertRaises(ValueError):
+            merge(source=GENERATED, existing=existing)
+
+    def test_dict(self):
+        params = self.types.ParamsOfResolveAppRequest(
+            app_request_id=1, result=self.types.AppRequestResult.Ok(result={'a': 1})
+        )
+        self.assertEqual(
+            {'app_request_id': 1, 'result': {'type': 'Ok', 'result': {'a': 1}}},
+            dump(params),
+        )
+
+    def test_from_dict(self):
+        data = {
+            'messages': [
+                {
+                    'id': '1',
+                    'bounce': False,
+                    'decoded_body': {
+                        'body_type': 'Input',
+                        'name': 'touch',
+                        'header': {'expire': 1, 'time': 2},
+                    },
+                }
+            ],
+            'transactions': [],
+        }
+        result = self.types.ResultOfQueryTransactionTree.from_dict(data=data)
+        body = result.messages[0].decoded_body
+        self.assertIsInstance(body, self.types.DecodedMessageBody)
+        self.assertIsInstance(body.header, self.types.FunctionHeader)
+        self.assertEqual(2, body.header.time)
+
+    def test_methods(self):
+        path = os.path.join(self.tmp.name, 'tonclient', 'client.py')
+        spec = importlib.util.spec_from_file_location('generated_client', path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        for name in ('get_api_reference', 'version', 'build_info'):
+            self.assertTrue(callable(getattr(module.TonClientBase, name)))
@@ -0,0 +1,161 @@
+import copy
+import enum
+import inspect
+import unittest
+
+from tonclient import types
+from tonclient.decoders import get_decoder, load
+from tonclient.test.test_serializers import instance
+
+
+def slots(obj):
+    """Set attributes of types object"""
+    names = [s for c in type(obj).__mro__ for s in getattr(c, '__slots__', ())]
+    return {name: getattr(obj, name) for name in names if hasattr(obj, name)}
+
+
+def is_types(value):
+    return type(value).__module__.startswith('tonclient.types')
+
+
+def state(value):
+    """Comparable state of types objects"""
+    if isinstance(value, list):
+        return [state(v) for v in value]
+    if is_types(value) and not isinstance(value, enum.Enum):
+        return type(value), {k: state(v) for k, v in slots(value).items()}
+    return value
+
+
+def response(value):
+    """Response dict of types object as core would send it"""
+    if isinstance(value, list):
+        return [response(v) for v in value]
+    if isinstance(value, enum.Enum):
+        return value.value
+    if is_types(value):
+        return {k: response(v) for k, v in slots(value).items()}
+    return value
+
+
+def result_classes():
+    """Types classes responses are decoded to"""
+    return [
+        getattr(types, name)
+        for name in types.__all__
+        if name.startswith('ResultOf') and inspect.isclass(getattr(types, name))
+    ]
+
+
+def former(cls, data):
+    """Build object as responses were built before compiled decoders"""
+    if hasattr(cls, 'from_dict'):
+        return cls.from_dict(data=data)
+    return cls(**data)
+
+
+class TestDecoders(unittest.TestCase):
+    def test_all_types(self):
+        classes = result_classes()
+        self.assertGreater(len(classes), 50)
+        for cls in classes:
+            for required_only in (False, True):
+                with self.subTest(cls=cls.__qualname__, required_only=required_only):
+                    try:
+                        obj = instance(cls, required_only=required_only)
+                        data = response(obj)
+                        expected = state(former(cls, copy.deepcopy(data)))
+                    except (AttributeError, TypeError, ValueError, KeyError):
+                        # Sample data is not accepted by `from_dict` itself
+                        continue
+                    self.assertEqual(expected, state(load(cls, data)))
+
+    def test_unknown_keys(self):
+        # Unknown keys are remembered after the first response
+        for _ in range(2):
+            result = load(types.ResultOfQueryTransactionTree, self.tree())
+            message = result.messages[0]
+            self.assertIsInstance(message, types.MessageNode)
+            self.assertIsInstance(message.decoded_body, types.DecodedMessageBody)
+            self.assertEqual(2, message.decoded_body.header.time)
+            self.assertEqual('2', result.transactions[0].id)
+
+    def test_compiled(self):
+        # Classes received from core don't fall back to `from_dict`
+        for cls in result_classes():
+            if '__init__' not in vars(cls) and not hasattr(cls, 'from_dict'):
+                continue
+            with self.subTest(cls=cls.__qualname__):
+                self.assertEqual('decode', get_decoder(cls).__name__)
+
+    def test_cross_module_fields(self):
+        # `DecodedOutput` field is annotated with type of other module
+        data = {
+            'out_messages': [],
+            'account': 'a',
+            'decoded': {
+                'out_messages': [
+                    {
+                        'body_type': 'Output',
+                        'name': 'get',
+                        'value': {},
+                        'header': None,
+                        'added_later': True,
+                    }
+                ],
+                'output': {},
+                'added_later': True,
+            },
+            'added_later': True,
+        }
+        result = load(types.ResultOfRunTvm, data)
+        message = result.decoded.out_messages[0]
+        self.assertIsInstance(result.decoded, types.DecodedOutput)
+        self.assertIsInstance(message, types.DecodedMessageBody)
+        self.assertEqual(types.MessageBodyType.OUTPUT, message.body_type)
+
+    def test_missing_keys(self):
+        with self.assertRaises(TypeError):
+            load(types.TransactionNode, {'id': '1', 'added_later': True})
+        # Error of the first attempt is raised if there are no unknown keys
+        with self.assertRaisesRegex(TypeError, 'in_msg'):
+            load(types.TransactionNode, {'id': '1'})
+
+    @staticmethod
+    def tree():
+        return {
+            'messages': [
+                {
+                    'id': '1',
+                    'bounce': False,
+                    'decoded_body': {
+                        'body_type': 'Input',
+                        'name': 'transfer',
+                        'value': {},
+                        'header': {'expire': 1, 'time': 2, 'signature': 's'},
+                        'added_later': True,
+                    },
+                    'added_later': True,
+                }
+            ],
+            'transactions': [
+                {
+                    'id': '2',
+                    'in_msg': '1',
+                    'out_msgs': [],
+                    'account_addr': 'a',
+                    'total_fees': '1',
+                    'aborted': False,
+                    'added_later': True,
+                }
+            ],
+            'added_later': True,
+        }
+
+    def test_union(self):
+        event = load(
+            types.ProcessingEvent,
+            {'type': 'WillFetchFirstBlock', 'message_id': 'm', 'message_dst': 'd'},
+        )
+        self.assertIsInstance(event, types.ProcessingEvent.WillFetchFirstBlock)
+        self.assertEqual('m', event.message_id)
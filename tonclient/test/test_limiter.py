@@ -0,0 +1,85 @@
+import asyncio
+import threading
+import time
+import unittest
+
+from tonclient.limiter import ConcurrencyLimiter
+
+
+class TestConcurrencyLimiter(unittest.TestCase):
+    def test_family(self):
+        limiter = ConcurrencyLimiter(limits={'net.': 10, 'net.query': 1})
+        self.assertEqual('net.query', limiter.family(method='net.query').prefix)
+        self.assertEqual('net.', limiter.family(method='net.subscribe').prefix)
+        self.assertIsNone(limiter.family(method='crypto.sha256'))
+
+    def test_sync_fifo(self):
+        limiter = ConcurrencyLimiter(limits={'net.': 1})
+        family = limiter.family(method='net.query')
+        self.assertTrue(limiter.acquire(family=family))
+
+        order = []
+
+        def _request(index):
+            limiter.acquire(family=family)
+            order.append(index)
+            limiter.release(family=family)
+
+        threads = []
+        for index in range(5):
+            threads.append(threading.Thread(target=_request, args=(index,)))
+            threads[-1].start()
+            while limiter.snapshot()['net.']['queued'] <= index:
+                time.sleep(0.001)
+
+        limiter.release(family=family)
+        for thread in threads:
+            thread.join()
+        self.assertEqual([0, 1, 2, 3, 4], order)
+        self.assertEqual(
+            {
+                'limit': 1,
+                'in_flight': 0,
+                'queued': 0,
+                'max_queued': 5,
+                'queued_total': 5,
+            },
+            limiter.snapshot()['net.'],
+        )
+
+    def test_sync_timeout(self):
+        limiter = ConcurrencyLimiter(limits={'net.': 1})
+        family = limiter.family(method='net.query')
+        limiter.acquire(family=family)
+        self.assertFalse(limiter.acquire(family=family, timeout=0.01))
+        self.assertEqual(0, limiter.snapshot()['net.']['queued'])
+
+    def test_async(self):
+        limiter = ConcurrencyLimiter(limits={'net.': 2})
+        family = limiter.family(method='net.query')
+        active, max_active = [0], [0]
+
+        async def _request():
+            await limiter.acquire_async(family=family)
+            active[0] += 1
+            max_active[0] = max(max_active[0], active[0])
+            await asyncio.sleep(0.001)
+            active[0] -= 1
+            limiter.release(family=family)
+
+        async def _main():
+            await asyncio.gather(*[_request() for _ in range(20)])
+
+            # Cancelled waiter leaves the queue
+            await limiter.acquire_async(family=family)
+            await limiter.acquire_async(family=family)
+            task = asyncio.ensure_future(limiter.acquire_async(family=family))
+            await asyncio.sleep(0)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            self.assertEqual(0, limiter.snapshot()['net.']['queued'])
+
+        asyncio.run(_main())
+        self.assertEqual(2, max_active[0])
+        self.assertEqual(2, limiter.snapshot()['net.']['in_flight'])
@@ -0,0 +1,62 @@
+import unittest
+
+from tonclient.bindings.codec import JsonCodec
+from tonclient.bindings.types import TCResponseType, TCStringData
+from tonclient.metrics import ClientMetrics
+from tonclient.module import RequestWaiter, ResponseRouter
+
+
+class TestClientMetrics(unittest.TestCase):
+    def test_snapshot(self):
+        metrics = ClientMetrics(buckets=(0.5, 1))
+        started = metrics.started(method='net.query', size=10)
+        self.assertEqual(1, metrics.snapshot()['net.query']['in_flight'])
+
+        metrics.response(method='net.query', size=5)
+        metrics.finished(method='net.query', started=started)
+        # Completed in 2 seconds
+        started = metrics.started(method='net.query', size=1) - 2
+        metrics.finished(method='net.query', started=started, is_error=True)
+
+        snapshot = metrics.snapshot()['net.query']
+        self.assertEqual(2, snapshot['requests'])
+        self.assertEqual(1, snapshot['errors'])
+        self.assertEqual(0, snapshot['in_flight'])
+        self.assertEqual(11, snapshot['request_bytes'])
+        self.assertEqual(5, snapshot['response_bytes'])
+        self.assertEqual(
+            {0.5: 1, 1: 1, float('inf'): 2}, snapshot['latency']['buckets']
+        )
+
+    def test_prometheus(self):
+        metrics = ClientMetrics(buckets=(1,))
+        started = metrics.started(method='abi.encode_message', size=3)
+        metrics.finished(method='abi.encode_message', started=started)
+        text = metrics.prometheus()
+        self.assertIn('tonclient_requests_total{method="abi.encode_message"} 1', text)
+        self.assertIn(
+            'tonclient_request_duration_seconds_bucket'
+            '{method="abi.encode_message",le="+Inf"} 1',
+            text,
+        )
+
+    def test_router(self):
+        metrics = ClientMetrics()
+        router = ResponseRouter(codec=JsonCodec(), metrics=metrics)
+        waiter = RequestWaiter()
+        request_id = router.register(
+            request={
+                'is_async': False,
+                'callback': None,
+                'future': waiter,
+                'method': 'crypto.sha256',
+                'started': metrics.started(method='crypto.sha256', size=2),
+            }
+        )
+        data = TCStringData.from_string(string='{"code": 1, "message": "", "data": {}}')
+        router.handler(request_id, data, TCResponseType.Error, True)
+
+        snapshot = metrics.snapshot()['crypto.sha256']
+        self.assertEqual(1, snapshot['errors'])
+        self.assertEqual(0, snapshot['in_flight'])
+        self.assertEqual(data.len, snapshot['response_bytes'])
@@ -0,0 +1,265 @@
+import asyncio
+import gc
+import threading
+import unittest
+import weakref
+from concurrent.futures import Future
+from types import SimpleNamespace
+from unittest import mock
+
+from tonclient.abi import TonAbi
+from tonclient.bindings.codec import JsonCodec
+from tonclient.bindings.types import TCResponseType, TCStringData
+from tonclient.errors import TonException
+from tonclient.module import (
+    RequestIdAllocator,
+    RequestWaiter,
+    ResponseRouter,
+    TonModule,
+    request_options,
+)
+from tonclient.registry import AbiRegistry
+from tonclient.types import (
+    Abi,
+    ClientError,
+    ParamsOfEncodeMessage,
+    ParamsOfParse,
+    ResultOfEncodeMessage,
+    ResultOfParse,
+    Signer,
+)
+
+
+class TestRequestIdAllocator(unittest.TestCase):
+    def test_monotonic(self):
+        allocator = RequestIdAllocator()
+        ids = [allocator.allocate(in_use={}) for _ in range(5)]
+        self.assertEqual([1, 2, 3, 4, 5], ids)
+
+    def test_skip_in_use(self):
+        allocator = RequestIdAllocator()
+        self.assertEqual(3, allocator.allocate(in_use={1, 2}))
+
+    def test_wraparound(self):
+        allocator = RequestIdAllocator()
+        allocator._counter = iter(range(RequestIdAllocator.MAX_ID, 2**32))
+        self.assertEqual(RequestIdAllocator.MAX_ID, allocator.allocate(in_use={}))
+        # Zero is skipped after wraparound
+        self.assertEqual(1, allocator.allocate(in_use={}))
+
+
+class TestRequestWaiter(unittest.TestCase):
+    def test_result(self):
+        waiter = RequestWaiter()
+        threading.Timer(0.01, waiter.set_result, args=[{'a': 1}]).start()
+        self.assertEqual({'a': 1}, waiter.result())
+        # Result may be read again
+        self.assertEqual({'a': 1}, waiter.result())
+
+    def test_timeout(self):
+        waiter = RequestWaiter()
+        self.assertFalse(waiter.wait(timeout=0.01))
+        waiter.set_result(1)
+        self.assertTrue(waiter.wait(timeout=0.01))
+
+    def test_exception(self):
+        waiter = RequestWaiter()
+        error = ClientError(code=1, message='', data={})
+        waiter.set_exception(TonException(error=error))
+        with self.assertRaises(TonException):
+            waiter.result()
+
+
+class TestResponseRouter(unittest.TestCase):
+    def test_routing(self):
+        routers = [ResponseRouter(codec=JsonCodec()) for _ in range(2)]
+        futures = [Future() for _ in routers]
+        ids = [
+            router.register(request={'is_async': False, 'future': future})
+            for router, future in zip(routers, futures)
+        ]
+        # Each client has its own ids
+        self.assertEqual(ids[0], ids[1])
+
+        for index, (router, request_id) in enumerate(zip(routers, ids)):
+            data = TCStringData.from_string(string=f'{{"router": {index}}}')
+            router.handler(request_id, data, TCResponseType.Success, True)
+            self.assertEqual({}, router.requests)
+
+        self.assertEqual([{'router': 0}, {'router': 1}], [f.result() for f in futures])
+
+    def test_raw_bytes(self):
+        router = ResponseRouter(codec=JsonCodec())
+        future = Future()
+        request_id = router.register(
+            request={'is_async': False, 'future': future, 'raw': 'bytes'}
+        )
+        data = TCStringData.from_string(string='{"a": 1}')
+        router.handler(request_id, data, TCResponseType.Success, True)
+        self.assertEqual(b'{"a": 1}', future.result())
+
+        # Errors are parsed
+        request_id = router.register(
+            request={'is_async': False, 'future': Future(), 'raw': 'bytes'}
+        )
+        future = router.requests[request_id]['future']
+        data = TCStringData.from_string(
+            string='{"code": 1, "message": "", "data": {}}'
+        )
+        router.handler(request_id, data, TCResponseType.Error, True)
+        self.assertEqual(1, future.exception().client_error.code)
+
+    def test_malformed_response(self):
+        router = ResponseRouter(codec=JsonCodec())
+        future = Future()
+        request_id = router.register(request={'is_async': False, 'future': future})
+        data = TCStringData.from_string(string=b'{"a": "\xff"}')
+        router.handler(request_id, data, TCResponseType.Success, True)
+        self.assertIsInstance(future.exception(timeout=0), ValueError)
+
+    def test_unknown_request(self):
+        router = ResponseRouter(codec=JsonCodec())
+        data = TCStringData.from_string(string='{}')
+        router.handler(1, data, TCResponseType.Success, True)
+
+    def test_cancel(self):
+        router = ResponseRouter(codec=JsonCodec())
+        waiter = RequestWaiter()
+        request_id = router.register(request={'is_async': False, 'future': waiter})
+        self.assertTrue(router.cancel(request_id=request_id, exception=None))
+        self.assertFalse(router.cancel(request_id=request_id, exception=None))
+
+        # Late response is ignored
+        data = TCStringData.from_string(string='{}')
+        router.handler(request_id, data, TCResponseType.Success, True)
+        self.assertFalse(waiter.wait(timeout=0))
+
+    def test_collected_client(self):
+        router = ResponseRouter(codec=JsonCodec())
+        future = Future()
+        request_id = router.register(request={'is_async': False, 'future': future})
+        handler = router.handler
+        router.cancel(request_id=request_id, exception=None)
+        ref = weakref.ref(router)
+        del router
+        gc.collect()
+        self.assertIsNone(ref())
+
+        # Late response of timed out request is ignored
+        data = TCStringData.from_string(string='{}')
+        handler(request_id, data, TCResponseType.Success, True)
+        self.assertFalse(future.done())
+
+    def test_finished_loop(self):
+        router = ResponseRouter(codec=JsonCodec())
+
+        async def _request():
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            router.delivery(loop=loop).push(future=future, result=1)
+            self.assertEqual(1, await future)
+            return weakref.ref(loop)
+
+        refs = [asyncio.run(_request()) for _ in range(3)]
+        gc.collect()
+        self.assertEqual([None] * 3, [ref() for ref in refs])
+        self.assertEqual(0, len(router._deliveries))
+
+    def test_stale_requests(self):
+        router = ResponseRouter(codec=JsonCodec())
+        request_id = router.register(request={'method': 'net.query'})
+        self.assertEqual([], router.stale_requests(max_age=60))
+
+        router.requests[request_id]['created'] -= 120
+        stale = router.stale_requests(max_age=60)
+        self.assertEqual([request_id], [r['request_id'] for r in stale])
+        self.assertEqual('net.query', stale[0]['method'])
+
+
+class RacingRouter(ResponseRouter):
+    """Router which gets response right before request is cancelled"""
+
+    def cancel(self, request_id, exception):
+        data = TCStringData.from_string(string='{"result": 1}')
+        self.handler(request_id, data, TCResponseType.Success, True)
+        return super().cancel(request_id=request_id, exception=exception)
+
+
+@mock.patch('tonclient.module.tc_request')
+class TestTimeoutRace(unittest.TestCase):
+    def setUp(self):
+        router = RacingRouter(codec=JsonCodec())
+        client = SimpleNamespace(ctx=None, router=router, metrics=None, tracer=None)
+        self.module = TonModule(client=client)
+        self.kwargs = {
+            'method': 'net.query',
+            'request_params': b'{}',
+            'callback': None,
+            'timeout': 0.01,
+        }
+
+    def test_sync(self, _):
+        result = self.module._async_core_request(**self.kwargs)
+        self.assertEqual({'result': 1}, result)
+
+    def test_future(self, _):
+        result = asyncio.run(self.module._async_core_request_future(**self.kwargs))
+        self.assertEqual({'result': 1}, result)
+
+
+class TestPrepareParams(unittest.TestCase):
+    def setUp(self):
+        self.codec = JsonCodec()
+        self.module = TonModule(client=SimpleNamespace(codec=self.codec))
+
+    def prepare(self, params, **kwargs):
+        return self.codec.loads(self.module._prepare_params(params, **kwargs))
+
+    def test_dict(self):
+        params = {'boc': 'te6cc'}
+        self.assertEqual({'boc': 'te6cc'}, self.prepare(params))
+        params_timeout = self.prepare(params, timeout=1)
+        self.assertEqual({'boc': 'te6cc', 'timeout': 1}, params_timeout)
+        # Params dict is not changed
+        self.assertEqual({'boc': 'te6cc'}, params)
+
+    def test_object(self):
+        params = ParamsOfParse(boc='te6cc')
+        self.assertEqual({'boc': 'te6cc'}, self.prepare(params))
+        params_timeout = self.prepare(params, timeout=1)
+        self.assertEqual({'boc': 'te6cc', 'timeout': 1}, params_timeout)
+
+
+class TestRawBatch(unittest.TestCase):
+    class Abi(TonAbi):
+        def request(self, method, callback=None, params_or_str=None, **kwargs):
+            return {'message': 'te6cc', 'address': '0:1', 'message_id': '1'}
+
+    def test_encode_message_batch(self):
+        client = SimpleNamespace(raw='dict', is_async=False, abi_registry=AbiRegistry())
+        module = self.Abi(client=client)
+        params = ParamsOfEncodeMessage(
+            abi=Abi.Json(value='{}'), signer=Signer.NoSigner(), address='0:1'
+        )
+        results = module.encode_message_batch(params=[params, params])
+        self.assertEqual(['te6cc'] * 2, [r.message for r in results])
+        self.assertIsInstance(results[0], ResultOfEncodeMessage)
+
+
+class TestRequestOptions(unittest.TestCase):
+    def test_unknown(self):
+        with self.assertRaises(TypeError):
+            with request_options(retries=1):
+                pass
+
+    def test_raw(self):
+        module = TonModule(client=SimpleNamespace(raw=None))
+        result = {'parsed': {'balance': '1'}}
+        with request_options(raw='dict'):
+            self.assertIs(result, module.response(ResultOfParse, response=result))
+        parsed = module.response(ResultOfParse, response=result)
+        self.assertIsInstance(parsed, ResultOfParse)
+
+        with self.assertRaises(ValueError):
+            with request_options(raw='objects'):
+                pass
@@ -354,7 +354,7 @@ class TestTonNetAsyncCore(unittest.TestCase):
 
     def test_get_signature_id(self):
         result = async_core_client.net.get_signature_id()
-        self.assertTrue('signature_id' in result.__dict__.keys())
+        self.assertTrue(hasattr(result, 'signature_id'))
 
     # TODO: Not working on TONOS SE
     # def test_block_iterator(self):
@@ -541,4 +541,4 @@ class TestTonNetSyncCore(unittest.TestCase):
 
     def test_get_signature_id(self):
         result = sync_core_client.net.get_signature_id()
-        self.assertTrue('signature_id' in result.__dict__.keys())
+        self.assertTrue(hasattr(result, 'signature_id'))
@@ -0,0 +1,198 @@
+import base64
+import json
+import os
+import threading
+import unittest
+from types import SimpleNamespace
+
+from tonclient.registry import AbiRegistry, FunctionIdIndex, RegisteredAbi
+from tonclient.serializers import dump
+from tonclient.test.helpers import SAMPLES_DIR
+from tonclient.types import (
+    Abi,
+    AbiContract,
+    MessageBodyType,
+    ParamsOfDecodeMessageBody,
+)
+
+
+class TestAbiRegistry(unittest.TestCase):
+    def setUp(self):
+        self.registry = AbiRegistry()
+        self.path = os.path.join(SAMPLES_DIR, 'Giver.abi.json')
+
+    def test_intern(self):
+        abi = self.registry.from_path(path=self.path)
+        self.assertIsInstance(abi, RegisteredAbi)
+        self.assertIsInstance(abi, Abi.Json)
+        self.assertIn(abi.hash, self.registry)
+
+        # Equal content in other formatting is the same ABI
+        with open(self.path) as fp:
+            data = json.load(fp)
+        self.assertIs(abi, self.registry.register(abi=json.dumps(data, indent=4)))
+        self.assertIs(abi, self.registry.register(abi=Abi.Json(value=abi.value)))
+        self.assertIs(abi, self.registry.register(abi=data))
+        self.assertIs(abi, self.registry.register(abi=abi))
+        self.assertIs(abi, self.registry.get(hash=abi.hash))
+        self.assertEqual(1, len(self.registry))
+
+        other = self.registry.from_path(os.path.join(SAMPLES_DIR, 'Hello.abi.json'))
+        self.assertIsNot(abi, other)
+        self.assertEqual(2, len(self.registry))
+
+    def test_contract(self):
+        contract = AbiContract(abi_version=2, version='2.2', header=['time'])
+        abi = self.registry.register(abi=Abi.Contract(value=contract))
+        self.assertEqual(dump(contract), json.loads(abi.value))
+        self.assertIs(abi, self.registry.register(abi=json.dumps(dump(contract))))
+
+    def test_handle(self):
+        handle = Abi.Handle(value=1)
+        self.assertIs(handle, self.registry.register(abi=handle))
+        self.assertEqual(0, len(self.registry))
+
+    def test_unsupported(self):
+        with self.assertRaises(TypeError):
+            self.registry.register(abi=1)
+
+    def test_request_dict(self):
+        abi = self.registry.from_path(path=self.path)
+        params = ParamsOfDecodeMessageBody(abi=abi, body='te6', is_internal=False)
+        self.assertEqual({'type': 'Json', 'value': abi.value}, dump(params)['abi'])
+        # ABI dict is built once
+        self.assertIs(dump(params)['abi'], dump(params)['abi'])
+
+    def test_text_cache(self):
+        self.registry.TEXT_CACHE_SIZE = 2
+        with open(self.path) as fp:
+            data = json.load(fp)
+        texts = [json.dumps(data, indent=indent) for indent in range(3)]
+        abi = self.registry.register(abi=texts[0])
+        self.registry.register(abi=texts[1])
+        self.registry.register(abi=texts[0])
+        self.registry.register(abi=texts[2])
+
+        # Least recently used text is evicted, ABI stays registered
+        self.assertEqual([texts[0], texts[2]], list(self.registry._by_text))
+        self.assertIs(abi, self.registry.register(abi=texts[1]))
+        self.assertEqual(1, len(self.registry))
+
+    def test_concurrent(self):
+        with open(self.path) as fp:
+            text = fp.read()
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(self.registry.register(abi=text))
+            )
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(1, len({id(abi) for abi in results}))
+
+
+def single_cell_boc(bits: str) -> str:
+    """BOC of one cell with data bits, e.g. `'1010'`"""
+    data = bits
+    if len(bits) % 8:
+        # Completion tag
+        data += '1' + '0' * (7 - len(bits) % 8)
+    data = int(data, 2).to_bytes(len(data) // 8, 'big') if data else b''
+    cell = bytes([0, len(bits) // 8 + (len(bits) + 7) // 8]) + data
+    header = b'\xb5\xee\x9c\x72' + bytes([0x01, 0x01, 1, 1, 0, len(cell), 0])
+    return base64.b64encode(header + cell).decode()
+
+
+def bits(value: int, count: int) -> str:
+    return format(value, f'0{count}b')
+
+
+class TestFunctionIdIndex(unittest.TestCase):
+    def setUp(self):
+        client = SimpleNamespace(abi_registry=AbiRegistry(), is_async=False)
+        self.index = FunctionIdIndex(client=client)
+        self.wallet = self.index.add(
+            abi={
+                'ABI version': 2,
+                'header': ['pubkey', 'time', 'expire'],
+                'functions': [
+                    {'name': 'sendTransaction', 'id': '0x0000000a'},
+                    {'name': 'getBalance', 'id': '0x0000000b'},
+                ],
+                'events': [],
+            }
+        )
+        with open(os.path.join(SAMPLES_DIR, 'Events.abi.json')) as fp:
+            # Ids of functions without explicit ones are calculated by core
+            self.events = self.index.add(abi={**json.load(fp), 'functions': []})
+
+    def test_add(self):
+        self.assertEqual(2, len(self.index))
+        self.assertIn(self.wallet, self.index)
+        self.index.add(abi=self.wallet.value)
+        self.assertEqual(2, len(self.index))
+
+    def test_internal(self):
+        entry = self.index.route(body=single_cell_boc(bits(0xA, 32)), is_internal=True)
+        self.assertIs(self.wallet, entry.abi)
+        self.assertEqual('sendTransaction', entry.name)
+        self.assertEqual(MessageBodyType.INPUT, entry.body_type)
+
+        body = single_cell_boc(bits(0x8000000B, 32) + '1' * 10)
+        entry = self.index.route(body=body, is_internal=True)
+        self.assertEqual('getBalance', entry.name)
+        self.assertEqual(MessageBodyType.OUTPUT, entry.body_type)
+
+    def test_external_inbound(self):
+        # Signature, pubkey, time and expire headers
+        signed = '1' + '0' * 512 + '1' + '1' * 256 + bits(1, 64) + bits(2, 32)
+        body = single_cell_boc(signed + bits(0xB, 32))
+        entry = self.index.route(body=body, is_internal=False)
+        self.assertEqual('getBalance', entry.name)
+        self.assertEqual(MessageBodyType.INPUT, entry.body_type)
+
+        unsigned = '0' + '0' + bits(1, 64) + bits(2, 32)
+        body = single_cell_boc(unsigned + bits(0xA, 32))
+        self.assertEqual('sendTransaction', self.index.route(body, False).name)
+
+    def test_external_outbound(self):
+        # Event id is calculated from signature
+        body = single_cell_boc(bits(0x71E58C5E, 32) + bits(7, 256))
+        entry = self.index.route(body=body, is_internal=False)
+        self.assertIs(self.events, entry.abi)
+        self.assertEqual('EventThrown', entry.name)
+        self.assertEqual(MessageBodyType.EVENT, entry.body_type)
+
+    def test_concurrent_add(self):
+        body = single_cell_boc('0' * 32 + bits(0xB, 32))
+        errors = []
+        stop = threading.Event()
+
+        def _route():
+            while not stop.is_set():
+                try:
+                    self.index.route(body=body, is_internal=False)
+                except RuntimeError as exc:
+                    errors.append(exc)
+                    return
+
+        thread = threading.Thread(target=_route)
+        thread.start()
+        try:
+            # Each ABI adds new headers set
+            for number in range(1000):
+                self.index.add(abi={'ABI version': 2, 'header': [f'h{number}']})
+        finally:
+            stop.set()
+            thread.join()
+        self.assertEqual([], errors)
+
+    def test_unknown(self):
+        self.assertIsNone(self.index.route(single_cell_boc(bits(1, 32)), True))
+        self.assertIsNone(self.index.route(single_cell_boc('1010'), True))
+        self.assertIsNone(self.index.route('te6ccgEBAQ', True))
+        self.assertIsNone(self.index.route('Wrong==', True))
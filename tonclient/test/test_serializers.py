@@ -0,0 +1,113 @@
+import enum
+import inspect
+import typing
+import unittest
+
+from tonclient import types
+from tonclient.serializers import dump, get_serializer
+from tonclient.types import BaseTypedType
+
+SAMPLES = {int: 1, str: 's', bool: True, float: 1.5}
+
+
+def strip(value):
+    """Remove `None` values of dicts recursively"""
+    if isinstance(value, dict):
+        return {k: strip(v) for k, v in value.items() if v is not None}
+    if isinstance(value, list):
+        return [strip(v) for v in value]
+    return value
+
+
+def build(annotation, required_only, depth=0):
+    """Build sample value of annotation"""
+    if isinstance(annotation, str):
+        # Annotations of other modules types are qualified, e.g. 'tvm.X'
+        name = annotation.rsplit('.', 1)[-1]
+        annotation = getattr(types, name, typing.Any)
+    if isinstance(annotation, typing.ForwardRef):
+        return build(annotation.__forward_arg__, required_only, depth)
+
+    origin = getattr(annotation, '__origin__', None)
+    if origin is list:
+        return [build(annotation.__args__[0], required_only, depth)]
+    if origin is typing.Union:
+        return build(annotation.__args__[0], required_only, depth)
+    if origin is dict or annotation is typing.Any:
+        return {'key': 'value'}
+    if annotation in SAMPLES:
+        return SAMPLES[annotation]
+    if not inspect.isclass(annotation):
+        return None
+    if issubclass(annotation, enum.Enum):
+        return list(annotation)[0]
+    if '__init__' not in vars(annotation):
+        # Namespace of `BaseTypedType` variants, e.g. `Abi`
+        variants = [
+            v
+            for v in vars(annotation).values()
+            if inspect.isclass(v) and issubclass(v, BaseTypedType)
+        ]
+        return build(variants[-1], required_only, depth) if variants else None
+    return instance(annotation, required_only, depth + 1)
+
+
+def instance(cls, required_only, depth=0):
+    """Build sample object of types class"""
+    kwargs = {}
+    for name, param in list(inspect.signature(cls.__init__).parameters.items())[1:]:
+        if param.default is not inspect.Parameter.empty and (
+            required_only or depth > 3
+        ):
+            continue
+        kwargs[name] = build(param.annotation, required_only, depth)
+    return cls(**kwargs)
+
+
+def types_classes():
+    """All types classes with `dict` property"""
+    seen = []
+    stack = [getattr(types, name) for name in types.__all__]
+    while stack:
+        cls = stack.pop()
+        if not inspect.isclass(cls) or cls in seen:
+            continue
+        stack.extend(v for v in vars(cls).values() if inspect.isclass(v))
+        if isinstance(inspect.getattr_static(cls, 'dict', None), property):
+            seen.append(cls)
+    return seen
+
+
+class TestSerializers(unittest.TestCase):
+    def test_all_types(self):
+        classes = types_classes()
+        self.assertGreater(len(classes), 100)
+        for cls in classes:
+            for required_only in (False, True):
+                with self.subTest(cls=cls.__qualname__, required_only=required_only):
+                    try:
+                        obj = instance(cls, required_only=required_only)
+                        expected = strip(obj.dict)
+                    except (AttributeError, TypeError, ValueError):
+                        # Sample params are not accepted by `dict` itself
+                        continue
+                    self.assertEqual(expected, strip(dump(obj)))
+
+    def test_compiled(self):
+        # Serializers don't fall back to `dict` property on any Python version
+        for cls in types_classes():
+            with self.subTest(cls=cls.__qualname__):
+                prop = inspect.getattr_static(cls, 'dict')
+                self.assertIsNot(prop.fget, get_serializer(cls))
+
+    def test_omit_none(self):
+        params = types.ParamsOfEncodeMessage(
+            abi=types.Abi.Json(value='{}'), signer=types.Signer.NoSigner()
+        )
+        self.assertEqual(
+            {
+                'abi': {'type': 'Json', 'value': '{}'},
+                'signer': {'type': 'None'},
+            },
+            dump(params),
+        )
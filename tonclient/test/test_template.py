@@ -0,0 +1,176 @@
+import asyncio
+import os
+import unittest
+from types import SimpleNamespace
+
+from tonclient.bindings.codec import JsonCodec
+from tonclient.errors import TonException
+from tonclient.registry import AbiRegistry
+from tonclient.serializers import dump
+from tonclient.template import MessageTemplate
+from tonclient.test.helpers import SAMPLES_DIR
+from tonclient.types import (
+    Abi,
+    CallSet,
+    ClientError,
+    FunctionHeader,
+    KeyPair,
+    ParamsOfEncodeMessageBody,
+    ResultOfAttachSignatureToMessageBody,
+    ResultOfEncodeMessageBody,
+    Signer,
+)
+
+
+class StubAbi:
+    """`abi` module which encodes body as JSON of request params"""
+
+    def __init__(self, is_async: bool = False):
+        self.is_async = is_async
+        self.requests = []
+
+    def _result(self, method, result):
+        self.requests.append(method)
+        if not self.is_async:
+            return result
+
+        async def _result():
+            return result
+
+        return _result()
+
+    def encode_message_body(self, params):
+        if params['call_set'].get('input', {}).get('fail'):
+            raise TonException(error=ClientError(code=1, message='', data={}))
+        result = ResultOfEncodeMessageBody(
+            body=JsonCodec().dumps(params['call_set']).decode(),
+            data_to_sign='data' if params['signer']['type'] == 'External' else None,
+        )
+        return self._result(method='encode_message_body', result=result)
+
+    def attach_signature_to_message_body(self, params):
+        result = ResultOfAttachSignatureToMessageBody(
+            body=f'{params["message"]}+{params["signature"]}'
+        )
+        return self._result(method='attach_signature_to_message_body', result=result)
+
+
+class TestMessageTemplate(unittest.TestCase):
+    def setUp(self):
+        self.client = SimpleNamespace(
+            abi_registry=AbiRegistry(), codec=JsonCodec(), is_async=False
+        )
+        self.abi = Abi.from_path(path=os.path.join(SAMPLES_DIR, 'Events.abi.json'))
+        self.keypair = KeyPair(public='1' * 64, secret='2' * 64)
+
+    def test_params(self):
+        header = FunctionHeader(pubkey=self.keypair.public)
+        template = MessageTemplate(
+            client=self.client,
+            abi=self.abi,
+            function_name='emitValue',
+            signer=Signer.Keys(keys=self.keypair),
+            input={'id': '0x1'},
+            header=header,
+        )
+        params = template.params(input={'id': '0x2'}, expire=10, time=20)
+
+        # Same params as of types object with interned ABI
+        header = FunctionHeader(pubkey=self.keypair.public, expire=10, time=20)
+        call_set = CallSet(
+            function_name='emitValue', header=header, input={'id': '0x2'}
+        )
+        expected = ParamsOfEncodeMessageBody(
+            abi=self.client.abi_registry.register(abi=self.abi),
+            call_set=call_set,
+            is_internal=False,
+            signer=Signer.Keys(keys=self.keypair),
+        )
+        self.assertEqual(dump(expected), params)
+
+        # Static header and inputs are not changed
+        params = template.params()
+        self.assertEqual({'pubkey': self.keypair.public}, params['call_set']['header'])
+        self.assertEqual({'id': '0x1'}, params['call_set']['input'])
+
+    def test_external_signer(self):
+        with self.assertRaises(ValueError):
+            MessageTemplate(
+                client=self.client,
+                abi=self.abi,
+                function_name='emitValue',
+                signer=Signer.External(public_key=self.keypair.public),
+            )
+
+    def test_encode(self):
+        self.client.abi = StubAbi()
+        template = MessageTemplate(
+            client=self.client,
+            abi=self.abi,
+            function_name='emitValue',
+            signer=Signer.NoSigner(),
+            input={'id': '0x1'},
+        )
+        encoded = template.encode(input={'value': 1}, expire=10)
+        self.assertEqual(
+            {
+                'function_name': 'emitValue',
+                'header': {'expire': 10},
+                'input': {'id': '0x1', 'value': 1},
+            },
+            JsonCodec().loads(encoded.body.encode()),
+        )
+
+        # Failed encodes are not counted
+        with self.assertRaises(TonException):
+            template.encode(input={'fail': True})
+        stats = template.stats
+        self.assertEqual(1, stats['messages'])
+        self.assertGreaterEqual(stats['prepare'], 0)
+        self.assertEqual(stats['prepare'], stats['per_message'])
+
+    def test_encode_external(self):
+        self.client.abi = StubAbi()
+        template = MessageTemplate(
+            client=self.client,
+            abi=self.abi,
+            function_name='emitValue',
+            signer=Signer.External(public_key=self.keypair.public),
+            sign=lambda data: f'signed {data}',
+        )
+        encoded = template.encode()
+        self.assertTrue(encoded.body.endswith('+signed data'))
+        self.assertEqual('data', encoded.data_to_sign)
+        self.assertEqual(
+            ['encode_message_body', 'attach_signature_to_message_body'],
+            self.client.abi.requests,
+        )
+
+    def test_encode_async(self):
+        self.client.is_async = True
+        self.client.abi = StubAbi(is_async=True)
+
+        async def sign(data):
+            return f'signed {data}'
+
+        template = MessageTemplate(
+            client=self.client,
+            abi=self.abi,
+            function_name='emitValue',
+            signer=Signer.External(public_key=self.keypair.public),
+            sign=sign,
+        )
+        encoded = asyncio.run(template.encode(input={'value': 1}))
+        self.assertTrue(encoded.body.endswith('+signed data'))
+        self.assertEqual(1, template.stats['messages'])
+
+    def test_stats(self):
+        template = MessageTemplate(
+            client=self.client,
+            abi=self.abi,
+            function_name='emitValue',
+            signer=Signer.NoSigner(),
+        )
+        self.assertEqual(
+            {'messages': 0, 'prepare': 0.0, 'per_message': 0.0}, template.stats
+        )
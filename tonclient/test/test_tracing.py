@@ -0,0 +1,88 @@
+import unittest
+
+from tonclient.bindings.codec import JsonCodec
+from tonclient.bindings.types import TCResponseType, TCStringData
+from tonclient.errors import TonException
+from tonclient.module import RequestWaiter, ResponseRouter
+from tonclient.tracing import Tracer
+
+
+class RecordingTracer(Tracer):
+    def __init__(self):
+        self.records = []
+
+    def start(self, method):
+        self.records.append(('start', method))
+        return method
+
+    def event(self, span, response_type, data):
+        self.records.append(('event', span, response_type, data))
+
+    def end(self, span, duration, error=None):
+        self.records.append(('end', span, type(error)))
+
+
+class TestTracer(unittest.TestCase):
+    def test_router(self):
+        tracer = RecordingTracer()
+        router = ResponseRouter(codec=JsonCodec(), tracer=tracer)
+        waiter = RequestWaiter()
+        request_id = router.register(
+            request={
+                'is_async': False,
+                'callback': None,
+                'future': waiter,
+                'method': 'processing.process_message',
+                'span': tracer.start(method='processing.process_message'),
+                'span_started': 0,
+            }
+        )
+
+        event = TCStringData.from_string(string='{"type": "WillSend"}')
+        router.handler(request_id, event, TCResponseType.Custom, False)
+        error = TCStringData.from_string(
+            string='{"code": 1, "message": "", "data": {}}'
+        )
+        router.handler(request_id, error, TCResponseType.Error, True)
+
+        span = 'processing.process_message'
+        self.assertEqual(
+            [
+                ('start', span),
+                ('event', span, TCResponseType.Custom, {'type': 'WillSend'}),
+                ('end', span, TonException),
+            ],
+            tracer.records,
+        )
+        with self.assertRaises(TonException):
+            waiter.result()
+
+    def test_raising_tracer(self):
+        class RaisingTracer(RecordingTracer):
+            def end(self, span, duration, error=None):
+                raise RuntimeError('Tracer failed')
+
+        tracer = RaisingTracer()
+        router = ResponseRouter(codec=JsonCodec(), tracer=tracer)
+        waiter = RequestWaiter()
+        request_id = router.register(
+            request={
+                'is_async': False,
+                'callback': None,
+                'future': waiter,
+                'method': 'net.query',
+                'span': tracer.start(method='net.query'),
+                'span_started': 0,
+            }
+        )
+
+        # Request is resolved, tracer exception is logged
+        data = TCStringData.from_string(string='{"result": 1}')
+        with self.assertLogs('tonclient.module', level='ERROR'):
+            router.handler(request_id, data, TCResponseType.Success, True)
+        self.assertTrue(waiter.wait(timeout=0))
+        self.assertEqual({'result': 1}, waiter.result())
+
+    def test_abstract(self):
+        with self.assertRaises(TypeError):
+            Tracer()  # pylint: disable=abstract-class-instantiated
@@ -0,0 +1,85 @@
+"""Client requests tracing"""
+import abc
+from typing import Any
+
+from tonclient.bindings.types import TCResponseType
+
+
+class Tracer(abc.ABC):
+    """
+    Core requests tracer interface.
+    Client calls tracer only if it is installed, `TonClient(tracer=...)`.
+    `event` and `end` may be called from core threads after the request
+    is resolved, their exceptions are logged and don't fail the request
+    """
+
+    @abc.abstractmethod
+    def start(self, method: str) -> Any:
+        """
+        Start request span
+
+        :param method: Core method name, e.g. `processing.process_message`
+        :return: Span object passed to `event` and `end`
+        """
+
+    def event(self, span: Any, response_type: int, data: Any):
+        """
+        Intermediate core response, e.g. `ProcessingEvent` or app request
+
+        :param span: Span returned by `start`
+        :param response_type: Core response type, `TCResponseType`
+        :param data: Parsed response
+        """
+
+    @abc.abstractmethod
+    def end(self, span: Any, duration: float, error: Exception = None):
+        """
+        End request span
+
+        :param span: Span returned by `start`
+        :param duration: Request duration in seconds
+        :param error: Request exception, `None` if request succeeded
+        """
+
+
+class OpenTelemetryTracer(Tracer):
+    """Tracer which reports requests as OpenTelemetry spans"""
+
+    EVENT_NAMES = {
+        TCResponseType.Nop: 'nop',
+        TCResponseType.AppRequest: 'app_request',
+        TCResponseType.AppNotify: 'app_notify',
+    }
+
+    def __init__(self, tracer: Any = None):
+        """
+        :param tracer: `opentelemetry.trace.Tracer`, tracer of the global
+                provider is used by default
+        """
+        # pylint: disable=import-outside-toplevel
+        from opentelemetry import trace
+
+        self._trace = trace
+        self._tracer = tracer or trace.get_tracer('tonclient')
+
+    def start(self, method: str) -> Any:
+        return self._tracer.start_span(
+            name=method,
+            kind=self._trace.SpanKind.CLIENT,
+            attributes={'tonclient.method': method},
+        )
+
+    def event(self, span: Any, response_type: int, data: Any):
+        name = self.EVENT_NAMES.get(response_type, 'event')
+        attributes = {'tonclient.response_type': response_type}
+        if isinstance(data, dict) and isinstance(data.get('type'), str):
+            # E.g. `ProcessingEvent` type
+            attributes['tonclient.event'] = data['type']
+        span.add_event(name=name, attributes=attributes)
+
+    def end(self, span: Any, duration: float, error: Exception = None):
+        span.set_attribute('tonclient.duration', duration)
+        if error is not None:
+            span.record_exception(error)
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR))
+        span.end()
@@ -1,14 +1,14 @@
 """TVM module methods"""
-from typing import Union, Awaitable
+from typing import Awaitable, Union
 
 from tonclient.module import TonModule
 from tonclient.types import (
     ParamsOfRunExecutor,
-    ResultOfRunExecutor,
-    ParamsOfRunTvm,
-    ResultOfRunTvm,
     ParamsOfRunGet,
+    ParamsOfRunTvm,
+    ResultOfRunExecutor,
     ResultOfRunGet,
+    ResultOfRunTvm,
 )
 
 
@@ -27,7 +27,7 @@ class TonTvm(TonModule):
         :param params: See `types.ParamsOfRunGet`
         :return: See `types.ResultOfRunGet`
         """
-        response = self.request(method='tvm.run_get', **params.dict)
+        response = self.request(method='tvm.run_get', params_or_str=params)
         return self.response(classname=ResultOfRunGet, response=response)
 
     def run_executor(
@@ -71,12 +71,12 @@ class TonTvm(TonModule):
         particular key block - then specify `execution_options` parameter.
 
         If you need to see the aborted transaction as a result, not as an
-        error, set `skip_transaction_check` to true.
+        error, set `skip_transaction_check` to true
 
         :param params: See `types.ParamsOfRunExecutor`
-        :return: `types.ResultOfRunExecutor`
+        :return: See `types.ResultOfRunExecutor`
         """
-        response = self.request(method='tvm.run_executor', **params.dict)
+        response = self.request(method='tvm.run_executor', params_or_str=params)
         return self.response(classname=ResultOfRunExecutor, response=response)
 
     def run_tvm(
@@ -99,10 +99,10 @@ class TonTvm(TonModule):
         other way, for instance, with Fift script.
 
         Attention! Updated account state is produces as well, but only
-        `account_state.storage.state.data` part of the boc is updated.
+        `account_state.storage.state.data` part of the boc is updated
 
         :param params: See `types.ParamsOfRunTvm`
         :return: See `types.ResultOfRunTvm`
         """
-        response = self.request(method='tvm.run_tvm', **params.dict)
+        response = self.request(method='tvm.run_tvm', params_or_str=params)
         return self.response(classname=ResultOfRunTvm, response=response)
@@ -0,0 +1,392 @@
+"""
+Everscale binding types.
+https://github.com/tonlabs/TON-SDK/tree/master/docs/reference/types-and-methods
+
+Types are split by SDK modules and each module is imported on the first
+access to its type, e.g. `from tonclient.types import ParamsOfEncodeMessage`
+imports only `tonclient.types.abi` (and its dependencies)
+"""
+import importlib
+from typing import TYPE_CHECKING
+
+# SDK module -> module types
+_MODULES = {
+    'base': (
+        'BaseTypedType',
+        'ResponseHandler',
+    ),
+    'client': (
+        'ClientErrorCode',
+        'ClientError',
+        'ClientConfig',
+        'NetworkQueriesProtocol',
+        'NetworkConfig',
+        'CryptoConfig',
+        'AbiConfig',
+        'BocConfig',
+        'ProofsConfig',
+        'BindingConfig',
+        'BuildInfoDependency',
+        'ParamsOfAppRequest',
+        'AppRequestResult',
+        'ResultOfGetApiReference',
+        'ResultOfVersion',
+        'ResultOfBuildInfo',
+        'ParamsOfResolveAppRequest',
+        'AppRequestResultType',
+    ),
+    'abi': (
+        'AbiHandle',
+        'AbiErrorCode',
+        'DataLayout',
+        'Abi',
+        'AbiContract',
+        'AbiFunction',
+        'AbiEvent',
+        'AbiData',
+        'AbiParam',
+        'FunctionHeader',
+        'CallSet',
+        'DeploySet',
+        'Signer',
+        'MessageBodyType',
+        'StateInitSource',
+        'StateInitParams',
+        'MessageSource',
+        'ParamsOfEncodeMessageBody',
+        'ResultOfEncodeMessageBody',
+        'ParamsOfAttachSignatureToMessageBody',
+        'ResultOfAttachSignatureToMessageBody',
+        'ParamsOfEncodeMessage',
+        'ResultOfEncodeMessage',
+        'ParamsOfAttachSignature',
+        'ResultOfAttachSignature',
+        'ParamsOfDecodeMessage',
+        'DecodedMessageBody',
+        'ParamsOfDecodeMessageBody',
+        'ParamsOfEncodeAccount',
+        'ResultOfEncodeAccount',
+        'ParamsOfEncodeInternalMessage',
+        'ResultOfEncodeInternalMessage',
+        'ParamsOfDecodeAccountData',
+        'ResultOfDecodeData',
+        'ParamsOfUpdateInitialData',
+        'ResultOfUpdateInitialData',
+        'ParamsOfDecodeInitialData',
+        'ParamsOfEncodeInitialData',
+        'ResultOfEncodeInitialData',
+        'ResultOfDecodeInitialData',
+        'ParamsOfDecodeBoc',
+        'ResultOfDecodeBoc',
+        'ParamsOfAbiEncodeBoc',
+        'ResultOfAbiEncodeBoc',
+        'ParamsOfCalcFunctionId',
+        'ResultOfCalcFunctionId',
+        'ParamsOfGetSignatureData',
+        'ResultOfGetSignatureData',
+        'AbiType',
+        'SignerType',
+        'StateInitSourceType',
+        'MessageSourceType',
+    ),
+    'boc': (
+        'BocErrorCode',
+        'Tvc',
+        'ParamsOfParse',
+        'ResultOfParse',
+        'ParamsOfParseShardstate',
+        'ParamsOfGetBlockchainConfig',
+        'ResultOfGetBlockchainConfig',
+        'ParamsOfGetBocHash',
+        'ResultOfGetBocHash',
+        'ParamsOfGetCodeFromTvc',
+        'ResultOfGetCodeFromTvc',
+        'BocCacheType',
+        'ParamsOfBocCacheGet',
+        'ResultOfBocCacheGet',
+        'ParamsOfBocCacheSet',
+        'ResultOfBocCacheSet',
+        'ParamsOfBocCacheUnpin',
+        'BuilderOp',
+        'ParamsOfEncodeBoc',
+        'ResultOfEncodeBoc',
+        'ParamsOfGetCodeSalt',
+        'ResultOfGetCodeSalt',
+        'ParamsOfSetCodeSalt',
+        'ResultOfSetCodeSalt',
+        'ParamsOfDecodeTvc',
+        'ResultOfDecodeTvc',
+        'ParamsOfDecodeStateInit',
+        'ResultOfDecodeStateInit',
+        'ParamsOfEncodeStateInit',
+        'ResultOfEncodeStateInit',
+        'ParamsOfGetCompilerVersion',
+        'ResultOfGetCompilerVersion',
+        'ParamsOfGetBocDepth',
+        'ResultOfGetBocDepth',
+        'ParamsOfEncodeExternalInMessage',
+        'ResultOfEncodeExternalInMessage',
+        'TvcType',
+        'BocCacheTypeType',
+        'BuilderOpType',
+    ),
+    'crypto': (
+        'SigningBoxHandle',
+        'EncryptionBoxHandle',
+        'CryptoBoxHandle',
+        'CryptoErrorCode',
+        'MnemonicDictionary',
+        'KeyPair',
+        'ParamsOfFactorize',
+        'ResultOfFactorize',
+        'ParamsOfModularPower',
+        'ResultOfModularPower',
+        'ParamsOfTonCrc16',
+        'ResultOfTonCrc16',
+        'ParamsOfGenerateRandomBytes',
+        'ResultOfGenerateRandomBytes',
+        'ParamsOfConvertPublicKeyToTonSafeFormat',
+        'ResultOfConvertPublicKeyToTonSafeFormat',
+        'ParamsOfSign',
+        'ResultOfSign',
+        'ParamsOfVerifySignature',
+        'ResultOfVerifySignature',
+        'ParamsOfHash',
+        'ResultOfHash',
+        'ParamsOfScrypt',
+        'ResultOfScrypt',
+        'ParamsOfNaclSignKeyPairFromSecret',
+        'ParamsOfNaclSign',
+        'ResultOfNaclSign',
+        'ParamsOfNaclSignOpen',
+        'ResultOfNaclSignOpen',
+        'ResultOfNaclSignDetached',
+        'ParamsOfNaclBoxKeyPairFromSecret',
+        'ParamsOfNaclBox',
+        'ResultOfNaclBox',
+        'ParamsOfNaclBoxOpen',
+        'ResultOfNaclBoxOpen',
+        'ParamsOfNaclSecretBox',
+        'ParamsOfNaclSecretBoxOpen',
+        'ParamsOfMnemonicWords',
+        'ResultOfMnemonicWords',
+        'ParamsOfMnemonicFromRandom',
+        'ResultOfMnemonicFromRandom',
+        'ParamsOfMnemonicFromEntropy',
+        'ResultOfMnemonicFromEntropy',
+        'ParamsOfMnemonicVerify',
+        'ResultOfMnemonicVerify',
+        'ParamsOfMnemonicDeriveSignKeys',
+        'ParamsOfHDKeyXPrvFromMnemonic',
+        'ResultOfHDKeyXPrvFromMnemonic',
+        'ParamsOfHDKeyDeriveFromXPrv',
+        'ResultOfHDKeyDeriveFromXPrv',
+        'ParamsOfHDKeyDeriveFromXPrvPath',
+        'ResultOfHDKeyDeriveFromXPrvPath',
+        'ParamsOfHDKeySecretFromXPrv',
+        'ResultOfHDKeySecretFromXPrv',
+        'ParamsOfHDKeyPublicFromXPrv',
+        'ResultOfHDKeyPublicFromXPrv',
+        'ParamsOfChaCha20',
+        'ResultOfChaCha20',
+        'RegisteredSigningBox',
+        'ParamsOfAppSigningBox',
+        'ResultOfAppSigningBox',
+        'ResultOfSigningBoxGetPublicKey',
+        'ParamsOfSigningBoxSign',
+        'ResultOfSigningBoxSign',
+        'ParamsOfNaclSignDetachedVerify',
+        'ResultOfNaclSignDetachedVerify',
+        'EncryptionBoxInfo',
+        'RegisteredEncryptionBox',
+        'ParamsOfAppEncryptionBox',
+        'ResultOfAppEncryptionBox',
+        'ParamsOfEncryptionBoxGetInfo',
+        'ResultOfEncryptionBoxGetInfo',
+        'ParamsOfEncryptionBoxEncrypt',
+        'ResultOfEncryptionBoxEncrypt',
+        'ParamsOfEncryptionBoxDecrypt',
+        'ResultOfEncryptionBoxDecrypt',
+        'CipherMode',
+        'EncryptionAlgorithm',
+        'ParamsOfCreateEncryptionBox',
+        'CryptoBoxSecret',
+        'BoxEncryptionAlgorithm',
+        'RegisteredCryptoBox',
+        'ParamsOfCreateCryptoBox',
+        'ResultOfGetCryptoBoxInfo',
+        'ResultOfGetCryptoBoxSeedPhrase',
+        'ParamsOfGetSigningBoxFromCryptoBox',
+        'ParamsOfGetEncryptionBoxFromCryptoBox',
+        'ParamsOfAppPasswordProvider',
+        'ResultOfAppPasswordProvider',
+        'ParamsOfAppSigningBoxType',
+        'ResultOfAppSigningBoxType',
+        'ParamsOfAppEncryptionBoxType',
+        'ResultOfAppEncryptionBoxType',
+        'EncryptionAlgorithmType',
+        'CryptoBoxSecretType',
+        'BoxEncryptionAlgorithmType',
+        'ParamsOfAppPasswordProviderType',
+        'ResultOfAppPasswordProviderType',
+    ),
+    'net': (
+        'NetErrorCode',
+        'SortDirection',
+        'OrderBy',
+        'ParamsOfQuery',
+        'ResultOfQuery',
+        'ParamsOfQueryCollection',
+        'ResultOfQueryCollection',
+        'ParamsOfWaitForCollection',
+        'ResultOfWaitForCollection',
+        'ParamsOfSubscribe',
+        'ParamsOfSubscribeCollection',
+        'ResultOfSubscribeCollection',
+        'SubscriptionResponseType',
+        'ResultOfSubscription',
+        'ParamsOfFindLastShardBlock',
+        'ResultOfFindLastShardBlock',
+        'EndpointsSet',
+        'AggregationFn',
+        'FieldAggregation',
+        'ParamsOfAggregateCollection',
+        'ResultOfAggregateCollection',
+        'ParamsOfQueryOperation',
+        'ParamsOfBatchQuery',
+        'ResultOfBatchQuery',
+        'ParamsOfQueryCounterparties',
+        'ResultOfGetEndpoints',
+        'MessageNode',
+        'TransactionNode',
+        'ParamsOfQueryTransactionTree',
+        'ResultOfQueryTransactionTree',
+        'RegisteredIterator',
+        'ParamsOfCreateBlockIterator',
+        'ParamsOfResumeBlockIterator',
+        'ParamsOfCreateTransactionIterator',
+        'ParamsOfResumeTransactionIterator',
+        'ParamsOfIteratorNext',
+        'ResultOfIteratorNext',
+        'ResultOfGetSignatureId',
+        'ParamsOfQueryOperationType',
+    ),
+    'processing': (
+        'ProcessingErrorCode',
+        'ProcessingEvent',
+        'ProcessingResponseType',
+        'ResultOfProcessMessage',
+        'DecodedOutput',
+        'ParamsOfSendMessage',
+        'ResultOfSendMessage',
+        'ParamsOfWaitForTransaction',
+        'ParamsOfProcessMessage',
+        'MonitoredMessage',
+        'MonitorFetchWaitMode',
+        'MessageMonitoringStatus',
+        'MessageMonitoringTransactionCompute',
+        'MessageMonitoringTransaction',
+        'MessageMonitoringParams',
+        'ParamsOfMonitorMessages',
+        'MonitoringQueueInfo',
+        'ParamsOfGetMonitorInfo',
+        'MessageMonitoringResult',
+        'ParamsOfFetchNextMonitorResults',
+        'ResultOfFetchNextMonitorResults',
+        'ParamsOfCancelMonitor',
+        'MessageSendingParams',
+        'ParamsOfSendMessages',
+        'ResultOfSendMessages',
+        'ProcessingEventType',
+        'MonitoredMessageType',
+    ),
+    'tvm': (
+        'TvmErrorCode',
+        'TransactionFees',
+        'ExecutionOptions',
+        'AccountForExecutor',
+        'ParamsOfRunExecutor',
+        'ResultOfRunExecutor',
+        'ParamsOfRunTvm',
+        'ResultOfRunTvm',
+        'ParamsOfRunGet',
+        'ResultOfRunGet',
+        'AccountForExecutorType',
+    ),
+    'utils': (
+        'AccountAddressType',
+        'AddressStringFormat',
+        'ParamsOfConvertAddress',
+        'ResultOfConvertAddress',
+        'ParamsOfCalcStorageFee',
+        'ResultOfCalcStorageFee',
+        'ParamsOfCompressZstd',
+        'ResultOfCompressZstd',
+        'ParamsOfDecompressZstd',
+        'ResultOfDecompressZstd',
+        'ParamsOfGetAddressType',
+        'ResultOfGetAddressType',
+        'AddressStringFormatType',
+    ),
+    'debot': (
+        'DebotHandle',
+        'DebotErrorCode',
+        'DebotAction',
+        'DebotInfo',
+        'DebotActivity',
+        'Spending',
+        'ParamsOfInit',
+        'RegisteredDebot',
+        'ParamsOfAppDebotBrowser',
+        'ResultOfAppDebotBrowser',
+        'ParamsOfStart',
+        'ParamsOfFetch',
+        'ResultOfFetch',
+        'ParamsOfExecute',
+        'ParamsOfSend',
+        'ParamsOfRemove',
+        'DebotState',
+        'DebotActivityType',
+        'ParamsOfAppDebotBrowserType',
+        'ResultOfAppDebotBrowserType',
+    ),
+    'proofs': (
+        'ProofsErrorCode',
+        'ParamsOfProofBlockData',
+        'ParamsOfProofTransactionData',
+        'ParamsOfProofMessageData',
+    ),
+}
+_TYPES = {name: module for module, names in _MODULES.items() for name in names}
+
+__all__ = list(_TYPES)
+
+if TYPE_CHECKING:
+    # Static analysis only: names are listed in `_MODULES` and are imported
+    # lazily by `__getattr__` at runtime
+    # pylint: disable=wildcard-import,unused-wildcard-import
+    from .base import *  # noqa: F401,F403
+    from .client import *  # noqa: F401,F403
+    from .abi import *  # noqa: F401,F403
+    from .boc import *  # noqa: F401,F403
+    from .crypto import *  # noqa: F401,F403
+    from .net import *  # noqa: F401,F403
+    from .processing import *  # noqa: F401,F403
+    from .tvm import *  # noqa: F401,F403
+    from .utils import *  # noqa: F401,F403
+    from .debot import *  # noqa: F401,F403
+    from .proofs import *  # noqa: F401,F403
+
+
+def __getattr__(name: str):
+    module = _TYPES.get(name)
+    if module is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    value = getattr(importlib.import_module(f'{__name__}.{module}'), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
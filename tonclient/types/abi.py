@@ -0,0 +1,1505 @@
+"""ABI module types"""
+from enum import Enum
+from typing import Any, Dict, List, Union
+
+from .base import BaseTypedType
+from . import boc, crypto
+
+
+AbiHandle = int
+
+
+class AbiErrorCode(int, Enum):
+    """ABI error codes"""
+
+    REQUIRED_ADDRESS_MISSING_FOR_ENCODE_MESSAGE = 301
+    REQUIRED_CALL_SET_MISSING_FOR_ENCODE_MESSAGE = 302
+    INVALID_JSON = 303
+    INVALID_MESSAGE = 304
+    ENCODE_DEPLOY_MESSAGE_FAILED = 305
+    ENCODE_RUN_MESSAGE_FAILED = 306
+    ATTACH_SIGNATURE_FAILED = 307
+    INVALID_TVC_IMAGE = 308
+    REQUIRED_PUBLIC_KEY_MISSING_FOR_FUNCTION_HEADER = 309
+    INVALID_SIGNER = 310
+    INVALID_ABI = 311
+    INVALID_FUNCTION_ID = 312
+    INVALID_DATA = 313
+    ENCODE_INITIAL_DATA_FAILED = 314
+    INVALID_FUNCTION_NAME = 315
+
+
+class DataLayout(str, Enum):
+    """DataLayout"""
+
+    INPUT = 'Input'
+    OUTPUT = 'Output'
+
+
+class Abi:
+    """Abi"""
+
+    class Contract(BaseTypedType):
+        """Abi.Contract"""
+
+        __slots__ = ('value',)
+
+        def __init__(self, value: 'AbiContract'):
+            """
+            :param value:
+            """
+            super(Abi.Contract, self).__init__(type='Contract')
+            self.value = value
+
+        @property
+        def dict(self):
+            return {**super(Abi.Contract, self).dict, 'value': self.value.dict}
+
+    class Json(BaseTypedType):
+        """Abi.Json"""
+
+        __slots__ = ('value',)
+
+        def __init__(self, value: str):
+            """
+            :param value:
+            """
+            super(Abi.Json, self).__init__(type='Json')
+            self.value = value
+
+        @property
+        def dict(self):
+            return {**super(Abi.Json, self).dict, 'value': self.value}
+
+    class Handle(BaseTypedType):
+        """Abi.Handle"""
+
+        __slots__ = ('value',)
+
+        def __init__(self, value: 'AbiHandle'):
+            """
+            :param value:
+            """
+            super(Abi.Handle, self).__init__(type='Handle')
+            self.value = value
+
+        @property
+        def dict(self):
+            return {**super(Abi.Handle, self).dict, 'value': self.value}
+
+    # region hand-written
+    class Serialized(BaseTypedType):
+        """Abi.Serialized"""
+
+        __slots__ = ('value',)
+
+        def __init__(self, value: 'AbiContract'):
+            """
+            :param value:
+            """
+            super(Abi.Serialized, self).__init__(type='Contract')
+            self.value = value
+
+        @property
+        def dict(self):
+            return {**super(Abi.Serialized, self).dict, 'value': self.value.dict}
+    # endregion
+
+    # region hand-written
+    @staticmethod
+    def from_path(path: str) -> Json:
+        """Create Abi object from path"""
+        with open(path, encoding='utf8') as fp:
+            return Abi.Json(value=fp.read())
+    # endregion
+
+
+class AbiContract:
+    """AbiContract"""
+
+    __slots__ = (
+        'abi_version',
+        'version',
+        'header',
+        'functions',
+        'events',
+        'data',
+        'fields',
+    )
+
+    # region hand-written
+    def __init__(
+        self,
+        abi_version: int = None,
+        version: str = None,
+        header: List[str] = None,
+        functions: List['AbiFunction'] = None,
+        events: List['AbiEvent'] = None,
+        data: List['AbiData'] = None,
+        fields: List['AbiParam'] = None,
+    ):
+        """
+        :param abi_version:
+        :param version:
+        :param header:
+        :param functions:
+        :param events:
+        :param data:
+        :param fields:
+        """
+        self.abi_version = abi_version
+        self.version = version
+        self.header = header or []
+        self.functions = functions or []
+        self.events = events or []
+        self.data = data or []
+        self.fields = fields or []
+    # endregion
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        functions = (
+            [i.dict for i in self.functions] if self.functions else self.functions
+        )
+        return {
+            'abi_version': self.abi_version,
+            'version': self.version,
+            'header': self.header,
+            'functions': functions,
+            'events': [i.dict for i in self.events] if self.events else self.events,
+            'data': [i.dict for i in self.data] if self.data else self.data,
+            'fields': [i.dict for i in self.fields] if self.fields else self.fields,
+        }
+
+
+class AbiFunction:
+    """AbiFunction"""
+
+    __slots__ = ('name', 'inputs', 'outputs', 'id')
+
+    def __init__(
+        self,
+        name: str,
+        inputs: List['AbiParam'],
+        outputs: List['AbiParam'],
+        id: str = None,
+    ):
+        """
+        :param name:
+        :param inputs:
+        :param outputs:
+        :param id:
+        """
+        self.name = name
+        self.inputs = inputs
+        self.outputs = outputs
+        self.id = id
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'name': self.name,
+            'inputs': [i.dict for i in self.inputs],
+            'outputs': [i.dict for i in self.outputs],
+            'id': self.id,
+        }
+
+
+class AbiEvent:
+    """AbiEvent"""
+
+    __slots__ = ('name', 'inputs', 'id')
+
+    def __init__(self, name: str, inputs: List['AbiParam'], id: str = None):
+        """
+        :param name:
+        :param inputs:
+        :param id:
+        """
+        self.name = name
+        self.inputs = inputs
+        self.id = id
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'name': self.name,
+            'inputs': [i.dict for i in self.inputs],
+            'id': self.id,
+        }
+
+
+class AbiData:
+    """AbiData"""
+
+    __slots__ = ('key', 'name', 'type', 'components')
+
+    # region hand-written
+    def __init__(
+        self, key: int, name: str, type: str, components: List['AbiParam'] = None
+    ):
+        """
+        :param key:
+        :param name:
+        :param type:
+        :param components:
+        """
+        self.key = key
+        self.name = name
+        self.type = type
+        self.components = components or []
+    # endregion
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        components = (
+            [i.dict for i in self.components] if self.components else self.components
+        )
+        return {
+            'key': self.key,
+            'name': self.name,
+            'type': self.type,
+            'components': components,
+        }
+
+
+class AbiParam:
+    """AbiParam"""
+
+    __slots__ = ('name', 'type', 'components')
+
+    # region hand-written
+    def __init__(self, name: str, type: str, components: List['AbiParam'] = None):
+        """
+        :param name:
+        :param type:
+        :param components:
+        """
+        self.name = name
+        self.type = type
+        self.components = components or []
+    # endregion
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        components = (
+            [i.dict for i in self.components] if self.components else self.components
+        )
+        return {'name': self.name, 'type': self.type, 'components': components}
+
+
+class FunctionHeader:
+    """
+    The ABI function header.
+    Includes several hidden function parameters that contract uses for
+    security, message delivery monitoring and replay protection reasons.
+    The actual set of header fields depends on the contract's ABI.
+    If a contract's ABI does not include some headers, then they are
+    not filled.
+    """
+
+    __slots__ = ('expire', 'time', 'pubkey')
+
+    def __init__(self, expire: int = None, time: int = None, pubkey: str = None):
+        """
+        :param expire: Message expiration time in seconds. If not specified -
+                calculated automatically from `message_expiration_timeout()`,
+                `try_index` and `message_expiration_timeout_grow_factor()`
+                (if ABI includes expire header)
+        :param time: Message creation time in milliseconds. If not specified,
+                now is used (if ABI includes time header)
+        :param pubkey: Public key is used by the contract to check the
+                signature. Encoded in `hex`. If not specified, method fails
+                with exception (if ABI includes pubkey header)
+        """
+        self.expire = expire
+        self.time = time
+        self.pubkey = pubkey
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'expire': self.expire, 'time': self.time, 'pubkey': self.pubkey}
+
+
+class CallSet:
+    """CallSet"""
+
+    __slots__ = ('function_name', 'header', 'input')
+
+    # region hand-written
+    def __init__(
+        self, function_name: str, header: 'FunctionHeader' = None, input: Any = None
+    ):
+        """
+        :param function_name: Function name that is being called.
+                Or function id encoded as string in `hex` (starting with 0x)
+        :param header: Function header. If an application omits some header
+                parameters required by the contract's ABI, the library will
+                set the default values for them
+        :param input: Function input parameters according to ABI
+        """
+        self.function_name = function_name
+        self.header = header or FunctionHeader()
+        self.input = input
+    # endregion
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'function_name': self.function_name,
+            'header': self.header.dict if self.header else self.header,
+            'input': self.input,
+        }
+
+
+class DeploySet:
+    """DeploySet"""
+
+    __slots__ = (
+        'tvc',
+        'code',
+        'state_init',
+        'workchain_id',
+        'initial_data',
+        'initial_pubkey',
+    )
+
+    def __init__(
+        self,
+        tvc: str = None,
+        code: str = None,
+        state_init: str = None,
+        workchain_id: int = None,
+        initial_data: List[Any] = None,
+        initial_pubkey: str = None,
+    ):
+        """
+        :param tvc: Content of TVC file encoded in `base64`
+                For compatibility reason this field can contain an encoded `StateInit`
+        :param code: Contract code BOC encoded with `base64`
+        :param state_init: State init BOC encoded with `base64`
+        :param workchain_id: Target workchain for destination address.
+                Default is 0
+        :param initial_data: List of initial values for contract's public
+                variables
+        :param initial_pubkey: Optional public key that can be provided in
+                deploy set in order to substitute one in TVM file or provided
+                by Signer.
+                Public key resolving priority:
+                    1. Public key from deploy set;
+                    2. Public key, specified in TVM file;
+                    3. Public key, provided by Signer
+        """
+        self.tvc = tvc
+        self.code = code
+        self.state_init = state_init
+        self.workchain_id = workchain_id
+        self.initial_data = initial_data
+        self.initial_pubkey = initial_pubkey
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'tvc': self.tvc,
+            'code': self.code,
+            'state_init': self.state_init,
+            'workchain_id': self.workchain_id,
+            'initial_data': self.initial_data,
+            'initial_pubkey': self.initial_pubkey,
+        }
+
+
+class Signer:
+    """Signer"""
+
+    # region hand-written
+    class NoSigner(BaseTypedType):
+        """No keys are provided. Creates an unsigned message"""
+
+        __slots__ = ()
+
+        def __init__(self):
+            super(Signer.NoSigner, self).__init__(type='None')
+    # endregion
+
+    class External(BaseTypedType):
+        """
+        Only public key is provided in unprefixed hex string format to
+        generate unsigned message and data_to_sign which can be signed later
+        """
+
+        __slots__ = ('public_key',)
+
+        def __init__(self, public_key: str):
+            """
+            :param public_key:
+            """
+            super(Signer.External, self).__init__(type='External')
+            self.public_key = public_key
+
+        @property
+        def dict(self):
+            return {**super(Signer.External, self).dict, 'public_key': self.public_key}
+
+    class Keys(BaseTypedType):
+        """Key pair is provided for signing"""
+
+        __slots__ = ('keys',)
+
+        def __init__(self, keys: 'crypto.KeyPair'):
+            """
+            :param keys:
+            """
+            super(Signer.Keys, self).__init__(type='Keys')
+            self.keys = keys
+
+        @property
+        def dict(self):
+            return {**super(Signer.Keys, self).dict, 'keys': self.keys.dict}
+
+    class SigningBox(BaseTypedType):
+        """
+        Signing Box interface is provided for signing, allows DApps to sign
+        messages using external APIs, such as HSM, cold wallet, etc.
+        """
+
+        __slots__ = ('handle',)
+
+        def __init__(self, handle: 'crypto.SigningBoxHandle'):
+            """
+            :param handle:
+            """
+            super(Signer.SigningBox, self).__init__(type='SigningBox')
+            self.handle = handle
+
+        @property
+        def dict(self):
+            return {**super(Signer.SigningBox, self).dict, 'handle': self.handle}
+
+
+class MessageBodyType(str, Enum):
+    """Message body types"""
+
+    # Message contains the input of the ABI function
+    INPUT = 'Input'
+    # Message contains the output of the ABI function
+    OUTPUT = 'Output'
+    # Message contains the input of the imported ABI function. Occurs when contract
+    # sends an internal message to other contract
+    INTERNAL_OUTPUT = 'InternalOutput'
+    # Message contains the input of the ABI event
+    EVENT = 'Event'
+
+
+class StateInitSource:
+    """StateInitSource"""
+
+    class Message(BaseTypedType):
+        """Deploy message"""
+
+        __slots__ = ('source',)
+
+        def __init__(self, source: 'MessageSourceType'):
+            """
+            :param source:
+            """
+            super(StateInitSource.Message, self).__init__(type='Message')
+            self.source = source
+
+        @property
+        def dict(self):
+            return {
+                **super(StateInitSource.Message, self).dict,
+                'source': self.source.dict,
+            }
+
+    class StateInit(BaseTypedType):
+        """State init data"""
+
+        __slots__ = ('code', 'data', 'library')
+
+        def __init__(self, code: str, data: str, library: str = None):
+            """
+            :param code: Code BOC. Encoded in `base64`
+            :param data: Data BOC. Encoded in `base64`
+            :param library: Library BOC. Encoded in `base64`
+            """
+            super(StateInitSource.StateInit, self).__init__(type='StateInit')
+            self.code = code
+            self.data = data
+            self.library = library
+
+        @property
+        def dict(self):
+            return {
+                **super(StateInitSource.StateInit, self).dict,
+                'code': self.code,
+                'data': self.data,
+                'library': self.library,
+            }
+
+    class Tvc(BaseTypedType):
+        """Content of the TVC file"""
+
+        __slots__ = ('tvc', 'public_key', 'init_params')
+
+        def __init__(
+            self,
+            tvc: str,
+            public_key: str = None,
+            init_params: 'StateInitParams' = None,
+        ):
+            """
+            :param tvc: Content of the TVC file. Encoded in `base64`
+            :param public_key:
+            :param init_params:
+            """
+            super(StateInitSource.Tvc, self).__init__(type='Tvc')
+            self.tvc = tvc
+            self.public_key = public_key
+            self.init_params = init_params
+
+        @property
+        def dict(self):
+            init_params = (
+                self.init_params.dict if self.init_params else self.init_params
+            )
+            return {
+                **super(StateInitSource.Tvc, self).dict,
+                'tvc': self.tvc,
+                'public_key': self.public_key,
+                'init_params': init_params,
+            }
+
+
+class StateInitParams:
+    """StateInitParams"""
+
+    __slots__ = ('abi', 'value')
+
+    def __init__(self, abi: 'AbiType', value: Any):
+        """
+        :param abi: One of Abi.*
+        :param value:
+        """
+        self.abi = abi
+        self.value = value
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'abi': self.abi.dict, 'value': self.value}
+
+
+class MessageSource:
+    """MessageSource"""
+
+    class Encoded(BaseTypedType):
+        """MessageSource.Encoded"""
+
+        __slots__ = ('message', 'abi')
+
+        def __init__(self, message: str, abi: 'AbiType' = None):
+            """
+            :param message:
+            :param abi:
+            """
+            super(MessageSource.Encoded, self).__init__(type='Encoded')
+            self.message = message
+            self.abi = abi
+
+        @property
+        def dict(self):
+            return {
+                **super(MessageSource.Encoded, self).dict,
+                'message': self.message,
+                'abi': self.abi.dict if self.abi else self.abi,
+            }
+
+    class EncodingParams(BaseTypedType):
+        """MessageSource.EncodingParams"""
+
+        __slots__ = ('params',)
+
+        def __init__(self, params: 'ParamsOfEncodeMessage'):
+            """
+            :param params:
+            """
+            super(MessageSource.EncodingParams, self).__init__(type='EncodingParams')
+            self.params = params
+
+        @property
+        def dict(self):
+            return {
+                **super(MessageSource.EncodingParams, self).dict,
+                **self.params.dict,
+            }
+
+
+class ParamsOfEncodeMessageBody:
+    """ParamsOfEncodeMessageBody"""
+
+    __slots__ = (
+        'abi',
+        'call_set',
+        'is_internal',
+        'signer',
+        'processing_try_index',
+        'address',
+    )
+
+    def __init__(
+        self,
+        abi: 'AbiType',
+        call_set: 'CallSet',
+        is_internal: bool,
+        signer: 'SignerType',
+        processing_try_index: int = None,
+        address: str = None,
+    ):
+        """
+        :param abi: Contract ABI
+        :param call_set: Function call parameters. Must be specified in non
+                deploy message. In case of deploy message contains parameters
+                of constructor
+        :param is_internal: True if internal message body must be encoded
+        :param signer: Signing parameters
+        :param processing_try_index: Processing try index. Used in message
+                processing with retries. Encoder uses the provided try index
+                to calculate message expiration time. Expiration timeouts will
+                grow with every retry. Default value is 0
+        :param address: Destination address of the message.
+                Since ABI version 2.3 destination address of external inbound message
+                is used in message body signature calculation.
+                Should be provided when signed external inbound message body is created.
+                Otherwise can be omitted
+        """
+        self.abi = abi
+        self.call_set = call_set
+        self.is_internal = is_internal
+        self.signer = signer
+        self.processing_try_index = processing_try_index
+        self.address = address
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'abi': self.abi.dict,
+            'call_set': self.call_set.dict,
+            'is_internal': self.is_internal,
+            'signer': self.signer.dict,
+            'processing_try_index': self.processing_try_index,
+            'address': self.address,
+        }
+
+
+class ResultOfEncodeMessageBody:
+    """ResultOfEncodeMessageBody"""
+
+    __slots__ = ('body', 'data_to_sign')
+
+    def __init__(self, body: str, data_to_sign: str = None):
+        """
+        :param body: Message body BOC encoded with `base64`
+        :param data_to_sign: Optional data to sign. Encoded with `base64`.
+                Presents when message is unsigned. Can be used for external
+                message signing. Is this case you need to sing this data and
+                produce signed message using `abi.attach_signature`
+        """
+        self.body = body
+        self.data_to_sign = data_to_sign
+
+
+class ParamsOfAttachSignatureToMessageBody:
+    """ParamsOfAttachSignatureToMessageBody"""
+
+    __slots__ = ('abi', 'public_key', 'message', 'signature')
+
+    def __init__(self, abi: 'AbiType', public_key: str, message: str, signature: str):
+        """
+        :param abi: Contract ABI
+        :param public_key: Public key. Must be encoded with `hex`
+        :param message: Unsigned message body BOC. Must be encoded
+                with `base64`
+        :param signature: Signature. Must be encoded with `hex`
+        """
+        self.abi = abi
+        self.public_key = public_key
+        self.message = message
+        self.signature = signature
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'abi': self.abi.dict,
+            'public_key': self.public_key,
+            'message': self.message,
+            'signature': self.signature,
+        }
+
+
+class ResultOfAttachSignatureToMessageBody:
+    """ResultOfAttachSignatureToMessageBody"""
+
+    __slots__ = ('body',)
+
+    def __init__(self, body: str):
+        """
+        :param body:
+        """
+        self.body = body
+
+
+class ParamsOfEncodeMessage:
+    """ParamsOfEncodeMessage"""
+
+    __slots__ = (
+        'abi',
+        'signer',
+        'address',
+        'deploy_set',
+        'call_set',
+        'processing_try_index',
+    )
+
+    def __init__(
+        self,
+        abi: 'AbiType',
+        signer: 'SignerType',
+        address: str = None,
+        deploy_set: 'DeploySet' = None,
+        call_set: 'CallSet' = None,
+        processing_try_index: int = None,
+    ):
+        """
+        :param abi: Contract ABI
+        :param signer: Signing parameters
+        :param address: Target address the message will be sent to. Must be
+                specified in case of non-deploy message
+        :param deploy_set: Deploy parameters. Must be specified in case of
+                deploy message
+        :param call_set: Function call parameters. Must be specified in case
+                of non-deploy message. In case of deploy message it is
+                optional and contains parameters of the functions that will
+                to be called upon deploy transaction
+        :param processing_try_index: Processing try index. Used in message
+                processing with retries (if contract's ABI includes
+                "expire" header). Encoder uses the provided try index to
+                calculate message expiration time. The 1st message expiration
+                time is specified in Client config. Expiration timeouts will
+                grow with every retry. Default value is 0
+        """
+        self.abi = abi
+        self.signer = signer
+        self.address = address
+        self.deploy_set = deploy_set
+        self.call_set = call_set
+        self.processing_try_index = processing_try_index
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'abi': self.abi.dict,
+            'signer': self.signer.dict,
+            'address': self.address,
+            'deploy_set': self.deploy_set.dict if self.deploy_set else self.deploy_set,
+            'call_set': self.call_set.dict if self.call_set else self.call_set,
+            'processing_try_index': self.processing_try_index,
+        }
+
+
+class ResultOfEncodeMessage:
+    """ResultOfEncodeMessage"""
+
+    __slots__ = ('message', 'address', 'message_id', 'data_to_sign')
+
+    def __init__(
+        self, message: str, address: str, message_id: str, data_to_sign: str = None
+    ):
+        """
+        :param message: Message BOC encoded with `base64`
+        :param address:
+        :param message_id:
+        :param data_to_sign: Optional data to be signed encoded in `base64`.
+                Returned in case of Signer::External. Can be used for external
+                message signing. Is this case you need to use this data to
+                create signature and then produce signed message using
+                `abi.attach_signature`
+        """
+        self.message = message
+        self.address = address
+        self.message_id = message_id
+        self.data_to_sign = data_to_sign
+
+
+class ParamsOfAttachSignature:
+    """ParamsOfAttachSignature"""
+
+    __slots__ = ('abi', 'public_key', 'message', 'signature')
+
+    def __init__(self, abi: 'AbiType', public_key: str, message: str, signature: str):
+        """
+        :param abi: Contract ABI
+        :param public_key: Public key encoded in `hex`
+        :param message: Unsigned message BOC encoded in `base64`
+        :param signature: Signature encoded in `hex`
+        """
+        self.abi = abi
+        self.public_key = public_key
+        self.message = message
+        self.signature = signature
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'abi': self.abi.dict,
+            'public_key': self.public_key,
+            'message': self.message,
+            'signature': self.signature,
+        }
+
+
+class ResultOfAttachSignature:
+    """ResultOfAttachSignature"""
+
+    __slots__ = ('message', 'message_id')
+
+    def __init__(self, message: str, message_id: str):
+        """
+        :param message: Signed message BOC
+        :param message_id: Message ID
+        """
+        self.message = message
+        self.message_id = message_id
+
+
+class ParamsOfDecodeMessage:
+    """ParamsOfDecodeMessage"""
+
+    __slots__ = ('abi', 'message', 'allow_partial', 'function_name', 'data_layout')
+
+    # region hand-written
+    def __init__(
+        self,
+        abi: 'AbiType',
+        message: str,
+        allow_partial: bool = False,
+        function_name: str = None,
+        data_layout: 'DataLayout' = None,
+    ):
+        """
+        :param abi: Contract ABI
+        :param message: Message BOC
+        :param allow_partial: Flag allowing partial BOC decoding when ABI doesn't
+                describe the full body BOC. Controls decoder behaviour when after
+                decoding all described in ABI params there are some data left in BOC:
+                `true` - return decoded values
+                `false` - return error of incomplete BOC deserialization (default)
+        :param function_name: Function name or function id if is known in advance
+        :param data_layout: DataLayout
+        """
+        self.abi = abi
+        self.message = message
+        self.allow_partial = allow_partial
+        self.function_name = function_name
+        self.data_layout = data_layout
+    # endregion
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'abi': self.abi.dict,
+            'message': self.message,
+            'allow_partial': self.allow_partial,
+            'function_name': self.function_name,
+            'data_layout': self.data_layout,
+        }
+
+
+class DecodedMessageBody:
+    """DecodedMessageBody"""
+
+    __slots__ = ('body_type', 'name', 'value', 'header')
+
+    def __init__(
+        self,
+        body_type: 'MessageBodyType',
+        name: str,
+        value: Any = None,
+        header: 'FunctionHeader' = None,
+    ):
+        """
+        :param body_type: Type of the message body content
+        :param name: Function or event name
+        :param value: Parameters or result value
+        :param header: Function header
+        """
+        self.body_type = body_type
+        self.name = name
+        self.value = value
+        self.header = header
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> 'DecodedMessageBody':
+        """Object from dict"""
+        if data.get('header'):
+            data['header'] = FunctionHeader(**data['header'])
+
+        return DecodedMessageBody(**data)
+
+
+class ParamsOfDecodeMessageBody:
+    """ParamsOfDecodeMessageBody"""
+
+    __slots__ = (
+        'abi',
+        'body',
+        'is_internal',
+        'allow_partial',
+        'function_name',
+        'data_layout',
+    )
+
+    # region hand-written
+    def __init__(
+        self,
+        abi: 'AbiType',
+        body: str,
+        is_internal: bool,
+        allow_partial: bool = False,
+        function_name: str = None,
+        data_layout: 'DataLayout' = None,
+    ):
+        """
+        :param abi: Contract ABI used to decode
+        :param body: Message body BOC encoded in `base64`
+        :param is_internal: True if the body belongs to the internal message
+        :param allow_partial: Flag allowing partial BOC decoding when ABI doesn't
+                describe the full body BOC. Controls decoder behaviour when after
+                decoding all described in ABI params there are some data left in BOC:
+                `true` - return decoded values
+                `false` - return error of incomplete BOC deserialization (default)
+        :param function_name: Function name or function id if is known in advance
+        :param data_layout: DataLayout
+        """
+        self.abi = abi
+        self.body = body
+        self.is_internal = is_internal
+        self.allow_partial = allow_partial
+        self.function_name = function_name
+        self.data_layout = data_layout
+    # endregion
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'abi': self.abi.dict,
+            'body': self.body,
+            'is_internal': self.is_internal,
+            'allow_partial': self.allow_partial,
+            'function_name': self.function_name,
+            'data_layout': self.data_layout,
+        }
+
+
+class ParamsOfEncodeAccount:
+    """ParamsOfEncodeAccount"""
+
+    __slots__ = ('state_init', 'balance', 'last_trans_lt', 'last_paid', 'boc_cache')
+
+    def __init__(
+        self,
+        state_init: 'StateInitSourceType',
+        balance: int = None,
+        last_trans_lt: int = None,
+        last_paid: int = None,
+        boc_cache: 'boc.BocCacheTypeType' = None,
+    ):
+        """
+        :param state_init: Source of the account state init
+        :param balance: Initial balance
+        :param last_trans_lt: Initial value for the `last_trans_lt`
+        :param last_paid: Initial value for the `last_paid`
+        :param boc_cache: Cache type to put the result. The BOC itself
+                returned if no cache type provided
+        """
+        self.state_init = state_init
+        self.balance = balance
+        self.last_trans_lt = last_trans_lt
+        self.last_paid = last_paid
+        self.boc_cache = boc_cache
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'state_init': self.state_init.dict,
+            'balance': self.balance,
+            'last_trans_lt': self.last_trans_lt,
+            'last_paid': self.last_paid,
+            'boc_cache': self.boc_cache.dict if self.boc_cache else self.boc_cache,
+        }
+
+
+class ResultOfEncodeAccount:
+    """ResultOfEncodeAccount"""
+
+    __slots__ = ('account', 'id')
+
+    def __init__(self, account: str, id: str):
+        """
+        :param account: Account BOC encoded in `base64`
+        :param id: Account ID encoded in `hex`
+        """
+        self.account = account
+        self.id = id
+
+
+class ParamsOfEncodeInternalMessage:
+    """ParamsOfEncodeInternalMessage"""
+
+    __slots__ = (
+        'abi',
+        'value',
+        'address',
+        'deploy_set',
+        'call_set',
+        'bounce',
+        'enable_ihr',
+        'src_address',
+    )
+
+    def __init__(
+        self,
+        value: str,
+        abi: 'AbiType' = None,
+        address: str = None,
+        deploy_set: 'DeploySet' = None,
+        call_set: 'CallSet' = None,
+        bounce: bool = None,
+        enable_ihr: bool = None,
+        src_address: str = None,
+    ):
+        """
+        :param abi: Contract ABI. Can be None if both `deploy_set`
+                and `call_set` are None
+        :param value: Value in nanograms to be sent with message
+        :param address: Target address the message will be sent to. Must be
+                specified in case of non-deploy message
+        :param deploy_set: Deploy parameters. Must be specified in case of
+                deploy message
+        :param call_set: Function call parameters. Must be specified in case
+                of non-deploy message. In case of deploy message it is
+                optional and contains parameters of the functions that will
+                to be called upon deploy transaction
+        :param bounce: Flag of bounceable message. Default is true
+        :param enable_ihr: Enable Instant Hypercube Routing for the message.
+                Default is false
+        :param src_address: Source address of the message
+        """
+        self.abi = abi
+        self.value = value
+        self.address = address
+        self.deploy_set = deploy_set
+        self.call_set = call_set
+        self.bounce = bounce
+        self.enable_ihr = enable_ihr
+        self.src_address = src_address
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'abi': self.abi.dict if self.abi else self.abi,
+            'value': self.value,
+            'address': self.address,
+            'deploy_set': self.deploy_set.dict if self.deploy_set else self.deploy_set,
+            'call_set': self.call_set.dict if self.call_set else self.call_set,
+            'bounce': self.bounce,
+            'enable_ihr': self.enable_ihr,
+            'src_address': self.src_address,
+        }
+
+
+class ResultOfEncodeInternalMessage:
+    """ResultOfEncodeInternalMessage"""
+
+    __slots__ = ('message', 'address', 'message_id')
+
+    def __init__(self, message: str, address: str, message_id: str):
+        """
+        :param message: Message BOC encoded with `base64`
+        :param address: Destination address
+        :param message_id: Message id
+        """
+        self.message = message
+        self.address = address
+        self.message_id = message_id
+
+
+class ParamsOfDecodeAccountData:
+    """ParamsOfDecodeAccountData"""
+
+    __slots__ = ('abi', 'data', 'allow_partial')
+
+    # region hand-written
+    def __init__(self, abi: 'AbiType', data: str, allow_partial: bool = False):
+        """
+        :param abi: Contract ABI
+        :param data: Data BOC or BOC handle
+        :param allow_partial: Flag allowing partial BOC decoding when ABI doesn't
+                describe the full body BOC. Controls decoder behaviour when after
+                decoding all described in ABI params there are some data left in BOC:
+                `true` - return decoded values
+                `false` - return error of incomplete BOC deserialization (default)
+        """
+        self.abi = abi
+        self.data = data
+        self.allow_partial = allow_partial
+    # endregion
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'abi': self.abi.dict,
+            'data': self.data,
+            'allow_partial': self.allow_partial,
+        }
+
+
+class ResultOfDecodeData:
+    """ResultOfDecodeData"""
+
+    __slots__ = ('data',)
+
+    def __init__(self, data: Any):
+        """
+        :param data: Decoded data as a JSON structure
+        """
+        self.data = data
+
+
+class ParamsOfUpdateInitialData:
+    """ParamsOfUpdateInitialData"""
+
+    __slots__ = ('data', 'abi', 'initial_data', 'initial_pubkey', 'boc_cache')
+
+    def __init__(
+        self,
+        data: str,
+        abi: 'AbiType' = None,
+        initial_data: Any = None,
+        initial_pubkey: str = None,
+        boc_cache: 'boc.BocCacheTypeType' = None,
+    ):
+        """
+        :param data: Data BOC or BOC handle
+        :param abi: Contract ABI
+        :param initial_data: List of initial values for contract's static
+                variables.
+                `abi` parameter should be provided to set initial data
+        :param initial_pubkey: Initial account owner's public key to set
+                into account data
+        :param boc_cache: Cache type to put the result.
+                The BOC itself returned if no cache type provided
+        """
+        self.data = data
+        self.abi = abi
+        self.initial_data = initial_data
+        self.initial_pubkey = initial_pubkey
+        self.boc_cache = boc_cache
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'data': self.data,
+            'abi': self.abi.dict if self.abi else self.abi,
+            'initial_data': self.initial_data,
+            'initial_pubkey': self.initial_pubkey,
+            'boc_cache': self.boc_cache.dict if self.boc_cache else self.boc_cache,
+        }
+
+
+class ResultOfUpdateInitialData:
+    """ResultOfUpdateInitialData"""
+
+    __slots__ = ('data',)
+
+    def __init__(self, data: str):
+        """
+        :param data: Updated data BOC or BOC handle
+        """
+        self.data = data
+
+
+class ParamsOfDecodeInitialData:
+    """ParamsOfDecodeInitialData"""
+
+    __slots__ = ('data', 'abi', 'allow_partial')
+
+    # region hand-written
+    def __init__(self, data: str, abi: 'AbiType' = None, allow_partial: bool = False):
+        """
+        :param data: Data BOC or BOC handle
+        :param abi: Contract ABI.
+                Initial data is decoded if this parameter is provided
+        :param allow_partial: Flag allowing partial BOC decoding when ABI doesn't
+                describe the full body BOC. Controls decoder behaviour when after
+                decoding all described in ABI params there are some data left in BOC:
+                `true` - return decoded values
+                `false` - return error of incomplete BOC deserialization (default)
+        """
+        self.data = data
+        self.abi = abi
+        self.allow_partial = allow_partial
+    # endregion
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'data': self.data,
+            'abi': self.abi.dict if self.abi else self.abi,
+            'allow_partial': self.allow_partial,
+        }
+
+
+class ParamsOfEncodeInitialData:
+    """ParamsOfEncodeInitialData"""
+
+    __slots__ = ('abi', 'initial_data', 'initial_pubkey', 'boc_cache')
+
+    def __init__(
+        self,
+        abi: 'AbiType' = None,
+        initial_data: Any = None,
+        initial_pubkey: str = None,
+        boc_cache: 'boc.BocCacheTypeType' = None,
+    ):
+        """
+        :param abi: Contract ABI
+        :param initial_data: Initial values for contract's static variables.
+                `abi` parameter should be provided to set initial data
+        :param initial_pubkey: Initial account owner's public key to set
+                into account data
+        :param boc_cache: Cache type to put the result.
+                The BOC itself returned, if no cache type provided
+        """
+        self.abi = abi
+        self.initial_data = initial_data
+        self.initial_pubkey = initial_pubkey
+        self.boc_cache = boc_cache
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'abi': self.abi.dict if self.abi else self.abi,
+            'initial_data': self.initial_data,
+            'initial_pubkey': self.initial_pubkey,
+            'boc_cache': self.boc_cache.dict if self.boc_cache else self.boc_cache,
+        }
+
+
+class ResultOfEncodeInitialData:
+    """ResultOfEncodeInitialData"""
+
+    __slots__ = ('data',)
+
+    def __init__(self, data: str):
+        """
+        :param data: Updated data BOC or BOC handle
+        """
+        self.data = data
+
+
+class ResultOfDecodeInitialData:
+    """ResultOfDecodeInitialData"""
+
+    __slots__ = ('initial_pubkey', 'initial_data')
+
+    def __init__(self, initial_pubkey: str, initial_data: Any = None):
+        """
+        :param initial_pubkey: Initial account owner's public key
+        :param initial_data: List of initial values of contract's public
+                variables. Initial data is decoded if `abi` input parameter
+                is provided
+        """
+        self.initial_pubkey = initial_pubkey
+        self.initial_data = initial_data
+
+
+class ParamsOfDecodeBoc:
+    """ParamsOfDecodeBoc"""
+
+    __slots__ = ('params', 'boc', 'allow_partial')
+
+    def __init__(self, params: List['AbiParam'], boc: str, allow_partial: bool):
+        """
+        :param params: Parameters to decode from BOC
+        :param boc: Data BOC or BOC handle
+        :param allow_partial:
+        """
+        self.params = params
+        self.boc = boc
+        self.allow_partial = allow_partial
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'params': [i.dict for i in self.params],
+            'boc': self.boc,
+            'allow_partial': self.allow_partial,
+        }
+
+
+class ResultOfDecodeBoc:
+    """ResultOfDecodeBoc"""
+
+    __slots__ = ('data',)
+
+    def __init__(self, data: Any):
+        """
+        :param data: Decoded data as a JSON structure
+        """
+        self.data = data
+
+
+class ParamsOfAbiEncodeBoc:
+    """ParamsOfAbiEncodeBoc"""
+
+    __slots__ = ('params', 'data', 'boc_cache')
+
+    def __init__(
+        self,
+        params: List['AbiParam'],
+        data: Any,
+        boc_cache: 'boc.BocCacheTypeType' = None,
+    ):
+        """
+        :param params: Parameters to encode into BOC
+        :param data: Parameters and values as a JSON structure
+        :param boc_cache: Cache type to put the result.
+                The BOC itself returned if no cache type provided
+        """
+        self.params = params
+        self.data = data
+        self.boc_cache = boc_cache
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'params': [i.dict for i in self.params],
+            'data': self.data,
+            'boc_cache': self.boc_cache.dict if self.boc_cache else self.boc_cache,
+        }
+
+
+class ResultOfAbiEncodeBoc:
+    """ResultOfAbiEncodeBoc"""
+
+    __slots__ = ('boc',)
+
+    def __init__(self, boc: str):
+        """
+        :param boc: BOC encoded as `base64`
+        """
+        self.boc = boc
+
+
+class ParamsOfCalcFunctionId:
+    """ParamsOfCalcFunctionId"""
+
+    __slots__ = ('abi', 'function_name', 'output')
+
+    def __init__(self, abi: 'AbiType', function_name: str, output: bool = None):
+        """
+        :param abi: Contract ABI
+        :param function_name: Contract function name
+        :param output: If set to `true` output function ID will be returned
+                which is used in contract response. Default is `false`
+        """
+        self.abi = abi
+        self.function_name = function_name
+        self.output = output
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'abi': self.abi.dict,
+            'function_name': self.function_name,
+            'output': self.output,
+        }
+
+
+class ResultOfCalcFunctionId:
+    """ResultOfCalcFunctionId"""
+
+    __slots__ = ('function_id',)
+
+    def __init__(self, function_id: int):
+        """
+        :param function_id: Contract function ID
+        """
+        self.function_id = function_id
+
+
+class ParamsOfGetSignatureData:
+    """ParamsOfGetSignatureData"""
+
+    __slots__ = ('abi', 'message')
+
+    def __init__(self, abi: 'AbiType', message: str):
+        """
+        :param abi: Contract ABI used to decode
+        :param message: Message BOC encoded in `base64`
+        """
+        self.abi = abi
+        self.message = message
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'abi': self.abi.dict, 'message': self.message}
+
+
+class ResultOfGetSignatureData:
+    """ResultOfGetSignatureData"""
+
+    __slots__ = ('signature', 'unsigned')
+
+    def __init__(self, signature: str, unsigned: str):
+        """
+        :param signature: Signature from the message in `hex`
+        :param unsigned: Hash to verify the signature in `base64`
+        """
+        self.signature = signature
+        self.unsigned = unsigned
+
+
+# Aggregated types
+AbiType = Union[Abi.Contract, Abi.Json, Abi.Handle, Abi.Serialized]
+SignerType = Union[Signer.NoSigner, Signer.External, Signer.Keys, Signer.SigningBox]
+StateInitSourceType = Union[
+    StateInitSource.Message, StateInitSource.StateInit, StateInitSource.Tvc
+]
+MessageSourceType = Union[MessageSource.Encoded, MessageSource.EncodingParams]
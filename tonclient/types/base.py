@@ -0,0 +1,28 @@
+"""Base types"""
+from typing import TYPE_CHECKING, Any, Callable, Union
+
+if TYPE_CHECKING:
+    from asyncio.selector_events import BaseSelectorEventLoop
+
+
+class BaseTypedType:
+    """
+    Base class for objects which should be sent as dict {'type': '', ...}.
+    E.g. `Abi`, `Signer`, `MessageSource`, etc.
+    """
+
+    __slots__ = ('type',)
+
+    def __init__(self, type: str):
+        """
+        :param type:
+        """
+        self.type = type
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'type': self.type}
+
+
+ResponseHandler = Callable[[Any, int, Union['BaseSelectorEventLoop', None]], None]
@@ -0,0 +1,818 @@
+"""BOC module types"""
+from enum import Enum
+from typing import Any, Dict, List, Union
+
+from .base import BaseTypedType
+
+
+class BocErrorCode(int, Enum):
+    """BOC module error codes"""
+
+    INVALID_BOC = 201
+    SERIALIZATION_ERROR = 202
+    INAPPROPRIATE_BLOCK = 203
+    MISSING_SOURCE_BOC = 204
+    INSUFFICIENT_CACHE_SIZE = 205
+    BOC_REF_NOT_FOUND = 206
+    INVALID_BOC_REF = 207
+
+
+class Tvc:
+    """TVC"""
+
+    class V1(BaseTypedType):
+        """Tvc.V1"""
+
+        __slots__ = ('code', 'description')
+
+        def __init__(self, code: str = None, description: str = None):
+            """
+            :param code:
+            :param description:
+            """
+            super(Tvc.V1, self).__init__(type='V1')
+            self.code = code
+            self.description = description
+
+        @property
+        def dict(self):
+            return {
+                **super(Tvc.V1, self).dict,
+                'code': self.code,
+                'description': self.description,
+            }
+
+    # region hand-written
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> 'Tvc':
+        """Object from dict"""
+        return getattr(Tvc, data['type'])(**data['value'])
+    # endregion
+
+
+class ParamsOfParse:
+    """ParamsOfParse"""
+
+    __slots__ = ('boc',)
+
+    def __init__(self, boc: str):
+        """
+        :param boc: BOC encoded as `base64`
+        """
+        self.boc = boc
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'boc': self.boc}
+
+
+class ResultOfParse:
+    """ResultOfParse"""
+
+    __slots__ = ('parsed',)
+
+    def __init__(self, parsed: Any):
+        """
+        :param parsed: JSON containing parsed BOC
+        """
+        self.parsed = parsed
+
+
+class ParamsOfParseShardstate:
+    """ParamsOfParseShardstate"""
+
+    __slots__ = ('boc', 'id', 'workchain_id')
+
+    def __init__(self, boc: str, id: str, workchain_id: int):
+        """
+        :param boc: BOC encoded as `base64`
+        :param id: Shardstate identificator
+        :param workchain_id: Workchain shardstate belongs to
+        """
+        self.boc = boc
+        self.id = id
+        self.workchain_id = workchain_id
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'boc': self.boc, 'id': self.id, 'workchain_id': self.workchain_id}
+
+
+class ParamsOfGetBlockchainConfig:
+    """ParamsOfGetBlockchainConfig"""
+
+    __slots__ = ('block_boc',)
+
+    def __init__(self, block_boc: str):
+        """
+        :param block_boc: Key block BOC or zero state BOC encoded as `base64`
+        """
+        self.block_boc = block_boc
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'block_boc': self.block_boc}
+
+
+class ResultOfGetBlockchainConfig:
+    """ResultOfGetBlockchainConfig"""
+
+    __slots__ = ('config_boc',)
+
+    def __init__(self, config_boc: str):
+        """
+        :param config_boc: Blockchain config BOC encoded as `base64`
+        """
+        self.config_boc = config_boc
+
+
+class ParamsOfGetBocHash:
+    """ParamsOfGetBocHash"""
+
+    __slots__ = ('boc',)
+
+    def __init__(self, boc: str):
+        """
+        :param boc: BOC encoded as `base64`
+        """
+        self.boc = boc
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'boc': self.boc}
+
+
+class ResultOfGetBocHash:
+    """ResultOfGetBocHash"""
+
+    __slots__ = ('hash',)
+
+    def __init__(self, hash: str):
+        """
+        :param hash: BOC root hash encoded with `hex`
+        """
+        self.hash = hash
+
+
+class ParamsOfGetCodeFromTvc:
+    """ParamsOfGetCodeFromTvc"""
+
+    __slots__ = ('tvc',)
+
+    def __init__(self, tvc: str):
+        """
+        :param tvc: Contract TVC image encoded as `base64`
+        """
+        self.tvc = tvc
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'tvc': self.tvc}
+
+
+class ResultOfGetCodeFromTvc:
+    """ResultOfGetCodeFromTvc"""
+
+    __slots__ = ('code',)
+
+    def __init__(self, code: str):
+        """
+        :param code: Contract code encoded as `base64`
+        """
+        self.code = code
+
+
+class BocCacheType:
+    """BocCacheType"""
+
+    class Pinned(BaseTypedType):
+        """BocCacheType.Pinned"""
+
+        __slots__ = ('pin',)
+
+        def __init__(self, pin: str):
+            """
+            :param pin: Pin the BOC with `pin` name. Such BOC will not be
+                    removed from cache until it is unpinned
+            """
+            super(BocCacheType.Pinned, self).__init__(type='Pinned')
+            self.pin = pin
+
+        @property
+        def dict(self):
+            return {**super(BocCacheType.Pinned, self).dict, 'pin': self.pin}
+
+    class Unpinned(BaseTypedType):
+        """BocCacheType.Unpinned"""
+
+        __slots__ = ()
+
+        def __init__(self):
+            super(BocCacheType.Unpinned, self).__init__(type='Unpinned')
+
+
+class ParamsOfBocCacheGet:
+    """ParamsOfBocCacheGet"""
+
+    __slots__ = ('boc_ref',)
+
+    def __init__(self, boc_ref: str):
+        """
+        :param boc_ref: Reference to the cached BOC
+        """
+        self.boc_ref = boc_ref
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'boc_ref': self.boc_ref}
+
+
+class ResultOfBocCacheGet:
+    """ResultOfBocCacheGet"""
+
+    __slots__ = ('boc',)
+
+    def __init__(self, boc: str = None):
+        """
+        :param boc: BOC encoded as `base64`
+        """
+        self.boc = boc
+
+
+class ParamsOfBocCacheSet:
+    """ParamsOfBocCacheSet"""
+
+    __slots__ = ('boc', 'cache_type')
+
+    def __init__(self, boc: str, cache_type: 'BocCacheTypeType'):
+        """
+        :param boc: BOC encoded as `base64` or BOC reference
+        :param cache_type: Cache type
+        """
+        self.boc = boc
+        self.cache_type = cache_type
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'boc': self.boc, 'cache_type': self.cache_type.dict}
+
+
+class ResultOfBocCacheSet:
+    """ResultOfBocCacheSet"""
+
+    __slots__ = ('boc_ref',)
+
+    def __init__(self, boc_ref: str):
+        """
+        :param boc_ref: Reference to the cached BOC
+        """
+        self.boc_ref = boc_ref
+
+
+class ParamsOfBocCacheUnpin:
+    """ParamsOfBocCacheUnpin"""
+
+    __slots__ = ('pin', 'boc_ref')
+
+    def __init__(self, pin: str, boc_ref: str = None):
+        """
+        :param pin: Pinned name
+        :param boc_ref: Reference to the cached BOC. If it is provided then
+                only referenced BOC is unpinned
+        """
+        self.pin = pin
+        self.boc_ref = boc_ref
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'pin': self.pin, 'boc_ref': self.boc_ref}
+
+
+class BuilderOp:
+    """BuilderOp"""
+
+    class Integer(BaseTypedType):
+        """Append integer to cell data"""
+
+        __slots__ = ('size', 'value')
+
+        def __init__(self, size: int, value: Any):
+            """
+            :param size: Bit size of the value
+            :param value: Number containing integer number, e.g. 123, -123.
+                    - Decimal string. e.g. "123", "-123".
+                    - 0x prefixed hexadecimal string, e.g 0x123, 0X123, -0x123
+            """
+            super(BuilderOp.Integer, self).__init__(type='Integer')
+            self.size = size
+            self.value = value
+
+        @property
+        def dict(self):
+            return {
+                **super(BuilderOp.Integer, self).dict,
+                'size': self.size,
+                'value': self.value,
+            }
+
+    class BitString(BaseTypedType):
+        """Append bit string to cell data"""
+
+        __slots__ = ('value',)
+
+        def __init__(self, value: str):
+            """
+            :param value: Bit string content using bitstring notation.
+                    See `TON VM specification 1.0`.
+                    Contains hexadecimal string representation:
+                        - Can end with `_` tag;
+                        - Can be prefixed with `x` or `X`;
+                        - Can be prefixed with `x{` or `X{` and ended with `}`.
+
+                    Contains binary string represented as a sequence
+                    of `0` and `1` prefixed with `n` or `N`.
+                    Examples:
+                        `1AB`, `x1ab`, `X1AB`, `x{1abc}`, `X{1ABC}`
+                        `2D9_`, `x2D9_`, `X2D9_`, `x{2D9_}`, `X{2D9_}`
+                        `n00101101100`, `N00101101100`
+            """
+            super(BuilderOp.BitString, self).__init__(type='BitString')
+            self.value = value
+
+        @property
+        def dict(self):
+            return {**super(BuilderOp.BitString, self).dict, 'value': self.value}
+
+    class Cell(BaseTypedType):
+        """Append ref to nested cells"""
+
+        __slots__ = ('builder',)
+
+        def __init__(self, builder: List['BuilderOpType']):
+            """
+            :param builder: Nested cell builder
+            """
+            super(BuilderOp.Cell, self).__init__(type='Cell')
+            self.builder = builder
+
+        @property
+        def dict(self):
+            return {
+                **super(BuilderOp.Cell, self).dict,
+                'builder': [i.dict for i in self.builder],
+            }
+
+    class CellBoc(BaseTypedType):
+        """Append ref to nested cell"""
+
+        __slots__ = ('boc',)
+
+        def __init__(self, boc: str):
+            """
+            :param boc: Nested cell BOC encoded with `base64` or BOC cache key
+            """
+            super(BuilderOp.CellBoc, self).__init__(type='CellBoc')
+            self.boc = boc
+
+        @property
+        def dict(self):
+            return {**super(BuilderOp.CellBoc, self).dict, 'boc': self.boc}
+
+    class Address(BaseTypedType):
+        """BuilderOp.Address"""
+
+        __slots__ = ('address',)
+
+        def __init__(self, address: str):
+            """
+            :param address: Address in a common `workchain:account` or `base64` format
+            """
+            super(BuilderOp.Address, self).__init__(type='Address')
+            self.address = address
+
+        @property
+        def dict(self):
+            return {**super(BuilderOp.Address, self).dict, 'address': self.address}
+
+
+class ParamsOfEncodeBoc:
+    """ParamsOfEncodeBoc"""
+
+    __slots__ = ('builder', 'boc_cache')
+
+    def __init__(
+        self, builder: List['BuilderOpType'], boc_cache: 'BocCacheTypeType' = None
+    ):
+        """
+        :param builder: Cell builder operations
+        :param boc_cache: Cache type to put the result. The BOC itself
+                returned if no cache type provided
+        """
+        self.builder = builder
+        self.boc_cache = boc_cache
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'builder': [i.dict for i in self.builder],
+            'boc_cache': self.boc_cache.dict if self.boc_cache else self.boc_cache,
+        }
+
+
+class ResultOfEncodeBoc:
+    """ResultOfEncodeBoc"""
+
+    __slots__ = ('boc',)
+
+    def __init__(self, boc: str):
+        """
+        :param boc: Encoded cell BOC or BOC cache key
+        """
+        self.boc = boc
+
+
+class ParamsOfGetCodeSalt:
+    """ParamsOfGetCodeSalt"""
+
+    __slots__ = ('code', 'boc_cache')
+
+    def __init__(self, code: str, boc_cache: 'BocCacheTypeType' = None):
+        """
+        :param code: Contract code BOC encoded as `base64` or code BOC handle
+        :param boc_cache: Cache type to put the result.
+                The BOC itself returned if no cache type provided
+        """
+        self.code = code
+        self.boc_cache = boc_cache
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'code': self.code,
+            'boc_cache': self.boc_cache.dict if self.boc_cache else self.boc_cache,
+        }
+
+
+class ResultOfGetCodeSalt:
+    """ResultOfGetCodeSalt"""
+
+    __slots__ = ('salt',)
+
+    def __init__(self, salt: str = None):
+        """
+        :param salt: Contract code salt if present
+        """
+        self.salt = salt
+
+
+class ParamsOfSetCodeSalt:
+    """ParamsOfSetCodeSalt"""
+
+    __slots__ = ('code', 'salt', 'boc_cache')
+
+    def __init__(self, code: str, salt: str, boc_cache: 'BocCacheTypeType' = None):
+        """
+        :param code: Contract code BOC encoded as `base64` or code BOC handle
+        :param salt: Code salt to set
+        :param boc_cache: Cache type to put the result.
+                The BOC itself returned if no cache type provided
+        """
+        self.code = code
+        self.salt = salt
+        self.boc_cache = boc_cache
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'code': self.code,
+            'salt': self.salt,
+            'boc_cache': self.boc_cache.dict if self.boc_cache else self.boc_cache,
+        }
+
+
+class ResultOfSetCodeSalt:
+    """ResultOfSetCodeSalt"""
+
+    __slots__ = ('code',)
+
+    def __init__(self, code: str):
+        """
+        :param code: Contract code with salt set
+        """
+        self.code = code
+
+
+class ParamsOfDecodeTvc:
+    """ParamsOfDecodeTvc"""
+
+    __slots__ = ('tvc',)
+
+    def __init__(self, tvc: str):
+        """
+        :param tvc: Contract TVC image BOC encoded as `base64` or BOC handle
+        """
+        self.tvc = tvc
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'tvc': self.tvc}
+
+
+class ResultOfDecodeTvc:
+    """ResultOfDecodeTvc"""
+
+    __slots__ = ('tvc',)
+
+    def __init__(self, tvc: 'TvcType'):
+        """
+        :param tvc:
+        """
+        self.tvc = tvc
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> 'ResultOfDecodeTvc':
+        """Object from dict"""
+        data['tvc'] = Tvc.from_dict(data=data['tvc'])
+
+        return ResultOfDecodeTvc(**data)
+
+
+class ParamsOfDecodeStateInit:
+    """ParamsOfDecodeInit"""
+
+    __slots__ = ('state_init', 'boc_cache')
+
+    def __init__(self, state_init: str, boc_cache: 'BocCacheTypeType' = None):
+        """
+        :param state_init: Contract StateInit image BOC encoded as `base64` or BOC
+                handle
+        :param boc_cache: Cache type to put the result.
+                The BOC itself returned if no cache type provided
+        """
+        self.state_init = state_init
+        self.boc_cache = boc_cache
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'state_init': self.state_init,
+            'boc_cache': self.boc_cache.dict if self.boc_cache else self.boc_cache,
+        }
+
+
+class ResultOfDecodeStateInit:
+    """ResultOfDecodeStateInit"""
+
+    __slots__ = (
+        'code',
+        'code_hash',
+        'code_depth',
+        'data',
+        'data_hash',
+        'data_depth',
+        'library',
+        'tick',
+        'tock',
+        'split_depth',
+        'compiler_version',
+    )
+
+    def __init__(
+        self,
+        code: str = None,
+        code_hash: str = None,
+        code_depth: int = None,
+        data: str = None,
+        data_hash: str = None,
+        data_depth: int = None,
+        library: str = None,
+        tick: bool = None,
+        tock: bool = None,
+        split_depth: int = None,
+        compiler_version: str = None,
+    ):
+        """
+        :param code: Contract code BOC encoded as `base64` or BOC handle
+        :param code_hash: Contract code hash
+        :param code_depth: Contract code depth
+        :param data: Contract data BOC encoded as `base64` or BOC handle
+        :param data_hash: Contract data hash
+        :param data_depth: Contract data depth
+        :param library: Contract library BOC encoded as `base64` or BOC handle
+        :param tick: `special.tick` field.
+                Specifies the contract ability to handle tick transactions
+        :param tock: `special.tock` field.
+                Specifies the contract ability to handle tock transactions
+        :param split_depth: Is present and non-zero only in instances
+                of large smart contracts
+        :param compiler_version: Compiler version, for example `sol 0.49.0`
+        """
+        self.code = code
+        self.code_hash = code_hash
+        self.code_depth = code_depth
+        self.data = data
+        self.data_hash = data_hash
+        self.data_depth = data_depth
+        self.library = library
+        self.tick = tick
+        self.tock = tock
+        self.split_depth = split_depth
+        self.compiler_version = compiler_version
+
+
+class ParamsOfEncodeStateInit:
+    """ParamsOfEncodeStateInit"""
+
+    __slots__ = ('code', 'data', 'library', 'tick', 'tock', 'split_depth', 'boc_cache')
+
+    def __init__(
+        self,
+        code: str = None,
+        data: str = None,
+        library: str = None,
+        tick: bool = None,
+        tock: bool = None,
+        split_depth: int = None,
+        boc_cache: 'BocCacheTypeType' = None,
+    ):
+        """
+        :param code: Contract code BOC encoded as `base64` or BOC handle
+        :param data: Contract data BOC encoded as `base64` or BOC handle
+        :param library: Contract library BOC encoded as `base64` or BOC handle
+        :param tick: `special.tick` field.
+                Specifies the contract ability to handle tick transactions
+        :param tock: `special.tock` field.
+                Specifies the contract ability to handle tock transactions
+        :param split_depth: Is present and non-zero only in instances
+                of large smart contracts
+        :param boc_cache: Cache type to put the result.
+                The BOC itself returned if no cache type provided
+        """
+        self.code = code
+        self.data = data
+        self.library = library
+        self.tick = tick
+        self.tock = tock
+        self.split_depth = split_depth
+        self.boc_cache = boc_cache
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'code': self.code,
+            'data': self.data,
+            'library': self.library,
+            'tick': self.tick,
+            'tock': self.tock,
+            'split_depth': self.split_depth,
+            'boc_cache': self.boc_cache.dict if self.boc_cache else self.boc_cache,
+        }
+
+
+class ResultOfEncodeStateInit:
+    """ResultOfEncodeStateInit"""
+
+    __slots__ = ('state_init',)
+
+    def __init__(self, state_init: str):
+        """
+        :param state_init:
+        """
+        self.state_init = state_init
+
+
+class ParamsOfGetCompilerVersion:
+    """ParamsOfGetCompilerVersion"""
+
+    __slots__ = ('code',)
+
+    def __init__(self, code: str):
+        """
+        :param code: Contract code BOC encoded as `base64` or code BOC handle
+        """
+        self.code = code
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'code': self.code}
+
+
+class ResultOfGetCompilerVersion:
+    """ResultOfGetCompilerVersion"""
+
+    __slots__ = ('version',)
+
+    def __init__(self, version: str = None):
+        """
+        :param version: Compiler version, e.g. `sol 0.49.0`
+        """
+        self.version = version
+
+
+class ParamsOfGetBocDepth:
+    """ParamsOfGetBocDepth"""
+
+    __slots__ = ('boc',)
+
+    def __init__(self, boc: str):
+        """
+        :param boc: BOC encoded as `base64` or BOC handle
+        """
+        self.boc = boc
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'boc': self.boc}
+
+
+class ResultOfGetBocDepth:
+    """ResultOfGetBocDepth"""
+
+    __slots__ = ('depth',)
+
+    def __init__(self, depth: int):
+        """
+        :param depth: BOC root cell depth
+        """
+        self.depth = depth
+
+
+class ParamsOfEncodeExternalInMessage:
+    """ParamsOfEncodeExternalInMessage"""
+
+    __slots__ = ('dst', 'src', 'init', 'body', 'boc_cache')
+
+    def __init__(
+        self,
+        dst: str,
+        src: str = None,
+        init: str = None,
+        body: str = None,
+        boc_cache: 'BocCacheTypeType' = None,
+    ):
+        """
+        :param dst: Destination address
+        :param src: Source address
+        :param init: Bag of cells with state init (used in deploy messages)
+        :param body: Bag of cells with the message body encoded as `base64`
+        :param boc_cache: Cache type to put the result.
+                The BOC itself returned if no cache type provided
+        """
+        self.dst = dst
+        self.src = src
+        self.init = init
+        self.body = body
+        self.boc_cache = boc_cache
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'dst': self.dst,
+            'src': self.src,
+            'init': self.init,
+            'body': self.body,
+            'boc_cache': self.boc_cache.dict if self.boc_cache else self.boc_cache,
+        }
+
+
+class ResultOfEncodeExternalInMessage:
+    """ResultOfEncodeExternalInMessage"""
+
+    __slots__ = ('message', 'message_id')
+
+    def __init__(self, message: str, message_id: str):
+        """
+        :param message: Message BOC encoded with `base64`
+        :param message_id: Message id
+        """
+        self.message = message
+        self.message_id = message_id
+
+
+# Aggregated types
+TvcType = Tvc.V1
+BocCacheTypeType = Union[BocCacheType.Pinned, BocCacheType.Unpinned]
+BuilderOpType = Union[
+    BuilderOp.Integer,
+    BuilderOp.BitString,
+    BuilderOp.Cell,
+    BuilderOp.CellBoc,
+    BuilderOp.Address,
+]
@@ -0,0 +1,594 @@
+"""Client module types"""
+from enum import Enum
+from typing import Any, Dict, List, Union
+
+from .base import BaseTypedType
+
+
+# region hand-written
+from warnings import warn
+# endregion
+
+
+class ClientErrorCode(int, Enum):
+    """Client module error codes"""
+
+    NOT_IMPLEMENTED = 1
+    INVALID_HEX = 2
+    INVALID_BASE64 = 3
+    INVALID_ADDRESS = 4
+    CALLBACK_PARAMS_CANT_BE_CONVERTED_TO_JSON = 5
+    WEBSOCKET_CONNECT_ERROR = 6
+    WEBSOCKET_RECEIVE_ERROR = 7
+    WEBSOCKET_SEND_ERROR = 8
+    HTTP_CLIENT_CREATE_ERROR = 9
+    HTTP_REQUEST_CREATE_ERROR = 10
+    HTTP_REQUEST_SEND_ERROR = 11
+    HTTP_REQUEST_PARSE_ERROR = 12
+    CALLBACK_NOT_REGISTERED = 13
+    NET_MODULE_NOT_INIT = 14
+    INVALID_CONFIG = 15
+    CANNOT_CREATE_RUNTIME = 16
+    INVALID_CONTEXT_HANDLE = 17
+    CANNOT_SERIALIZE_RESULT = 18
+    CANNOT_SERIALIZE_ERROR = 19
+    CANNOT_CONVERT_JS_VALUE_TO_JSON = 20
+    CANNOT_RECEIVE_SPAWNED_RESULT = 21
+    SET_TIMER_ERROR = 22
+    INVALID_PARAMS = 23
+    CONTRACTS_ADDRESS_CONVERSION_FAILED = 24
+    UNKNOWN_FUNCTION = 25
+    APP_REQUEST_ERROR = 26
+    NO_SUCH_REQUEST = 27
+    CANNOT_SEND_REQUEST_RESULT = 28
+    CANNOT_RECEIVE_REQUEST_RESULT = 29
+    CANNOT_PARSE_REQUEST_RESULT = 30
+    UNEXPECTED_CALLBACK_RESPONSE = 31
+    CANNOT_PARSE_NUMBER = 32
+    INTERNAL_ERROR = 33
+    INVALID_HANDLE = 34
+    LOCAL_STORAGE_ERROR = 35
+    INVALID_DATA = 36
+
+
+# region hand-written
+class ClientError:
+    """Client error object"""
+
+    __slots__ = ('code', 'message', 'data', 'module')
+
+    def __init__(self, code: int, message: str, data: Any):
+        """
+        :param code:
+        :param message:
+        :param data:
+        """
+        self.code = code
+        self.message = message
+        self.data = data
+
+    def __str__(self):
+        return f'[{self.code}] {self.message} (Data: {self.data})'
+
+
+class ClientConfig:
+    """Client config object"""
+
+    __slots__ = (
+        'network',
+        'crypto',
+        'abi',
+        'boc',
+        'proofs',
+        'binding',
+        'local_storage_path',
+    )
+
+    def __init__(
+        self,
+        network: 'NetworkConfig' = None,
+        boc: 'BocConfig' = None,
+        crypto: 'CryptoConfig' = None,
+        abi: 'AbiConfig' = None,
+        proofs: 'ProofsConfig' = None,
+        binding: 'BindingConfig' = None,
+        local_storage_path: str = None,
+    ):
+        """
+        :param network:
+        :param crypto:
+        :param abi:
+        :param boc:
+        :param proofs:
+        :param binding:
+        :param local_storage_path: For file based storage is a folder name
+            where SDK will store its data. For browser based is a browser
+            async storage key prefix.
+            Default (recommended) value is "~/.tonclient" for native environments
+            and ".tonclient" for web-browser
+        """
+        self.network = network or NetworkConfig(server_address='http://localhost')
+        self.crypto = crypto or CryptoConfig()
+        self.abi = abi or AbiConfig()
+        self.boc = boc or BocConfig()
+        self.proofs = proofs or ProofsConfig()
+        self.binding = binding or BindingConfig()
+        self.local_storage_path = local_storage_path
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'network': self.network.dict,
+            'crypto': self.crypto.dict,
+            'abi': self.abi.dict,
+            'boc': self.boc.dict,
+            'proofs': self.proofs.dict,
+            'binding': self.binding.dict,
+            'local_storage_path': self.local_storage_path,
+        }
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> 'ClientConfig':
+        """Object from dict"""
+        return ClientConfig(
+            network=NetworkConfig(**data['network']),
+            crypto=CryptoConfig(**data['crypto']),
+            abi=AbiConfig(**data['abi']),
+            boc=BocConfig(**data['boc']),
+            proofs=ProofsConfig(**data['proofs']),
+            binding=BindingConfig(**data['binding']),
+            local_storage_path=data['local_storage_path'],
+        )
+# endregion
+
+
+class NetworkQueriesProtocol(str, Enum):
+    """
+    Network protocol used to perform GraphQL queries
+        HTTP - Each GraphQL query uses separate HTTP request
+        WS - All GraphQL queries will be served using single web socket connection
+    """
+
+    HTTP = 'HTTP'
+    WS = 'WS'
+
+
+# region hand-written
+class NetworkConfig:
+    """Network config object"""
+
+    __slots__ = (
+        'server_address',
+        'endpoints',
+        'network_retries_count',
+        'max_reconnect_timeout',
+        'message_retries_count',
+        'message_processing_timeout',
+        'wait_for_timeout',
+        'out_of_sync_threshold',
+        'reconnect_timeout',
+        'sending_endpoint_count',
+        'access_key',
+        'latency_detection_interval',
+        'max_latency',
+        'query_timeout',
+        'queries_protocol',
+        'first_remp_status_timeout',
+        'next_remp_status_timeout',
+        'signature_id',
+    )
+
+    deprecated = ['network_retries_count', 'reconnect_timeout']
+
+    def __getattribute__(self, __name: str) -> Any:
+        if __name in NetworkConfig.deprecated:
+            warn(f'`{__name}` is deprecated', DeprecationWarning, stacklevel=2)
+        return super().__getattribute__(__name)
+
+    def __setattr__(self, __name: str, __value: Any) -> None:
+        if __name in NetworkConfig.deprecated:
+            warn(f'`{__name}` is deprecated', DeprecationWarning, stacklevel=2)
+        super().__setattr__(__name, __value)
+
+    def __init__(
+        self,
+        server_address: str = None,
+        endpoints: List[str] = None,
+        network_retries_count: int = None,
+        reconnect_timeout: int = None,
+        max_reconnect_timeout: int = None,
+        message_retries_count: int = None,
+        message_processing_timeout: int = None,
+        query_timeout: int = None,
+        wait_for_timeout: int = None,
+        out_of_sync_threshold: int = None,
+        sending_endpoint_count: int = None,
+        access_key: str = None,
+        latency_detection_interval: int = None,
+        max_latency: int = None,
+        queries_protocol: 'NetworkQueriesProtocol' = None,
+        first_remp_status_timeout: int = None,
+        next_remp_status_timeout: int = None,
+        signature_id: int = None,
+    ):
+        """
+        :param server_address: DApp Server public address. For instance,
+                for `net.ton.dev/graphql` GraphQL endpoint the server
+                address will be net.ton.dev
+        :param endpoints: List of DApp Server addresses. Any correct URL
+                format can be specified, including IP addresses.
+                This parameter is prevailing over `server_address`
+        :param network_retries_count: (DEPRECATED) The number of automatic
+                network retries that SDK performs in case of connection
+                problems. The default value is 5
+        :param reconnect_timeout: (DEPRECATED) Timeout between reconnect
+                attempts
+        :param max_reconnect_timeout: Maximum time for sequential reconnections
+                in ms. Default value is 120000 (2 min)
+        :param message_retries_count: The number of automatic message
+                processing retries that SDK performs in case of
+                `Message Expired (507)` error - but only for those messages
+                which local emulation was successful or failed with replay
+                protection error. The default value is 5
+        :param message_processing_timeout: Timeout that is used to process
+                message delivery for the contracts which ABI does not include
+                "expire" header. If the message is not delivered within the
+                specified timeout the appropriate error occurs
+        :param wait_for_timeout: Maximum timeout that is used for query
+                response in ms. The default value is 40000 (40 sec)
+        :param out_of_sync_threshold: Maximum time difference between server
+                and client. If client's device time is out of sync and
+                difference is more than the threshold then error will occur.
+                Also, the error will occur if the specified threshold is more
+                than `message_processing_timeout / 2`.
+                The default value is 15000 (15 sec)
+        :param sending_endpoint_count: Maximum number of randomly chosen
+                endpoints the library uses to send message.
+                The default value is 2 endpoints
+        :param access_key: Access key to GraphQL API. At the moment is not
+                used in production
+        :param latency_detection_interval: Frequency of sync latency detection.
+                Library periodically checks the current endpoint for blockchain
+                data synchronization latency. If the latency (time-lag) is
+                less than `NetworkConfig.max_latency` then library selects
+                another endpoint.
+                Must be specified in milliseconds. Default is 60000 (1 min)
+        :param max_latency: Maximum value for the endpoint's blockchain data
+                synchronization latency (time-lag). Library periodically checks
+                the current endpoint for blockchain data synchronization
+                latency. If the latency (time-lag) is less than
+                `NetworkConfig.max_latency` then library selects another
+                endpoint.
+                Must be specified in milliseconds. Default is 60000 (1 min)
+        :param query_timeout: Default timeout for http requests.
+                It is used when no timeout specified for the request to limit
+                the answer waiting time. If no answer received during the
+                timeout requests ends with error.
+                Must be specified in milliseconds. Default is 60000 (1 min)
+        :param queries_protocol: Queries protocol
+        :param first_remp_status_timeout: First REMP status awaiting timeout.
+                If no status recieved during the timeout than fallback transaction
+                scenario is activated
+        :param next_remp_status_timeout: Subsequent REMP status awaiting timeout.
+                If no status recieved during the timeout than fallback transaction
+                scenario is activated
+        :param signature_id: Network signature ID which is used by VM in signature
+                verifying instructions if capability `CapSignatureWithId` is enabled
+                in blockchain configuration parameters.
+                This parameter should be set to `global_id` field from any blockchain
+                block if network can not be reachable at the moment of message
+                encoding and the message is aimed to be sent into network with
+                `CapSignatureWithId` enabled. Otherwise signature ID is detected
+                automatically inside message encoding functions
+        """
+        self.server_address = server_address
+        self.endpoints = endpoints
+        self.network_retries_count = network_retries_count
+        self.max_reconnect_timeout = max_reconnect_timeout
+        self.message_retries_count = message_retries_count
+        self.message_processing_timeout = message_processing_timeout
+        self.wait_for_timeout = wait_for_timeout
+        self.out_of_sync_threshold = out_of_sync_threshold
+        self.reconnect_timeout = reconnect_timeout
+        self.sending_endpoint_count = sending_endpoint_count
+        self.access_key = access_key
+        self.latency_detection_interval = latency_detection_interval
+        self.max_latency = max_latency
+        self.query_timeout = query_timeout
+        self.queries_protocol = queries_protocol
+        self.first_remp_status_timeout = first_remp_status_timeout
+        self.next_remp_status_timeout = next_remp_status_timeout
+        self.signature_id = signature_id
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'server_address': self.server_address,
+            'endpoints': self.endpoints,
+            'network_retries_count': self.network_retries_count,
+            'max_reconnect_timeout': self.max_reconnect_timeout,
+            'message_retries_count': self.message_retries_count,
+            'message_processing_timeout': self.message_processing_timeout,
+            'wait_for_timeout': self.wait_for_timeout,
+            'out_of_sync_threshold': self.out_of_sync_threshold,
+            'reconnect_timeout': self.reconnect_timeout,
+            'sending_endpoint_count': self.sending_endpoint_count,
+            'access_key': self.access_key,
+            'latency_detection_interval': self.latency_detection_interval,
+            'max_latency': self.max_latency,
+            'query_timeout': self.query_timeout,
+            'queries_protocol': self.queries_protocol,
+            'first_remp_status_timeout': self.first_remp_status_timeout,
+            'next_remp_status_timeout': self.next_remp_status_timeout,
+            'signature_id': self.signature_id,
+        }
+# endregion
+
+
+class CryptoConfig:
+    """Crypto config object"""
+
+    __slots__ = ('mnemonic_dictionary', 'mnemonic_word_count', 'hdkey_derivation_path')
+
+    def __init__(
+        self,
+        mnemonic_dictionary: int = None,
+        mnemonic_word_count: int = None,
+        hdkey_derivation_path: str = None,
+    ):
+        """
+        :param mnemonic_dictionary: Mnemonic dictionary that will be used by
+                default in crypto functions. If not specified, 1 dictionary
+                will be used
+        :param mnemonic_word_count: Mnemonic word count that will be used by
+                default in crypto functions. If not specified the default
+                value will be 12
+        :param hdkey_derivation_path: Derivation path that will be used by
+                default in crypto functions. If not specified
+                `m/44'/396'/0'/0/0` will be used
+        """
+        self.mnemonic_dictionary = mnemonic_dictionary
+        self.mnemonic_word_count = mnemonic_word_count
+        self.hdkey_derivation_path = hdkey_derivation_path
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'mnemonic_dictionary': self.mnemonic_dictionary,
+            'mnemonic_word_count': self.mnemonic_word_count,
+            'hdkey_derivation_path': self.hdkey_derivation_path,
+        }
+
+
+class AbiConfig:
+    """ABI config object"""
+
+    __slots__ = (
+        'workchain',
+        'message_expiration_timeout',
+        'message_expiration_timeout_grow_factor',
+    )
+
+    def __init__(
+        self,
+        workchain: int = None,
+        message_expiration_timeout: int = None,
+        message_expiration_timeout_grow_factor: float = None,
+    ):
+        """
+        :param workchain: Workchain id that is used by default in DeploySet
+        :param message_expiration_timeout: Message lifetime for contracts
+                which ABI includes "expire" header. The default value is 40 sec
+        :param message_expiration_timeout_grow_factor: Factor that increases
+                the expiration timeout for each retry. The default value is 1.5
+        """
+        self.workchain = workchain
+        self.message_expiration_timeout = message_expiration_timeout
+        self.message_expiration_timeout_grow_factor = (
+            message_expiration_timeout_grow_factor
+        )
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'workchain': self.workchain,
+            'message_expiration_timeout': self.message_expiration_timeout,
+            'message_expiration_timeout_grow_factor': self.message_expiration_timeout_grow_factor,
+        }
+
+
+class BocConfig:
+    """BOC config object"""
+
+    __slots__ = ('cache_max_size',)
+
+    def __init__(self, cache_max_size: int = None):
+        """
+        :param cache_max_size: Maximum BOC cache size in kilobytes.
+                Default is 10 MB
+        """
+        self.cache_max_size = cache_max_size
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'cache_max_size': self.cache_max_size}
+
+
+class ProofsConfig:
+    """Proofs config object"""
+
+    __slots__ = ('cache_in_local_storage',)
+
+    def __init__(self, cache_in_local_storage: bool = None):
+        """
+        :param cache_in_local_storage: Cache proofs in the local storage.
+                Default is `true`. If this value is set to `true`, downloaded
+                proofs and master-chain BOCs are saved into the persistent
+                local storage (e.g. file system for native environments or browser's
+                IndexedDB for the web); otherwise all the data is cached only in memory
+                in current client's context and will be lost after destruction of the
+                client
+        """
+        self.cache_in_local_storage = cache_in_local_storage
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'cache_in_local_storage': self.cache_in_local_storage}
+
+
+class BindingConfig:
+    """Binding config object"""
+
+    __slots__ = ('library', 'version')
+
+    def __init__(self, library: str = None, version: str = None):
+        """
+        :param library:
+        :param version:
+        """
+        self.library = library
+        self.version = version
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'library': self.library, 'version': self.version}
+
+
+class BuildInfoDependency:
+    """BuildInfoDependency"""
+
+    __slots__ = ('name', 'git_commit')
+
+    def __init__(self, name: str, git_commit: str):
+        """
+        :param name: Dependency name. Usually it is a crate name
+        :param git_commit: Git commit hash of the related repository
+        """
+        self.name = name
+        self.git_commit = git_commit
+
+
+class ParamsOfAppRequest:
+    """ParamsOfAppRequest"""
+
+    __slots__ = ('app_request_id', 'request_data')
+
+    def __init__(self, app_request_id: int, request_data: Any):
+        """
+        :param app_request_id: Request ID. Should be used in
+                `resolve_app_request` call
+        :param request_data: Request describing data
+        """
+        self.app_request_id = app_request_id
+        self.request_data = request_data
+
+
+class AppRequestResult:
+    """AppRequestResult"""
+
+    class Error(BaseTypedType):
+        """Error occurred during request processing"""
+
+        __slots__ = ('text',)
+
+        def __init__(self, text: str):
+            """
+            :param text: Error description
+            """
+            super(AppRequestResult.Error, self).__init__(type='Error')
+            self.text = text
+
+        @property
+        def dict(self):
+            return {**super(AppRequestResult.Error, self).dict, 'text': self.text}
+
+    class Ok(BaseTypedType):
+        """Request processed successfully"""
+
+        __slots__ = ('result',)
+
+        def __init__(self, result: Any):
+            """
+            :param result: Request processing result
+            """
+            super(AppRequestResult.Ok, self).__init__(type='Ok')
+            self.result = result
+
+        @property
+        def dict(self):
+            return {**super(AppRequestResult.Ok, self).dict, 'result': self.result}
+
+
+class ResultOfGetApiReference:
+    """ResultOfGetApiReference"""
+
+    __slots__ = ('api',)
+
+    def __init__(self, api: Any):
+        """
+        :param api: API
+        """
+        self.api = api
+
+
+class ResultOfVersion:
+    """ResultOfVersion"""
+
+    __slots__ = ('version',)
+
+    def __init__(self, version: str):
+        """
+        :param version: Core Library version
+        """
+        self.version = version
+
+
+class ResultOfBuildInfo:
+    """ResultOfBuildInfo"""
+
+    __slots__ = ('build_number', 'dependencies')
+
+    def __init__(self, build_number: int, dependencies: List['BuildInfoDependency']):
+        """
+        :param build_number: Build number assigned to this build by the CI
+        :param dependencies: Fingerprint of the most important dependencies
+        """
+        self.build_number = build_number
+        self.dependencies = dependencies
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> 'ResultOfBuildInfo':
+        """Object from dict"""
+        data['dependencies'] = [BuildInfoDependency(**i) for i in data['dependencies']]
+
+        return ResultOfBuildInfo(**data)
+
+
+class ParamsOfResolveAppRequest:
+    """ParamsOfResolveAppRequest"""
+
+    __slots__ = ('app_request_id', 'result')
+
+    def __init__(self, app_request_id: int, result: 'AppRequestResultType'):
+        """
+        :param app_request_id: Request ID received from SDK
+        :param result: Result of request processing
+        """
+        self.app_request_id = app_request_id
+        self.result = result
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'app_request_id': self.app_request_id, 'result': self.result.dict}
+
+
+# Aggregated types
+AppRequestResultType = Union[AppRequestResult.Error, AppRequestResult.Ok]
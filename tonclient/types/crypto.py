@@ -0,0 +1,1994 @@
+"""Crypto module types"""
+from enum import Enum
+from typing import Any, Dict, List, Union
+
+from .base import BaseTypedType
+
+
+# region hand-written
+import json
+from io import StringIO
+# endregion
+
+
+SigningBoxHandle = int
+EncryptionBoxHandle = int
+CryptoBoxHandle = int
+
+
+class CryptoErrorCode(int, Enum):
+    """Crypto module error codes"""
+
+    INVALID_PUBLIC_KEY = 100
+    INVALID_SECRET_KEY = 101
+    INVALID_KEY = 102
+    INVALID_FACTORIZE_CHALLENGE = 106
+    INVALID_BIGINT = 107
+    SCRYPT_FAILED = 108
+    INVALID_KEY_SIZE = 109
+    NACL_SECRET_BOX_FAILED = 110
+    NACL_BOX_FAILED = 111
+    NACL_SIGN_FAILED = 112
+    BIP39_INVALID_ENTROPY = 113
+    BIP39_INVALID_PHRASE = 114
+    BIP32_INVALID_KEY = 115
+    BIP32_INVALID_DERIVE_PATH = 116
+    BIP39_INVALID_DICTIONARY = 117
+    BIP39_INVALID_WORD_COUNT = 118
+    MNEMONIC_GENERATION_FAILED = 119
+    MNEMONIC_FROM_ENTROPY_FAILED = 120
+    SIGNING_BOX_NOT_REGISTERED = 121
+    INVALID_SIGNATURE = 122
+    ENCRYPTION_BOX_NOT_REGISTERED = 123
+    INVALID_IV_SIZE = 124
+    UNSUPPORTED_CIPHER_MODE = 125
+    CANNOT_CREATE_CIPHER = 126
+    ENCRYPT_DATA_ERROR = 127
+    DECRYPT_DATA_ERROR = 128
+    IV_REQUIRED = 129
+    CRYPTO_BOX_NOT_REGISTERED = 130
+    INVALID_CRYPTO_BOX_TYPE = 131
+    CRYPTO_BOX_SECRET_SERIALIZATION_ERROR = 132
+    CRYPTO_BOX_SECRET_DESERIALIZATION_ERROR = 133
+    INVALID_NONCE_SIZE = 134
+
+
+class MnemonicDictionary(int, Enum):
+    """Mnemonic dictionary types"""
+
+    TON = 0
+    ENGLISH = 1
+    CHINESE_SIMPLIFIED = 2
+    CHINESE_TRADITIONAL = 3
+    FRENCH = 4
+    ITALIAN = 5
+    JAPANESE = 6
+    KOREAN = 7
+    SPANISH = 8
+
+
+class KeyPair:
+    """Keypair object representation"""
+
+    __slots__ = ('public', 'secret')
+
+    def __init__(self, public: str, secret: str):
+        """
+        :param public: Public key - 64 symbols `hex` string
+        :param secret: Private key - 64 symbols `hex` string
+        """
+        self.public = public
+        self.secret = secret
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'public': self.public, 'secret': self.secret}
+
+    # region hand-written
+    @property
+    def binary(self) -> bytes:
+        """Keypair in binary format"""
+        return bytes.fromhex(f'{self.secret}{self.public}')
+
+    @staticmethod
+    def load(path: str, is_binary: bool) -> 'KeyPair':
+        """Load keypair from file"""
+        if is_binary:
+            with open(path, 'rb') as fp:
+                keys = fp.read().hex()
+                keys = {'public': keys[64:], 'secret': keys[:64]}
+        else:
+            with open(path, 'r') as fp:
+                keys = json.loads(fp.read())
+
+        return KeyPair(**keys)
+
+    def dump(self, path: str, as_binary: bool) -> None:
+        """Dump keypair to file"""
+        if as_binary:
+            with open(path, 'wb') as fp:
+                fp.write(self.binary)
+        else:
+            with open(path, 'w') as fp:
+                json.dump(self.dict, fp)
+
+    @staticmethod
+    def load_io(io: StringIO, as_binary: bool = False) -> 'KeyPair':
+        """Load keypair from StringIO"""
+        data = io.getvalue()
+        keys = (
+            json.loads(data)
+            if not as_binary
+            else {'public': data[64:], 'secret': data[:64]}
+        )
+
+        return KeyPair(**keys)
+
+    def dump_io(self, io: StringIO, as_binary: bool = False):
+        """Dump keypair to StringIO"""
+        keys = json.dumps(self.dict) if not as_binary else self.binary.hex()
+        io.write(keys)
+    # endregion
+
+
+class ParamsOfFactorize:
+    """ParamsOfFactorize"""
+
+    __slots__ = ('composite',)
+
+    def __init__(self, composite: str):
+        """
+        :param composite: Hexadecimal representation of u64 composite number
+        """
+        self.composite = composite
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'composite': self.composite}
+
+
+class ResultOfFactorize:
+    """ResultOfFactorize"""
+
+    __slots__ = ('factors',)
+
+    def __init__(self, factors: List[str]):
+        """
+        :param factors: Two factors of composite or empty if composite
+                can't be factorized
+        """
+        self.factors = factors
+
+
+class ParamsOfModularPower:
+    """ParamsOfModularPower"""
+
+    __slots__ = ('base', 'exponent', 'modulus')
+
+    def __init__(self, base: str, exponent: str, modulus: str):
+        """
+        :param base: `base` argument of calculation
+        :param exponent: `exponent` argument of calculation
+        :param modulus: `modulus` argument of calculation
+        """
+        self.base = base
+        self.exponent = exponent
+        self.modulus = modulus
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'base': self.base, 'exponent': self.exponent, 'modulus': self.modulus}
+
+
+class ResultOfModularPower:
+    """ResultOfModularPower"""
+
+    __slots__ = ('modular_power',)
+
+    def __init__(self, modular_power: str):
+        """
+        :param modular_power: Result of modular exponentiation
+        """
+        self.modular_power = modular_power
+
+
+class ParamsOfTonCrc16:
+    """ParamsOfTonCrc16"""
+
+    __slots__ = ('data',)
+
+    def __init__(self, data: str):
+        """
+        :param data: Input data for CRC calculation. Encoded with `base64`
+        """
+        self.data = data
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'data': self.data}
+
+
+class ResultOfTonCrc16:
+    """ResultOfTonCrc16"""
+
+    __slots__ = ('crc',)
+
+    def __init__(self, crc: int):
+        """
+        :param crc: Calculated CRC for input data
+        """
+        self.crc = crc
+
+
+class ParamsOfGenerateRandomBytes:
+    """ParamsOfGenerateRandomBytes"""
+
+    __slots__ = ('length',)
+
+    def __init__(self, length: int):
+        """
+        :param length: Size of random byte array
+        """
+        self.length = length
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'length': self.length}
+
+
+class ResultOfGenerateRandomBytes:
+    """ResultOfGenerateRandomBytes"""
+
+    __slots__ = ('bytes',)
+
+    def __init__(self, bytes: str):
+        """
+        :param bytes: Generated bytes encoded in `base64`
+        """
+        self.bytes = bytes
+
+
+class ParamsOfConvertPublicKeyToTonSafeFormat:
+    """ParamsOfConvertPublicKeyToTonSafeFormat"""
+
+    __slots__ = ('public_key',)
+
+    def __init__(self, public_key: str):
+        """
+        :param public_key: Public key - 64 symbols `hex` string
+        """
+        self.public_key = public_key
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'public_key': self.public_key}
+
+
+class ResultOfConvertPublicKeyToTonSafeFormat:
+    """ResultOfConvertPublicKeyToTonSafeFormat"""
+
+    __slots__ = ('ton_public_key',)
+
+    def __init__(self, ton_public_key: str):
+        """
+        :param ton_public_key: Public key represented in TON safe format
+        """
+        self.ton_public_key = ton_public_key
+
+
+class ParamsOfSign:
+    """ParamsOfSign"""
+
+    __slots__ = ('unsigned', 'keys')
+
+    def __init__(self, unsigned: str, keys: 'KeyPair'):
+        """
+        :param unsigned: Data that must be signed encoded in `base64`
+        :param keys: Sign keys
+        """
+        self.unsigned = unsigned
+        self.keys = keys
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'unsigned': self.unsigned, 'keys': self.keys.dict}
+
+
+class ResultOfSign:
+    """ResultOfSign"""
+
+    __slots__ = ('signed', 'signature')
+
+    def __init__(self, signed: str, signature: str):
+        """
+        :param signed: Signed data combined with signature encoded in `base64`
+        :param signature: Signature encoded in `hex`
+        """
+        self.signed = signed
+        self.signature = signature
+
+
+class ParamsOfVerifySignature:
+    """ParamsOfVerifySignature"""
+
+    __slots__ = ('signed', 'public')
+
+    def __init__(self, signed: str, public: str):
+        """
+        :param signed: Signed data that must be verified encoded in `base64`
+        :param public: Signer's public key - 64 symbols `hex` string
+        """
+        self.signed = signed
+        self.public = public
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'signed': self.signed, 'public': self.public}
+
+
+class ResultOfVerifySignature:
+    """ResultOfVerifySignature"""
+
+    __slots__ = ('unsigned',)
+
+    def __init__(self, unsigned: str):
+        """
+        :param unsigned: Unsigned data encoded in `base64`
+        """
+        self.unsigned = unsigned
+
+
+class ParamsOfHash:
+    """ParamsOfHash"""
+
+    __slots__ = ('data',)
+
+    def __init__(self, data: str):
+        """
+        :param data: Input data for hash calculation. Encoded with `base64`
+        """
+        self.data = data
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'data': self.data}
+
+
+class ResultOfHash:
+    """ResultOfHash"""
+
+    __slots__ = ('hash',)
+
+    def __init__(self, hash: str):
+        """
+        :param hash: Hash of input data
+        """
+        self.hash = hash
+
+
+class ParamsOfScrypt:
+    """ParamsOfScrypt"""
+
+    __slots__ = ('password', 'salt', 'log_n', 'r', 'p', 'dk_len')
+
+    def __init__(
+        self, password: str, salt: str, log_n: int, r: int, p: int, dk_len: int
+    ):
+        """
+        :param password: The password bytes to be hashed. Must be encoded
+                with `base64`
+        :param salt: Salt bytes that modify the hash to protect against
+                Rainbow table attacks. Must be encoded with `base64`
+        :param log_n: CPU/memory cost parameter
+        :param r: The block size parameter, which fine-tunes sequential
+                memory read size and performance
+        :param p: Parallelization parameter
+        :param dk_len: Intended output length in octets of the derived key
+        """
+        self.password = password
+        self.salt = salt
+        self.log_n = log_n
+        self.r = r
+        self.p = p
+        self.dk_len = dk_len
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'password': self.password,
+            'salt': self.salt,
+            'log_n': self.log_n,
+            'r': self.r,
+            'p': self.p,
+            'dk_len': self.dk_len,
+        }
+
+
+class ResultOfScrypt:
+    """ResultOfScrypt"""
+
+    __slots__ = ('key',)
+
+    def __init__(self, key: str):
+        """
+        :param key: Derived key. Encoded with `hex`
+        """
+        self.key = key
+
+
+class ParamsOfNaclSignKeyPairFromSecret:
+    """ParamsOfNaclSignKeyPairFromSecret"""
+
+    __slots__ = ('secret',)
+
+    def __init__(self, secret: str):
+        """
+        :param secret: Secret key - unprefixed 0-padded to 64
+                symbols `hex` string
+        """
+        self.secret = secret
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'secret': self.secret}
+
+
+class ParamsOfNaclSign:
+    """ParamsOfNaclSign"""
+
+    __slots__ = ('unsigned', 'secret')
+
+    def __init__(self, unsigned: str, secret: str):
+        """
+        :param unsigned: Data that must be signed encoded in `base64`
+        :param secret: Signer's secret key.
+                Unprefixed 0-padded to 128 symbols hex string (concatenation
+                of 64 symbols secret and 64 symbols public keys).
+                See `nacl_sign_keypair_from_secret_key`
+        """
+        self.unsigned = unsigned
+        self.secret = secret
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'unsigned': self.unsigned, 'secret': self.secret}
+
+
+class ResultOfNaclSign:
+    """ResultOfNaclSign"""
+
+    __slots__ = ('signed',)
+
+    def __init__(self, signed: str):
+        """
+        :param signed: Signed data, encoded in `base64`
+        """
+        self.signed = signed
+
+
+class ParamsOfNaclSignOpen:
+    """ParamsOfNaclSignOpen"""
+
+    __slots__ = ('signed', 'public')
+
+    def __init__(self, signed: str, public: str):
+        """
+        :param signed: Signed data that must be unsigned. Encoded with `base64`
+        :param public: Signer's public key - unprefixed 0-padded to 64
+                symbols `hex` string
+        """
+        self.signed = signed
+        self.public = public
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'signed': self.signed, 'public': self.public}
+
+
+class ResultOfNaclSignOpen:
+    """ResultOfNaclSignOpen"""
+
+    __slots__ = ('unsigned',)
+
+    def __init__(self, unsigned: str):
+        """
+        :param unsigned: Unsigned data, encoded in `base64`
+        """
+        self.unsigned = unsigned
+
+
+class ResultOfNaclSignDetached:
+    """ResultOfNaclSignDetached"""
+
+    __slots__ = ('signature',)
+
+    def __init__(self, signature: str):
+        """
+        :param signature: Signature encoded in `hex`
+        """
+        self.signature = signature
+
+
+class ParamsOfNaclBoxKeyPairFromSecret:
+    """ParamsOfNaclBoxKeyPairFromSecret"""
+
+    __slots__ = ('secret',)
+
+    def __init__(self, secret: str):
+        """
+        :param secret: Secret key - unprefixed 0-padded to 64
+                symbols `hex` string
+        """
+        self.secret = secret
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'secret': self.secret}
+
+
+class ParamsOfNaclBox:
+    """ParamsOfNaclBox"""
+
+    __slots__ = ('decrypted', 'nonce', 'their_public', 'secret')
+
+    def __init__(self, decrypted: str, nonce: str, their_public: str, secret: str):
+        """
+        :param decrypted: Data that must be encrypted encoded in `base64`
+        :param nonce: Nonce, encoded in `hex`
+        :param their_public: Receiver's public key - unprefixed 0-padded
+                to 64 symbols `hex` string
+        :param secret: Sender's private key - unprefixed 0-padded to 64
+                symbols `hex` string
+        """
+        self.decrypted = decrypted
+        self.nonce = nonce
+        self.their_public = their_public
+        self.secret = secret
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'decrypted': self.decrypted,
+            'nonce': self.nonce,
+            'their_public': self.their_public,
+            'secret': self.secret,
+        }
+
+
+class ResultOfNaclBox:
+    """ResultOfNaclBox"""
+
+    __slots__ = ('encrypted',)
+
+    def __init__(self, encrypted: str):
+        """
+        :param encrypted: Encrypted data encoded in `base64`
+        """
+        self.encrypted = encrypted
+
+
+class ParamsOfNaclBoxOpen:
+    """ParamsOfNaclBoxOpen"""
+
+    __slots__ = ('encrypted', 'nonce', 'their_public', 'secret')
+
+    def __init__(self, encrypted: str, nonce: str, their_public: str, secret: str):
+        """
+        :param encrypted: Data that must be decrypted. Encoded with `base64`
+        :param nonce: Nonce, encoded in `hex`
+        :param their_public: Sender's public key - unprefixed 0-padded to 64
+                symbols `hex` string
+        :param secret: Receiver's private key - unprefixed 0-padded to 64
+                symbols `hex` string
+        """
+        self.encrypted = encrypted
+        self.nonce = nonce
+        self.their_public = their_public
+        self.secret = secret
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'encrypted': self.encrypted,
+            'nonce': self.nonce,
+            'their_public': self.their_public,
+            'secret': self.secret,
+        }
+
+
+class ResultOfNaclBoxOpen:
+    """ResultOfNaclBoxOpen"""
+
+    __slots__ = ('decrypted',)
+
+    def __init__(self, decrypted: str):
+        """
+        :param decrypted: Decrypted data encoded in `base64`
+        """
+        self.decrypted = decrypted
+
+
+class ParamsOfNaclSecretBox:
+    """ParamsOfNaclSecretBox"""
+
+    __slots__ = ('decrypted', 'nonce', 'key')
+
+    def __init__(self, decrypted: str, nonce: str, key: str):
+        """
+        :param decrypted: Data that must be encrypted. Encoded with `base64`
+        :param nonce: Nonce in `hex`
+        :param key: Secret key - unprefixed 0-padded to 64 symbols `hex` string
+        """
+        self.decrypted = decrypted
+        self.nonce = nonce
+        self.key = key
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'decrypted': self.decrypted, 'nonce': self.nonce, 'key': self.key}
+
+
+class ParamsOfNaclSecretBoxOpen:
+    """ParamsOfNaclSecretBoxOpen"""
+
+    __slots__ = ('encrypted', 'nonce', 'key')
+
+    def __init__(self, encrypted: str, nonce: str, key: str):
+        """
+        :param encrypted: Data that must be decrypted. Encoded with `base64`
+        :param nonce: Nonce in `hex`
+        :param key: Public key - unprefixed 0-padded to 64 symbols `hex` string
+        """
+        self.encrypted = encrypted
+        self.nonce = nonce
+        self.key = key
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'encrypted': self.encrypted, 'nonce': self.nonce, 'key': self.key}
+
+
+class ParamsOfMnemonicWords:
+    """ParamsOfMnemonicWords"""
+
+    __slots__ = ('dictionary',)
+
+    def __init__(self, dictionary: 'MnemonicDictionary' = None):
+        """
+        :param dictionary: Dictionary identifier
+        """
+        self.dictionary = dictionary
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'dictionary': self.dictionary}
+
+
+class ResultOfMnemonicWords:
+    """ResultOfMnemonicWords"""
+
+    __slots__ = ('words',)
+
+    def __init__(self, words: str):
+        """
+        :param words: The list of mnemonic words
+        """
+        self.words = words
+
+
+class ParamsOfMnemonicFromRandom:
+    """ParamsOfMnemonicFromRandom"""
+
+    __slots__ = ('dictionary', 'word_count')
+
+    def __init__(self, dictionary: 'MnemonicDictionary' = None, word_count: int = None):
+        """
+        :param dictionary: Dictionary identifier
+        :param word_count: Mnemonic word count
+        """
+        self.dictionary = dictionary
+        self.word_count = word_count
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'dictionary': self.dictionary, 'word_count': self.word_count}
+
+
+class ResultOfMnemonicFromRandom:
+    """ResultOfMnemonicFromRandom"""
+
+    __slots__ = ('phrase',)
+
+    def __init__(self, phrase: str):
+        """
+        :param phrase: String of mnemonic words
+        """
+        self.phrase = phrase
+
+
+class ParamsOfMnemonicFromEntropy:
+    """ParamsOfMnemonicFromEntropy"""
+
+    __slots__ = ('entropy', 'dictionary', 'word_count')
+
+    def __init__(
+        self,
+        entropy: str,
+        dictionary: 'MnemonicDictionary' = None,
+        word_count: int = None,
+    ):
+        """
+        :param entropy: Entropy bytes. `Hex` encoded
+        :param dictionary: Dictionary identifier
+        :param word_count: Mnemonic word count
+        """
+        self.entropy = entropy
+        self.dictionary = dictionary
+        self.word_count = word_count
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'entropy': self.entropy,
+            'dictionary': self.dictionary,
+            'word_count': self.word_count,
+        }
+
+
+class ResultOfMnemonicFromEntropy:
+    """ResultOfMnemonicFromEntropy"""
+
+    __slots__ = ('phrase',)
+
+    def __init__(self, phrase: str):
+        """
+        :param phrase: String of mnemonic words
+        """
+        self.phrase = phrase
+
+
+class ParamsOfMnemonicVerify:
+    """ParamsOfMnemonicVerify"""
+
+    __slots__ = ('phrase', 'dictionary', 'word_count')
+
+    def __init__(
+        self,
+        phrase: str,
+        dictionary: 'MnemonicDictionary' = None,
+        word_count: int = None,
+    ):
+        """
+        :param phrase: Phrase to be verified
+        :param dictionary: Dictionary identifier
+        :param word_count: Word count
+        """
+        self.phrase = phrase
+        self.dictionary = dictionary
+        self.word_count = word_count
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'phrase': self.phrase,
+            'dictionary': self.dictionary,
+            'word_count': self.word_count,
+        }
+
+
+class ResultOfMnemonicVerify:
+    """ResultOfMnemonicVerify"""
+
+    __slots__ = ('valid',)
+
+    def __init__(self, valid: bool):
+        """
+        :param valid: Flag indicating if the mnemonic is valid or not
+        """
+        self.valid = valid
+
+
+class ParamsOfMnemonicDeriveSignKeys:
+    """ParamsOfMnemonicDeriveSignKeys"""
+
+    __slots__ = ('phrase', 'path', 'dictionary', 'word_count')
+
+    def __init__(
+        self,
+        phrase: str,
+        path: str = None,
+        dictionary: 'MnemonicDictionary' = None,
+        word_count: int = None,
+    ):
+        """
+        :param phrase: String of mnemonic words
+        :param path: Derivation path, for instance "m/44'/396'/0'/0/0"
+        :param dictionary: Dictionary identifier
+        :param word_count: Word count
+        """
+        self.phrase = phrase
+        self.path = path
+        self.dictionary = dictionary
+        self.word_count = word_count
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'phrase': self.phrase,
+            'path': self.path,
+            'dictionary': self.dictionary,
+            'word_count': self.word_count,
+        }
+
+
+class ParamsOfHDKeyXPrvFromMnemonic:
+    """ParamsOfHDKeyXPrvFromMnemonic"""
+
+    __slots__ = ('phrase', 'dictionary', 'word_count')
+
+    def __init__(
+        self,
+        phrase: str,
+        dictionary: 'MnemonicDictionary' = None,
+        word_count: int = None,
+    ):
+        """
+        :param phrase: String of mnemonic words
+        :param dictionary: Dictionary identifier
+        :param word_count: Mnemonic word count
+        """
+        self.phrase = phrase
+        self.dictionary = dictionary
+        self.word_count = word_count
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'phrase': self.phrase,
+            'dictionary': self.dictionary,
+            'word_count': self.word_count,
+        }
+
+
+class ResultOfHDKeyXPrvFromMnemonic:
+    """ResultOfHDKeyXPrvFromMnemonic"""
+
+    __slots__ = ('xprv',)
+
+    def __init__(self, xprv: str):
+        """
+        :param xprv: Serialized extended master private key
+        """
+        self.xprv = xprv
+
+
+class ParamsOfHDKeyDeriveFromXPrv:
+    """ParamsOfHDKeyDeriveFromXPrv"""
+
+    __slots__ = ('xprv', 'child_index', 'hardened')
+
+    def __init__(self, xprv: str, child_index: int, hardened: bool):
+        """
+        :param xprv: Serialized extended private key
+        :param child_index: Child index (see BIP-0032)
+        :param hardened: Indicates the derivation of hardened/not-hardened
+                key (see BIP-0032)
+        """
+        self.xprv = xprv
+        self.child_index = child_index
+        self.hardened = hardened
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'xprv': self.xprv,
+            'child_index': self.child_index,
+            'hardened': self.hardened,
+        }
+
+
+class ResultOfHDKeyDeriveFromXPrv:
+    """ResultOfHDKeyDeriveFromXPrv"""
+
+    __slots__ = ('xprv',)
+
+    def __init__(self, xprv: str):
+        """
+        :param xprv: Serialized extended private key
+        """
+        self.xprv = xprv
+
+
+class ParamsOfHDKeyDeriveFromXPrvPath:
+    """ParamsOfHDKeyDeriveFromXPrvPath"""
+
+    __slots__ = ('xprv', 'path')
+
+    def __init__(self, xprv: str, path: str):
+        """
+        :param xprv: Serialized extended private key
+        :param path: Derivation path, for instance "m/44'/396'/0'/0/0"
+        """
+        self.xprv = xprv
+        self.path = path
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'xprv': self.xprv, 'path': self.path}
+
+
+class ResultOfHDKeyDeriveFromXPrvPath:
+    """ResultOfHDKeyDeriveFromXPrvPath"""
+
+    __slots__ = ('xprv',)
+
+    def __init__(self, xprv: str):
+        """
+        :param xprv: Derived serialized extended private key
+        """
+        self.xprv = xprv
+
+
+class ParamsOfHDKeySecretFromXPrv:
+    """ParamsOfHDKeySecretFromXPrv"""
+
+    __slots__ = ('xprv',)
+
+    def __init__(self, xprv: str):
+        """
+        :param xprv: Serialized extended private key
+        """
+        self.xprv = xprv
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'xprv': self.xprv}
+
+
+class ResultOfHDKeySecretFromXPrv:
+    """ResultOfHDKeySecretFromXPrv"""
+
+    __slots__ = ('secret',)
+
+    def __init__(self, secret: str):
+        """
+        :param secret: Private key - 64 symbols `hex` string
+        """
+        self.secret = secret
+
+
+class ParamsOfHDKeyPublicFromXPrv:
+    """ParamsOfHDKeyPublicFromXPrv"""
+
+    __slots__ = ('xprv',)
+
+    def __init__(self, xprv: str):
+        """
+        :param xprv: Serialized extended private key
+        """
+        self.xprv = xprv
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'xprv': self.xprv}
+
+
+class ResultOfHDKeyPublicFromXPrv:
+    """ResultOfHDKeyPublicFromXPrv"""
+
+    __slots__ = ('public',)
+
+    def __init__(self, public: str):
+        """
+        :param public: Public key - 64 symbols `hex` string
+        """
+        self.public = public
+
+
+class ParamsOfChaCha20:
+    """ParamsOfChaCha20"""
+
+    __slots__ = ('data', 'key', 'nonce')
+
+    def __init__(self, data: str, key: str, nonce: str):
+        """
+        :param data: Source data to be encrypted or decrypted.
+                Must be encoded with `base64`
+        :param key: 256-bit key. Must be encoded with `hex`
+        :param nonce: 96-bit nonce. Must be encoded with `hex`
+        """
+        self.data = data
+        self.key = key
+        self.nonce = nonce
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'data': self.data, 'key': self.key, 'nonce': self.nonce}
+
+
+class ResultOfChaCha20:
+    """ResultOfChaCha20"""
+
+    __slots__ = ('data',)
+
+    def __init__(self, data: str):
+        """
+        :param data: Encrypted/decrypted data. Encoded with `base64`
+        """
+        self.data = data
+
+
+class RegisteredSigningBox:
+    """RegisteredSigningBox"""
+
+    __slots__ = ('handle',)
+
+    def __init__(self, handle: 'SigningBoxHandle'):
+        """
+        :param handle: Handle of the signing box
+        """
+        self.handle = handle
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'handle': self.handle}
+
+
+class ParamsOfAppSigningBox:
+    """ParamsOfAppSigningBox"""
+
+    class GetPublicKey(BaseTypedType):
+        """Get signing box public key"""
+
+        __slots__ = ()
+
+        def __init__(self):
+            super(ParamsOfAppSigningBox.GetPublicKey, self).__init__(
+                type='GetPublicKey'
+            )
+
+    class Sign(BaseTypedType):
+        """Sign data"""
+
+        __slots__ = ('unsigned',)
+
+        def __init__(self, unsigned: str):
+            """
+            :param unsigned: Data to sign encoded as `base64`
+            """
+            super(ParamsOfAppSigningBox.Sign, self).__init__(type='Sign')
+            self.unsigned = unsigned
+
+        @property
+        def dict(self):
+            return {
+                **super(ParamsOfAppSigningBox.Sign, self).dict,
+                'unsigned': self.unsigned,
+            }
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> 'ParamsOfAppSigningBoxType':
+        """Object from dict"""
+        kwargs = {k: v for k, v in data.items() if k != 'type'}
+        return getattr(ParamsOfAppSigningBox, data['type'])(**kwargs)
+
+
+class ResultOfAppSigningBox:
+    """ResultOfAppSigningBox"""
+
+    class GetPublicKey(BaseTypedType):
+        """Result of getting public key"""
+
+        __slots__ = ('public_key',)
+
+        def __init__(self, public_key: str):
+            """
+            :param public_key: Signing box public key
+            """
+            super(ResultOfAppSigningBox.GetPublicKey, self).__init__(
+                type='GetPublicKey'
+            )
+            self.public_key = public_key
+
+        @property
+        def dict(self):
+            return {
+                **super(ResultOfAppSigningBox.GetPublicKey, self).dict,
+                'public_key': self.public_key,
+            }
+
+    class Sign(BaseTypedType):
+        """Result of signing data"""
+
+        __slots__ = ('signature',)
+
+        def __init__(self, signature: str):
+            """
+            :param signature: Data signature encoded as `hex`
+            """
+            super(ResultOfAppSigningBox.Sign, self).__init__(type='Sign')
+            self.signature = signature
+
+        @property
+        def dict(self):
+            return {
+                **super(ResultOfAppSigningBox.Sign, self).dict,
+                'signature': self.signature,
+            }
+
+
+class ResultOfSigningBoxGetPublicKey:
+    """ResultOfSigningBoxGetPublicKey"""
+
+    __slots__ = ('pubkey',)
+
+    def __init__(self, pubkey: str):
+        """
+        :param pubkey: Public key of signing box
+        """
+        self.pubkey = pubkey
+
+
+class ParamsOfSigningBoxSign:
+    """ParamsOfSigningBoxSign"""
+
+    __slots__ = ('signing_box', 'unsigned')
+
+    def __init__(self, signing_box: 'SigningBoxHandle', unsigned: str):
+        """
+        :param signing_box: Signing Box handle
+        :param unsigned: Unsigned user data. Must be encoded with `base64`
+        """
+        self.signing_box = signing_box
+        self.unsigned = unsigned
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'signing_box': self.signing_box, 'unsigned': self.unsigned}
+
+
+class ResultOfSigningBoxSign:
+    """ResultOfSigningBoxSign"""
+
+    __slots__ = ('signature',)
+
+    def __init__(self, signature: str):
+        """
+        :param signature: Data signature. Encoded with `base64`
+        """
+        self.signature = signature
+
+
+class ParamsOfNaclSignDetachedVerify:
+    """ParamsOfNaclSignDetachedVerify"""
+
+    __slots__ = ('unsigned', 'signature', 'public')
+
+    def __init__(self, unsigned: str, signature: str, public: str):
+        """
+        :param unsigned: Unsigned data that must be verified.
+                Encoded with `base64`
+        :param signature: Signature that must be verified. Encoded with `hex`
+        :param public: Signer's public key - unprefixed 0-padded to 64 symbols
+                `hex` string
+        """
+        self.unsigned = unsigned
+        self.signature = signature
+        self.public = public
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'unsigned': self.unsigned,
+            'signature': self.signature,
+            'public': self.public,
+        }
+
+
+class ResultOfNaclSignDetachedVerify:
+    """ResultOfNaclSignDetachedVerify"""
+
+    __slots__ = ('succeeded',)
+
+    def __init__(self, succeeded: bool):
+        """
+        :param succeeded: true if verification succeeded or false if it failed
+        """
+        self.succeeded = succeeded
+
+
+class EncryptionBoxInfo:
+    """Encryption box information"""
+
+    __slots__ = ('hdpath', 'algorithm', 'options', 'public')
+
+    def __init__(
+        self,
+        hdpath: str = None,
+        algorithm: str = None,
+        options: Any = None,
+        public: Any = None,
+    ):
+        """
+        :param hdpath: Derivation path, for instance "m/44'/396'/0'/0/0"
+        :param algorithm: Cryptographic algorithm, used by this encryption box
+        :param options: Options, depends on algorithm and specific encryption
+                box implementation
+        :param public: Public information, depends on algorithm
+        """
+        self.hdpath = hdpath
+        self.algorithm = algorithm
+        self.options = options
+        self.public = public
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'hdpath': self.hdpath,
+            'algorithm': self.algorithm,
+            'options': self.options,
+            'public': self.public,
+        }
+
+
+class RegisteredEncryptionBox:
+    """RegisteredEncryptionBox"""
+
+    __slots__ = ('handle',)
+
+    def __init__(self, handle: 'EncryptionBoxHandle'):
+        """
+        :param handle: Handle of the encryption box
+        """
+        self.handle = handle
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'handle': self.handle}
+
+
+class ParamsOfAppEncryptionBox:
+    """Encryption box callbacks"""
+
+    class GetInfo(BaseTypedType):
+        """ParamsOfAppEncryptionBox.GetInfo"""
+
+        __slots__ = ()
+
+        def __init__(self):
+            super(ParamsOfAppEncryptionBox.GetInfo, self).__init__(type='GetInfo')
+
+    class Encrypt(BaseTypedType):
+        """ParamsOfAppEncryptionBox.Encrypt"""
+
+        __slots__ = ('data',)
+
+        def __init__(self, data: str):
+            """
+            :param data: Data, encoded in `base64`
+            """
+            super(ParamsOfAppEncryptionBox.Encrypt, self).__init__(type='Encrypt')
+            self.data = data
+
+        @property
+        def dict(self):
+            return {
+                **super(ParamsOfAppEncryptionBox.Encrypt, self).dict,
+                'data': self.data,
+            }
+
+    class Decrypt(BaseTypedType):
+        """ParamsOfAppEncryptionBox.Decrypt"""
+
+        __slots__ = ('data',)
+
+        def __init__(self, data: str):
+            """
+            :param data: Data, encoded in `base64`
+            """
+            super(ParamsOfAppEncryptionBox.Decrypt, self).__init__(type='Decrypt')
+            self.data = data
+
+        @property
+        def dict(self):
+            return {
+                **super(ParamsOfAppEncryptionBox.Decrypt, self).dict,
+                'data': self.data,
+            }
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> 'ParamsOfAppEncryptionBoxType':
+        """Object from dict"""
+        kwargs = {k: v for k, v in data.items() if k != 'type'}
+        return getattr(ParamsOfAppEncryptionBox, data['type'])(**kwargs)
+
+
+class ResultOfAppEncryptionBox:
+    """Returning values from signing box callbacks"""
+
+    class GetInfo(BaseTypedType):
+        """ResultOfAppEncryptionBox.GetInfo"""
+
+        __slots__ = ('info',)
+
+        def __init__(self, info: 'EncryptionBoxInfo'):
+            """
+            :param info:
+            """
+            super(ResultOfAppEncryptionBox.GetInfo, self).__init__(type='GetInfo')
+            self.info = info
+
+        @property
+        def dict(self):
+            return {
+                **super(ResultOfAppEncryptionBox.GetInfo, self).dict,
+                'info': self.info.dict,
+            }
+
+    class Encrypt(BaseTypedType):
+        """ResultOfAppEncryptionBox.Encrypt"""
+
+        __slots__ = ('data',)
+
+        def __init__(self, data: str):
+            """
+            :param data: Encrypted data, encoded in `base64`
+            """
+            super(ResultOfAppEncryptionBox.Encrypt, self).__init__(type='Encrypt')
+            self.data = data
+
+        @property
+        def dict(self):
+            return {
+                **super(ResultOfAppEncryptionBox.Encrypt, self).dict,
+                'data': self.data,
+            }
+
+    class Decrypt(BaseTypedType):
+        """ResultOfAppEncryptionBox.Decrypt"""
+
+        __slots__ = ('data',)
+
+        def __init__(self, data: str):
+            """
+            :param data: Decrypted data, encoded in `base64`
+            """
+            super(ResultOfAppEncryptionBox.Decrypt, self).__init__(type='Decrypt')
+            self.data = data
+
+        @property
+        def dict(self):
+            return {
+                **super(ResultOfAppEncryptionBox.Decrypt, self).dict,
+                'data': self.data,
+            }
+
+
+class ParamsOfEncryptionBoxGetInfo:
+    """ParamsOfEncryptionBoxGetInfo"""
+
+    __slots__ = ('encryption_box',)
+
+    def __init__(self, encryption_box: 'EncryptionBoxHandle'):
+        """
+        :param encryption_box:
+        """
+        self.encryption_box = encryption_box
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'encryption_box': self.encryption_box}
+
+
+class ResultOfEncryptionBoxGetInfo:
+    """ResultOfEncryptionBoxGetInfo"""
+
+    __slots__ = ('info',)
+
+    def __init__(self, info: 'EncryptionBoxInfo'):
+        """
+        :param info:
+        """
+        self.info = info
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> 'ResultOfEncryptionBoxGetInfo':
+        """Object from dict"""
+        data['info'] = EncryptionBoxInfo(**data['info'])
+
+        return ResultOfEncryptionBoxGetInfo(**data)
+
+
+class ParamsOfEncryptionBoxEncrypt:
+    """ParamsOfEncryptionBoxEncrypt"""
+
+    __slots__ = ('encryption_box', 'data')
+
+    def __init__(self, encryption_box: 'EncryptionBoxHandle', data: str):
+        """
+        :param encryption_box: Encryption box handle
+        :param data: Data to be encrypted, encoded in `base64`
+        """
+        self.encryption_box = encryption_box
+        self.data = data
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'encryption_box': self.encryption_box, 'data': self.data}
+
+
+class ResultOfEncryptionBoxEncrypt:
+    """ResultOfEncryptionBoxEncrypt"""
+
+    __slots__ = ('data',)
+
+    def __init__(self, data: str):
+        """
+        :param data: Encrypted data, encoded in `base64`
+        """
+        self.data = data
+
+
+class ParamsOfEncryptionBoxDecrypt:
+    """ParamsOfEncryptionBoxDecrypt"""
+
+    __slots__ = ('encryption_box', 'data')
+
+    def __init__(self, encryption_box: 'EncryptionBoxHandle', data: str):
+        """
+        :param encryption_box: Encryption box handle
+        :param data: Data to be decrypted, encoded in `base64`
+        """
+        self.encryption_box = encryption_box
+        self.data = data
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'encryption_box': self.encryption_box, 'data': self.data}
+
+
+class ResultOfEncryptionBoxDecrypt:
+    """ResultOfEncryptionBoxDecrypt"""
+
+    __slots__ = ('data',)
+
+    def __init__(self, data: str):
+        """
+        :param data: Decrypted data, encoded in `base64`
+        """
+        self.data = data
+
+
+class CipherMode(str, Enum):
+    """Cipher mode types"""
+
+    CBC = 'CBC'
+    CFB = 'CFB'
+    CTR = 'CTR'
+    ECB = 'ECB'
+    OFB = 'OFB'
+
+
+class EncryptionAlgorithm:
+    """EncryptionAlgorithm"""
+
+    # region hand-written
+    class Aes(BaseTypedType):
+        """EncryptionAlgorithm.Aes"""
+
+        __slots__ = ('mode', 'key', 'iv')
+
+        def __init__(self, mode: 'CipherMode', key: str, iv: str = None):
+            super(EncryptionAlgorithm.Aes, self).__init__(type='AES')
+            self.mode = mode
+            self.key = key
+            self.iv = iv
+
+        @property
+        def dict(self):
+            return {
+                **super(EncryptionAlgorithm.Aes, self).dict,
+                'value': {'mode': self.mode, 'key': self.key, 'iv': self.iv},
+            }
+
+    class AesInfo:
+        """EncryptionAlgorithm.AesInfo"""
+
+        __slots__ = ('cipher', 'iv')
+
+        def __init__(self, cipher: 'CipherMode', iv: str = None):
+            self.cipher = cipher
+            self.iv = iv
+    # endregion
+
+
+class ParamsOfCreateEncryptionBox:
+    """ParamsOfCreateEncryptionBox"""
+
+    __slots__ = ('algorithm',)
+
+    def __init__(self, algorithm: 'EncryptionAlgorithmType'):
+        """
+        :param algorithm: Encryption algorithm specifier including
+                cipher parameters (key, IV, etc)
+        """
+        self.algorithm = algorithm
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'algorithm': self.algorithm.dict}
+
+
+class CryptoBoxSecret:
+    """CryptoBoxSecret types"""
+
+    class RandomSeedPhrase(BaseTypedType):
+        """
+        Creates Crypto Box from a random seed phrase.
+        This option can be used if a developer doesn't want the seed phrase
+        to leave the core library's memory, where it is stored encrypted.
+
+        This type should be used upon the first wallet initialization, all
+        further initializations should use `EncryptedSecret` type instead.
+
+        Get `encrypted_secret` with `get_crypto_box_info` function and store it
+        on your side.
+        """
+
+        __slots__ = ('dictionary', 'wordcount')
+
+        def __init__(self, dictionary: 'MnemonicDictionary', wordcount: int):
+            """
+            :param dictionary:
+            :param wordcount:
+            """
+            super(CryptoBoxSecret.RandomSeedPhrase, self).__init__(
+                type='RandomSeedPhrase'
+            )
+            self.dictionary = dictionary
+            self.wordcount = wordcount
+
+        @property
+        def dict(self):
+            return {
+                **super(CryptoBoxSecret.RandomSeedPhrase, self).dict,
+                'dictionary': self.dictionary,
+                'wordcount': self.wordcount,
+            }
+
+    class PredefinedSeedPhrase(BaseTypedType):
+        """
+        Restores crypto box instance from an existing seed phrase.
+        This type should be used when Crypto Box is initialized from a seed
+        phrase, entered by a user.
+
+        This type should be used only upon the first wallet initialization, all
+        further initializations should use `EncryptedSecret` type instead.
+
+        Get `encrypted_secret` with `get_crypto_box_info` function and store it on
+        your side.
+        """
+
+        __slots__ = ('phrase', 'dictionary', 'wordcount')
+
+        def __init__(
+            self, phrase: str, dictionary: 'MnemonicDictionary', wordcount: int
+        ):
+            """
+            :param phrase:
+            :param dictionary:
+            :param wordcount:
+            """
+            super(CryptoBoxSecret.PredefinedSeedPhrase, self).__init__(
+                type='PredefinedSeedPhrase'
+            )
+            self.phrase = phrase
+            self.dictionary = dictionary
+            self.wordcount = wordcount
+
+        @property
+        def dict(self):
+            return {
+                **super(CryptoBoxSecret.PredefinedSeedPhrase, self).dict,
+                'phrase': self.phrase,
+                'dictionary': self.dictionary,
+                'wordcount': self.wordcount,
+            }
+
+    class EncryptedSecret(BaseTypedType):
+        """
+        Use this type for wallet reinitializations, when you already have
+        `encrypted_secret` on hands.
+        To get `encrypted_secret`, use `get_crypto_box_info` function after you
+        initialized your crypto box for the first time.
+
+        It is an object, containing seed phrase or private key
+        (now we support only seed phrase), encrypted with `secret_encryption_salt`
+        and password from `password_provider`.
+
+        Note that if you want to change salt or password provider, then you need
+        to reinitialize the wallet with `PredefinedSeedPhrase`, then get
+        `EncryptedSecret` via `get_crypto_box_info`, store it somewhere, and only
+        after that initialize the wallet with `EncryptedSecret` type.
+        """
+
+        __slots__ = ('encrypted_secret',)
+
+        def __init__(self, encrypted_secret: str):
+            """
+            :param encrypted_secret:
+            """
+            super(CryptoBoxSecret.EncryptedSecret, self).__init__(
+                type='EncryptedSecret'
+            )
+            self.encrypted_secret = encrypted_secret
+
+        @property
+        def dict(self):
+            return {
+                **super(CryptoBoxSecret.EncryptedSecret, self).dict,
+                'encrypted_secret': self.encrypted_secret,
+            }
+
+
+class BoxEncryptionAlgorithm:
+    """BoxEncryptionAlgorithm types"""
+
+    class ChaCha20(BaseTypedType):
+        """BoxEncryptionAlgorithm.ChaCha20"""
+
+        __slots__ = ('nonce',)
+
+        def __init__(self, nonce: str):
+            """
+            :param nonce: 96-bit nonce. Must be encoded with `hex`
+            """
+            super(BoxEncryptionAlgorithm.ChaCha20, self).__init__(type='ChaCha20')
+            self.nonce = nonce
+
+        # region hand-written
+        @property
+        def dict(self):
+            return {
+                **super(BoxEncryptionAlgorithm.ChaCha20, self).dict,
+                'value': {
+                    'nonce': self.nonce,
+                },
+            }
+        # endregion
+
+    class NaclBox(BaseTypedType):
+        """BoxEncryptionAlgorithm.NaclBox"""
+
+        __slots__ = ('their_public', 'nonce')
+
+        def __init__(self, their_public: str, nonce: str):
+            """
+            :param their_public: 256-bit key. Must be encoded with `hex`
+            :param nonce: 96-bit nonce. Must be encoded with `hex`
+            """
+            super(BoxEncryptionAlgorithm.NaclBox, self).__init__(type='NaclBox')
+            self.their_public = their_public
+            self.nonce = nonce
+
+        # region hand-written
+        @property
+        def dict(self):
+            return {
+                **super(BoxEncryptionAlgorithm.NaclBox, self).dict,
+                'value': {
+                    'their_public': self.their_public,
+                    'nonce': self.nonce,
+                },
+            }
+        # endregion
+
+    class NaclSecretBox(BaseTypedType):
+        """BoxEncryptionAlgorithm.NaclSecretBox"""
+
+        __slots__ = ('nonce',)
+
+        def __init__(self, nonce: str):
+            """
+            :param nonce: Nonce in `hex`
+            """
+            super(BoxEncryptionAlgorithm.NaclSecretBox, self).__init__(
+                type='NaclSecretBox'
+            )
+            self.nonce = nonce
+
+        # region hand-written
+        @property
+        def dict(self):
+            return {
+                **super(BoxEncryptionAlgorithm.NaclSecretBox, self).dict,
+                'value': {
+                    'nonce': self.nonce,
+                },
+            }
+        # endregion
+
+
+class RegisteredCryptoBox:
+    """RegisteredCryptoBox"""
+
+    __slots__ = ('handle',)
+
+    def __init__(self, handle: 'CryptoBoxHandle'):
+        """
+        :param handle:
+        """
+        self.handle = handle
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'handle': self.handle}
+
+
+class ParamsOfCreateCryptoBox:
+    """ParamsOfCreateCryptoBox"""
+
+    __slots__ = ('secret_encryption_salt', 'secret')
+
+    def __init__(self, secret_encryption_salt: str, secret: 'CryptoBoxSecretType'):
+        """
+        :param secret_encryption_salt: Salt used for secret encryption.
+                For example, a mobile device can use device ID as salt
+        :param secret: Cryptobox secret
+        """
+        self.secret_encryption_salt = secret_encryption_salt
+        self.secret = secret
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'secret_encryption_salt': self.secret_encryption_salt,
+            'secret': self.secret.dict,
+        }
+
+
+class ResultOfGetCryptoBoxInfo:
+    """ResultOfGetCryptoBoxInfo"""
+
+    __slots__ = ('encrypted_secret',)
+
+    def __init__(self, encrypted_secret: str):
+        """
+        :param encrypted_secret: Secret (seed phrase) encrypted
+                with salt and password
+        """
+        self.encrypted_secret = encrypted_secret
+
+
+class ResultOfGetCryptoBoxSeedPhrase:
+    """ResultOfGetCryptoBoxSeedPhrase"""
+
+    __slots__ = ('phrase', 'dictionary', 'wordcount')
+
+    def __init__(self, phrase: str, dictionary: 'MnemonicDictionary', wordcount: int):
+        """
+        :param phrase:
+        :param dictionary:
+        :param wordcount:
+        """
+        self.phrase = phrase
+        self.dictionary = dictionary
+        self.wordcount = wordcount
+
+    # region hand-written
+    @property
+    def dict(self):
+        return {
+            'phrase': self.phrase,
+            'dictionary': self.dictionary,
+            'wordcount': self.wordcount,
+        }
+    # endregion
+
+
+class ParamsOfGetSigningBoxFromCryptoBox:
+    """ParamsOfGetSigningBoxFromCryptoBox"""
+
+    __slots__ = ('handle', 'hdpath', 'secret_lifetime')
+
+    def __init__(
+        self, handle: 'CryptoBoxHandle', hdpath: str = None, secret_lifetime: int = None
+    ):
+        """
+        :param handle: Crypto Box Handle
+        :param hdpath: HD key derivation path.
+                By default, Everscale HD path is used
+        :param secret_lifetime: Store derived secret for this lifetime (in ms).
+                The timer starts after each signing box operation.
+                Secrets will be deleted immediately after each
+                signing box operation, if this value is not set
+        """
+        self.handle = handle
+        self.hdpath = hdpath
+        self.secret_lifetime = secret_lifetime
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'handle': self.handle,
+            'hdpath': self.hdpath,
+            'secret_lifetime': self.secret_lifetime,
+        }
+
+
+class ParamsOfGetEncryptionBoxFromCryptoBox:
+    """ParamsOfGetEncryptionBoxFromCryptoBox"""
+
+    __slots__ = ('handle', 'algorithm', 'hdpath', 'secret_lifetime')
+
+    def __init__(
+        self,
+        handle: 'CryptoBoxHandle',
+        algorithm: 'BoxEncryptionAlgorithmType',
+        hdpath: str = None,
+        secret_lifetime: int = None,
+    ):
+        """
+        :param handle: Crypto Box Handle
+        :param algorithm: Encryption algorithm
+        :param hdpath: HD key derivation path.
+                By default, Everscale HD path is used
+        :param secret_lifetime: Store derived secret for encryption algorithm
+                for this lifetime (in ms). The timer starts after each
+                encryption box operation. Secrets will be deleted
+                (overwritten with zeroes) after each encryption operation,
+                if this value is not set
+        """
+        self.handle = handle
+        self.algorithm = algorithm
+        self.hdpath = hdpath
+        self.secret_lifetime = secret_lifetime
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'handle': self.handle,
+            'algorithm': self.algorithm.dict,
+            'hdpath': self.hdpath,
+            'secret_lifetime': self.secret_lifetime,
+        }
+
+
+class ParamsOfAppPasswordProvider:
+    """AppPasswordProvided callbacks"""
+
+    class GetPassword(BaseTypedType):
+        """ParamsOfAppPasswordProvider.GetPassword"""
+
+        __slots__ = ('encryption_public_key',)
+
+        def __init__(self, encryption_public_key: str):
+            """
+            :param encryption_public_key: Temporary library pubkey, that is
+                    used on application side for password encryption, along
+                    with application temporary private key and nonce.
+                    Used for password decryption on library side
+            """
+            super(ParamsOfAppPasswordProvider.GetPassword, self).__init__(
+                type='GetPassword'
+            )
+            self.encryption_public_key = encryption_public_key
+
+        @property
+        def dict(self):
+            return {
+                **super(ParamsOfAppPasswordProvider.GetPassword, self).dict,
+                'encryption_public_key': self.encryption_public_key,
+            }
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> 'ParamsOfAppPasswordProviderType':
+        """Object from dict"""
+        kwargs = {k: v for k, v in data.items() if k != 'type'}
+        return getattr(ParamsOfAppPasswordProvider, data['type'])(**kwargs)
+
+
+class ResultOfAppPasswordProvider:
+    """Returning values from AppPasswordProvider"""
+
+    class GetPassword(BaseTypedType):
+        """ResultOfAppPasswordProvider.GetPassword"""
+
+        __slots__ = ('encrypted_password', 'app_encryption_pubkey')
+
+        def __init__(self, encrypted_password: str, app_encryption_pubkey: str):
+            """
+            :param encrypted_password: Password, encrypted and encoded to `base64`.
+                    Crypto box uses this password to decrypt its secret (seed phrase)
+            :param app_encryption_pubkey: Hex encoded public key of a temporary
+                    key pair, used for password encryption on application side.
+                    Used together with `encryption_public_key` to decode
+                    `encrypted_password`
+            """
+            super(ResultOfAppPasswordProvider.GetPassword, self).__init__(
+                type='GetPassword'
+            )
+            self.encrypted_password = encrypted_password
+            self.app_encryption_pubkey = app_encryption_pubkey
+
+        @property
+        def dict(self):
+            return {
+                **super(ResultOfAppPasswordProvider.GetPassword, self).dict,
+                'encrypted_password': self.encrypted_password,
+                'app_encryption_pubkey': self.app_encryption_pubkey,
+            }
+
+
+# Aggregated types
+ParamsOfAppSigningBoxType = Union[
+    ParamsOfAppSigningBox.GetPublicKey, ParamsOfAppSigningBox.Sign
+]
+ResultOfAppSigningBoxType = Union[
+    ResultOfAppSigningBox.GetPublicKey, ResultOfAppSigningBox.Sign
+]
+ParamsOfAppEncryptionBoxType = Union[
+    ParamsOfAppEncryptionBox.GetInfo,
+    ParamsOfAppEncryptionBox.Encrypt,
+    ParamsOfAppEncryptionBox.Decrypt,
+]
+ResultOfAppEncryptionBoxType = Union[
+    ResultOfAppEncryptionBox.GetInfo,
+    ResultOfAppEncryptionBox.Encrypt,
+    ResultOfAppEncryptionBox.Decrypt,
+]
+EncryptionAlgorithmType = EncryptionAlgorithm.Aes
+CryptoBoxSecretType = Union[
+    CryptoBoxSecret.RandomSeedPhrase,
+    CryptoBoxSecret.PredefinedSeedPhrase,
+    CryptoBoxSecret.EncryptedSecret,
+]
+BoxEncryptionAlgorithmType = Union[
+    BoxEncryptionAlgorithm.ChaCha20,
+    BoxEncryptionAlgorithm.NaclBox,
+    BoxEncryptionAlgorithm.NaclSecretBox,
+]
+ParamsOfAppPasswordProviderType = ParamsOfAppPasswordProvider.GetPassword
+ResultOfAppPasswordProviderType = ResultOfAppPasswordProvider.GetPassword
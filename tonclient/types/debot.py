@@ -0,0 +1,692 @@
+"""Debot module types"""
+from enum import Enum
+from typing import Any, Dict, List, Union
+
+from .base import BaseTypedType
+from . import crypto
+
+
+DebotHandle = int
+
+
+class DebotErrorCode(int, Enum):
+    """DeBot module error codes"""
+
+    DEBOT_START_FAILED = 801
+    DEBOT_FETCH_FAILED = 802
+    DEBOT_EXECUTION_FAILED = 803
+    DEBOT_INVALID_HANDLE = 804
+    DEBOT_INVALID_JSON_PARAMS = 805
+    DEBOT_INVALID_FUNCTION_ID = 806
+    DEBOT_INVALID_ABI = 807
+    DEBOT_GET_METHOD_FAILED = 808
+    DEBOT_INVALID_MSG = 809
+    DEBOT_EXTERNAL_CALL_FAILED = 810
+    DEBOT_BROWSER_CALLBACK_FAILED = 811
+    DEBOT_OPERATION_REJECTED = 812
+
+
+class DebotAction:
+    """DebotAction"""
+
+    __slots__ = ('description', 'name', 'action_type', 'to', 'attributes', 'misc')
+
+    def __init__(
+        self,
+        description: str,
+        name: str,
+        action_type: int,
+        to: int,
+        attributes: str,
+        misc: str,
+    ):
+        """
+        :param description: A short action description. Should be used by
+                Debot Browser as name of menu item
+        :param name: Depends on action type. Can be a debot function name or
+                a print string (for Print Action)
+        :param action_type: Action type
+        :param to: ID of debot context to switch after action execution
+        :param attributes: Action attributes. In the form of "param=value,flag"
+                Attribute example: instant, args, fargs, sign
+        :param misc: Some internal action data. Used by debot only
+        """
+        self.description = description
+        self.name = name
+        self.action_type = action_type
+        self.to = to
+        self.attributes = attributes
+        self.misc = misc
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'description': self.description,
+            'name': self.name,
+            'action_type': self.action_type,
+            'to': self.to,
+            'attributes': self.attributes,
+            'misc': self.misc,
+        }
+
+    # region hand-written
+    def __str__(self):
+        return self.description
+    # endregion
+
+
+class DebotInfo:
+    """DebotInfo"""
+
+    __slots__ = (
+        'interfaces',
+        'name',
+        'version',
+        'publisher',
+        'caption',
+        'author',
+        'support',
+        'hello',
+        'language',
+        'dabi',
+        'icon',
+    )
+
+    def __init__(
+        self,
+        interfaces: List[str],
+        name: str = None,
+        version: str = None,
+        publisher: str = None,
+        caption: str = None,
+        author: str = None,
+        support: str = None,
+        hello: str = None,
+        language: str = None,
+        dabi: str = None,
+        icon: str = None,
+    ):
+        """
+        :param interfaces: Vector with IDs of DInterfaces used by DeBot
+        :param name: DeBot short name
+        :param version: DeBot semantic version
+        :param publisher: The name of DeBot deployer
+        :param caption: Short info about DeBot
+        :param author: The name of DeBot developer
+        :param support: TON address of author for questions and donations
+        :param hello: String with the first message from DeBot
+        :param language: String with DeBot interface language (ISO-639)
+        :param dabi: String with DeBot ABI
+        :param icon: DeBot icon
+        """
+        self.interfaces = interfaces
+        self.name = name
+        self.version = version
+        self.publisher = publisher
+        self.caption = caption
+        self.author = author
+        self.support = support
+        self.hello = hello
+        self.language = language
+        self.dabi = dabi
+        self.icon = icon
+
+    # region hand-written
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'interfaces': self.interfaces,
+            'name': self.name,
+            'version': self.version,
+            'publisher': self.publisher,
+            'caption': self.caption,
+            'author': self.author,
+            'support': self.support,
+            'hello': self.hello,
+            'language': self.language,
+            'dabi': self.dabi,
+            'icon': self.icon,
+        }
+    # endregion
+
+
+class DebotActivity:
+    """Describes the operation that the DeBot wants to perform"""
+
+    class Transaction(BaseTypedType):
+        """DebotActivity.Transaction"""
+
+        __slots__ = (
+            'msg',
+            'dst',
+            'out',
+            'fee',
+            'setcode',
+            'signkey',
+            'signing_box_handle',
+        )
+
+        def __init__(
+            self,
+            msg: str,
+            dst: str,
+            out: List['Spending'],
+            fee: int,
+            setcode: bool,
+            signkey: str,
+            signing_box_handle: int,
+        ):
+            """
+            :param msg: External inbound message BOC
+            :param dst: Target smart contract address
+            :param out: List of spending as a result of transaction
+            :param fee: Transaction total fee
+            :param setcode: Indicates if target smart contract updates its code
+            :param signkey: Public key from keypair that was used to sign
+                    external message
+            :param signing_box_handle: Signing box handle used to sign
+                    external message
+            """
+            super(DebotActivity.Transaction, self).__init__(type='Transaction')
+            self.msg = msg
+            self.dst = dst
+            self.out = out
+            self.fee = fee
+            self.setcode = setcode
+            self.signkey = signkey
+            self.signing_box_handle = signing_box_handle
+
+        @property
+        def dict(self):
+            return {
+                **super(DebotActivity.Transaction, self).dict,
+                'msg': self.msg,
+                'dst': self.dst,
+                'out': [i.dict for i in self.out],
+                'fee': self.fee,
+                'setcode': self.setcode,
+                'signkey': self.signkey,
+                'signing_box_handle': self.signing_box_handle,
+            }
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> 'DebotActivityType':
+        """Object from dict"""
+        if data.get('out'):
+            data['out'] = [Spending(**i) for i in data['out']]
+        kwargs = {k: v for k, v in data.items() if k != 'type'}
+        return getattr(DebotActivity, data['type'])(**kwargs)
+
+
+class Spending:
+    """
+    Describes how much funds will be debited from the target contract
+    balance as a result of the transaction
+    """
+
+    __slots__ = ('amount', 'dst')
+
+    def __init__(self, amount: int, dst: str):
+        """
+        :param amount: Amount of nano tokens that will be sent to `dst` address
+        :param dst: Destination address of recipient of funds
+        """
+        self.amount = amount
+        self.dst = dst
+
+
+class ParamsOfInit:
+    """Parameters to init DeBot"""
+
+    __slots__ = ('address',)
+
+    def __init__(self, address: str):
+        """
+        :param address: Debot smart contract address
+        """
+        self.address = address
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'address': self.address}
+
+
+class RegisteredDebot:
+    """
+    Structure for storing debot handle returned from `start` and `fetch`
+    functions
+    """
+
+    __slots__ = ('debot_handle', 'debot_abi', 'info')
+
+    def __init__(self, debot_handle: 'DebotHandle', debot_abi: str, info: 'DebotInfo'):
+        """
+        :param debot_handle: Debot handle which references an instance of
+                debot engine
+        :param debot_abi: Debot abi as json string
+        :param info: Debot metadata
+        """
+        self.debot_handle = debot_handle
+        self.debot_abi = debot_abi
+        self.info = info
+
+    # region hand-written
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'debot_handle': self.debot_handle,
+            'debot_abi': self.debot_abi,
+            'info': self.info.dict,
+        }
+    # endregion
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> 'RegisteredDebot':
+        """Object from dict"""
+        data['info'] = DebotInfo(**data['info'])
+
+        return RegisteredDebot(**data)
+
+
+class ParamsOfAppDebotBrowser:
+    """
+    Debot Browser callbacks.
+    Called by debot engine to communicate with debot browser
+    """
+
+    class Log(BaseTypedType):
+        """Print message to user"""
+
+        __slots__ = ('msg',)
+
+        def __init__(self, msg: str):
+            """
+            :param msg: A string that must be printed to user
+            """
+            super(ParamsOfAppDebotBrowser.Log, self).__init__(type='Log')
+            self.msg = msg
+
+        @property
+        def dict(self):
+            return {**super(ParamsOfAppDebotBrowser.Log, self).dict, 'msg': self.msg}
+
+    class Switch(BaseTypedType):
+        """Switch debot to another context (menu)"""
+
+        __slots__ = ('context_id',)
+
+        def __init__(self, context_id: int):
+            """
+            :param context_id: Debot context ID to which debot is switched
+            """
+            super(ParamsOfAppDebotBrowser.Switch, self).__init__(type='Switch')
+            self.context_id = context_id
+
+        @property
+        def dict(self):
+            return {
+                **super(ParamsOfAppDebotBrowser.Switch, self).dict,
+                'context_id': self.context_id,
+            }
+
+    class SwitchCompleted(BaseTypedType):
+        """Notify browser that all context actions are shown"""
+
+        __slots__ = ()
+
+        def __init__(self):
+            super(ParamsOfAppDebotBrowser.SwitchCompleted, self).__init__(
+                type='SwitchCompleted'
+            )
+
+    class ShowAction(BaseTypedType):
+        """
+        Show action to the user.
+        Called after switch for each action in context
+        """
+
+        __slots__ = ('action',)
+
+        def __init__(self, action: 'DebotAction'):
+            """
+            :param action: Debot action that must be shown to user as menu
+                    item. At least description property must be shown from
+                    `DebotAction` structure
+            """
+            super(ParamsOfAppDebotBrowser.ShowAction, self).__init__(type='ShowAction')
+            self.action = action
+
+        @property
+        def dict(self):
+            return {
+                **super(ParamsOfAppDebotBrowser.ShowAction, self).dict,
+                'action': self.action.dict,
+            }
+
+    class Input(BaseTypedType):
+        """Request user input"""
+
+        __slots__ = ('prompt',)
+
+        def __init__(self, prompt: str):
+            """
+            :param prompt: A prompt string that must be printed to user
+                    before input request
+            """
+            super(ParamsOfAppDebotBrowser.Input, self).__init__(type='Input')
+            self.prompt = prompt
+
+        @property
+        def dict(self):
+            return {
+                **super(ParamsOfAppDebotBrowser.Input, self).dict,
+                'prompt': self.prompt,
+            }
+
+    class GetSigningBox(BaseTypedType):
+        """
+        Get signing box to sign data.
+        Signing box returned is owned and disposed by debot engine
+        """
+
+        __slots__ = ()
+
+        def __init__(self):
+            super(ParamsOfAppDebotBrowser.GetSigningBox, self).__init__(
+                type='GetSigningBox'
+            )
+
+    class InvokeDebot(BaseTypedType):
+        """Execute action of another debot"""
+
+        __slots__ = ('debot_addr', 'action')
+
+        def __init__(self, debot_addr: str, action: 'DebotAction'):
+            """
+            :param debot_addr: Address of debot in blockchain
+            :param action: Debot action to execute
+            """
+            super(ParamsOfAppDebotBrowser.InvokeDebot, self).__init__(
+                type='InvokeDebot'
+            )
+            self.debot_addr = debot_addr
+            self.action = action
+
+        @property
+        def dict(self):
+            return {
+                **super(ParamsOfAppDebotBrowser.InvokeDebot, self).dict,
+                'debot_addr': self.debot_addr,
+                'action': self.action.dict,
+            }
+
+    class Send(BaseTypedType):
+        """Used by Debot to call DInterface implemented by Debot Browser"""
+
+        __slots__ = ('message',)
+
+        def __init__(self, message: str):
+            """
+            :param message: Internal message to DInterface address. Message
+                    body contains interface function and parameters
+            """
+            super(ParamsOfAppDebotBrowser.Send, self).__init__(type='Send')
+            self.message = message
+
+        @property
+        def dict(self):
+            return {
+                **super(ParamsOfAppDebotBrowser.Send, self).dict,
+                'message': self.message,
+            }
+
+    class Approve(BaseTypedType):
+        """Requests permission from DeBot Browser to execute DeBot operation"""
+
+        __slots__ = ('activity',)
+
+        def __init__(self, activity: 'DebotActivityType'):
+            """
+            :param activity: DeBot activity details
+            """
+            super(ParamsOfAppDebotBrowser.Approve, self).__init__(type='Approve')
+            self.activity = activity
+
+        @property
+        def dict(self):
+            return {
+                **super(ParamsOfAppDebotBrowser.Approve, self).dict,
+                'activity': self.activity.dict,
+            }
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> 'ParamsOfAppDebotBrowserType':
+        """Object from dict"""
+        if data.get('action'):
+            data['action'] = DebotAction(**data['action'])
+        if data.get('activity'):
+            data['activity'] = DebotActivity.from_dict(data=data['activity'])
+        kwargs = {k: v for k, v in data.items() if k != 'type'}
+        return getattr(ParamsOfAppDebotBrowser, data['type'])(**kwargs)
+
+
+class ResultOfAppDebotBrowser:
+    """Returning values from Debot Browser callbacks"""
+
+    class Input(BaseTypedType):
+        """Result of user input"""
+
+        __slots__ = ('value',)
+
+        def __init__(self, value: str):
+            """
+            :param value: String entered by user
+            """
+            super(ResultOfAppDebotBrowser.Input, self).__init__(type='Input')
+            self.value = value
+
+        @property
+        def dict(self):
+            return {
+                **super(ResultOfAppDebotBrowser.Input, self).dict,
+                'value': self.value,
+            }
+
+    class GetSigningBox(BaseTypedType):
+        """Result of getting signing box"""
+
+        __slots__ = ('signing_box',)
+
+        def __init__(self, signing_box: 'crypto.SigningBoxHandle'):
+            """
+            :param signing_box: Signing box for signing data requested by
+                    debot engine. Signing box is owned and disposed by debot
+                    engine
+            """
+            super(ResultOfAppDebotBrowser.GetSigningBox, self).__init__(
+                type='GetSigningBox'
+            )
+            self.signing_box = signing_box
+
+        @property
+        def dict(self):
+            return {
+                **super(ResultOfAppDebotBrowser.GetSigningBox, self).dict,
+                'signing_box': self.signing_box,
+            }
+
+    class InvokeDebot(BaseTypedType):
+        """Result of debot invoking"""
+
+        __slots__ = ()
+
+        def __init__(self):
+            super(ResultOfAppDebotBrowser.InvokeDebot, self).__init__(
+                type='InvokeDebot'
+            )
+
+    class Approve(BaseTypedType):
+        """Result of approve callback"""
+
+        __slots__ = ('approved',)
+
+        def __init__(self, approved: bool):
+            """
+            :param approved: Indicates whether the DeBot is allowed to
+                    perform the specified operation
+            """
+            super(ResultOfAppDebotBrowser.Approve, self).__init__(type='Approve')
+            self.approved = approved
+
+        @property
+        def dict(self):
+            return {
+                **super(ResultOfAppDebotBrowser.Approve, self).dict,
+                'approved': self.approved,
+            }
+
+
+class ParamsOfStart:
+    """Parameters to start debot"""
+
+    __slots__ = ('debot_handle',)
+
+    def __init__(self, debot_handle: 'DebotHandle'):
+        """
+        :param debot_handle: Debot handle which references an instance of
+                debot engine
+        """
+        self.debot_handle = debot_handle
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'debot_handle': self.debot_handle}
+
+
+class ParamsOfFetch:
+    """Parameters to fetch debot"""
+
+    __slots__ = ('address',)
+
+    def __init__(self, address: str):
+        """
+        :param address: Debot smart contract address
+        """
+        self.address = address
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'address': self.address}
+
+
+class ResultOfFetch:
+    """ResultOfFetch"""
+
+    __slots__ = ('info',)
+
+    def __init__(self, info: 'DebotInfo'):
+        """
+        :param info: Debot metadata
+        """
+        self.info = info
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> 'ResultOfFetch':
+        """Object from dict"""
+        data['info'] = DebotInfo(**data['info'])
+
+        return ResultOfFetch(**data)
+
+
+class ParamsOfExecute:
+    """Parameters for executing debot action"""
+
+    __slots__ = ('debot_handle', 'action')
+
+    def __init__(self, debot_handle: 'DebotHandle', action: 'DebotAction'):
+        """
+        :param debot_handle: Debot handle which references an instance of
+                debot engine
+        :param action: Debot Action that must be executed
+        """
+        self.debot_handle = debot_handle
+        self.action = action
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'debot_handle': self.debot_handle, 'action': self.action.dict}
+
+
+class ParamsOfSend:
+    """Parameters of send function"""
+
+    __slots__ = ('debot_handle', 'message')
+
+    def __init__(self, debot_handle: 'DebotHandle', message: str):
+        """
+        :param debot_handle: Debot handle which references an instance of
+                debot engine
+        :param message: BOC of internal message to debot encoded in `base64`
+        """
+        self.debot_handle = debot_handle
+        self.message = message
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'debot_handle': self.debot_handle, 'message': self.message}
+
+
+class ParamsOfRemove:
+    """ParamsOfRemove"""
+
+    __slots__ = ('debot_handle',)
+
+    def __init__(self, debot_handle: 'DebotHandle'):
+        """
+        :param debot_handle: Debot handle which references an instance of
+                debot engine
+        """
+        self.debot_handle = debot_handle
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'debot_handle': self.debot_handle}
+
+
+class DebotState(int, Enum):
+    """Debot state types"""
+
+    ZERO = 0
+    CURRENT = 253
+    PREV = 254
+    EXIT = 255
+
+
+# Aggregated types
+DebotActivityType = DebotActivity.Transaction
+ParamsOfAppDebotBrowserType = Union[
+    ParamsOfAppDebotBrowser.Log,
+    ParamsOfAppDebotBrowser.Switch,
+    ParamsOfAppDebotBrowser.SwitchCompleted,
+    ParamsOfAppDebotBrowser.ShowAction,
+    ParamsOfAppDebotBrowser.Input,
+    ParamsOfAppDebotBrowser.GetSigningBox,
+    ParamsOfAppDebotBrowser.InvokeDebot,
+    ParamsOfAppDebotBrowser.Send,
+    ParamsOfAppDebotBrowser.Approve,
+]
+ResultOfAppDebotBrowserType = Union[
+    ResultOfAppDebotBrowser.Input,
+    ResultOfAppDebotBrowser.GetSigningBox,
+    ResultOfAppDebotBrowser.InvokeDebot,
+    ResultOfAppDebotBrowser.Approve,
+]
@@ -0,0 +1,1021 @@
+"""Net module types"""
+from enum import Enum
+from typing import Any, Dict, List, Union
+
+from .base import BaseTypedType
+from . import abi
+
+
+class NetErrorCode(int, Enum):
+    """Net module error codes"""
+
+    QUERY_FAILED = 601
+    SUBSCRIBE_FAILED = 602
+    WAIT_FOR_FAILED = 603
+    GET_SUBSCRIPTION_RESULT_FAILED = 604
+    INVALID_SERVER_RESPONSE = 605
+    CLOCK_OUT_OF_SYNC = 606
+    WAIT_FOR_TIMEOUT = 607
+    GRAPHQL_ERROR = 608
+    NETWORK_MODULE_SUSPENDED = 609
+    WEBSOCKET_DISCONNECTED = 610
+    NOT_SUPPORTED = 611
+    NO_ENDPOINTS_PROVIDED = 612
+    GRAPHQL_WEBSOCKET_INIT_ERROR = 613
+    NETWORK_MODULE_RESUMED = 614
+    UNAUTHORIZED = 615
+    QUERY_TRANSACTION_TREE_TIMEOUT = 616
+    GRAPHQL_CONNECTION_ERROR = 617
+
+
+class SortDirection(str, Enum):
+    """Sord direction types"""
+
+    ASC = 'ASC'
+    DESC = 'DESC'
+
+
+class OrderBy:
+    """OrderBy"""
+
+    __slots__ = ('path', 'direction')
+
+    def __init__(self, path: str, direction: 'SortDirection'):
+        """
+        :param path:
+        :param direction:
+        """
+        self.path = path
+        self.direction = direction
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'path': self.path, 'direction': self.direction}
+
+
+class ParamsOfQuery:
+    """ParamsOfQuery"""
+
+    __slots__ = ('query', 'variables')
+
+    def __init__(self, query: str, variables: Any = None):
+        """
+        :param query: GraphQL query text
+        :param variables: Variables used in query. Must be a map with named
+                values that can be used in query
+        """
+        self.query = query
+        self.variables = variables
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'query': self.query, 'variables': self.variables}
+
+
+class ResultOfQuery:
+    """ResultOfQuery"""
+
+    __slots__ = ('result',)
+
+    def __init__(self, result: Any):
+        """
+        :param result: Result provided by DAppServer
+        """
+        self.result = result
+
+
+class ParamsOfQueryCollection:
+    """ParamsOfQueryCollection"""
+
+    __slots__ = ('collection', 'result', 'filter', 'order', 'limit')
+
+    # region hand-written
+    def __init__(
+        self,
+        collection: str,
+        result: str,
+        filter: Dict[str, Any] = None,
+        order: List['OrderBy'] = None,
+        limit: int = None,
+    ):
+        """
+        :param collection: Collection name (accounts, blocks, transactions,
+                messages, block_signatures)
+        :param result: Projection (result) string
+        :param filter: Collection filter
+        :param order: Sorting order
+        :param limit: Number of documents to return
+        """
+        self.collection = collection
+        self.result = result
+        self.filter = filter
+        self.order = order or []
+        self.limit = limit
+    # endregion
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'collection': self.collection,
+            'result': self.result,
+            'filter': self.filter,
+            'order': [i.dict for i in self.order] if self.order else self.order,
+            'limit': self.limit,
+        }
+
+
+class ResultOfQueryCollection:
+    """ResultOfQueryCollection"""
+
+    __slots__ = ('result',)
+
+    def __init__(self, result: List[Any]):
+        """
+        :param result: Objects that match the provided criteria
+        """
+        self.result = result
+
+
+class ParamsOfWaitForCollection:
+    """ParamsOfWaitForCollection"""
+
+    __slots__ = ('collection', 'result', 'filter', 'timeout')
+
+    def __init__(
+        self, collection: str, result: str, filter: Any = None, timeout: int = None
+    ):
+        """
+        :param collection: Collection name (accounts, blocks, transactions,
+                messages, block_signatures)
+        :param result: Projection (result) string
+        :param filter: Collection filter
+        :param timeout: Query timeout
+        """
+        self.collection = collection
+        self.result = result
+        self.filter = filter
+        self.timeout = timeout
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'collection': self.collection,
+            'result': self.result,
+            'filter': self.filter,
+            'timeout': self.timeout,
+        }
+
+
+class ResultOfWaitForCollection:
+    """ResultOfWaitForCollection"""
+
+    __slots__ = ('result',)
+
+    def __init__(self, result: Any):
+        """
+        :param result: First found object that matches the provided criteria
+        """
+        self.result = result
+
+
+class ParamsOfSubscribe:
+    """ParamsOfSubscribe"""
+
+    __slots__ = ('subscription', 'variables')
+
+    def __init__(self, subscription: str, variables: Any = None):
+        """
+        :param subscription: GraphQL subscription text
+        :param variables: Variables used in subscription.
+                Must be a map with named values that can be used in query
+        """
+        self.subscription = subscription
+        self.variables = variables
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'subscription': self.subscription, 'variables': self.variables}
+
+
+class ParamsOfSubscribeCollection:
+    """ParamsOfSubscribeCollection"""
+
+    __slots__ = ('collection', 'result', 'filter')
+
+    def __init__(self, collection: str, result: str, filter: Any = None):
+        """
+        :param collection: Collection name (accounts, blocks, transactions,
+                messages, block_signatures)
+        :param result: Projection (result) string
+        :param filter: Collection filter
+        """
+        self.collection = collection
+        self.result = result
+        self.filter = filter
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'collection': self.collection,
+            'result': self.result,
+            'filter': self.filter,
+        }
+
+
+class ResultOfSubscribeCollection:
+    """ResultOfSubscribeCollection"""
+
+    __slots__ = ('handle',)
+
+    def __init__(self, handle: int):
+        """
+        :param handle: Subscription handle. Must be closed with `unsubscribe`
+        """
+        self.handle = handle
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'handle': self.handle}
+
+
+class SubscriptionResponseType(int, Enum):
+    """Subscription response types"""
+
+    OK = 100
+    ERROR = 101
+
+
+class ResultOfSubscription:
+    """ResultOfSubscription"""
+
+    __slots__ = ('result',)
+
+    def __init__(self, result: Any):
+        """
+        :param result: First appeared object that matches the provided criteria
+        """
+        self.result = result
+
+
+class ParamsOfFindLastShardBlock:
+    """ParamsOfFindLastShardBlock"""
+
+    __slots__ = ('address',)
+
+    def __init__(self, address: str):
+        """
+        :param address: Account address
+        """
+        self.address = address
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'address': self.address}
+
+
+class ResultOfFindLastShardBlock:
+    """ResultOfFindLastShardBlock"""
+
+    __slots__ = ('block_id',)
+
+    def __init__(self, block_id: str):
+        """
+        :param block_id: Account shard last block ID
+        """
+        self.block_id = block_id
+
+
+class EndpointsSet:
+    """EndpointsSet"""
+
+    __slots__ = ('endpoints',)
+
+    def __init__(self, endpoints: List[str]):
+        """
+        :param endpoints: List of endpoints provided by server
+        """
+        self.endpoints = endpoints
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'endpoints': self.endpoints}
+
+
+class AggregationFn(str, Enum):
+    """Aggregate functions"""
+
+    COUNT = 'COUNT'
+    MIN = 'MIN'
+    MAX = 'MAX'
+    SUM = 'SUM'
+    AVERAGE = 'AVERAGE'
+
+
+class FieldAggregation:
+    """FieldAggregation"""
+
+    __slots__ = ('field', 'fn')
+
+    def __init__(self, field: str, fn: 'AggregationFn'):
+        """
+        :param field: Dot separated path to the field
+        :param fn: Aggregation function that must be applied to field values
+        """
+        self.field = field
+        self.fn = fn
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'field': self.field, 'fn': self.fn}
+
+
+class ParamsOfAggregateCollection:
+    """ParamsOfAggregateCollection"""
+
+    __slots__ = ('collection', 'filter', 'fields')
+
+    def __init__(
+        self,
+        collection: str,
+        filter: Any = None,
+        fields: List['FieldAggregation'] = None,
+    ):
+        """
+        :param collection: Collection name (accounts, blocks, transactions,
+                messages, block_signatures)
+        :param filter: Collection filter
+        :param fields: Projection (result) string
+        """
+        self.collection = collection
+        self.filter = filter
+        self.fields = fields
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'collection': self.collection,
+            'filter': self.filter,
+            'fields': [i.dict for i in self.fields] if self.fields else self.fields,
+        }
+
+
+class ResultOfAggregateCollection:
+    """ResultOfAggregateCollection"""
+
+    __slots__ = ('values',)
+
+    def __init__(self, values: List[str]):
+        """
+        :param values: Values for requested fields.
+                Returns an array of strings. Each string refers to the
+                corresponding fields item.
+                Numeric value is returned as a decimal string representations
+        """
+        self.values = values
+
+
+class ParamsOfQueryOperation:
+    """ParamsOfQueryOperation"""
+
+    class QueryCollection(BaseTypedType):
+        """ParamsOfQueryOperation.QueryCollection"""
+
+        __slots__ = ('params',)
+
+        def __init__(self, params: 'ParamsOfQueryCollection'):
+            """
+            :param params:
+            """
+            super(ParamsOfQueryOperation.QueryCollection, self).__init__(
+                type='QueryCollection'
+            )
+            self.params = params
+
+        @property
+        def dict(self):
+            return {
+                **super(ParamsOfQueryOperation.QueryCollection, self).dict,
+                **self.params.dict,
+            }
+
+    class WaitForCollection(BaseTypedType):
+        """ParamsOfQueryOperation.WaitForCollection"""
+
+        __slots__ = ('params',)
+
+        def __init__(self, params: 'ParamsOfWaitForCollection'):
+            """
+            :param params:
+            """
+            super(ParamsOfQueryOperation.WaitForCollection, self).__init__(
+                type='WaitForCollection'
+            )
+            self.params = params
+
+        @property
+        def dict(self):
+            return {
+                **super(ParamsOfQueryOperation.WaitForCollection, self).dict,
+                **self.params.dict,
+            }
+
+    class AggregateCollection(BaseTypedType):
+        """ParamsOfQueryOperation.AggregateCollection"""
+
+        __slots__ = ('params',)
+
+        def __init__(self, params: 'ParamsOfAggregateCollection'):
+            """
+            :param params:
+            """
+            super(ParamsOfQueryOperation.AggregateCollection, self).__init__(
+                type='AggregateCollection'
+            )
+            self.params = params
+
+        @property
+        def dict(self):
+            return {
+                **super(ParamsOfQueryOperation.AggregateCollection, self).dict,
+                **self.params.dict,
+            }
+
+    class QueryCounterparties(BaseTypedType):
+        """ParamsOfQueryOperation.QueryCounterparties"""
+
+        __slots__ = ('params',)
+
+        def __init__(self, params: 'ParamsOfQueryCounterparties'):
+            """
+            :param params:
+            """
+            super(ParamsOfQueryOperation.QueryCounterparties, self).__init__(
+                type='QueryCounterparties'
+            )
+            self.params = params
+
+        @property
+        def dict(self):
+            return {
+                **super(ParamsOfQueryOperation.QueryCounterparties, self).dict,
+                **self.params.dict,
+            }
+
+
+class ParamsOfBatchQuery:
+    """ParamsOfBatchQuery"""
+
+    __slots__ = ('operations',)
+
+    def __init__(self, operations: List['ParamsOfQueryOperationType']):
+        """
+        :param operations: List of query operations that must be performed
+                per single fetch
+        """
+        self.operations = operations
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'operations': [i.dict for i in self.operations]}
+
+
+class ResultOfBatchQuery:
+    """ResultOfBatchQuery"""
+
+    __slots__ = ('results',)
+
+    def __init__(self, results: List[Any]):
+        """
+        :param results: Result values for batched queries. Returns an array
+                of values. Each value corresponds to queries item
+        """
+        self.results = results
+
+
+class ParamsOfQueryCounterparties:
+    """ParamsOfQueryCounterparties"""
+
+    __slots__ = ('account', 'result', 'first', 'after')
+
+    def __init__(self, account: str, result: str, first: int = None, after: str = None):
+        """
+        :param account: Account address
+        :param result: Projection (result) string
+        :param first: Number of counterparties to return
+        :param after: `cursor` field of the last received result
+        """
+        self.account = account
+        self.result = result
+        self.first = first
+        self.after = after
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'account': self.account,
+            'result': self.result,
+            'first': self.first,
+            'after': self.after,
+        }
+
+
+class ResultOfGetEndpoints:
+    """ResultOfGetEndpoints"""
+
+    __slots__ = ('query', 'endpoints')
+
+    def __init__(self, query: str, endpoints: List[str]):
+        """
+        :param query: Current query endpoint
+        :param endpoints: List of all endpoints used by client
+        """
+        self.query = query
+        self.endpoints = endpoints
+
+
+class MessageNode:
+    """MessageNode"""
+
+    __slots__ = (
+        'id',
+        'bounce',
+        'src_transaction_id',
+        'dst_transaction_id',
+        'src',
+        'dst',
+        'value',
+        'decoded_body',
+    )
+
+    def __init__(
+        self,
+        id: str,
+        bounce: bool,
+        src_transaction_id: str = None,
+        dst_transaction_id: str = None,
+        src: str = None,
+        dst: str = None,
+        value: str = None,
+        decoded_body: 'abi.DecodedMessageBody' = None,
+    ):
+        """
+        :param id: Message id
+        :param bounce: Bounce flag
+        :param src_transaction_id: Source transaction id. This field is
+                missing for an external inbound messages
+        :param dst_transaction_id: Destination transaction id. This field is
+                missing for an external outbound messages
+        :param src: Source address
+        :param dst: Destination address
+        :param value: Transferred tokens value
+        :param decoded_body: Decoded body. Library tries to decode message
+                body using provided `params.abi_registry`. This field will be
+                missing if none of the provided abi can be used to decode
+        """
+        self.id = id
+        self.bounce = bounce
+        self.src_transaction_id = src_transaction_id
+        self.dst_transaction_id = dst_transaction_id
+        self.src = src
+        self.dst = dst
+        self.value = value
+        self.decoded_body = decoded_body
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> 'MessageNode':
+        """Object from dict"""
+        if data.get('decoded_body'):
+            data['decoded_body'] = abi.DecodedMessageBody.from_dict(
+                data=data['decoded_body']
+            )
+
+        return MessageNode(**data)
+
+
+class TransactionNode:
+    """TransactionNode"""
+
+    __slots__ = (
+        'id',
+        'in_msg',
+        'out_msgs',
+        'account_addr',
+        'total_fees',
+        'aborted',
+        'exit_code',
+    )
+
+    def __init__(
+        self,
+        id: str,
+        in_msg: str,
+        out_msgs: List[str],
+        account_addr: str,
+        total_fees: str,
+        aborted: bool,
+        exit_code: int = None,
+    ):
+        """
+        :param id: Transaction id
+        :param in_msg: In message id
+        :param out_msgs: Out message ids
+        :param account_addr: Account address
+        :param total_fees: Transactions total fees
+        :param aborted: Aborted flag
+        :param exit_code: Compute phase exit code
+        """
+        self.id = id
+        self.in_msg = in_msg
+        self.out_msgs = out_msgs
+        self.account_addr = account_addr
+        self.total_fees = total_fees
+        self.aborted = aborted
+        self.exit_code = exit_code
+
+
+class ParamsOfQueryTransactionTree:
+    """ParamsOfQueryTransactionTree"""
+
+    __slots__ = ('in_msg', 'abi_registry', 'timeout', 'transaction_max_count')
+
+    def __init__(
+        self,
+        in_msg: str,
+        abi_registry: List['abi.AbiType'] = None,
+        timeout: int = None,
+        transaction_max_count: int = None,
+    ):
+        """
+        :param in_msg: Input message id
+        :param abi_registry: List of contract ABIs that will be used to
+                decode message bodies. Library will try to decode each
+                returned message body using any ABI from the registry
+        :param timeout: Timeout used to limit waiting time for the missing
+                messages and transaction. If some of the following messages
+                and transactions are missing yet. The maximum waiting time is
+                regulated by this option. Default value is 60000 (1 min)
+        :param transaction_max_count: Maximum transaction count to wait.
+                If transaction tree contains more transaction then this parameter
+                then only first transaction_max_count transaction are awaited and
+                returned.
+                Default value is 50. If transaction_max_count is set to 0 then no
+                limitation on transaction count is used and all transaction are
+                returned
+        """
+        self.in_msg = in_msg
+        self.abi_registry = abi_registry
+        self.timeout = timeout
+        self.transaction_max_count = transaction_max_count
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        abi_registry = (
+            [i.dict for i in self.abi_registry]
+            if self.abi_registry
+            else self.abi_registry
+        )
+        return {
+            'in_msg': self.in_msg,
+            'abi_registry': abi_registry,
+            'timeout': self.timeout,
+            'transaction_max_count': self.transaction_max_count,
+        }
+
+
+class ResultOfQueryTransactionTree:
+    """ResultOfQueryTransactionTree"""
+
+    __slots__ = ('messages', 'transactions')
+
+    def __init__(
+        self, messages: List['MessageNode'], transactions: List['TransactionNode']
+    ):
+        """
+        :param messages: Messages
+        :param transactions: Transactions
+        """
+        self.messages = messages
+        self.transactions = transactions
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> 'ResultOfQueryTransactionTree':
+        """Object from dict"""
+        data['messages'] = [MessageNode.from_dict(data=i) for i in data['messages']]
+        data['transactions'] = [TransactionNode(**i) for i in data['transactions']]
+
+        return ResultOfQueryTransactionTree(**data)
+
+
+class RegisteredIterator:
+    """RegisteredIterator"""
+
+    __slots__ = ('handle',)
+
+    def __init__(self, handle: int):
+        """
+        :param handle: Iterator handle. Must be removed using remove_iterator
+                when it is no more needed for the application
+        """
+        self.handle = handle
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'handle': self.handle}
+
+
+class ParamsOfCreateBlockIterator:
+    """ParamsOfCreateBlockIterator"""
+
+    __slots__ = ('start_time', 'end_time', 'shard_filter', 'result')
+
+    def __init__(
+        self,
+        start_time: int = None,
+        end_time: int = None,
+        shard_filter: List[str] = None,
+        result: str = None,
+    ):
+        """
+        :param start_time: Starting time to iterate from.
+                If the application specifies this parameter then the iteration
+                includes blocks with `gen_utime` >= `start_time`.
+                Otherwise the iteration starts from zero state.
+                Must be specified in seconds
+        :param end_time: Optional end time to iterate for.
+                If the application specifies this parameter then the iteration
+                includes blocks with `gen_utime` < `end_time`.
+                Otherwise the iteration never stops.
+                Must be specified in seconds
+        :param shard_filter: Shard prefix filter.
+                If the application specifies this parameter and it is not
+                the empty array then the iteration will include items related
+                to accounts that belongs to the specified shard prefixes.
+                Shard prefix must be represented as a string
+                "workchain:prefix". Where `workchain` is a signed integer and
+                the `prefix` is a hexadecimal representation if the 64-bit
+                unsigned integer with tagged shard prefix.
+                For example: "0:3800000000000000"
+        :param result: Projection (result) string.
+                List of the fields that must be returned for iterated items.
+                This field is the same as the `result` parameter of the
+                `query_collection` function. Note that iterated items can
+                contains additional fields that are not requested in the result
+        """
+        self.start_time = start_time
+        self.end_time = end_time
+        self.shard_filter = shard_filter
+        self.result = result
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'start_time': self.start_time,
+            'end_time': self.end_time,
+            'shard_filter': self.shard_filter,
+            'result': self.result,
+        }
+
+
+class ParamsOfResumeBlockIterator:
+    """ParamsOfResumeBlockIterator"""
+
+    __slots__ = ('resume_state',)
+
+    def __init__(self, resume_state: Any):
+        """
+        :param resume_state: Iterator state from which to resume.
+                Same as value returned from `iterator_next`
+        """
+        self.resume_state = resume_state
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'resume_state': self.resume_state}
+
+
+class ParamsOfCreateTransactionIterator:
+    """ParamsOfCreateTransactionIterator"""
+
+    __slots__ = (
+        'start_time',
+        'end_time',
+        'shard_filter',
+        'accounts_filter',
+        'result',
+        'include_transfers',
+    )
+
+    def __init__(
+        self,
+        start_time: int = None,
+        end_time: int = None,
+        shard_filter: List[str] = None,
+        accounts_filter: List[str] = None,
+        result: str = None,
+        include_transfers: bool = None,
+    ):
+        """
+        :param start_time: Starting time to iterate from.
+                If the application specifies this parameter then the iteration
+                includes blocks with `gen_utime` >= `start_time`.
+                Otherwise the iteration starts from zero state.
+                Must be specified in seconds
+        :param end_time: Optional end time to iterate for.
+                If the application specifies this parameter then the iteration
+                includes blocks with `gen_utime` < `end_time`.
+                Otherwise the iteration never stops.
+                Must be specified in seconds
+        :param shard_filter: Shard prefix filters.
+                If the application specifies this parameter and it is not an
+                empty array then the iteration will include items related to
+                accounts that belongs to the specified shard prefixes.
+                Shard prefix must be represented as a string
+                "workchain:prefix". Where `workchain` is a signed integer
+                and the `prefix` if a hexadecimal representation if the 64-bit
+                unsigned integer with tagged shard prefix.
+                For example: "0:3800000000000000".
+                Account address conforms to the shard filter if it belongs to
+                the filter workchain and the first bits of address match to
+                the shard prefix. Only transactions with suitable account
+                addresses are iterated
+        :param accounts_filter: Account address filter.
+                Application can specify the list of accounts for which it
+                wants to iterate transactions.
+                If this parameter is missing or an empty list then the library
+                iterates transactions for all accounts that pass the shard
+                filter.
+                Note that the library doesn't detect conflicts between the
+                account filter and the shard filter if both are specified.
+                So it is an application responsibility to specify the correct
+                filter combination
+        :param result: Projection (result) string.
+                List of the fields that must be returned for iterated items.
+                This field is the same as the `result` parameter of the
+                `query_collection` function.
+                Note that iterated items can contain additional fields that
+                are not requested in the `result`
+        :param include_transfers: Include `transfers` field in iterated
+                transactions. If this parameter is `true` then each
+                transaction contains field `transfers` with list of transfer.
+
+                Each transfer is calculated from the particular message
+                related to the transaction and has the following structure:
+                    * message source message identifier;
+                    * isBounced indicates that the transaction is bounced,
+                            which means the value will be returned back to the
+                            sender;
+                    * isDeposit indicates that this transfer is the
+                            deposit (true) or withdraw (false);
+                    * counterparty account address of the transfer source or
+                            destination depending on isDeposit;
+                    * value amount of nano tokens transferred.
+                            The value is represented as a decimal string
+                            because the actual value can be more precise than
+                            the JSON number can represent. Application must
+                            use this string carefully conversion to number
+                            can follow to loose of precision
+        """
+        self.start_time = start_time
+        self.end_time = end_time
+        self.shard_filter = shard_filter
+        self.accounts_filter = accounts_filter
+        self.result = result
+        self.include_transfers = include_transfers
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'start_time': self.start_time,
+            'end_time': self.end_time,
+            'shard_filter': self.shard_filter,
+            'accounts_filter': self.accounts_filter,
+            'result': self.result,
+            'include_transfers': self.include_transfers,
+        }
+
+
+class ParamsOfResumeTransactionIterator:
+    """ParamsOfResumeTransactionIterator"""
+
+    __slots__ = ('resume_state', 'accounts_filter')
+
+    def __init__(self, resume_state: Any, accounts_filter: List[str] = None):
+        """
+        :param resume_state: Iterator state from which to resume.
+                Same as value returned from `iterator_next`
+        :param accounts_filter: Account address filter.
+                Application can specify the list of accounts for which
+                it wants to iterate transactions.
+                If this parameter is missing or an empty list then the
+                library iterates transactions for all accounts that passes
+                the shard filter.
+                Note that the library doesn't detect conflicts between the
+                account filter and the shard filter if both are specified.
+                So it is the application's responsibility to specify the
+                correct filter combination
+        """
+        self.resume_state = resume_state
+        self.accounts_filter = accounts_filter
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'resume_state': self.resume_state,
+            'accounts_filter': self.accounts_filter,
+        }
+
+
+class ParamsOfIteratorNext:
+    """ParamsOfIteratorNext"""
+
+    __slots__ = ('iterator', 'limit', 'return_resume_state')
+
+    def __init__(
+        self, iterator: int, limit: int = None, return_resume_state: bool = None
+    ):
+        """
+        :param iterator: Iterator handle
+        :param limit: Maximum count of the returned items.
+                If value is missing or is less than 1 the library uses 1
+        :param return_resume_state: Indicates that function must return the
+                iterator state that can be used for resuming iteration
+        """
+        self.iterator = iterator
+        self.limit = limit
+        self.return_resume_state = return_resume_state
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'iterator': self.iterator,
+            'limit': self.limit,
+            'return_resume_state': self.return_resume_state,
+        }
+
+
+class ResultOfIteratorNext:
+    """ResultOfIteratorNext"""
+
+    __slots__ = ('items', 'has_more', 'resume_state')
+
+    def __init__(self, items: List[Any], has_more: bool, resume_state: Any = None):
+        """
+        :param items: Next available items.
+                Note that `iterator_next` can return an empty items and
+                `has_more` equals to `true`.
+                In this case the application have to continue iteration.
+                Such situation can take place when there is no data yet but
+                the requested `end_time` is not reached
+        :param has_more: Indicates that there are more available items in
+                iterated range
+        :param resume_state: Optional iterator state that can be used for
+                resuming iteration. This field is returned only if the
+                `return_resume_state` parameter is specified.
+                Note that `resume_state` corresponds to the iteration position
+                after the returned items
+        """
+        self.items = items
+        self.has_more = has_more
+        self.resume_state = resume_state
+
+
+class ResultOfGetSignatureId:
+    """ResultOfGetSignatureId"""
+
+    __slots__ = ('signature_id',)
+
+    def __init__(self, signature_id: int = None):
+        """
+        :param signature_id: Signature ID for configured network if it should be used
+                in messages signature
+        """
+        self.signature_id = signature_id
+
+
+# Aggregated types
+ParamsOfQueryOperationType = Union[
+    ParamsOfQueryOperation.QueryCollection,
+    ParamsOfQueryOperation.WaitForCollection,
+    ParamsOfQueryOperation.AggregateCollection,
+    ParamsOfQueryOperation.QueryCounterparties,
+]
@@ -0,0 +1,1152 @@
+"""Processing module types"""
+from enum import Enum
+from typing import Any, Dict, List, Union
+
+from .base import BaseTypedType
+from . import abi, client, tvm
+
+
+class ProcessingErrorCode(int, Enum):
+    """Processing module error codes"""
+
+    MESSAGE_ALREADY_EXPIRED = 501
+    MESSAGE_HAS_NO_DESTINATION_ADDRESS = 502
+    CANNOT_BUILD_MESSAGE_CELL = 503
+    FETCH_BLOCK_FAILED = 504
+    SEND_MESSAGE_FAILED = 505
+    INVALID_MESSAGE_BOC = 506
+    MESSAGE_EXPIRED = 507
+    TRANSACTION_WAIT_TIMEOUT = 508
+    INVALID_BLOCK_RECEIVED = 509
+    CANNOT_CHECK_BLOCK_SHARD = 510
+    BLOCK_NOT_FOUND = 511
+    INVALID_DATA = 512
+    EXTERNAL_SIGNER_MUST_NOT_BE_USED = 513
+    MESSAGE_REJECTED = 514
+    INVALID_REMP_STATUS = 515
+    NEXT_REMP_STATUS_TIMEOUT = 516
+
+
+class ProcessingEvent:
+    """ProcessingEvent"""
+
+    class WillFetchFirstBlock(BaseTypedType):
+        """
+        Notifies the application that the account's current shard block
+        will be fetched from the network. This step is performed before
+        the message sending so that sdk knows starting from which block
+        it will search for the transaction.
+        Fetched block will be used later in waiting phase
+        """
+
+        __slots__ = ('message_id', 'message_dst')
+
+        def __init__(self, message_id: str, message_dst: str):
+            """
+            :param message_id:
+            :param message_dst:
+            """
+            super(ProcessingEvent.WillFetchFirstBlock, self).__init__(
+                type='WillFetchFirstBlock'
+            )
+            self.message_id = message_id
+            self.message_dst = message_dst
+
+        @property
+        def dict(self):
+            return {
+                **super(ProcessingEvent.WillFetchFirstBlock, self).dict,
+                'message_id': self.message_id,
+                'message_dst': self.message_dst,
+            }
+
+    class FetchFirstBlockFailed(BaseTypedType):
+        """
+        Notifies the app that the client has failed to fetch the account's
+        current shard block.
+        This may happen due to the network issues. Receiving this event
+        means that message processing will not proceed - message was not
+        sent, and Developer can try to run `process_message` again, in the
+        hope that the connection is restored
+        """
+
+        __slots__ = ('error', 'message_id', 'message_dst')
+
+        def __init__(
+            self, error: 'client.ClientError', message_id: str, message_dst: str
+        ):
+            """
+            :param error:
+            :param message_id:
+            :param message_dst:
+            """
+            super(ProcessingEvent.FetchFirstBlockFailed, self).__init__(
+                type='FetchFirstBlockFailed'
+            )
+            self.error = error
+            self.message_id = message_id
+            self.message_dst = message_dst
+
+        @property
+        def dict(self):
+            return {
+                **super(ProcessingEvent.FetchFirstBlockFailed, self).dict,
+                'error': self.error.dict,
+                'message_id': self.message_id,
+                'message_dst': self.message_dst,
+            }
+
+    class WillSend(BaseTypedType):
+        """
+        Notifies the app that the message will be sent to the network.
+        This event means that the account's current shard block was
+        successfully fetched and the message was successfully created
+        (`abi.encode_message` function was executed successfully)
+        """
+
+        __slots__ = ('shard_block_id', 'message_id', 'message_dst', 'message')
+
+        def __init__(
+            self, shard_block_id: str, message_id: str, message_dst: str, message: str
+        ):
+            """
+            :param shard_block_id:
+            :param message_id:
+            :param message_dst:
+            :param message:
+            """
+            super(ProcessingEvent.WillSend, self).__init__(type='WillSend')
+            self.shard_block_id = shard_block_id
+            self.message_id = message_id
+            self.message_dst = message_dst
+            self.message = message
+
+        @property
+        def dict(self):
+            return {
+                **super(ProcessingEvent.WillSend, self).dict,
+                'shard_block_id': self.shard_block_id,
+                'message_id': self.message_id,
+                'message_dst': self.message_dst,
+                'message': self.message,
+            }
+
+    class DidSend(BaseTypedType):
+        """
+        Notifies the app that the message was sent to the network,
+        i.e `processing.send_message` was successfully executed.
+        Now, the message is in the blockchain.
+        If Application exits at this phase, Developer needs to proceed
+        with processing after the application is restored with
+        `wait_for_transaction` function, passing `shard_block_id` and
+        `message` from this event.
+        Do not forget to specify `abi` of your contract as well, it is
+        crucial for processing
+        """
+
+        __slots__ = ('shard_block_id', 'message_id', 'message_dst', 'message')
+
+        def __init__(
+            self, shard_block_id: str, message_id: str, message_dst: str, message: str
+        ):
+            """
+            :param shard_block_id:
+            :param message_id:
+            :param message_dst:
+            :param message:
+            """
+            super(ProcessingEvent.DidSend, self).__init__(type='DidSend')
+            self.shard_block_id = shard_block_id
+            self.message_id = message_id
+            self.message_dst = message_dst
+            self.message = message
+
+        @property
+        def dict(self):
+            return {
+                **super(ProcessingEvent.DidSend, self).dict,
+                'shard_block_id': self.shard_block_id,
+                'message_id': self.message_id,
+                'message_dst': self.message_dst,
+                'message': self.message,
+            }
+
+    class SendFailed(BaseTypedType):
+        """
+        Notifies the app that the sending operation was failed with
+        network error.
+        Nevertheless the processing will be continued at the waiting phase
+        because the message possibly has been delivered to the node.
+        If Application exits at this phase, Developer needs to proceed
+        with processing after the application is restored with
+        `wait_for_transaction` function, passing `shard_block_id` and
+        `message` from this event.
+        Do not forget to specify `abi` of your contract as well, it is
+        crucial for processing
+        """
+
+        __slots__ = ('shard_block_id', 'message_id', 'message_dst', 'message', 'error')
+
+        def __init__(
+            self,
+            shard_block_id: str,
+            message_id: str,
+            message_dst: str,
+            message: str,
+            error: 'client.ClientError',
+        ):
+            """
+            :param shard_block_id:
+            :param message_id:
+            :param message_dst:
+            :param message:
+            :param error:
+            """
+            super(ProcessingEvent.SendFailed, self).__init__(type='SendFailed')
+            self.shard_block_id = shard_block_id
+            self.message_id = message_id
+            self.message_dst = message_dst
+            self.message = message
+            self.error = error
+
+        @property
+        def dict(self):
+            return {
+                **super(ProcessingEvent.SendFailed, self).dict,
+                'shard_block_id': self.shard_block_id,
+                'message_id': self.message_id,
+                'message_dst': self.message_dst,
+                'message': self.message,
+                'error': self.error.dict,
+            }
+
+    class WillFetchNextBlock(BaseTypedType):
+        """
+        Notifies the app that the next shard block will be fetched
+        from the network.
+        Event can occurs more than one time due to block walking procedure.
+        If Application exits at this phase, Developer needs to proceed with
+        processing after the application is restored with
+        `wait_for_transaction` function, passing `shard_block_id` and
+        `message` from this event.
+        Do not forget to specify `abi` of your contract as well, it is
+        crucial for processing
+        """
+
+        __slots__ = ('shard_block_id', 'message_id', 'message_dst', 'message')
+
+        def __init__(
+            self, shard_block_id: str, message_id: str, message_dst: str, message: str
+        ):
+            """
+            :param shard_block_id:
+            :param message_id:
+            :param message_dst:
+            :param message:
+            """
+            super(ProcessingEvent.WillFetchNextBlock, self).__init__(
+                type='WillFetchNextBlock'
+            )
+            self.shard_block_id = shard_block_id
+            self.message_id = message_id
+            self.message_dst = message_dst
+            self.message = message
+
+        @property
+        def dict(self):
+            return {
+                **super(ProcessingEvent.WillFetchNextBlock, self).dict,
+                'shard_block_id': self.shard_block_id,
+                'message_id': self.message_id,
+                'message_dst': self.message_dst,
+                'message': self.message,
+            }
+
+    class FetchNextBlockFailed(BaseTypedType):
+        """
+        Notifies the app that the next block can't be fetched.
+        If no block was fetched within `NetworkConfig.wait_for_timeout`
+        then processing stops.
+        This may happen when the shard stops, or there are other network
+        issues. In this case Developer should resume message processing with
+        `wait_for_transaction`, passing `shard_block_id`, `message` and
+        contract `abi` to it.
+        Note that passing ABI is crucial, because it will influence the
+        processing strategy.
+        Another way to tune this is to specify long timeout in
+        `NetworkConfig.wait_for_timeout`
+        """
+
+        __slots__ = ('shard_block_id', 'message_id', 'message_dst', 'message', 'error')
+
+        def __init__(
+            self,
+            shard_block_id: str,
+            message_id: str,
+            message_dst: str,
+            message: str,
+            error: 'client.ClientError',
+        ):
+            """
+            :param shard_block_id:
+            :param message_id:
+            :param message_dst:
+            :param message:
+            :param error:
+            """
+            super(ProcessingEvent.FetchNextBlockFailed, self).__init__(
+                type='FetchNextBlockFailed'
+            )
+            self.shard_block_id = shard_block_id
+            self.message_id = message_id
+            self.message_dst = message_dst
+            self.message = message
+            self.error = error
+
+        @property
+        def dict(self):
+            return {
+                **super(ProcessingEvent.FetchNextBlockFailed, self).dict,
+                'shard_block_id': self.shard_block_id,
+                'message_id': self.message_id,
+                'message_dst': self.message_dst,
+                'message': self.message,
+                'error': self.error.dict,
+            }
+
+    class MessageExpired(BaseTypedType):
+        """
+        Notifies the app that the message was not executed within expire
+        timeout on-chain and will never be because it is already expired.
+        The expiration timeout can be configured with `AbiConfig` parameters.
+        This event occurs only for the contracts which ABI includes
+        "expire" header.
+        If Application specifies `NetworkConfig.message_retries_count > 0`,
+        then `process_message` will perform retries: will create a new
+        message and send it again and repeat it until it reaches the maximum
+        retries count or receives a successful result.
+        All the processing events will be repeated
+        """
+
+        __slots__ = ('message_id', 'message_dst', 'message', 'error')
+
+        def __init__(
+            self,
+            message_id: str,
+            message_dst: str,
+            message: str,
+            error: 'client.ClientError',
+        ):
+            """
+            :param message_id:
+            :param message_dst:
+            :param message:
+            :param error:
+            """
+            super(ProcessingEvent.MessageExpired, self).__init__(type='MessageExpired')
+            self.message_id = message_id
+            self.message_dst = message_dst
+            self.message = message
+            self.error = error
+
+        @property
+        def dict(self):
+            return {
+                **super(ProcessingEvent.MessageExpired, self).dict,
+                'message_id': self.message_id,
+                'message_dst': self.message_dst,
+                'message': self.message,
+                'error': self.error.dict,
+            }
+
+    class RempSentToValidators(BaseTypedType):
+        """
+        Notifies the app that the message has been delivered to the thread's validators
+        """
+
+        __slots__ = ('message_id', 'message_dst', 'timestamp', 'json')
+
+        def __init__(
+            self, message_id: str, message_dst: str, timestamp: int, json: Any
+        ):
+            """
+            :param message_id:
+            :param message_dst:
+            :param timestamp:
+            :param json:
+            """
+            super(ProcessingEvent.RempSentToValidators, self).__init__(
+                type='RempSentToValidators'
+            )
+            self.message_id = message_id
+            self.message_dst = message_dst
+            self.timestamp = timestamp
+            self.json = json
+
+        @property
+        def dict(self):
+            return {
+                **super(ProcessingEvent.RempSentToValidators, self).dict,
+                'message_id': self.message_id,
+                'message_dst': self.message_dst,
+                'timestamp': self.timestamp,
+                'json': self.json,
+            }
+
+    class RempIncludedIntoBlock(BaseTypedType):
+        """
+        Notifies the app that the message has been successfully included into a block
+        candidate by the thread's collator
+        """
+
+        __slots__ = ('message_id', 'message_dst', 'timestamp', 'json')
+
+        def __init__(
+            self, message_id: str, message_dst: str, timestamp: int, json: Any
+        ):
+            """
+            :param message_id:
+            :param message_dst:
+            :param timestamp:
+            :param json:
+            """
+            super(ProcessingEvent.RempIncludedIntoBlock, self).__init__(
+                type='RempIncludedIntoBlock'
+            )
+            self.message_id = message_id
+            self.message_dst = message_dst
+            self.timestamp = timestamp
+            self.json = json
+
+        @property
+        def dict(self):
+            return {
+                **super(ProcessingEvent.RempIncludedIntoBlock, self).dict,
+                'message_id': self.message_id,
+                'message_dst': self.message_dst,
+                'timestamp': self.timestamp,
+                'json': self.json,
+            }
+
+    class RempIncludedIntoAcceptedBlock(BaseTypedType):
+        """
+        Notifies the app that the block candicate with the message has been
+        accepted by the thread's validators
+        """
+
+        __slots__ = ('message_id', 'message_dst', 'timestamp', 'json')
+
+        def __init__(
+            self, message_id: str, message_dst: str, timestamp: int, json: Any
+        ):
+            """
+            :param message_id:
+            :param message_dst:
+            :param timestamp:
+            :param json:
+            """
+            super(ProcessingEvent.RempIncludedIntoAcceptedBlock, self).__init__(
+                type='RempIncludedIntoAcceptedBlock'
+            )
+            self.message_id = message_id
+            self.message_dst = message_dst
+            self.timestamp = timestamp
+            self.json = json
+
+        @property
+        def dict(self):
+            return {
+                **super(ProcessingEvent.RempIncludedIntoAcceptedBlock, self).dict,
+                'message_id': self.message_id,
+                'message_dst': self.message_dst,
+                'timestamp': self.timestamp,
+                'json': self.json,
+            }
+
+    class RempOther(BaseTypedType):
+        """
+        Notifies the app about some other minor REMP statuses occurring during
+        message processing
+        """
+
+        __slots__ = ('message_id', 'message_dst', 'timestamp', 'json')
+
+        def __init__(
+            self, message_id: str, message_dst: str, timestamp: int, json: Any
+        ):
+            """
+            :param message_id:
+            :param message_dst:
+            :param timestamp:
+            :param json:
+            """
+            super(ProcessingEvent.RempOther, self).__init__(type='RempOther')
+            self.message_id = message_id
+            self.message_dst = message_dst
+            self.timestamp = timestamp
+            self.json = json
+
+        @property
+        def dict(self):
+            return {
+                **super(ProcessingEvent.RempOther, self).dict,
+                'message_id': self.message_id,
+                'message_dst': self.message_dst,
+                'timestamp': self.timestamp,
+                'json': self.json,
+            }
+
+    class RempError(BaseTypedType):
+        """
+        Notifies the app about any problem that has occured in REMP
+        processing - in this case library switches to the fallback transaction awaiting
+        scenario (sequential block reading)
+        """
+
+        __slots__ = ('error', 'message_id', 'message_dst')
+
+        def __init__(
+            self, error: 'client.ClientError', message_id: str, message_dst: str
+        ):
+            """
+            :param error:
+            :param message_id:
+            :param message_dst:
+            """
+            super(ProcessingEvent.RempError, self).__init__(type='RempError')
+            self.error = error
+            self.message_id = message_id
+            self.message_dst = message_dst
+
+        @property
+        def dict(self):
+            return {
+                **super(ProcessingEvent.RempError, self).dict,
+                'error': self.error.dict,
+                'message_id': self.message_id,
+                'message_dst': self.message_dst,
+            }
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> 'ProcessingEventType':
+        """Object from dict"""
+        if data.get('error'):
+            data['error'] = client.ClientError(**data['error'])
+        kwargs = {k: v for k, v in data.items() if k != 'type'}
+        return getattr(ProcessingEvent, data['type'])(**kwargs)
+
+
+class ProcessingResponseType(int, Enum):
+    """Processing response types"""
+
+    PROCESSING_EVENT = 100
+
+
+class ResultOfProcessMessage:
+    """ResultOfProcessMessage"""
+
+    __slots__ = ('transaction', 'out_messages', 'fees', 'decoded')
+
+    def __init__(
+        self,
+        transaction: Any,
+        out_messages: List[str],
+        fees: 'tvm.TransactionFees',
+        decoded: 'DecodedOutput' = None,
+    ):
+        """
+        :param transaction: Parsed transaction. In addition to the regular
+                transaction fields there is a boc field encoded with `base64`
+                which contains source transaction BOC
+        :param out_messages: List of output messages' BOCs. Encoded as `base64`
+        :param fees: Transaction fees
+        :param decoded: Optional decoded message bodies according to the
+                optional `abi` parameter
+        """
+        self.transaction = transaction
+        self.out_messages = out_messages
+        self.fees = fees
+        self.decoded = decoded
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> 'ResultOfProcessMessage':
+        """Object from dict"""
+        data['fees'] = tvm.TransactionFees(**data['fees'])
+        if data.get('decoded'):
+            data['decoded'] = DecodedOutput.from_dict(data=data['decoded'])
+
+        return ResultOfProcessMessage(**data)
+
+
+class DecodedOutput:
+    """DecodedOutput"""
+
+    __slots__ = ('out_messages', 'output')
+
+    def __init__(
+        self,
+        out_messages: List[Union['abi.DecodedMessageBody', None]],
+        output: Any = None,
+    ):
+        """
+        :param out_messages: Decoded bodies of the out messages. If the
+                message can't be decoded, then None will be stored in the
+                appropriate position
+        :param output: Decoded body of the function output message
+        """
+        self.out_messages = out_messages
+        self.output = output
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> 'DecodedOutput':
+        """Object from dict"""
+        data['out_messages'] = [
+            abi.DecodedMessageBody.from_dict(data=i) if i else None
+            for i in data['out_messages']
+        ]
+
+        return DecodedOutput(**data)
+
+
+class ParamsOfSendMessage:
+    """ParamsOfSendMessage"""
+
+    __slots__ = ('message', 'send_events', 'abi')
+
+    def __init__(
+        self, message: str, send_events: bool = None, abi: 'abi.AbiType' = None
+    ):
+        """
+        :param message: Message BOC
+        :param send_events: Flag for requesting events sending
+        :param abi: Optional message ABI. If this parameter is specified and
+                the message has the expire header then expiration time will
+                be checked against the current time to prevent unnecessary
+                sending of already expired message. The message already
+                expired error will be returned in this case. Note, that
+                specifying abi for ABI compliant contracts is strongly
+                recommended, so that proper processing strategy can be chosen
+        """
+        self.message = message
+        self.send_events = send_events
+        self.abi = abi
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'message': self.message,
+            'send_events': self.send_events,
+            'abi': self.abi.dict if self.abi else self.abi,
+        }
+
+
+class ResultOfSendMessage:
+    """ResultOfSendMessage"""
+
+    __slots__ = ('shard_block_id', 'sending_endpoints')
+
+    def __init__(self, shard_block_id: str, sending_endpoints: List[str]):
+        """
+        :param shard_block_id: The last generated shard block of the message
+                destination account before the message was sent. This block id
+                must be used as a parameter of the `wait_for_transaction`
+        :param sending_endpoints: The list of endpoints to which the message
+                was sent. This list id must be used as a parameter of the
+                `wait_for_transaction`
+        """
+        self.shard_block_id = shard_block_id
+        self.sending_endpoints = sending_endpoints
+
+
+class ParamsOfWaitForTransaction:
+    """ParamsOfWaitForTransaction"""
+
+    __slots__ = ('message', 'shard_block_id', 'send_events', 'abi', 'sending_endpoints')
+
+    def __init__(
+        self,
+        message: str,
+        shard_block_id: str,
+        send_events: bool = None,
+        abi: 'abi.AbiType' = None,
+        sending_endpoints: List[str] = None,
+    ):
+        """
+        :param message: Message BOC. Encoded with base64
+        :param shard_block_id: The last generated block id of the destination
+                account shard before the message was sent. You must provide
+                the same value as the `send_message` has returned
+        :param send_events: Flag that enables/disables intermediate events
+        :param abi: Optional ABI for decoding the transaction result.
+                If it is specified, then the output messages' bodies will be
+                decoded according to this ABI. The `abi_decoded` result field
+                will be filled out
+        :param sending_endpoints: The list of endpoints to which the message
+                was sent. You must provide the same value as the `send_message`
+                has returned
+        """
+        self.message = message
+        self.shard_block_id = shard_block_id
+        self.send_events = send_events
+        self.abi = abi
+        self.sending_endpoints = sending_endpoints
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'message': self.message,
+            'shard_block_id': self.shard_block_id,
+            'send_events': self.send_events,
+            'abi': self.abi.dict if self.abi else self.abi,
+            'sending_endpoints': self.sending_endpoints,
+        }
+
+
+class ParamsOfProcessMessage:
+    """ParamsOfProcessMessage"""
+
+    __slots__ = ('message_encode_params', 'send_events')
+
+    def __init__(
+        self,
+        message_encode_params: 'abi.ParamsOfEncodeMessage',
+        send_events: bool = None,
+    ):
+        """
+        :param message_encode_params: Message encode parameters
+        :param send_events: Flag for requesting events sending
+        """
+        self.message_encode_params = message_encode_params
+        self.send_events = send_events
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'message_encode_params': self.message_encode_params.dict,
+            'send_events': self.send_events,
+        }
+
+
+class MonitoredMessage:
+    """MonitoredMessage"""
+
+    class Boc(BaseTypedType):
+        """BOC of the message"""
+
+        __slots__ = ('boc',)
+
+        def __init__(self, boc: str):
+            """
+            :param boc:
+            """
+            super(MonitoredMessage.Boc, self).__init__(type='Boc')
+            self.boc = boc
+
+        @property
+        def dict(self):
+            return {**super(MonitoredMessage.Boc, self).dict, 'boc': self.boc}
+
+    class HashAddress(BaseTypedType):
+        """Message's hash and destination address"""
+
+        __slots__ = ('hash', 'address')
+
+        def __init__(self, hash: str, address: str):
+            """
+            :param hash:
+            :param address:
+            """
+            super(MonitoredMessage.HashAddress, self).__init__(type='HashAddress')
+            self.hash = hash
+            self.address = address
+
+        @property
+        def dict(self):
+            return {
+                **super(MonitoredMessage.HashAddress, self).dict,
+                'hash': self.hash,
+                'address': self.address,
+            }
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> 'MonitoredMessageType':
+        """Object from dict"""
+        kwargs = {k: v for k, v in data.items() if k != 'type'}
+        return getattr(MonitoredMessage, data['type'])(**kwargs)
+
+
+class MonitorFetchWaitMode(str, Enum):
+    """
+    AtLeastOne
+        If there are no resolved results yet, then monitor awaits for the next
+        resolved result
+    All
+        Monitor waits until all unresolved messages will be resolved.
+        If there are no unresolved messages then monitor will wait
+    NoWait
+    """
+
+    AT_LEAST_ONE = 'AtLeastOne'
+    ALL = 'All'
+    NO_WAIT = 'NoWait'
+
+
+class MessageMonitoringStatus(str, Enum):
+    """MessageMonitoringStatus"""
+
+    FINALIZED = 'Finalized'
+    TIMEOUT = 'Timeout'
+    RESERVED = 'Reserved'
+
+
+class MessageMonitoringTransactionCompute:
+    """MessageMonitoringTransactionCompute"""
+
+    __slots__ = ('exit_code',)
+
+    def __init__(self, exit_code: int):
+        """
+        :param exit_code: Compute phase exit code
+        """
+        self.exit_code = exit_code
+
+    # region hand-written
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'exit_code': self.exit_code}
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> 'MessageMonitoringTransactionCompute':
+        """Object from dict"""
+        return MessageMonitoringTransactionCompute(**data)
+    # endregion
+
+
+class MessageMonitoringTransaction:
+    """MessageMonitoringTransaction"""
+
+    __slots__ = ('aborted', 'hash', 'compute')
+
+    def __init__(
+        self,
+        aborted: bool,
+        hash: str = None,
+        compute: 'MessageMonitoringTransactionCompute' = None,
+    ):
+        """
+        :param aborted: Aborted field of the transaction
+        :param hash: Hash of the transaction.
+                Present if transaction was included into the blocks.
+                When then transaction was emulated this field will be missing
+        :param compute: Optional information about the compute phase of the transaction
+        """
+        self.aborted = aborted
+        self.hash = hash
+        self.compute = compute
+
+    # region hand-written
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'aborted': self.aborted,
+            'hash': self.hash,
+            'compute': self.compute.dict if self.compute else None,
+        }
+    # endregion
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> 'MessageMonitoringTransaction':
+        """Object from dict"""
+        if data.get('compute'):
+            data['compute'] = MessageMonitoringTransactionCompute(**data['compute'])
+
+        return MessageMonitoringTransaction(**data)
+
+
+class MessageMonitoringParams:
+    """MessageMonitoringParams"""
+
+    __slots__ = ('message', 'wait_until', 'user_data')
+
+    def __init__(
+        self, message: 'MonitoredMessageType', wait_until: int, user_data: Any = None
+    ):
+        """
+        :param message: Monitored message identification.
+                Can be provided as a message's BOC or (hash, address) pair.
+                BOC is a preferable way because it helps to determine possible
+                error reason (using TVM execution of the message)
+        :param wait_until: Block time Must be specified as a UNIX timestamp in seconds
+        :param user_data: User defined data associated with this message.
+                Helps to identify this message
+        """
+        self.message = message
+        self.wait_until = wait_until
+        self.user_data = user_data
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'message': self.message.dict,
+            'wait_until': self.wait_until,
+            'user_data': self.user_data,
+        }
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> 'MessageMonitoringParams':
+        """Object from dict"""
+        data['message'] = MonitoredMessage.from_dict(data=data['message'])
+
+        return MessageMonitoringParams(**data)
+
+
+class ParamsOfMonitorMessages:
+    """ParamsOfMonitorMessages"""
+
+    __slots__ = ('queue', 'messages')
+
+    def __init__(self, queue: str, messages: List['MessageMonitoringParams']):
+        """
+        :param queue: Name of the monitoring queue
+        :param messages: Messages to start monitoring for
+        """
+        self.queue = queue
+        self.messages = messages
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'queue': self.queue, 'messages': [i.dict for i in self.messages]}
+
+
+class MonitoringQueueInfo:
+    """MonitoringQueueInfo"""
+
+    __slots__ = ('unresolved', 'resolved')
+
+    def __init__(self, unresolved: int, resolved: int):
+        """
+        :param unresolved: Count of the unresolved messages
+        :param resolved: Count of resolved results
+        """
+        self.unresolved = unresolved
+        self.resolved = resolved
+
+    # region hand-written
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> 'MonitoringQueueInfo':
+        """Object from dict"""
+        return MonitoringQueueInfo(**data)
+    # endregion
+
+
+class ParamsOfGetMonitorInfo:
+    """ParamsOfGetMonitorInfo"""
+
+    __slots__ = ('queue',)
+
+    def __init__(self, queue: str):
+        """
+        :param queue: Name of the monitoring queue
+        """
+        self.queue = queue
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'queue': self.queue}
+
+
+class MessageMonitoringResult:
+    """MessageMonitoringResult"""
+
+    __slots__ = ('hash', 'status', 'transaction', 'error', 'user_data')
+
+    def __init__(
+        self,
+        hash: str,
+        status: 'MessageMonitoringStatus',
+        transaction: 'MessageMonitoringTransaction' = None,
+        error: str = None,
+        user_data: Any = None,
+    ):
+        """
+        :param hash: Hash of the message
+        :param status: Processing status
+        :param transaction: In case of `Finalized` the transaction is extracted
+                from the block.
+                In case of `Timeout` the transaction is emulated using
+                the last known account state
+        :param error: In case of `Timeout` contains possible error reason
+        :param user_data: User defined data related to this message
+        """
+        self.hash = hash
+        self.status = status
+        self.transaction = transaction
+        self.error = error
+        self.user_data = user_data
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> 'MessageMonitoringResult':
+        """Object from dict"""
+        if data.get('transaction'):
+            data['transaction'] = MessageMonitoringTransaction.from_dict(
+                data=data['transaction']
+            )
+
+        return MessageMonitoringResult(**data)
+
+
+class ParamsOfFetchNextMonitorResults:
+    """ParamsOfFetchNextMonitorResults"""
+
+    __slots__ = ('queue', 'wait_mode')
+
+    def __init__(self, queue: str, wait_mode: 'MonitorFetchWaitMode' = None):
+        """
+        :param queue: Name of the monitoring queue
+        :param wait_mode: Wait mode. Default is `NO_WAIT`
+        """
+        self.queue = queue
+        self.wait_mode = wait_mode
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'queue': self.queue, 'wait_mode': self.wait_mode}
+
+
+class ResultOfFetchNextMonitorResults:
+    """ResultOfFetchNextMonitorResults"""
+
+    __slots__ = ('results',)
+
+    def __init__(self, results: List['MessageMonitoringResult']):
+        """
+        :param results: List of the resolved results
+        """
+        self.results = results
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> 'ResultOfFetchNextMonitorResults':
+        """Object from dict"""
+        data['results'] = [
+            MessageMonitoringResult.from_dict(data=i) for i in data['results']
+        ]
+
+        return ResultOfFetchNextMonitorResults(**data)
+
+
+class ParamsOfCancelMonitor:
+    """ParamsOfCancelMonitor"""
+
+    __slots__ = ('queue',)
+
+    def __init__(self, queue: str):
+        """
+        :param queue: Name of the monitoring queue
+        """
+        self.queue = queue
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'queue': self.queue}
+
+
+class MessageSendingParams:
+    """MessageSendingParams"""
+
+    __slots__ = ('boc', 'wait_until', 'user_data')
+
+    def __init__(self, boc: str, wait_until: int, user_data: Any = None):
+        """
+        :param boc: BOC of the message, that must be sent to the blockchain
+        :param wait_until: Expiration time of the message.
+                Must be specified as a UNIX timestamp in seconds
+        :param user_data: User defined data associated with this message.
+                Helps to identify this message when received `MessageMonitoringResult`
+        """
+        self.boc = boc
+        self.wait_until = wait_until
+        self.user_data = user_data
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'boc': self.boc,
+            'wait_until': self.wait_until,
+            'user_data': self.user_data,
+        }
+
+
+class ParamsOfSendMessages:
+    """ParamsOfSendMessages"""
+
+    __slots__ = ('messages', 'monitor_queue')
+
+    def __init__(
+        self, messages: List['MessageSendingParams'], monitor_queue: str = None
+    ):
+        """
+        :param messages: Messages that must be sent to the blockchain
+        :param monitor_queue: Optional message monitor queue that starts
+                monitoring for the processing results for sent messages
+        """
+        self.messages = messages
+        self.monitor_queue = monitor_queue
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'messages': [i.dict for i in self.messages],
+            'monitor_queue': self.monitor_queue,
+        }
+
+
+class ResultOfSendMessages:
+    """ResultOfSendMessages"""
+
+    __slots__ = ('messages',)
+
+    def __init__(self, messages: List['MessageMonitoringParams']):
+        """
+        :param messages: Messages that was sent to the blockchain for execution
+        """
+        self.messages = messages
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> 'ResultOfSendMessages':
+        """Object from dict"""
+        data['messages'] = [
+            MessageMonitoringParams.from_dict(data=i) for i in data['messages']
+        ]
+
+        return ResultOfSendMessages(**data)
+
+
+# Aggregated types
+ProcessingEventType = Union[
+    ProcessingEvent.WillFetchFirstBlock,
+    ProcessingEvent.FetchFirstBlockFailed,
+    ProcessingEvent.WillSend,
+    ProcessingEvent.DidSend,
+    ProcessingEvent.SendFailed,
+    ProcessingEvent.WillFetchNextBlock,
+    ProcessingEvent.FetchNextBlockFailed,
+    ProcessingEvent.MessageExpired,
+    ProcessingEvent.RempSentToValidators,
+    ProcessingEvent.RempIncludedIntoBlock,
+    ProcessingEvent.RempIncludedIntoAcceptedBlock,
+    ProcessingEvent.RempOther,
+    ProcessingEvent.RempError,
+]
+MonitoredMessageType = Union[MonitoredMessage.Boc, MonitoredMessage.HashAddress]
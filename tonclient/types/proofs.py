@@ -0,0 +1,74 @@
+"""Proofs module types"""
+from enum import Enum
+from typing import Any
+
+
+class ProofsErrorCode(int, Enum):
+    """Proofs module error codes"""
+
+    INVALID_DATA = 901
+    PROOF_CHECK_FAILED = 902
+    INTERNAL_ERROR = 903
+    DATA_DIFFERS_FROM_PROVEN = 904
+
+
+class ParamsOfProofBlockData:
+    """ParamsOfProofBlockData"""
+
+    __slots__ = ('block',)
+
+    def __init__(self, block: Any):
+        """
+        :param block: Single block's data, retrieved from TONOS API,
+                that needs proof. Required fields are `id` and/or
+                top-level `boc` (for block identification), others are optional
+        """
+        self.block = block
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'block': self.block}
+
+
+class ParamsOfProofTransactionData:
+    """ParamsOfProofTransactionData"""
+
+    __slots__ = ('transaction',)
+
+    def __init__(self, transaction: Any):
+        """
+        :param transaction: Single transaction's data as queried from DApp
+                server, without modifications. The required fields are `id`
+                and/or top-level `boc`, others are optional. In order to
+                reduce network requests count, it is recommended to provide
+                `block_id` and `boc` of transaction
+        """
+        self.transaction = transaction
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'transaction': self.transaction}
+
+
+class ParamsOfProofMessageData:
+    """ParamsOfProofMessageData"""
+
+    __slots__ = ('message',)
+
+    def __init__(self, message: Any):
+        """
+        :param message: Single message's data as queried from DApp server,
+                without modifications. The required fields are id and/or
+                top-level `boc`, others are optional.
+                In order to reduce network requests count, it is recommended
+                to provide at least `boc` of message and non-null
+                `src_transaction.id` or `dst_transaction.id`
+        """
+        self.message = message
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'message': self.message}
@@ -0,0 +1,436 @@
+"""TVM module types"""
+from enum import Enum
+from typing import Any, Dict, List, Union
+
+from .base import BaseTypedType
+from . import abi, boc, processing
+
+
+class TvmErrorCode(int, Enum):
+    """TVM module error codes"""
+
+    CANNOT_READ_TRANSACTION = 401
+    CANNOT_READ_BLOCKCHAIN_CONFIG = 402
+    TRANSACTION_ABORTED = 403
+    INTERNAL_ERROR = 404
+    ACTION_PHASE_FAILED = 405
+    ACCOUNT_CODE_MISSING = 406
+    LOW_BALANCE = 407
+    ACCOUNT_FROZEN_OR_DELETED = 408
+    ACCOUNT_MISSING = 409
+    UNKNOWN_EXECUTION_ERROR = 410
+    INVALID_INPUT_STACK = 411
+    INVALID_ACCOUNT_BOC = 412
+    INVALID_MESSAGE_TYPE = 413
+    CONTRACT_EXECUTION_ERROR = 414
+
+
+class TransactionFees:
+    """TransactionFees"""
+
+    __slots__ = (
+        'in_msg_fwd_fee',
+        'storage_fee',
+        'gas_fee',
+        'out_msgs_fwd_fee',
+        'total_account_fees',
+        'total_output',
+        'ext_in_msg_fee',
+        'total_fwd_fees',
+        'account_fees',
+    )
+
+    def __init__(
+        self,
+        in_msg_fwd_fee: int,
+        storage_fee: int,
+        gas_fee: int,
+        out_msgs_fwd_fee: int,
+        total_account_fees: int,
+        total_output: int,
+        ext_in_msg_fee: int,
+        total_fwd_fees: int,
+        account_fees: int,
+    ):
+        """
+        :param in_msg_fwd_fee:
+        :param storage_fee:
+        :param gas_fee:
+        :param out_msgs_fwd_fee:
+        :param total_account_fees:
+        :param total_output:
+        :param ext_in_msg_fee:
+        :param total_fwd_fees:
+        :param account_fees:
+        """
+        self.in_msg_fwd_fee = in_msg_fwd_fee
+        self.storage_fee = storage_fee
+        self.gas_fee = gas_fee
+        self.out_msgs_fwd_fee = out_msgs_fwd_fee
+        self.total_account_fees = total_account_fees
+        self.total_output = total_output
+        self.ext_in_msg_fee = ext_in_msg_fee
+        self.total_fwd_fees = total_fwd_fees
+        self.account_fees = account_fees
+
+
+class ExecutionOptions:
+    """ExecutionOptions"""
+
+    __slots__ = (
+        'blockchain_config',
+        'block_time',
+        'block_lt',
+        'transaction_lt',
+        'chksig_always_succeed',
+        'signature_id',
+    )
+
+    def __init__(
+        self,
+        blockchain_config: str = None,
+        block_time: int = None,
+        block_lt: int = None,
+        transaction_lt: int = None,
+        chksig_always_succeed: bool = None,
+        signature_id: int = None,
+    ):
+        """
+        :param blockchain_config: boc with config
+        :param block_time: time that is used as transaction time
+        :param block_lt: block logical time
+        :param transaction_lt: transaction logical time
+        :param chksig_always_succeed: Overrides standard TVM behaviour.
+                If set to `true` then CHKSIG always will return `true`
+        :param signature_id: Signature ID to be used in signature verifying
+                instructions when `CapSignatureWithId` capability is enabled
+        """
+        self.blockchain_config = blockchain_config
+        self.block_time = block_time
+        self.block_lt = block_lt
+        self.transaction_lt = transaction_lt
+        self.chksig_always_succeed = chksig_always_succeed
+        self.signature_id = signature_id
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {
+            'blockchain_config': self.blockchain_config,
+            'block_time': self.block_time,
+            'block_lt': self.block_lt,
+            'transaction_lt': self.transaction_lt,
+            'chksig_always_succeed': self.chksig_always_succeed,
+            'signature_id': self.signature_id,
+        }
+
+
+class AccountForExecutor:
+    """AccountForExecutor"""
+
+    # region hand-written
+    class NoAccount(BaseTypedType):
+        """
+        Non-existing account to run a creation internal message.
+        Should be used with `skip_transaction_check = true` if the message
+        has no deploy data since transactions on the uninitialized account
+        are always aborted
+        """
+
+        __slots__ = ()
+
+        def __init__(self):
+            super(AccountForExecutor.NoAccount, self).__init__(type='None')
+    # endregion
+
+    class Uninit(BaseTypedType):
+        """Emulate uninitialized account to run deploy message"""
+
+        __slots__ = ()
+
+        def __init__(self):
+            super(AccountForExecutor.Uninit, self).__init__(type='Uninit')
+
+    class Account(BaseTypedType):
+        """AccountForExecutor.Account"""
+
+        __slots__ = ('boc', 'unlimited_balance')
+
+        def __init__(self, boc: str, unlimited_balance: bool = None):
+            """
+            :param boc: Account BOC. Encoded as `base64`
+            :param unlimited_balance: Flag for running account with the
+                    unlimited balance. Can be used to calculate transaction
+                    fees without balance check
+            """
+            super(AccountForExecutor.Account, self).__init__(type='Account')
+            self.boc = boc
+            self.unlimited_balance = unlimited_balance
+
+        @property
+        def dict(self):
+            return {
+                **super(AccountForExecutor.Account, self).dict,
+                'boc': self.boc,
+                'unlimited_balance': self.unlimited_balance,
+            }
+
+
+class ParamsOfRunExecutor:
+    """ParamsOfRunExecutor"""
+
+    __slots__ = (
+        'message',
+        'account',
+        'execution_options',
+        'abi',
+        'skip_transaction_check',
+        'boc_cache',
+        'return_updated_account',
+    )
+
+    def __init__(
+        self,
+        message: str,
+        account: 'AccountForExecutorType',
+        execution_options: 'ExecutionOptions' = None,
+        abi: 'abi.AbiType' = None,
+        skip_transaction_check: bool = None,
+        boc_cache: 'boc.BocCacheTypeType' = None,
+        return_updated_account: bool = None,
+    ):
+        """
+        :param message: Input message BOC. Must be encoded as `base64`
+        :param account: Account to run on executor
+        :param execution_options: Execution options
+        :param abi: Contract ABI for decoding output messages
+        :param skip_transaction_check: Skip transaction check flag
+        :param boc_cache: Cache type to put the result. The BOC itself
+                returned if no cache type provided
+        :param return_updated_account: Return updated account flag. Empty
+                string is returned if the flag is `false`
+        """
+        self.message = message
+        self.account = account
+        self.execution_options = execution_options
+        self.abi = abi
+        self.skip_transaction_check = skip_transaction_check
+        self.boc_cache = boc_cache
+        self.return_updated_account = return_updated_account
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        execution_options = (
+            self.execution_options.dict
+            if self.execution_options
+            else self.execution_options
+        )
+        return {
+            'message': self.message,
+            'account': self.account.dict,
+            'execution_options': execution_options,
+            'abi': self.abi.dict if self.abi else self.abi,
+            'skip_transaction_check': self.skip_transaction_check,
+            'boc_cache': self.boc_cache.dict if self.boc_cache else self.boc_cache,
+            'return_updated_account': self.return_updated_account,
+        }
+
+
+class ResultOfRunExecutor:
+    """ResultOfRunExecutor"""
+
+    __slots__ = ('transaction', 'out_messages', 'account', 'fees', 'decoded')
+
+    def __init__(
+        self,
+        transaction: Any,
+        out_messages: List[str],
+        account: str,
+        fees: 'TransactionFees',
+        decoded: 'processing.DecodedOutput' = None,
+    ):
+        """
+        :param transaction: Parsed transaction. In addition to the regular
+                transaction fields there is a boc field encoded with `base64`
+                which contains source transaction BOC
+        :param out_messages: List of output messages' BOCs. Encoded as `base64`
+        :param account: Updated account state BOC. Encoded as `base64`
+        :param fees: Transaction fees
+        :param decoded: Optional decoded message bodies according to the
+                optional `abi` parameter
+        """
+        self.transaction = transaction
+        self.out_messages = out_messages
+        self.account = account
+        self.fees = fees
+        self.decoded = decoded
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> 'ResultOfRunExecutor':
+        """Object from dict"""
+        data['fees'] = TransactionFees(**data['fees'])
+        if data.get('decoded'):
+            data['decoded'] = processing.DecodedOutput.from_dict(data=data['decoded'])
+
+        return ResultOfRunExecutor(**data)
+
+
+class ParamsOfRunTvm:
+    """ParamsOfRunTvm"""
+
+    __slots__ = (
+        'message',
+        'account',
+        'abi',
+        'execution_options',
+        'boc_cache',
+        'return_updated_account',
+    )
+
+    def __init__(
+        self,
+        message: str,
+        account: str,
+        abi: 'abi.AbiType' = None,
+        execution_options: 'ExecutionOptions' = None,
+        boc_cache: 'boc.BocCacheTypeType' = None,
+        return_updated_account: bool = None,
+    ):
+        """
+        :param message: Input message BOC. Must be encoded as `base64`
+        :param account: Account BOC. Must be encoded as `base64`
+        :param abi: Contract ABI for decoding output messages
+        :param execution_options: Execution options
+        :param boc_cache: Cache type to put the result. The BOC itself
+                returned if no cache type provided
+        :param return_updated_account: Return updated account flag. Empty
+                string is returned if the flag is `false`
+        """
+        self.message = message
+        self.account = account
+        self.abi = abi
+        self.execution_options = execution_options
+        self.boc_cache = boc_cache
+        self.return_updated_account = return_updated_account
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        execution_options = (
+            self.execution_options.dict
+            if self.execution_options
+            else self.execution_options
+        )
+        return {
+            'message': self.message,
+            'account': self.account,
+            'abi': self.abi.dict if self.abi else self.abi,
+            'execution_options': execution_options,
+            'boc_cache': self.boc_cache.dict if self.boc_cache else self.boc_cache,
+            'return_updated_account': self.return_updated_account,
+        }
+
+
+class ResultOfRunTvm:
+    """ResultOfRunTvm"""
+
+    __slots__ = ('out_messages', 'account', 'decoded')
+
+    def __init__(
+        self,
+        out_messages: List[str],
+        account: str,
+        decoded: 'processing.DecodedOutput' = None,
+    ):
+        """
+        :param out_messages: List of output messages' BOCs. Encoded as `base64`
+        :param account: Updated account state BOC. Encoded as `base64`.
+                Attention! Only data in account state is updated
+        :param decoded: Optional decoded message bodies according to the
+                optional `abi` parameter
+        """
+        self.out_messages = out_messages
+        self.account = account
+        self.decoded = decoded
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> 'ResultOfRunTvm':
+        """Object from dict"""
+        if data.get('decoded'):
+            data['decoded'] = processing.DecodedOutput.from_dict(data=data['decoded'])
+
+        return ResultOfRunTvm(**data)
+
+
+class ParamsOfRunGet:
+    """ParamsOfRunGet"""
+
+    __slots__ = (
+        'account',
+        'function_name',
+        'input',
+        'execution_options',
+        'tuple_list_as_array',
+    )
+
+    def __init__(
+        self,
+        account: str,
+        function_name: str,
+        input: Any = None,
+        execution_options: 'ExecutionOptions' = None,
+        tuple_list_as_array: bool = None,
+    ):
+        """
+        :param account: Account BOC in `base64`
+        :param function_name: Function name
+        :param input: Input parameters
+        :param execution_options: Execution options
+        :param tuple_list_as_array: Convert lists based on nested tuples in
+                the result into plain arrays. Default is false.
+                Input parameters may use any of lists representations.
+                If you receive this error on Web: "Runtime error. Unreachable
+                code should not be executed...", set this flag to true.
+                This may happen, for example, when elector contract contains
+                too many participants
+        """
+        self.account = account
+        self.function_name = function_name
+        self.input = input
+        self.execution_options = execution_options
+        self.tuple_list_as_array = tuple_list_as_array
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        execution_options = (
+            self.execution_options.dict
+            if self.execution_options
+            else self.execution_options
+        )
+        return {
+            'account': self.account,
+            'function_name': self.function_name,
+            'input': self.input,
+            'execution_options': execution_options,
+            'tuple_list_as_array': self.tuple_list_as_array,
+        }
+
+
+class ResultOfRunGet:
+    """ResultOfRunGet"""
+
+    __slots__ = ('output',)
+
+    def __init__(self, output: Any):
+        """
+        :param output: Values returned by getmethod on stack
+        """
+        self.output = output
+
+
+# Aggregated types
+AccountForExecutorType = Union[
+    AccountForExecutor.NoAccount, AccountForExecutor.Uninit, AccountForExecutor.Account
+]
@@ -0,0 +1,220 @@
+"""Utils module types"""
+from enum import Enum
+from typing import Union
+
+from .base import BaseTypedType
+
+
+class AccountAddressType(str, Enum):
+    """Account address types"""
+
+    ACCOUNT_ID = 'AccountId'
+    HEX = 'Hex'
+    BASE64 = 'Base64'
+
+
+class AddressStringFormat:
+    """AddressStringFormat"""
+
+    class AccountId(BaseTypedType):
+        """AddressStringFormat.AccountId"""
+
+        __slots__ = ()
+
+        def __init__(self):
+            super(AddressStringFormat.AccountId, self).__init__(type='AccountId')
+
+    class Hex(BaseTypedType):
+        """AddressStringFormat.Hex"""
+
+        __slots__ = ()
+
+        def __init__(self):
+            super(AddressStringFormat.Hex, self).__init__(type='Hex')
+
+    class Base64(BaseTypedType):
+        """AddressStringFormat.Base64"""
+
+        __slots__ = ('url', 'test', 'bounce')
+
+        def __init__(self, url: bool, test: bool, bounce: bool):
+            """
+            :param url:
+            :param test:
+            :param bounce:
+            """
+            super(AddressStringFormat.Base64, self).__init__(type='Base64')
+            self.url = url
+            self.test = test
+            self.bounce = bounce
+
+        @property
+        def dict(self):
+            return {
+                **super(AddressStringFormat.Base64, self).dict,
+                'url': self.url,
+                'test': self.test,
+                'bounce': self.bounce,
+            }
+
+
+class ParamsOfConvertAddress:
+    """ParamsOfConvertAddress"""
+
+    __slots__ = ('address', 'output_format')
+
+    def __init__(self, address: str, output_format: 'AddressStringFormatType'):
+        """
+        :param address: Account address in any TON format
+        :param output_format: Specify the format to convert to
+        """
+        self.address = address
+        self.output_format = output_format
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'address': self.address, 'output_format': self.output_format.dict}
+
+
+class ResultOfConvertAddress:
+    """ResultOfConvertAddress"""
+
+    __slots__ = ('address',)
+
+    def __init__(self, address: str):
+        """
+        :param address: Address in the specified format
+        """
+        self.address = address
+
+
+class ParamsOfCalcStorageFee:
+    """ParamsOfCalcStorageFee"""
+
+    __slots__ = ('account', 'period')
+
+    def __init__(self, account: str, period: int):
+        """
+        :param account:
+        :param period:
+        """
+        self.account = account
+        self.period = period
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'account': self.account, 'period': self.period}
+
+
+class ResultOfCalcStorageFee:
+    """ResultOfCalcStorageFee"""
+
+    __slots__ = ('fee',)
+
+    def __init__(self, fee: str):
+        """
+        :param fee:
+        """
+        self.fee = fee
+
+
+class ParamsOfCompressZstd:
+    """ParamsOfCompressZstd"""
+
+    __slots__ = ('uncompressed', 'level')
+
+    def __init__(self, uncompressed: str, level: int = None):
+        """
+        :param uncompressed: Uncompressed data. Must be encoded as `base64`
+        :param level: Compression level, from 1 to 21.
+                Where:
+                    1 - lowest compression level (fastest compression);
+                    21 - highest compression level (slowest compression).
+                If level is omitted, the default compression level is used
+                (currently 3)
+        """
+        self.uncompressed = uncompressed
+        self.level = level
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'uncompressed': self.uncompressed, 'level': self.level}
+
+
+class ResultOfCompressZstd:
+    """ResultOfCompressZstd"""
+
+    __slots__ = ('compressed',)
+
+    def __init__(self, compressed: str):
+        """
+        :param compressed: Compressed data. Encoded as `base64`
+        """
+        self.compressed = compressed
+
+
+class ParamsOfDecompressZstd:
+    """ParamsOfDecompressZstd"""
+
+    __slots__ = ('compressed',)
+
+    def __init__(self, compressed: str):
+        """
+        :param compressed: Compressed data. Must be encoded as `base64`
+        """
+        self.compressed = compressed
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'compressed': self.compressed}
+
+
+class ResultOfDecompressZstd:
+    """ResultOfDecompressZstd"""
+
+    __slots__ = ('decompressed',)
+
+    def __init__(self, decompressed: str):
+        """
+        :param decompressed: Decompressed data. Encoded as `base64`
+        """
+        self.decompressed = decompressed
+
+
+class ParamsOfGetAddressType:
+    """ParamsOfGetAddressType"""
+
+    __slots__ = ('address',)
+
+    def __init__(self, address: str):
+        """
+        :param address: Account address in any TON format
+        """
+        self.address = address
+
+    @property
+    def dict(self):
+        """Dict from object"""
+        return {'address': self.address}
+
+
+class ResultOfGetAddressType:
+    """ResultOfGetAddressType"""
+
+    __slots__ = ('address_type',)
+
+    def __init__(self, address_type: 'AccountAddressType'):
+        """
+        :param address_type: Account address type
+        """
+        self.address_type = address_type
+
+
+# Aggregated types
+AddressStringFormatType = Union[
+    AddressStringFormat.AccountId, AddressStringFormat.Hex, AddressStringFormat.Base64
+]
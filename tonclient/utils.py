@@ -1,17 +1,17 @@
 """Utils module methods"""
-from typing import Union, Awaitable
+from typing import Awaitable, Union
 
 from tonclient.module import TonModule
 from tonclient.types import (
-    ParamsOfConvertAddress,
-    ResultOfConvertAddress,
     ParamsOfCalcStorageFee,
-    ResultOfCalcStorageFee,
     ParamsOfCompressZstd,
-    ResultOfCompressZstd,
+    ParamsOfConvertAddress,
     ParamsOfDecompressZstd,
-    ResultOfDecompressZstd,
     ParamsOfGetAddressType,
+    ResultOfCalcStorageFee,
+    ResultOfCompressZstd,
+    ResultOfConvertAddress,
+    ResultOfDecompressZstd,
     ResultOfGetAddressType,
 )
 
@@ -28,7 +28,7 @@ class TonUtils(TonModule):
         :param params: See `types.ParamsOfConvertAddress`
         :return: See `types.ResultOfConvertAddress`
         """
-        response = self.request(method='utils.convert_address', **params.dict)
+        response = self.request(method='utils.convert_address', params_or_str=params)
         return self.response(classname=ResultOfConvertAddress, response=response)
 
     def calc_storage_fee(
@@ -40,7 +40,7 @@ class TonUtils(TonModule):
         :param params: See `types.ParamsOfCalcStorageFee`
         :return: See `types.ResultOfCalcStorageFee`
         """
-        response = self.request(method='utils.calc_storage_fee', **params.dict)
+        response = self.request(method='utils.calc_storage_fee', params_or_str=params)
         return self.response(classname=ResultOfCalcStorageFee, response=response)
 
     def compress_zstd(
@@ -52,7 +52,7 @@ class TonUtils(TonModule):
         :param params: See `types.ParamsOfCompressZstd`
         :return: See `types.ResultOfCompressZstd`
         """
-        response = self.request(method='utils.compress_zstd', **params.dict)
+        response = self.request(method='utils.compress_zstd', params_or_str=params)
         return self.response(classname=ResultOfCompressZstd, response=response)
 
     def decompress_zstd(
@@ -64,7 +64,7 @@ class TonUtils(TonModule):
         :param params: See `types.ParamsOfDecompressZstd`
         :return: See `types.ResultOfDecompressZstd`
         """
-        response = self.request(method='utils.decompress_zstd', **params.dict)
+        response = self.request(method='utils.decompress_zstd', params_or_str=params)
         return self.response(classname=ResultOfDecompressZstd, response=response)
 
     def get_address_type(
@@ -86,5 +86,5 @@ class TonUtils(TonModule):
         :param params: See `types.ParamsOfGetAddressType`
         :return: See `types.ResultOfGetAddressType`
         """
-        response = self.request(method='utils.get_address_type', **params.dict)
+        response = self.request(method='utils.get_address_type', params_or_str=params)
         return self.response(classname=ResultOfGetAddressType, response=response)